@@ -2,6 +2,8 @@
 Configurações personalizadas do projeto específico: conjunto de dados, 
 dicionários de nomes de variáveis, etc.
 """
+from pathlib import Path
+
 import numpy as np
 
 NOME_PROJETO = "Estudo de Sensação Térmica Humana em Santa Maria - RS"
@@ -16,6 +18,8 @@ SUBSTITUICOES_LIMPEZA = {
     "99": np.nan,
     "F": "f",
 }
+# Backend da limpeza/conversao: pandas ou arrow (pyarrow.compute, mesmo resultado)
+BACKEND_PROCESSAMENTO = "pandas"
 
 # Conversao de tipos (data, hora, numericos, categoricos)
 TYPE_DICT = {
@@ -61,6 +65,33 @@ TYPE_DICT = {
     "chuva_tot": "float64",
 }
 
+# Validacao do esquema apos a conversao de tipos: tipos de TYPE_DICT, faixas
+# (minimo, maximo; None = sem limite) e fracao maxima de faltantes por coluna.
+# A validacao roda antes da imputacao: lotes pequenos tem colunas inteiras
+# vazias que a imputacao preenche (rsolartot, tu), entao a taxa padrao e 1.0
+# (sem limite); colunas de CONFIG_IMPUTACAO_CUSTOMIZADA nunca tem limite
+VALIDAR_ESQUEMA = True
+LIMITES_VALORES = {
+    "idade": (0, 120),
+    "peso": (0, None),
+    "altura": (0, None),
+    **{f"p{i}": (-3, 3) for i in range(1, 9)},
+    "tmedia": (-40, 60),
+    "tmax": (-40, 60),
+    "tmin": (-40, 60),
+    "tu": (-40, 60),
+    "ur": (0, 100),
+    "ur_max": (0, 100),
+    "ur_min": (0, 100),
+    "rsolarmed": (0, None),
+    "rsolartot": (0, None),
+    "vel_vento": (0, None),
+    "sd_dirvento": (0, None),
+    "vel_vento_max": (0, None),
+    "chuva_tot": (0, None),
+}
+TAXA_MAXIMA_FALTANTES = 1.0
+
 COLUNA_DATA = "data"
 COLUNA_HORA = "hora"
 
@@ -82,6 +113,38 @@ COLUNAS_PONTO_FLUTUANTE = [
     "tu",
 ]
 
+# Colunas meteorologicas, repetidas em cada respondente do mesmo data/hora.
+# Com SEPARAR_TABELAS_CLIMA o pipeline completo processa uma tabela de clima
+# (uma linha por instante) e outra de respondentes, unidas so nas features
+SEPARAR_TABELAS_CLIMA = False
+COLUNAS_CLIMA = [
+    "tev",
+    "utci",
+    "sst",
+    "ste",
+    "psti",
+    "wbgt",
+    "wci",
+    "tek",
+    "te",
+    "pst",
+    "tmedia",
+    "tmax",
+    "tmin",
+    "tu",
+    "ur",
+    "ur_max",
+    "ur_min",
+    "rsolarmed",
+    "rsolartot",
+    "vel_vento",
+    "dir_vento",
+    "sd_dirvento",
+    "vel_vento_max",
+    "dir_max_vento",
+    "chuva_tot",
+]
+
 COLUNAS_NUMEROS_INTEIROS = [
     "idade",
     "p1",
@@ -99,6 +162,7 @@ COLUNAS_CATEGORICAS = [
     "vestimenta",
 ]
 
+# Tipos opcionais: "tu_stull" (preenche os faltantes de tu com Stull)
 TIPOS_FEATURES_DERIVADAS = [
     "imc",
     "imc_classe",
@@ -112,6 +176,9 @@ METODO_IMPUTACAO_NUM = "median"
 METODO_IMPUTACAO_CAT = "mode"
 VALOR_CONST_CATEGORICA = "__missing__"
 
+# Janela da média móvel usada quando a interpolação temporal deixa faltantes
+JANELA_INTERPOLACAO_TEMPORAL = "48h"
+
 # Configuração avançada de imputação por coluna (compatível com pipeline antigo)
 CONFIG_IMPUTACAO_CUSTOMIZADA = {
     # Perguntas do questionário: backward fill (como no pipeline antigo)
@@ -123,8 +190,8 @@ CONFIG_IMPUTACAO_CUSTOMIZADA = {
     # Vestimenta: backward fill
     "vestimenta": "backward",
     
-    # Variáveis meteorológicas: usar média móvel + interpolação
-    # (tratamento especial no pipeline via imputar_media_movel_interpolada)
+    # Variáveis meteorológicas: interpolação no eixo do tempo (data + hora)
+    # (tratamento especial no pipeline via imputar_interpolacao_temporal)
     "rsolartot": "rolling_mean_48",  # Indicador especial
     "rsolarmed": "rolling_mean_48",  # Indicador especial
     
@@ -136,7 +203,9 @@ CONFIG_IMPUTACAO_CUSTOMIZADA = {
     # Outras categóricas: mode
     "sexo": "mode",
     
-    # tu: será calculado via features derivadas se faltante
+    # Bulbo úmido: Stull (2011) a partir de tmedia e ur; o que ficar fora do
+    # domínio da fórmula segue para o método padrão
+    "tu": "stull",
 }
 
 CRIAR_FEATURES_TEMPORAIS = True
@@ -144,6 +213,7 @@ CRIAR_COLUNA_MES_ANO = True
 
 APLICAR_CODIFICACAO = True
 METODO_CODIFICACAO = "label"  # label|onehot
+ONEHOT_ESPARSO = False  # dummies como SparseDtype(bool) (colunas de alta cardinalidade)
 SUFIXO_CODIFICADAS = "_cod"
 
 APLICAR_NORMALIZACAO = True
@@ -152,9 +222,44 @@ METODO_NORMALIZACAO = "standard"
 AGRUPAMENTO_NORMALIZAR = "mes-ano"
 SUFIXO_NORMALIZADAS = "_norm"
 
+# Compactacao de dtypes (menor tipo seguro + category para texto repetitivo)
+COMPACTAR_TIPOS = False
+TOLERANCIA_COMPACTACAO = 1e-6  # erro relativo maximo aceito em float32
+LIMITE_CARDINALIDADE_CATEGORIA = 0.5  # n_unicos / n_validos para virar category
+
+# Modo incremental do pipeline completo: recalcula tudo quando a media de
+# alguma coluna numerica se desloca mais que este numero de desvios-padrao
+LIMITE_DERIVA_INCREMENTAL = 0.1
+
+# Execucao paralela das operacoes por coluna (features derivadas, codificacao,
+# normalizacao e imputacao): 1 = sequencial, None/0 = todos os nucleos
+N_TRABALHADORES_PIPELINE = 1
+MODO_EXECUCAO_PARALELA = "thread"  # thread|processo
+
+# Execucao particionada do pipeline de features: divide o frame pela coluna de
+# agrupamento da normalizacao (mes-ano) e processa as particoes em processos,
+# com as colunas passadas por memoria compartilhada (usa N_TRABALHADORES_PIPELINE)
+PARTICIONAR_FEATURES = False
+
+# Especificacao declarativa do pipeline (etapas, colunas e metodos), compilada
+# em plano de execucao otimizado por src.pipelines.plano_pipeline (caminho
+# absoluto: vale de qualquer diretorio de trabalho)
+ESPECIFICACAO_PIPELINE = str(Path(__file__).resolve().parent / "pipeline.yaml")
+
+# Benchmark de desempenho (python -m src.utils.benchmark)
+BENCHMARK_TAMANHOS = [1_000, 10_000, 100_000]
+BENCHMARK_REPETICOES = 3
+BENCHMARK_LIMIAR_REGRESSAO = 0.25  # aumento relativo tolerado antes de acusar regressao
+BENCHMARK_BASELINE = "benchmarks/baseline.json"
+
 SALVAR_MAPEAMENTOS = True
 DIRETORIO_ARTEFATOS = "artefatos_processamento"
 
+# Dados processados/de features gravados como Parquet particionado (Hive) por
+# ano e mes-ano; load_dataframe le o diretorio com poda de particoes
+COLUNA_PARTICAO_DADOS = "mes-ano"
+COMPRESSAO_PARQUET = "zstd"
+
 # Mapeamentos de renome e alvo (simples, opcionais)
 MAPA_SENSACAO_TERMICA = {
     -3: "Muito Frio",
@@ -213,28 +318,50 @@ NOVOS_CABECALHOS = {
 
 __all__ = [
     "SUBSTITUICOES_LIMPEZA",
+    "BACKEND_PROCESSAMENTO",
     "COLUNA_DATA",
     "COLUNA_HORA",
     "COLUNAS_PONTO_FLUTUANTE",
     "COLUNAS_NUMEROS_INTEIROS",
     "COLUNAS_CATEGORICAS",
+    "SEPARAR_TABELAS_CLIMA",
+    "COLUNAS_CLIMA",
     "TIPOS_FEATURES_DERIVADAS",
     "METODO_IMPUTACAO_NUM",
     "METODO_IMPUTACAO_CAT",
     "VALOR_CONST_CATEGORICA",
+    "JANELA_INTERPOLACAO_TEMPORAL",
     "CRIAR_FEATURES_TEMPORAIS",
     "CRIAR_COLUNA_MES_ANO",
     "APLICAR_CODIFICACAO",
     "METODO_CODIFICACAO",
+    "ONEHOT_ESPARSO",
     "SUFIXO_CODIFICADAS",
     "APLICAR_NORMALIZACAO",
     "COLUNAS_NORMALIZAR",
     "METODO_NORMALIZACAO",
     "AGRUPAMENTO_NORMALIZAR",
     "SUFIXO_NORMALIZADAS",
+    "COMPACTAR_TIPOS",
+    "TOLERANCIA_COMPACTACAO",
+    "LIMITE_CARDINALIDADE_CATEGORIA",
+    "LIMITE_DERIVA_INCREMENTAL",
+    "N_TRABALHADORES_PIPELINE",
+    "MODO_EXECUCAO_PARALELA",
+    "PARTICIONAR_FEATURES",
+    "ESPECIFICACAO_PIPELINE",
+    "BENCHMARK_TAMANHOS",
+    "BENCHMARK_REPETICOES",
+    "BENCHMARK_LIMIAR_REGRESSAO",
+    "BENCHMARK_BASELINE",
+    "COLUNA_PARTICAO_DADOS",
+    "COMPRESSAO_PARQUET",
     "SALVAR_MAPEAMENTOS",
     "DIRETORIO_ARTEFATOS",
     "TYPE_DICT",
+    "VALIDAR_ESQUEMA",
+    "LIMITES_VALORES",
+    "TAXA_MAXIMA_FALTANTES",
     "MAPA_SENSACAO_TERMICA",
     "RENOMEAR_COLUNAS",
 ]
@@ -9,6 +9,11 @@ Contém funções para:
 from .codificacao import (
     aplicar_codificacao_rotulos,
     aplicar_dummy,
+    categorias_dummy,
+    matriz_esparsa,
+    salvar_vocabulario,
+    carregar_vocabulario,
+    CODIGO_DESCONHECIDO,
 )
 from .criacao_features import (
     calcular_valor_imc,
@@ -22,12 +27,18 @@ from .normalizacao import (
     pick_scaler,
     normalizar,
     SCALERS,
+    NormalizadorIncremental,
 )
 
 __all__ = [
     # Codificação
     "aplicar_codificacao_rotulos",
     "aplicar_dummy",
+    "categorias_dummy",
+    "matriz_esparsa",
+    "salvar_vocabulario",
+    "carregar_vocabulario",
+    "CODIGO_DESCONHECIDO",
     # Features derivadas
     "calcular_valor_imc",
     "imc_classe",
@@ -39,4 +50,5 @@ __all__ = [
     "pick_scaler",
     "normalizar",
     "SCALERS",
+    "NormalizadorIncremental",
 ]
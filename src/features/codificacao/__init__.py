@@ -2,9 +2,16 @@
 Codificacao categorica (label ou one-hot) e mapeamentos.
 """
 from .aplicar_codificacao_rotulos import aplicar_codificacao_rotulos
-from .aplicar_dummy import aplicar_dummy
+from .aplicar_dummy import aplicar_dummy, categorias_dummy, matriz_esparsa
+from .codificar_label import CODIGO_DESCONHECIDO
+from .vocabulario_rotulos import carregar_vocabulario, salvar_vocabulario
 
 __all__ = [
     "aplicar_codificacao_rotulos",
     "aplicar_dummy",
+    "categorias_dummy",
+    "matriz_esparsa",
+    "salvar_vocabulario",
+    "carregar_vocabulario",
+    "CODIGO_DESCONHECIDO",
 ]
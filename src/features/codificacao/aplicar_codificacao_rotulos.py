@@ -1,24 +1,66 @@
 """
 Aplicacao de label encoding.
 """
-from typing import Dict, Iterable, Tuple
+from functools import partial
+from typing import Any, Dict, Iterable, Optional, Tuple
 import pandas as pd
 from .codificar_label import codificar_label
+from ...utils.executor_dag import NoColuna, executar_grafo
+
+
+def _codificar_coluna(
+    df: pd.DataFrame,
+    coluna: str,
+    sufixo: str,
+    vocabulario: Optional[Dict[int, str]] = None,
+    n_buckets_hash: Optional[int] = None,
+) -> Tuple[Dict[str, Any], Dict[int, str]]:
+    categorias = None if vocabulario is None else [vocabulario[c] for c in sorted(vocabulario, key=int)]
+    codigos, mapa = codificar_label(df[coluna], vocabulario=categorias, n_buckets_hash=n_buckets_hash)
+    return {f"{coluna}{sufixo}": codigos.astype("int64")}, mapa
 
 
 def aplicar_codificacao_rotulos(
     df: pd.DataFrame,
     colunas: Iterable[str],
     sufixo: str = "_cod",
+    n_trabalhadores: Optional[int] = 1,
+    modo_execucao: str = "thread",
+    vocabularios: Optional[Dict[str, Dict[int, str]]] = None,
+    buckets_hash: Optional[Dict[str, int]] = None,
 ) -> Tuple[pd.DataFrame, Dict[str, Dict[int, str]]]:
-    """Aplica label encoding nas colunas informadas."""
+    """
+    Aplica label encoding nas colunas informadas.
+
+    Cada coluna é um nó independente do grafo de colunas: todas são
+    codificadas num único nível e gravadas de uma vez; com
+    n_trabalhadores > 1 as colunas são codificadas em paralelo.
+
+    Colunas com vocabulário (mapeamentos de um ajuste anterior, ex.:
+    carregar_vocabulario) mantêm os códigos ajustados e categorias novas
+    recebem CODIGO_DESCONHECIDO; as demais são ajustadas nos dados. Colunas
+    em buckets_hash usam o modo hashing, com prioridade sobre o vocabulário.
+    """
     if not colunas:
         return df, {}
+    vocabularios = vocabularios or {}
+    buckets_hash = buckets_hash or {}
     df = df.copy()
-    mapa_rotulos = {}
-    for col in colunas:
-        if col in df.columns:
-            codigos, mapa = codificar_label(df[col])
-            df[f"{col}{sufixo}"] = codigos.astype("int64")
-            mapa_rotulos[col] = mapa
+    nos = [
+        NoColuna(
+            col,
+            partial(
+                _codificar_coluna,
+                coluna=col,
+                sufixo=sufixo,
+                vocabulario=None if col in buckets_hash else vocabularios.get(col),
+                n_buckets_hash=buckets_hash.get(col),
+            ),
+            (col,),
+            (f"{col}{sufixo}",),
+        )
+        for col in dict.fromkeys(colunas)
+        if col in df.columns
+    ]
+    df, mapa_rotulos = executar_grafo(df, nos, n_trabalhadores=n_trabalhadores, modo=modo_execucao)
     return df, mapa_rotulos
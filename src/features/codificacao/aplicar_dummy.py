@@ -1,8 +1,71 @@
 """
 One-hot encoding.
 """
-from typing import Iterable
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 import pandas as pd
+from scipy import sparse
+
+
+def categorias_dummy(df: pd.DataFrame, colunas: Iterable[str]) -> Dict[str, List]:
+    """
+    Categorias de cada coluna na ordem das colunas de get_dummies.
+
+    Colunas category mantêm todas as categorias declaradas; as demais usam
+    os valores observados ordenados (faltantes não geram coluna).
+    """
+    categorias = {}
+    for coluna in colunas:
+        if coluna not in df.columns:
+            continue
+        serie = df[coluna]
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            categorias[coluna] = serie.cat.categories.tolist()
+        else:
+            categorias[coluna] = pd.factorize(serie, sort=True)[1].tolist()
+    return categorias
+
+
+def _codigos(serie: pd.Series, categorias: Sequence) -> np.ndarray:
+    """Posição de cada valor em categorias (-1 para faltante ou desconhecido)."""
+    return pd.Index(list(categorias), dtype=object).get_indexer(serie.astype(object))
+
+
+def _dummies_com_categorias(
+    df: pd.DataFrame,
+    cols: List[str],
+    categorias: Dict[str, Sequence],
+    dropar_primeiro: bool,
+    prefixos: List[str],
+    prefixo_sep: str,
+    esparso: bool,
+) -> pd.DataFrame:
+    """Monta as dummies a partir das categorias, sem depender dos valores vistos."""
+    blocos = []
+    for coluna, prefixo in zip(cols, prefixos):
+        cats = list(categorias.get(coluna, []))
+        codigos = _codigos(df[coluna], cats)
+        inicio = 1 if dropar_primeiro else 0
+        nomes = [f"{prefixo}{prefixo_sep}{c}" for c in cats[inicio:]]
+        codigos = codigos - inicio
+        linhas = np.flatnonzero(codigos >= 0)
+        matriz = sparse.csc_matrix(
+            (np.ones(len(linhas), dtype=bool), (linhas, codigos[linhas])),
+            shape=(len(df), len(nomes)),
+        )
+        if esparso:
+            bloco = pd.DataFrame(
+                {
+                    nome: pd.arrays.SparseArray.from_spmatrix(matriz[:, [j]])
+                    for j, nome in enumerate(nomes)
+                },
+                index=df.index,
+            )
+        else:
+            bloco = pd.DataFrame(matriz.toarray(), index=df.index, columns=nomes)
+        blocos.append(bloco)
+    return pd.concat([df.drop(columns=cols), *blocos], axis=1)
 
 
 def aplicar_dummy(
@@ -12,17 +75,64 @@ def aplicar_dummy(
     drop_first: bool = None,
     prefixo: str = None,
     prefixo_sep: str = "_",
+    esparso: bool = False,
+    categorias: Optional[Dict[str, Sequence]] = None,
 ) -> pd.DataFrame:
-    """Aplica one-hot encoding com get_dummies."""
+    """
+    Aplica one-hot encoding com get_dummies.
+
+    Com esparso=True as dummies são colunas SparseDtype(bool), que guardam
+    só as posições verdadeiras (útil em colunas de alta cardinalidade). Com
+    categorias (ex.: categorias_dummy do treino), as colunas geradas são
+    exatamente as dessas categorias: valores desconhecidos zeram todas e
+    categorias ausentes nos dados ainda geram coluna.
+    """
     # Compatibilidade: aceita drop_first ou dropar_primeiro
     if drop_first is not None:
         dropar_primeiro = drop_first
-    
+
     cols = [c for c in colunas if c in df.columns]
     if not cols:
         return df
-    
+
     # Usa prefixo se fornecido, senão usa o nome da coluna
     prefix = prefixo if prefixo is not None else cols
-    
-    return pd.get_dummies(df, columns=cols, drop_first=dropar_primeiro, prefix=prefix, prefix_sep=prefixo_sep)
+
+    if categorias is None and not esparso:
+        return pd.get_dummies(df, columns=cols, drop_first=dropar_primeiro, prefix=prefix, prefix_sep=prefixo_sep)
+
+    prefixos = [prefix] * len(cols) if isinstance(prefix, str) else list(prefix)
+    if categorias is None:
+        categorias = categorias_dummy(df, cols)
+    return _dummies_com_categorias(df, cols, categorias, dropar_primeiro, prefixos, prefixo_sep, esparso)
+
+
+def _coluna_csc(serie: pd.Series) -> sparse.csc_matrix:
+    """Coluna como matriz n x 1; esparsas com preenchimento zero não são densificadas."""
+    if isinstance(serie.dtype, pd.SparseDtype) and not serie.sparse.fill_value:
+        valores = serie.array
+        linhas = valores.sp_index.to_int_index().indices
+        return sparse.csc_matrix(
+            (valores.sp_values.astype("float64"), (linhas, np.zeros(len(linhas), dtype=int))),
+            shape=(len(serie), 1),
+        )
+    return sparse.csc_matrix(serie.to_numpy(dtype="float64", na_value=np.nan)[:, None])
+
+
+def matriz_esparsa(
+    df: pd.DataFrame,
+    colunas: Optional[Iterable[str]] = None,
+) -> Tuple[sparse.csr_matrix, List[str]]:
+    """
+    Converte colunas numéricas/booleanas (densas ou esparsas) em matriz CSR.
+
+    Para estimadores que aceitam entrada esparsa (ex.: lineares e árvores do
+    scikit-learn), sem densificar as dummies.
+
+    Returns:
+        Tupla (matriz, nomes_das_colunas)
+    """
+    nomes = list(df.columns if colunas is None else colunas)
+    if not nomes:
+        return sparse.csr_matrix((len(df), 0)), nomes
+    return sparse.hstack([_coluna_csc(df[nome]) for nome in nomes], format="csr"), nomes
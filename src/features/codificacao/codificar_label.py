@@ -1,28 +1,97 @@
 """
 Codificacao label: converte valores categoricos em codigos numericos.
 """
-from typing import Dict, Tuple
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
 import pandas as pd
 
+# Rótulo dos valores faltantes no vocabulário
+FALTANTE = "__faltante__"
+# Código reservado para categorias fora do vocabulário (inferência)
+CODIGO_DESCONHECIDO = -1
+
+
+def _categorias_texto(serie: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Códigos por linha e categorias únicas (texto) em ordem de aparição.
 
-def codificar_label(serie: pd.Series) -> Tuple[pd.Series, Dict[int, str]]:
+    Em dtypes homogêneos fatoriza os valores originais e só converte para
+    texto as categorias únicas (os faltantes são unificados numa segunda
+    fatoração). Colunas object com outros tipos além de texto são
+    convertidas antes, pois 1, 1.0 e True têm o mesmo hash mas textos
+    diferentes.
+    """
+    if serie.dtype == object and pd.api.types.infer_dtype(serie, skipna=True) not in ("string", "empty"):
+        categorias_linha, categorias = pd.factorize(serie.astype("string").fillna(FALTANTE))
+        return categorias_linha, pd.Index(categorias.astype(object), dtype=object)
+    codigos, unicos = pd.factorize(serie, use_na_sentinel=False)
+    texto = pd.Series(unicos, dtype=serie.dtype).astype("string").fillna(FALTANTE)
+    codigos_texto, categorias = pd.factorize(texto)
+    return codigos_texto[codigos], pd.Index(categorias.astype(object), dtype=object)
+
+
+def _hash_categorias(categorias: pd.Index, n_buckets: int) -> np.ndarray:
+    """Bucket estável (siphash de chave fixa) de cada categoria."""
+    if not len(categorias):
+        return np.empty(0, dtype="int64")
+    hashes = pd.util.hash_array(categorias.to_numpy(dtype=object), categorize=False)
+    return (hashes % np.uint64(n_buckets)).astype("int64")
+
+
+def codificar_label(
+    serie: pd.Series,
+    vocabulario: Optional[Sequence[str]] = None,
+    estender: bool = False,
+    n_buckets_hash: Optional[int] = None,
+) -> Tuple[pd.Series, Dict[int, str]]:
     """
     Codifica uma Serie categórica em códigos numéricos.
-    
+
+    Sem vocabulário, os códigos seguem a ordem de aparição das categorias
+    (faltantes viram '__faltante__'). Com vocabulário, cada categoria recebe
+    o código que já tinha; as novas vão para os próximos códigos (estender)
+    ou para CODIGO_DESCONHECIDO. Com n_buckets_hash, o código é o hash do
+    texto da categoria módulo n_buckets_hash, sem vocabulário.
+
     Args:
         serie: Serie com valores categóricos
-        
+        vocabulario: Categorias na ordem dos códigos (ex.: valores do
+            mapeamento inverso de um ajuste anterior)
+        estender: Acrescenta ao vocabulário as categorias novas
+        n_buckets_hash: Número de buckets do modo hashing (colunas de alta
+            cardinalidade)
+
     Returns:
         Tupla (serie_codificada, mapeamento_inverso)
-        onde mapeamento_inverso é {codigo: valor_original}
+        onde mapeamento_inverso é {codigo: valor_original}; no modo hashing,
+        o primeiro valor visto em cada bucket
     """
-    serie_limpa = serie.astype("string").fillna("__faltante__")
-
-    # Mantém a ordem de aparição das categorias para mapeamento estável.
-    valores_unicos = serie_limpa.unique().tolist()
-    mapeamento = {valor: indice for indice, valor in enumerate(valores_unicos)}
-    mapeamento_inverso = {indice: str(valor) for valor, indice in mapeamento.items()}
+    codigos, categorias = _categorias_texto(serie)
 
-    serie_codificada = serie_limpa.map(mapeamento).astype("Int64")
+    if n_buckets_hash is not None:
+        buckets = _hash_categorias(categorias, n_buckets_hash)
+        mapeamento_inverso = {}
+        for bucket, categoria in zip(buckets.tolist(), categorias):
+            mapeamento_inverso.setdefault(bucket, str(categoria))
+        codigos_categoria = buckets
+    elif vocabulario is None:
+        mapeamento_inverso = dict(enumerate(str(c) for c in categorias))
+        codigos_categoria = np.arange(len(categorias))
+    else:
+        conhecidas = pd.Index(list(vocabulario), dtype=object)
+        codigos_categoria = conhecidas.get_indexer(categorias)
+        novas = codigos_categoria < 0
+        if estender and novas.any():
+            codigos_categoria[novas] = len(conhecidas) + np.arange(novas.sum())
+            conhecidas = conhecidas.append(categorias[novas])
+        else:
+            codigos_categoria[novas] = CODIGO_DESCONHECIDO
+        mapeamento_inverso = dict(enumerate(str(c) for c in conhecidas))
 
+    serie_codificada = pd.Series(
+        pd.array(np.asarray(codigos_categoria)[codigos], dtype="Int64"),
+        index=serie.index,
+        name=serie.name,
+    )
     return serie_codificada, mapeamento_inverso
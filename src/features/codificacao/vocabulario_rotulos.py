@@ -0,0 +1,67 @@
+"""
+Persistência dos vocabulários de label encoding.
+
+O vocabulário de cada coluna é gravado como a lista de categorias na ordem
+dos códigos, junto com as colunas em modo hashing, para que a inferência
+use exatamente os códigos do treino.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+VERSAO_VOCABULARIO = 1
+
+
+def salvar_vocabulario(
+    mapeamentos: Dict[str, Dict[int, str]],
+    caminho: Union[str, Path],
+    buckets_hash: Optional[Dict[str, int]] = None,
+) -> Path:
+    """
+    Grava os mapeamentos de aplicar_codificacao_rotulos em JSON.
+
+    Args:
+        mapeamentos: {coluna: {codigo: categoria}}
+        caminho: Arquivo de destino
+        buckets_hash: {coluna: n_buckets} das colunas em modo hashing
+
+    Returns:
+        Caminho gravado
+    """
+    buckets_hash = buckets_hash or {}
+    conteudo: Dict[str, Any] = {
+        "versao": VERSAO_VOCABULARIO,
+        "categorias": {
+            coluna: [inverso[c] for c in sorted(inverso, key=int)]
+            for coluna, inverso in mapeamentos.items()
+            if coluna not in buckets_hash
+        },
+        "buckets_hash": {coluna: int(n) for coluna, n in buckets_hash.items()},
+    }
+    caminho = Path(caminho)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    caminho.write_text(json.dumps(conteudo, ensure_ascii=False, indent=2), encoding="utf-8")
+    return caminho
+
+
+def carregar_vocabulario(
+    caminho: Union[str, Path],
+) -> Tuple[Dict[str, Dict[int, str]], Dict[str, int]]:
+    """
+    Lê um vocabulário gravado por salvar_vocabulario.
+
+    Returns:
+        Tupla (vocabularios, buckets_hash), prontos para
+        aplicar_codificacao_rotulos
+    """
+    conteudo = json.loads(Path(caminho).read_text(encoding="utf-8"))
+    if conteudo.get("versao") != VERSAO_VOCABULARIO:
+        raise ValueError(f"Versão de vocabulário não suportada: {conteudo.get('versao')}")
+    vocabularios = {
+        coluna: dict(enumerate(categorias))
+        for coluna, categorias in conteudo["categorias"].items()
+    }
+    return vocabularios, dict(conteudo.get("buckets_hash", {}))
+
+
+__all__ = ["salvar_vocabulario", "carregar_vocabulario", "VERSAO_VOCABULARIO"]
@@ -5,8 +5,19 @@ from .calcular_valor_imc import calcular_valor_imc
 from .imc_classe import imc_classe
 from .calcular_heat_index import calcular_heat_index
 from .calcular_ponto_orvalho import calcular_ponto_orvalho
-from .calcular_tu_stull import calcular_tu_stull
-from .adicionar_features_derivadas import adicionar_features_derivadas
+from .calcular_tu_stull import (
+    calcular_tu_stull,
+    calcular_tu_stull_vetorizado,
+    dominio_stull,
+    preencher_tu_stull,
+)
+from .calcular_interacoes import calcular_produto_temperatura_umidade, calcular_razao_temperatura_umidade
+from .adicionar_features_derivadas import (
+    FUNCOES_FEATURES_DERIVADAS,
+    adicionar_features_derivadas,
+    colunas_clima,
+    entradas_feature_derivada,
+)
 
 __all__ = [
     "calcular_valor_imc",
@@ -14,5 +25,13 @@ __all__ = [
     "calcular_heat_index",
     "calcular_ponto_orvalho",
     "calcular_tu_stull",
+    "calcular_tu_stull_vetorizado",
+    "dominio_stull",
+    "preencher_tu_stull",
+    "calcular_produto_temperatura_umidade",
+    "calcular_razao_temperatura_umidade",
+    "FUNCOES_FEATURES_DERIVADAS",
     "adicionar_features_derivadas",
+    "colunas_clima",
+    "entradas_feature_derivada",
 ]
@@ -1,53 +1,137 @@
 """
 Adicao de features derivadas.
 """
-from typing import List
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 import pandas as pd
 from .calcular_valor_imc import calcular_valor_imc
 from .imc_classe import imc_classe
 from .calcular_heat_index import calcular_heat_index
 from .calcular_ponto_orvalho import calcular_ponto_orvalho
+from .calcular_interacoes import calcular_produto_temperatura_umidade, calcular_razao_temperatura_umidade
+from .calcular_tu_stull import preencher_tu_stull
+from ...utils.executor_dag import NoColuna, executar_grafo
+
+# Cálculo de cada tipo sobre os valores de uma linha (tu_stull à parte:
+# preenche só os faltantes de tu). t*u e t/u também aceitam Series.
+FUNCOES_FEATURES_DERIVADAS: Dict[str, Callable[..., Any]] = {
+    "imc": calcular_valor_imc,
+    "imc_classe": imc_classe,
+    "heat_index": calcular_heat_index,
+    "dew_point": calcular_ponto_orvalho,
+    "t*u": calcular_produto_temperatura_umidade,
+    "t/u": calcular_razao_temperatura_umidade,
+}
+
+
+def colunas_clima(colunas: Iterable[str]) -> Tuple[str, str]:
+    """Colunas de temperatura e umidade usadas pelas features de clima."""
+    colunas = set(colunas)
+    coluna_temp = "tmedia" if "tmedia" in colunas else "temperatura"
+    coluna_umidade = "ur" if "ur" in colunas else "umidade"
+    return coluna_temp, coluna_umidade
+
+
+def entradas_feature_derivada(tipo: str, coluna_temp: str, coluna_umidade: str) -> Tuple[str, ...]:
+    """Colunas de entrada de FUNCOES_FEATURES_DERIVADAS[tipo], na ordem dos argumentos."""
+    if tipo == "imc":
+        return ("peso", "altura")
+    if tipo == "imc_classe":
+        return ("imc",)
+    return (coluna_temp, coluna_umidade)
+
+
+def _calcular_tipo(
+    df: pd.DataFrame,
+    tipo: str,
+    coluna_temp: str,
+    coluna_umidade: str,
+) -> Tuple[Dict[str, Any], None]:
+    """Calcula as colunas de um tipo de feature derivada."""
+    if tipo == "imc":
+        return {"imc": df.apply(lambda r: calcular_valor_imc(r.get("peso"), r.get("altura")), axis=1)}, None
+    if tipo == "imc_classe":
+        return {"imc_classe": df["imc"].apply(imc_classe)}, None
+    if tipo == "heat_index":
+        return {
+            "heat_index": df.apply(
+                lambda r: calcular_heat_index(r.get(coluna_temp), r.get(coluna_umidade)),
+                axis=1,
+            )
+        }, None
+    if tipo == "dew_point":
+        return {
+            "dew_point": df.apply(
+                lambda r: calcular_ponto_orvalho(r.get(coluna_temp), r.get(coluna_umidade)),
+                axis=1,
+            )
+        }, None
+    if tipo == "tu_stull":
+        return {"tu": preencher_tu_stull(df, "tu", coluna_temp, coluna_umidade)["tu"]}, None
+    if tipo == "t*u":
+        valor_tu = calcular_produto_temperatura_umidade(df[coluna_temp], df[coluna_umidade])
+        return {"t*u": valor_tu, "t_u": valor_tu}, None
+    return {"t/u": calcular_razao_temperatura_umidade(df[coluna_temp], df[coluna_umidade])}, None
+
+
+def _nos_features_derivadas(
+    colunas: pd.Index,
+    tipos: List[str],
+    coluna_temp: str,
+    coluna_umidade: str,
+) -> List[NoColuna]:
+    """Nós do grafo para os tipos aplicáveis às colunas disponíveis."""
+    clima = (coluna_temp, coluna_umidade)
+    tem_clima = set(clima).issubset(colunas)
+    nos = []
+
+    def _no(tipo: str, entradas: Tuple[str, ...], saidas: Tuple[str, ...]) -> None:
+        funcao = partial(_calcular_tipo, tipo=tipo, coluna_temp=coluna_temp, coluna_umidade=coluna_umidade)
+        nos.append(NoColuna(tipo, funcao, entradas, saidas))
+
+    # IMC e classe
+    if "imc" in tipos and {"peso", "altura"}.issubset(colunas):
+        _no("imc", ("peso", "altura"), ("imc",))
+    if "imc_classe" in tipos and ("imc" in colunas or any(no.nome == "imc" for no in nos)):
+        _no("imc_classe", ("imc",), ("imc_classe",))
+
+    # Bulbo úmido (Stull) nos faltantes de tu
+    if "tu_stull" in tipos and tem_clima:
+        _no("tu_stull", clima + (("tu",) if "tu" in colunas else ()), ("tu",))
+
+    # Heat index, dew point e interacoes simples
+    if "heat_index" in tipos and tem_clima:
+        _no("heat_index", clima, ("heat_index",))
+    if "dew_point" in tipos and tem_clima:
+        _no("dew_point", clima, ("dew_point",))
+    if "t*u" in tipos and tem_clima:
+        _no("t*u", clima, ("t*u", "t_u"))
+    if "t/u" in tipos and tem_clima:
+        _no("t/u", clima, ("t/u",))
+    return nos
 
 
 def adicionar_features_derivadas(
     df: pd.DataFrame,
     tipos: List[str],
     sufixo_codificado: str = "_cod",
+    n_trabalhadores: Optional[int] = 1,
+    modo_execucao: str = "thread",
 ) -> pd.DataFrame:
-    """Adiciona features derivadas selecionadas pela lista tipos."""
+    """
+    Adiciona features derivadas selecionadas pela lista tipos.
+
+    Cada tipo é um nó do grafo de colunas (imc_classe depende de imc); com
+    n_trabalhadores > 1 os tipos independentes são calculados em paralelo,
+    com o mesmo resultado da execução sequencial.
+    """
     if not tipos:
         return df
     df = df.copy()
-    coluna_temp = "tmedia" if "tmedia" in df.columns else "temperatura"
-    coluna_umidade = "ur" if "ur" in df.columns else "umidade"
+    coluna_temp, coluna_umidade = colunas_clima(df.columns)
 
-    # IMC e classe
-    if "imc" in tipos and {"peso", "altura"}.issubset(df.columns):
-        df["imc"] = df.apply(lambda r: calcular_valor_imc(r.get("peso"), r.get("altura")), axis=1)
-    if "imc_classe" in tipos and "imc" in df.columns:
-        df["imc_classe"] = df["imc"].apply(imc_classe)
-
-    # Heat index
-    if "heat_index" in tipos and {coluna_temp, coluna_umidade}.issubset(df.columns):
-        df["heat_index"] = df.apply(
-            lambda r: calcular_heat_index(r.get(coluna_temp), r.get(coluna_umidade)),
-            axis=1,
-        )
-
-    # Dew point
-    if "dew_point" in tipos and {coluna_temp, coluna_umidade}.issubset(df.columns):
-        df["dew_point"] = df.apply(
-            lambda r: calcular_ponto_orvalho(r.get(coluna_temp), r.get(coluna_umidade)),
-            axis=1,
-        )
-
-    # Interacoes simples
-    if "t*u" in tipos and {coluna_temp, coluna_umidade}.issubset(df.columns):
-        valor_tu = df[coluna_temp] * df[coluna_umidade]
-        df["t*u"] = valor_tu
-        df["t_u"] = valor_tu
-    if "t/u" in tipos and {coluna_temp, coluna_umidade}.issubset(df.columns):
-        df["t/u"] = df[coluna_temp] / df[coluna_umidade]
+    nos = _nos_features_derivadas(df.columns, tipos, coluna_temp, coluna_umidade)
+    df, _ = executar_grafo(df, nos, n_trabalhadores=n_trabalhadores, modo=modo_execucao)
 
     # Ajusta nomes codificados se necessário
     if sufixo_codificado and "sexo" in df.columns:
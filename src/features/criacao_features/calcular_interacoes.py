@@ -0,0 +1,16 @@
+"""
+Calculo das interacoes temperatura x umidade (t*u e t/u).
+
+Aceitam escalares ou Series; t/u segue a divisao do numpy (divisor zero
+da inf com sinal ou NaN).
+"""
+import numpy as np
+
+
+def calcular_produto_temperatura_umidade(temperatura_c, umidade_relativa):
+    return temperatura_c * umidade_relativa
+
+
+def calcular_razao_temperatura_umidade(temperatura_c, umidade_relativa):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.divide(temperatura_c, umidade_relativa)
@@ -1,9 +1,32 @@
 """
 Calculo da temperatura de bulbo umido (Stull 2011).
 """
+from typing import Tuple
+
 import numpy as np
 import pandas as pd
 
+# Domínio em que a fórmula de Stull foi ajustada (erro < 1 °C)
+FAIXA_TEMPERATURA_STULL: Tuple[float, float] = (-20.0, 50.0)
+FAIXA_UMIDADE_STULL: Tuple[float, float] = (5.0, 99.0)
+
+
+def _como_float(valores) -> np.ndarray:
+    if isinstance(valores, (pd.Series, pd.Index)):
+        return valores.to_numpy(dtype="float64", na_value=np.nan)
+    return np.asarray(valores, dtype="float64")
+
+
+def _stull(temperatura: np.ndarray, umidade_relativa: np.ndarray) -> np.ndarray:
+    """Fórmula de Stull sobre arrays float64 (NaN se alguma entrada faltar)."""
+    return (
+        temperatura * np.arctan(0.151977 * np.sqrt(umidade_relativa + 8.313659))
+        + np.arctan(temperatura + umidade_relativa)
+        - np.arctan(umidade_relativa - 1.676331)
+        + 0.00391838 * (umidade_relativa ** 1.5) * np.arctan(0.023101 * umidade_relativa)
+        - 4.686035
+    )
+
 
 def calcular_tu_stull(temperatura: float, umidade_relativa: float) -> float:
     """Temperatura de bulbo umido (Stull 2011)."""
@@ -16,3 +39,62 @@ def calcular_tu_stull(temperatura: float, umidade_relativa: float) -> float:
         + 0.00391838 * (umidade_relativa ** 1.5) * np.arctan(0.023101 * umidade_relativa)
         - 4.686035
     )
+
+
+def calcular_tu_stull_vetorizado(temperatura, umidade_relativa) -> np.ndarray:
+    """
+    calcular_tu_stull para arrays/Series inteiros, na mesma ordem de operações.
+
+    As funções do numpy sobre arrays usam laços vetorizados (SIMD), que
+    podem diferir do escalar em 1 ulp (|diferença| < 1e-13 nas faixas de
+    temperatura e umidade usadas).
+
+    Faltantes (NaN, pd.NA) em qualquer entrada dão NaN. Não aplica o
+    domínio da fórmula; ver dominio_stull.
+    """
+    temperatura, umidade_relativa = _como_float(temperatura), _como_float(umidade_relativa)
+    with np.errstate(invalid="ignore"):
+        return _stull(temperatura, umidade_relativa)
+
+
+def dominio_stull(temperatura, umidade_relativa) -> np.ndarray:
+    """Máscara das linhas dentro de FAIXA_TEMPERATURA_STULL e FAIXA_UMIDADE_STULL."""
+    temperatura, umidade_relativa = _como_float(temperatura), _como_float(umidade_relativa)
+    with np.errstate(invalid="ignore"):
+        return (
+            (temperatura >= FAIXA_TEMPERATURA_STULL[0])
+            & (temperatura <= FAIXA_TEMPERATURA_STULL[1])
+            & (umidade_relativa >= FAIXA_UMIDADE_STULL[0])
+            & (umidade_relativa <= FAIXA_UMIDADE_STULL[1])
+        )
+
+
+def preencher_tu_stull(
+    df: pd.DataFrame,
+    coluna_tu: str = "tu",
+    coluna_temp: str = "tmedia",
+    coluna_umidade: str = "ur",
+) -> pd.DataFrame:
+    """
+    Preenche os faltantes de coluna_tu com Stull, de uma vez para todas as linhas.
+
+    Só recebem valor as linhas com temperatura e umidade válidas e dentro do
+    domínio da fórmula; as demais (e os valores existentes) ficam como
+    estão. Sem as colunas de entrada, df volta inalterado.
+    """
+    if not {coluna_temp, coluna_umidade}.issubset(df.columns):
+        return df
+    if coluna_tu in df.columns:
+        atual = df[coluna_tu].to_numpy(dtype="float64", na_value=np.nan)
+    else:
+        atual = np.full(len(df), np.nan)
+    preencher = np.isnan(atual) & dominio_stull(df[coluna_temp], df[coluna_umidade])
+    df = df.copy()
+    if preencher.any():
+        atual = atual.copy()
+        atual[preencher] = calcular_tu_stull_vetorizado(
+            df[coluna_temp].to_numpy(dtype="float64", na_value=np.nan)[preencher],
+            df[coluna_umidade].to_numpy(dtype="float64", na_value=np.nan)[preencher],
+        )
+    df[coluna_tu] = atual
+    return df
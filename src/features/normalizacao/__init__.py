@@ -3,9 +3,11 @@ Normalização de dados numéricos.
 """
 from .normalizar import normalizar
 from .definir_escalar import pick_scaler, SCALERS
+from .normalizador_incremental import NormalizadorIncremental
 
 __all__ = [
     "normalizar",
     "pick_scaler",
     "SCALERS",
+    "NormalizadorIncremental",
 ]
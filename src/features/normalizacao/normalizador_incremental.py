@@ -0,0 +1,223 @@
+"""
+Normalizacao incremental por grupo com estatisticas mesclaveis (Welford/Chan).
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+_ESTATISTICAS = ("contagem", "media", "m2", "minimo", "maximo")
+
+
+def _estatisticas_lote(df: pd.DataFrame, cols: List[str], agrupamento: str) -> Dict[str, pd.DataFrame]:
+    """Contagem, media, M2, min e max por grupo de um lote (um groupby por estatistica)."""
+    valores = pd.DataFrame(
+        df[cols].to_numpy(dtype="float64", na_value=np.nan), columns=cols, index=df.index
+    )
+    agrupado = valores.groupby(df[agrupamento])
+    contagem = agrupado.count().astype("float64")
+    media = agrupado.mean()
+    m2 = (agrupado.var(ddof=0) * contagem).fillna(0.0)
+    return {
+        "contagem": contagem,
+        "media": media,
+        "m2": m2,
+        "minimo": agrupado.min(),
+        "maximo": agrupado.max(),
+    }
+
+
+def _mesclar(a: Dict[str, pd.DataFrame], b: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """Combina estatisticas de duas particoes (formula paralela de Chan)."""
+    indice = a["contagem"].index.union(b["contagem"].index)
+    colunas = a["contagem"].columns
+
+    def _alinhar(estat: Dict[str, pd.DataFrame], nome: str, preenchimento: float) -> np.ndarray:
+        return estat[nome].reindex(index=indice, columns=colunas).to_numpy(dtype="float64", na_value=preenchimento)
+
+    n_a, n_b = _alinhar(a, "contagem", 0.0), _alinhar(b, "contagem", 0.0)
+    n_a, n_b = np.nan_to_num(n_a), np.nan_to_num(n_b)
+    media_a = np.nan_to_num(_alinhar(a, "media", 0.0))
+    media_b = np.nan_to_num(_alinhar(b, "media", 0.0))
+    m2_a = np.nan_to_num(_alinhar(a, "m2", 0.0))
+    m2_b = np.nan_to_num(_alinhar(b, "m2", 0.0))
+
+    n = n_a + n_b
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = media_b - media_a
+        peso_b = np.where(n > 0, n_b / n, 0.0)
+        media = media_a + delta * peso_b
+        m2 = m2_a + m2_b + np.where(n > 0, delta**2 * n_a * n_b / n, 0.0)
+    media[n == 0] = np.nan
+
+    def _quadro(valores: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(valores, index=indice, columns=colunas)
+
+    return {
+        "contagem": _quadro(n),
+        "media": _quadro(media),
+        "m2": _quadro(m2),
+        "minimo": _quadro(np.fmin(_alinhar(a, "minimo", np.nan), _alinhar(b, "minimo", np.nan))),
+        "maximo": _quadro(np.fmax(_alinhar(a, "maximo", np.nan), _alinhar(b, "maximo", np.nan))),
+    }
+
+
+class NormalizadorIncremental:
+    """
+    Normalizador 'standard' por grupo que aprende incrementalmente.
+
+    Mantem, por grupo e coluna, contagem, media, M2 (soma dos quadrados dos
+    desvios), minimo e maximo. Novas linhas atualizam apenas os grupos em
+    que aparecem e estados de particoes diferentes podem ser mesclados; o
+    resultado coincide com um ajuste completo de normalizar(metodo='standard')
+    dentro da tolerancia de ponto flutuante.
+
+    Example:
+        >>> norm = NormalizadorIncremental(['tmedia', 'ur'], agrupamento='mes-ano')
+        >>> norm.atualizar(df_historico)
+        >>> afetados = norm.atualizar(df_novo_mes)
+        >>> df_novo_norm = norm.transformar(df_novo_mes)
+    """
+
+    def __init__(
+        self,
+        colunas: Optional[Iterable[str]] = None,
+        agrupamento: str = "mes-ano",
+        sufixo: str = "_norm",
+    ):
+        self.colunas: Optional[List[str]] = list(colunas) if colunas is not None else None
+        self.agrupamento = agrupamento
+        self.sufixo = sufixo
+        self._estatisticas: Optional[Dict[str, pd.DataFrame]] = None
+
+    @property
+    def grupos(self) -> List[Any]:
+        if self._estatisticas is None:
+            return []
+        return self._estatisticas["contagem"].index.tolist()
+
+    def _resolver_colunas(self, df: pd.DataFrame) -> List[str]:
+        if self.colunas is None:
+            self.colunas = [
+                c for c in df.select_dtypes(include=["number"]).columns if c != self.agrupamento
+            ]
+        return self.colunas
+
+    def atualizar(self, df: pd.DataFrame, substituir: bool = False) -> List[Any]:
+        """
+        Incorpora novas linhas ao estado.
+
+        Args:
+            df: Linhas novas
+            substituir: Se True, df traz todas as linhas dos grupos presentes
+                (ex.: grupos reprocessados) e as estatisticas desses grupos
+                sao recalculadas em vez de mescladas
+
+        Returns:
+            Lista dos grupos cujas estatisticas mudaram
+        """
+        cols = self._resolver_colunas(df)
+        lote = _estatisticas_lote(df, cols, self.agrupamento)
+        grupos = lote["contagem"].index
+        if self._estatisticas is None:
+            self._estatisticas = lote
+        else:
+            atual = self._estatisticas
+            if substituir:
+                atual = {nome: v.drop(index=grupos, errors="ignore") for nome, v in atual.items()}
+            self._estatisticas = _mesclar(atual, lote)
+        return grupos.tolist()
+
+    def mesclar(self, outro: "NormalizadorIncremental") -> "NormalizadorIncremental":
+        """Mescla o estado de outra particao (mesmas colunas) neste normalizador."""
+        if outro._estatisticas is None:
+            return self
+        if self._estatisticas is None:
+            self.colunas = list(outro.colunas)
+            self._estatisticas = {k: v.copy() for k, v in outro._estatisticas.items()}
+            return self
+        if list(outro.colunas) != list(self.colunas):
+            raise ValueError("Normalizadores com colunas diferentes nao podem ser mesclados")
+        self._estatisticas = _mesclar(self._estatisticas, outro._estatisticas)
+        return self
+
+    def medias_desvios(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Retorna (medias, desvios ddof=1) por grupo x coluna."""
+        if self._estatisticas is None:
+            raise ValueError("Normalizador ainda nao foi atualizado com dados")
+        n = self._estatisticas["contagem"]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            desvios = np.sqrt(self._estatisticas["m2"] / (n - 1)).where(n > 1)
+        return self._estatisticas["media"], desvios
+
+    def scalers(self) -> Dict[Any, Dict[str, Dict[str, float]]]:
+        """Informacoes por grupo no formato de normalizar: {grupo: {coluna: {mean, std}}}."""
+        medias, desvios = self.medias_desvios()
+        info: Dict[Any, Dict[str, Dict[str, float]]] = {}
+        for grupo, linha_media, linha_desvio in zip(
+            medias.index.tolist(), medias.to_numpy(), desvios.to_numpy()
+        ):
+            info[grupo] = {
+                col: {"mean": float(m), "std": float(d) if not np.isnan(d) else 0.0}
+                for col, m, d in zip(self.colunas, linha_media, linha_desvio)
+            }
+        return info
+
+    def transformar(self, df: pd.DataFrame, grupos: Optional[Iterable[Any]] = None) -> pd.DataFrame:
+        """
+        Aplica as estatisticas atuais (custo proporcional as linhas recebidas).
+
+        Args:
+            df: Linhas a normalizar
+            grupos: Se informado, normaliza apenas linhas desses grupos (ex.:
+                retorno de atualizar); as demais ficam com NaN
+
+        Returns:
+            Copia de df com colunas normalizadas (coluna + sufixo)
+        """
+        medias, desvios = self.medias_desvios()
+        df_out = df.copy()
+        codigos = medias.index.get_indexer(df[self.agrupamento])
+        if grupos is not None:
+            permitidos = medias.index.get_indexer(pd.Index(list(grupos)))
+            codigos = np.where(np.isin(codigos, permitidos), codigos, -1)
+        validos = codigos >= 0
+        valores = df[self.colunas].to_numpy(dtype="float64", na_value=np.nan)
+        media_linha = medias.to_numpy()[codigos[validos]]
+        desvio_linha = desvios.to_numpy()[codigos[validos]]
+        degenerado = np.isnan(desvio_linha) | (desvio_linha == 0)
+        saida = np.full(valores.shape, np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            saida[validos] = np.where(
+                degenerado, 0.0, (valores[validos] - media_linha) / desvio_linha
+            )
+        novas = pd.DataFrame(
+            saida, index=df.index, columns=[f"{c}{self.sufixo}" for c in self.colunas]
+        )
+        df_out[list(novas.columns)] = novas
+        return df_out
+
+    def para_dict(self) -> Dict[str, Any]:
+        """Serializa o estado (para salvar como artefato)."""
+        estado = {
+            "colunas": self.colunas,
+            "agrupamento": self.agrupamento,
+            "sufixo": self.sufixo,
+        }
+        if self._estatisticas is not None:
+            estado["grupos"] = self.grupos
+            for nome in _ESTATISTICAS:
+                estado[nome] = self._estatisticas[nome].to_numpy().tolist()
+        return estado
+
+    @classmethod
+    def de_dict(cls, estado: Dict[str, Any]) -> "NormalizadorIncremental":
+        """Reconstroi o normalizador a partir de para_dict."""
+        norm = cls(estado["colunas"], estado["agrupamento"], estado["sufixo"])
+        if "grupos" in estado:
+            indice = pd.Index(estado["grupos"])
+            norm._estatisticas = {
+                nome: pd.DataFrame(estado[nome], index=indice, columns=norm.colunas, dtype="float64")
+                for nome in _ESTATISTICAS
+            }
+        return norm
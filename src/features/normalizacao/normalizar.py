@@ -1,9 +1,52 @@
 """
 Normalizacao de colunas numericas.
 """
-from typing import Any, Dict, Iterable, Optional, Union
+from functools import partial
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 from .definir_escalar import pick_scaler
+from .normalizar_por_grupo import normalizar_por_grupo
+from ...utils.executor_dag import NoColuna, executar_grafo, resolver_trabalhadores
+
+
+def _normalizar_coluna(
+    df: pd.DataFrame,
+    coluna: str,
+    metodo: str,
+    agrupamento: str,
+) -> Tuple[Dict[str, Any], Tuple[Dict[str, Any], Dict[Any, Any], np.ndarray]]:
+    # Nada é gravado pelo executor: as saídas voltam no artefato
+    return {}, normalizar_por_grupo(df, [coluna], metodo, agrupamento, scaler_por_coluna=True)
+
+
+def _normalizar_colunas_em_paralelo(
+    df: pd.DataFrame,
+    metodos: Dict[str, str],
+    agrupamento: str,
+    n_trabalhadores: Optional[int],
+    modo_execucao: str,
+) -> Tuple[Dict[str, Any], Dict[Any, Dict[str, Any]], np.ndarray]:
+    """normalizar_por_grupo coluna a coluna, com scalers em {grupo: {coluna: info}}."""
+    nos = [
+        NoColuna(
+            col,
+            partial(_normalizar_coluna, coluna=col, metodo=metodo_col, agrupamento=agrupamento),
+            (col, agrupamento),
+            (),
+        )
+        for col, metodo_col in metodos.items()
+    ]
+    _, resultados = executar_grafo(df, nos, n_trabalhadores=n_trabalhadores, modo=modo_execucao)
+    saidas: Dict[str, Any] = {}
+    scalers: Dict[Any, Dict[str, Any]] = {}
+    com_grupo = None
+    for col in metodos:
+        saidas_col, scalers_col, com_grupo = resultados[col]
+        saidas.update(saidas_col)
+        for grupo, infos in scalers_col.items():
+            scalers.setdefault(grupo, {}).update(infos)
+    return saidas, scalers, com_grupo
 
 
 def normalizar(
@@ -12,6 +55,9 @@ def normalizar(
     metodo: str = "standard",
     agrupamento: Optional[str] = None,
     sufixo: str = "",
+    vetorizado: bool = True,
+    n_trabalhadores: Optional[int] = 1,
+    modo_execucao: str = "thread",
 ) -> tuple[pd.DataFrame, Any]:
     """
     Normaliza colunas numericas; se agrupamento for informado, aplica por grupo.
@@ -25,6 +71,11 @@ def normalizar(
         metodo: Método padrão de normalização ('standard', 'minmax', 'robust')
         agrupamento: Coluna para agrupar antes de normalizar
         sufixo: Sufixo para colunas normalizadas
+        vetorizado: Com agrupamento, usa normalizar_por_grupo (estatísticas de
+            todos os grupos em uma passada); False mantém o laço por grupo
+        n_trabalhadores: No caminho vetorizado, normaliza colunas em paralelo
+            (dicionário ou 'standard' com mais de uma coluna); 1 é sequencial
+        modo_execucao: 'thread' ou 'processo' (ver utils.executor_dag)
         
     Returns:
         Tupla (DataFrame normalizado, scaler(s) usados)
@@ -62,6 +113,59 @@ def normalizar(
         )
         return transformado, scaler
 
+    def _gravar_saidas(saidas: Dict[str, Any], com_grupo: np.ndarray) -> None:
+        novas = {}
+        for col, valores in saidas.items():
+            col_out = _coluna_saida(col)
+            if col_out in df_norm.columns:
+                # Linhas sem grupo mantêm o valor existente (como no laço por grupo)
+                if not com_grupo.all():
+                    atual = df_norm[col_out].to_numpy(dtype="float64", na_value=np.nan)
+                    valores = np.where(com_grupo, np.asarray(valores, dtype="float64"), atual)
+                df_norm[col_out] = valores
+            else:
+                novas[col_out] = valores
+        if novas:
+            df_novas = pd.DataFrame(novas, index=df_norm.index)
+            df_norm[list(novas)] = df_novas
+
+    usar_vetorizado = vetorizado and agrupamento and agrupamento in df_norm.columns
+    paralelo = usar_vetorizado and resolver_trabalhadores(n_trabalhadores) > 1
+
+    if isinstance(colunas, dict) and paralelo:
+        metodos = {col: metodo_col for col, metodo_col in colunas.items() if col in df_norm.columns}
+        if not metodos:
+            return df_norm, {}
+        saidas, scalers_dict, com_grupo = _normalizar_colunas_em_paralelo(
+            df_norm, metodos, agrupamento, n_trabalhadores, modo_execucao
+        )
+        _gravar_saidas(saidas, com_grupo)
+        return df_norm, scalers_dict
+
+    if isinstance(colunas, dict) and usar_vetorizado:
+        scalers_dict = {}
+        cols_por_metodo: Dict[str, list[str]] = {}
+        for col, metodo_col in colunas.items():
+            if col in df_norm.columns:
+                cols_por_metodo.setdefault(metodo_col, []).append(col)
+        saidas_dict: Dict[str, np.ndarray] = {}
+        com_grupo = None
+        for metodo_col, cols_metodo in cols_por_metodo.items():
+            saidas, scalers_metodo, com_grupo = normalizar_por_grupo(
+                df_norm, cols_metodo, metodo_col, agrupamento, scaler_por_coluna=True
+            )
+            saidas_dict.update(saidas)
+            for grupo, infos in scalers_metodo.items():
+                scalers_dict.setdefault(grupo, {}).update(infos)
+        if com_grupo is not None:
+            # Mantém a ordem de colunas e de chaves do dicionário original
+            ordem = [c for c in colunas if c in saidas_dict]
+            _gravar_saidas({c: saidas_dict[c] for c in ordem}, com_grupo)
+            scalers_dict = {
+                grupo: {c: infos[c] for c in ordem} for grupo, infos in scalers_dict.items()
+            }
+        return df_norm, scalers_dict
+
     if isinstance(colunas, dict):
         scalers_dict: Dict[Any, Any] = {} if (agrupamento and agrupamento in df_norm.columns) else {}
         for col, metodo_col in colunas.items():
@@ -85,6 +189,18 @@ def normalizar(
     if not cols:
         return df_norm, None
 
+    if paralelo and len(cols) > 1 and (metodo or "standard").lower() == "standard":
+        saidas, scalers_grupo, com_grupo = _normalizar_colunas_em_paralelo(
+            df_norm, {col: metodo for col in cols}, agrupamento, n_trabalhadores, modo_execucao
+        )
+        _gravar_saidas(saidas, com_grupo)
+        return df_norm, scalers_grupo
+
+    if usar_vetorizado:
+        saidas, scalers_grupo, com_grupo = normalizar_por_grupo(df_norm, cols, metodo, agrupamento)
+        _gravar_saidas(saidas, com_grupo)
+        return df_norm, scalers_grupo
+
     if agrupamento and agrupamento in df_norm.columns:
         scalers_grupo: Dict[Any, Any] = {}
         for grupo, idx in df_norm.groupby(agrupamento).groups.items():
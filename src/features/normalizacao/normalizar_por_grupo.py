@@ -0,0 +1,119 @@
+"""
+Normalizacao por grupo vetorizada (sem fatiar/escrever com .loc por grupo).
+"""
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .definir_escalar import pick_scaler
+
+
+def codificar_grupos(df: pd.DataFrame, agrupamento: str) -> Tuple[pd.Index, np.ndarray]:
+    """
+    Retorna (chaves_ordenadas, codigos) do agrupamento.
+
+    As chaves seguem a mesma ordem de df.groupby(agrupamento).groups; linhas
+    com chave nula recebem codigo -1.
+    """
+    chaves = pd.Index(list(df.groupby(agrupamento).groups.keys()))
+    codigos = chaves.get_indexer(df[agrupamento])
+    return chaves, codigos
+
+
+def _info_padrao(media: float, desvio: float) -> Dict[str, float]:
+    return {"mean": float(media), "std": float(desvio) if not pd.isna(desvio) else 0.0}
+
+
+def _padronizar(
+    valores: np.ndarray,
+    codigos: np.ndarray,
+    n_grupos: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Media/desvio (ddof=1) por grupo em uma passada e aplicacao por broadcast."""
+    quadro = pd.DataFrame(valores)
+    agrupado = quadro.groupby(codigos)
+    medias = agrupado.mean().reindex(range(n_grupos)).to_numpy()
+    desvios = agrupado.std(ddof=1).reindex(range(n_grupos)).to_numpy()
+
+    saida = np.full(valores.shape, np.nan)
+    com_grupo = codigos >= 0
+    cods = codigos[com_grupo]
+    media_linha = medias[cods]
+    desvio_linha = desvios[cods]
+    degenerado = np.isnan(desvio_linha) | (desvio_linha == 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        padronizado = (valores[com_grupo] - media_linha) / desvio_linha
+    # Grupo sem variancia (ou com uma linha): coluna inteira vira 0.0
+    saida[com_grupo] = np.where(degenerado, 0.0, padronizado)
+    return saida, medias, desvios
+
+
+def normalizar_por_grupo(
+    df: pd.DataFrame,
+    cols: List[str],
+    metodo: str,
+    agrupamento: str,
+    scaler_por_coluna: bool = False,
+) -> Tuple[Dict[str, Any], Dict[Any, Any], np.ndarray]:
+    """
+    Normaliza colunas por grupo sem laços de escrita por grupo.
+
+    'standard' calcula media/desvio de todos os grupos e colunas em um unico
+    groupby e aplica por broadcast. Os demais metodos (scalers sklearn) ainda
+    ajustam um scaler por grupo, mas sobre segmentos pre-calculados e com uma
+    unica escrita por coluna.
+
+    Args:
+        df: DataFrame de entrada
+        cols: Colunas a normalizar
+        metodo: Metodo de normalizacao ('standard', 'minmax', ...)
+        agrupamento: Coluna de agrupamento
+        scaler_por_coluna: Se True, informacoes/scalers ficam em
+            {grupo: {coluna: info}} (formato do caminho por dicionario)
+
+    Returns:
+        Tupla (saidas, scalers, com_grupo) onde saidas mapeia coluna -> valores
+        normalizados (NaN nas linhas sem grupo), scalers segue o formato de
+        normalizar e com_grupo marca as linhas que pertencem a algum grupo
+    """
+    chaves, codigos = codificar_grupos(df, agrupamento)
+    com_grupo = codigos >= 0
+    scalers: Dict[Any, Any] = {}
+
+    if (metodo or "standard").lower() == "standard":
+        valores = df[cols].to_numpy(dtype="float64", na_value=np.nan)
+        saida, medias, desvios = _padronizar(valores, codigos, len(chaves))
+        for g, chave in enumerate(chaves.tolist()):
+            infos = {col: _info_padrao(medias[g, j], desvios[g, j]) for j, col in enumerate(cols)}
+            if not scaler_por_coluna and len(cols) == 1:
+                scalers[chave] = infos[cols[0]]
+            else:
+                scalers[chave] = infos
+        saidas = {}
+        for j, col in enumerate(cols):
+            # Aritmética pandas em inteiros/floats nullable resulta em Float64
+            if pd.api.types.is_extension_array_dtype(df[col].dtype):
+                saidas[col] = pd.array(saida[:, j], dtype="Float64")
+            else:
+                saidas[col] = saida[:, j]
+        return saidas, scalers, com_grupo
+
+    saida = np.full((len(df), len(cols)), np.nan)
+    ordem = np.argsort(codigos, kind="stable")
+    limites = np.searchsorted(codigos[ordem], np.arange(len(chaves) + 1))
+    quadro = df[cols]
+    for g, chave in enumerate(chaves.tolist()):
+        posicoes = ordem[limites[g]:limites[g + 1]]
+        bloco = quadro.iloc[posicoes]
+        if scaler_por_coluna:
+            scalers[chave] = {}
+            for j, col in enumerate(cols):
+                scaler = pick_scaler(metodo)
+                saida[posicoes, j] = scaler.fit_transform(bloco[[col]])[:, 0]
+                scalers[chave][col] = scaler
+        else:
+            scaler = pick_scaler(metodo)
+            saida[posicoes] = scaler.fit_transform(bloco)
+            scalers[chave] = scaler
+    return {col: saida[:, j] for j, col in enumerate(cols)}, scalers, com_grupo
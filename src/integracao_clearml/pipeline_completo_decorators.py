@@ -23,6 +23,8 @@ from clearml import Task, Dataset, OutputModel, PipelineDecorator
 from src.pipelines.pipeline_processamento import executar_pipeline_processamento
 from src.pipelines.pipeline_features import executar_pipeline_features
 from src.pipelines.pipeline_treinamento_unified import treinar_pipeline_completo
+from src.utils.io import carregar_dados_etapa, salvar_dados_etapa
+from config import config_custom as config
 
 
 # ============================================================================
@@ -175,10 +177,17 @@ def component_pipeline_processamento(
     # Salvar e upload
     temp_path = Path("./temp_clearml")
     temp_path.mkdir(exist_ok=True)
-    temp_file = temp_path / "dados_processados.csv"
-    df_processado.to_csv(temp_file, index=False)
+    # Parquet particionado por ano/mes-ano (leitura com poda de particoes);
+    # CSV unico quando a coluna de particao falta ou tem nulos
+    temp_dir = temp_path / "dados_processados"
+    salvar_dados_etapa(
+        df_processado,
+        str(temp_dir),
+        coluna_particao=config.COLUNA_PARTICAO_DADOS,
+        compressao=config.COMPRESSAO_PARQUET,
+    )
     
-    dataset_processado.add_files(str(temp_file))
+    dataset_processado.add_files(str(temp_dir), dataset_path="dados_processados")
     dataset_processado.upload()
     dataset_processado.finalize()
     
@@ -221,9 +230,14 @@ def component_pipeline_features(
     dataset_proc = Dataset.get(dataset_id=dataset_processado_id)
     local_path = dataset_proc.get_local_copy()
     
-    # Carregar dados
-    csv_files = list(Path(local_path).glob("*.csv"))
-    df_proc = pd.read_csv(csv_files[0])
+    # Carregar dados (Parquet particionado; CSV em datasets anteriores).
+    # O Parquet volta agrupado por mes-ano: reordena pela data, como no CSV
+    diretorio_dados = Path(local_path) / "dados_processados"
+    if diretorio_dados.is_dir():
+        df_proc = carregar_dados_etapa(str(diretorio_dados), coluna_ordem=config.COLUNA_DATA)
+    else:
+        csv_files = list(Path(local_path).glob("*.csv"))
+        df_proc = pd.read_csv(csv_files[0])
     print(f"Dados processados carregados: {df_proc.shape}")
     
     # Executar pipeline de features
@@ -259,10 +273,17 @@ def component_pipeline_features(
     # Salvar e upload
     temp_path = Path("./temp_clearml")
     temp_path.mkdir(exist_ok=True)
-    temp_file = temp_path / "dados_features.csv"
-    df_feat.to_csv(temp_file, index=False)
+    # Parquet particionado por ano/mes-ano (leitura com poda de particoes);
+    # CSV unico quando a coluna de particao falta ou tem nulos
+    temp_dir = temp_path / "dados_features"
+    salvar_dados_etapa(
+        df_feat,
+        str(temp_dir),
+        coluna_particao=config.COLUNA_PARTICAO_DADOS,
+        compressao=config.COMPRESSAO_PARQUET,
+    )
     
-    dataset_features.add_files(str(temp_file))
+    dataset_features.add_files(str(temp_dir), dataset_path="dados_features")
     dataset_features.upload()
     dataset_features.finalize()
     
@@ -316,9 +337,14 @@ def component_pipeline_treinamento(
     dataset_feat = Dataset.get(dataset_id=dataset_features_id)
     local_path = dataset_feat.get_local_copy()
     
-    # Carregar dados
-    csv_files = list(Path(local_path).glob("*.csv"))
-    df_feat = pd.read_csv(csv_files[0])
+    # Carregar dados (Parquet particionado; CSV em datasets anteriores).
+    # O Parquet volta agrupado por mes-ano: reordena pela data, como no CSV
+    diretorio_dados = Path(local_path) / "dados_features"
+    if diretorio_dados.is_dir():
+        df_feat = carregar_dados_etapa(str(diretorio_dados), coluna_ordem=config.COLUNA_DATA)
+    else:
+        csv_files = list(Path(local_path).glob("*.csv"))
+        df_feat = pd.read_csv(csv_files[0])
     print(f"Dados com features carregados: {df_feat.shape}")
     
     # Remover NAs
@@ -5,12 +5,39 @@ Pipelines disponíveis:
 - pipeline_processamento: Apenas processamento base (limpeza, conversão, imputação)
 - pipeline_features: Apenas engenharia de features (codificação, normalização, derivadas)
 - pipeline_completo: Processamento + Features em uma única chamada
+- pipeline_incremental: Pipeline completo processando só as linhas novas (checkpoint)
 - pipeline_treinamento: Pipeline completo de treinamento de modelos
+
+PerfilEtapas mede tempo, CPU, memória, linhas e colunas de cada etapa
+(passe perfil=PerfilEtapas() aos pipelines e salve em JSON ou Chrome trace).
+medir_escalabilidade_features mede o pipeline de features particionado por
+mes-ano (particionar=True) em função do número de processos.
+
+compilar_plano compila a especificação YAML do pipeline
+(config.ESPECIFICACAO_PIPELINE) em um plano imprimível, com custos
+estimados, que executar_plano roda. Com features_modelo (gravado no
+treino), executar_pipeline_completo só calcula o que alimenta o modelo.
+compilar_transformador_linha gera, a partir do ajuste no histórico, a
+função que leva um registro bruto (dict ou linha NumPy) ao vetor do modelo.
 """
 
-from .pipeline_processamento import executar_pipeline_processamento
-from .pipeline_features import executar_pipeline_features
+from .pipeline_processamento import (
+    executar_pipeline_processamento,
+    executar_pipeline_processamento_tabelas,
+)
+from .pipeline_features import executar_pipeline_features, executar_pipeline_features_tabelas
 from .pipeline_completo import executar_pipeline_completo
+from .pipeline_incremental import executar_pipeline_incremental
+from .perfil_etapas import PerfilEtapas
+from .execucao_particionada import medir_escalabilidade_features
+from .plano_pipeline import (
+    carregar_especificacao,
+    compilar_plano,
+    especificacao_de_parametros,
+    executar_especificacao,
+    executar_plano,
+)
+from .transformador_linha import TransformadorLinha, compilar_transformador_linha
 
 # Pipeline unificado de treinamento (recomendado)
 from .pipeline_treinamento_unified import (
@@ -20,8 +47,20 @@ from .pipeline_treinamento_unified import (
 
 __all__ = [
     'executar_pipeline_processamento',
+    'executar_pipeline_processamento_tabelas',
     'executar_pipeline_features',
+    'executar_pipeline_features_tabelas',
     'executar_pipeline_completo',
+    'executar_pipeline_incremental',
+    'PerfilEtapas',
+    'medir_escalabilidade_features',
+    'carregar_especificacao',
+    'compilar_plano',
+    'especificacao_de_parametros',
+    'executar_plano',
+    'executar_especificacao',
+    'TransformadorLinha',
+    'compilar_transformador_linha',
     'treinar_pipeline_completo',
     'treinar_rapido',
 ]
@@ -0,0 +1,253 @@
+"""
+Cache local em disco para resultados de etapas dos pipelines.
+
+A chave de cada etapa combina a impressão digital da entrada (hash dos
+buffers das colunas, ou a chave da etapa anterior), os parâmetros da etapa e
+a versão do código (hash dos fontes dos quais a etapa depende). Resultados
+são gravados com joblib (DataFrames e artefatos como scalers, sem perda de
+dtypes) e o diretório tem tamanho máximo com descarte LRU por mtime.
+
+Variáveis de ambiente:
+    CACHE_ETAPAS_ATIVO: "1"/"true" ativa o cache (padrão: desativado)
+    CACHE_ETAPAS_DIR: diretório do cache (padrão: .cache/etapas)
+    CACHE_ETAPAS_LIMITE_MB: tamanho máximo do diretório em MB (padrão: 1024)
+"""
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from ..utils.io.cache_disco import aplicar_limite_lru, gravar_atomico
+
+DIRETORIO_CACHE_ETAPAS_PADRAO = os.path.join(".cache", "etapas")
+LIMITE_CACHE_ETAPAS_MB_PADRAO = 1024
+
+# Fontes das quais cada etapa depende (relativos à raiz do projeto)
+FONTES_ETAPAS = {
+    "processamento": (
+        "config/config_custom.py",
+        "src/processamento",
+        "src/features/criacao_features/calcular_tu_stull.py",
+        "src/pipelines/pipeline_processamento.py",
+        "src/utils/executor_dag.py",
+    ),
+    "features": (
+        "config/config_custom.py",
+        "src/features",
+        "src/processamento/memoria",
+        "src/processamento/tabelas",
+        "src/pipelines/pipeline_features.py",
+        "src/pipelines/execucao_particionada.py",
+        "src/utils/executor_dag.py",
+        "src/utils/memoria_compartilhada.py",
+    ),
+}
+
+# Incrementar quando o formato gravado mudar de forma incompatível
+_VERSAO_CACHE = "1"
+_RAIZ_PROJETO = Path(__file__).resolve().parents[2]
+
+
+def cache_etapas_ativo(usar_cache: Optional[bool] = None) -> bool:
+    """Resolve se o cache de etapas deve ser usado (argumento explícito tem prioridade)."""
+    if usar_cache is not None:
+        return bool(usar_cache)
+    valor = os.environ.get("CACHE_ETAPAS_ATIVO", "")
+    return valor.strip().lower() in {"1", "true", "sim", "yes", "on"}
+
+
+def diretorio_cache_etapas(diretorio: Optional[str] = None) -> Path:
+    """Retorna o diretório do cache (argumento > ambiente > padrão)."""
+    return Path(diretorio or os.environ.get("CACHE_ETAPAS_DIR") or DIRETORIO_CACHE_ETAPAS_PADRAO)
+
+
+def _limite_bytes(limite_mb: Optional[float] = None) -> int:
+    if limite_mb is None:
+        limite_mb = float(os.environ.get("CACHE_ETAPAS_LIMITE_MB", LIMITE_CACHE_ETAPAS_MB_PADRAO))
+    return int(limite_mb * 1024 * 1024)
+
+
+def impressao_digital(df: pd.DataFrame) -> str:
+    """
+    Hash rápido do conteúdo de um DataFrame.
+
+    Colunas numéricas/datetime NumPy entram pelo buffer de memória (sem
+    conversão); as demais (texto, extensões nullable, category) pelo hash
+    vetorizado do pandas. Nomes, dtypes e índice fazem parte do hash.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{df.shape}|".encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df.index, index=False).to_numpy().tobytes())
+    for nome, serie in df.items():
+        digest.update(f"|{nome}|{serie.dtype}|".encode("utf-8"))
+        if isinstance(serie.dtype, np.dtype) and serie.dtype.kind in "biufcmM":
+            digest.update(np.ascontiguousarray(serie.to_numpy()).view(np.uint8).data)
+        else:
+            digest.update(pd.util.hash_pandas_object(serie, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _hash_fontes(assinatura: Tuple[Tuple[str, int, int], ...]) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    for relativo, _, _ in assinatura:
+        digest.update(relativo.encode("utf-8"))
+        digest.update((_RAIZ_PROJETO / relativo).read_bytes())
+    return digest.hexdigest()
+
+
+def versao_codigo(fontes: Sequence[str]) -> str:
+    """
+    Hash dos arquivos .py listados (ou contidos nos diretórios listados).
+
+    O conteúdo só é relido quando mtime/tamanho de algum arquivo muda, então
+    edições feitas durante uma sessão de notebook invalidam o cache.
+    """
+    assinatura = []
+    for fonte in fontes:
+        caminho = _RAIZ_PROJETO / fonte
+        arquivos = sorted(caminho.rglob("*.py")) if caminho.is_dir() else [caminho]
+        for arquivo in arquivos:
+            try:
+                info = arquivo.stat()
+            except FileNotFoundError:
+                continue
+            relativo = str(arquivo.relative_to(_RAIZ_PROJETO))
+            assinatura.append((relativo, info.st_mtime_ns, info.st_size))
+    return _hash_fontes(tuple(assinatura))
+
+
+def chave_etapa(
+    etapa: str,
+    entrada: Union[pd.DataFrame, str],
+    parametros: Optional[Dict[str, Any]] = None,
+    fontes: Optional[Sequence[str]] = None,
+) -> str:
+    """
+    Calcula a chave de uma etapa.
+
+    Args:
+        etapa: Nome da etapa (ex.: 'processamento')
+        entrada: DataFrame de entrada ou chave da etapa anterior (encadeamento
+            sem recalcular o hash da saída intermediária)
+        parametros: Parâmetros que alteram o resultado
+        fontes: Fontes do código da etapa (usa FONTES_ETAPAS[etapa] se None)
+
+    Returns:
+        Hash hexadecimal
+    """
+    impressao = entrada if isinstance(entrada, str) else impressao_digital(entrada)
+    fontes = fontes if fontes is not None else FONTES_ETAPAS.get(etapa, ())
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{_VERSAO_CACHE}|{etapa}|{impressao}|".encode("utf-8"))
+    digest.update(joblib.hash(parametros or {}).encode("ascii"))
+    digest.update(versao_codigo(fontes).encode("ascii"))
+    return digest.hexdigest()
+
+
+def aplicar_limite_lru_etapas(diretorio: Optional[str] = None, limite_mb: Optional[float] = None) -> int:
+    """
+    Remove as entradas menos usadas até o cache caber no limite.
+
+    Returns:
+        Quantidade de entradas removidas
+    """
+    return aplicar_limite_lru(diretorio_cache_etapas(diretorio), "*.joblib", _limite_bytes(limite_mb))
+
+
+def limpar_cache_etapas(diretorio: Optional[str] = None) -> int:
+    """Remove todas as entradas do cache. Retorna quantas foram removidas."""
+    return aplicar_limite_lru_etapas(diretorio, limite_mb=0)
+
+
+def ler_etapa(chave: str, diretorio: Optional[str] = None) -> Optional[Any]:
+    """Lê o resultado de uma etapa (None se não houver entrada válida)."""
+    caminho = diretorio_cache_etapas(diretorio) / f"{chave}.joblib"
+    if not caminho.exists():
+        return None
+    try:
+        resultado = joblib.load(caminho)
+    except Exception:
+        caminho.unlink(missing_ok=True)
+        return None
+    # Marca uso recente para a política LRU
+    os.utime(caminho)
+    return resultado
+
+
+def gravar_etapa(
+    resultado: Any,
+    chave: str,
+    diretorio: Optional[str] = None,
+    limite_mb: Optional[float] = None,
+) -> Optional[Path]:
+    """
+    Grava o resultado de uma etapa (falhas são ignoradas: o cache é só otimização).
+
+    Returns:
+        Caminho gravado ou None se não foi possível gravar
+    """
+    pasta = diretorio_cache_etapas(diretorio)
+    destino = pasta / f"{chave}.joblib"
+    try:
+        pasta.mkdir(parents=True, exist_ok=True)
+        gravar_atomico(destino, lambda caminho: joblib.dump(resultado, caminho))
+    except Exception:
+        return None
+    aplicar_limite_lru_etapas(diretorio, limite_mb)
+    return destino
+
+
+def executar_etapa_com_cache(
+    etapa: str,
+    funcao: Callable[[], Any],
+    entrada: Union[pd.DataFrame, str],
+    parametros: Optional[Dict[str, Any]] = None,
+    usar_cache: Optional[bool] = None,
+    diretorio: Optional[str] = None,
+) -> Tuple[Any, Optional[str]]:
+    """
+    Executa funcao() ou recupera o resultado gravado para a mesma chave.
+
+    Args:
+        etapa: Nome da etapa (define as fontes da versão do código)
+        funcao: Executa a etapa sem argumentos
+        entrada: DataFrame de entrada ou chave da etapa anterior
+        parametros: Parâmetros da etapa
+        usar_cache: Força ativar/desativar (usa CACHE_ETAPAS_ATIVO se None)
+        diretorio: Diretório do cache (usa ambiente/padrão se None)
+
+    Returns:
+        Tupla (resultado, chave); chave é None com o cache desativado
+    """
+    if not cache_etapas_ativo(usar_cache):
+        return funcao(), None
+
+    chave = chave_etapa(etapa, entrada, parametros)
+    resultado = ler_etapa(chave, diretorio)
+    if resultado is not None:
+        print(f"💾 Etapa '{etapa}' recuperada do cache ({chave[:12]})")
+        return resultado, chave
+
+    resultado = funcao()
+    gravar_etapa(resultado, chave, diretorio)
+    return resultado, chave
+
+
+__all__ = [
+    "cache_etapas_ativo",
+    "diretorio_cache_etapas",
+    "impressao_digital",
+    "versao_codigo",
+    "chave_etapa",
+    "ler_etapa",
+    "gravar_etapa",
+    "aplicar_limite_lru_etapas",
+    "limpar_cache_etapas",
+    "executar_etapa_com_cache",
+]
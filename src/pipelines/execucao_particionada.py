@@ -0,0 +1,141 @@
+"""
+Execução particionada por grupo (ex.: mes-ano) em um pool de processos.
+
+O DataFrame é dividido pelas chaves da coluna de partição, na ordem de
+codificar_grupos (chaves ordenadas; linhas sem chave numa partição final).
+Cada partição roda em um processo, que lê suas linhas das colunas
+publicadas em memória compartilhada; os resultados são concatenados e as
+linhas voltam à ordem original. Só é equivalente à execução sobre o frame
+inteiro para operações que não cruzam partições (por linha ou por grupo da
+própria coluna de partição).
+"""
+import contextlib
+import io
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..features.normalizacao.normalizar_por_grupo import codificar_grupos
+from ..utils.executor_dag import medir_escalabilidade, resolver_trabalhadores
+from ..utils.memoria_compartilhada import PublicacaoCompartilhada, QuadroCompartilhado
+
+
+def particoes_por_grupo(df: pd.DataFrame, coluna: str) -> List[np.ndarray]:
+    """
+    Posições das linhas de cada partição de coluna.
+
+    Uma partição por chave, na ordem de df.groupby(coluna).groups, e uma
+    última com as linhas de chave nula, se houver. Dentro de cada partição
+    as linhas seguem a ordem original.
+    """
+    chaves, codigos = codificar_grupos(df, coluna)
+    ordem = np.argsort(codigos, kind="stable")
+    limites = np.searchsorted(codigos[ordem], np.arange(-1, len(chaves) + 1))
+    particoes = [ordem[limites[g + 1]:limites[g + 2]] for g in range(len(chaves))]
+    if limites[1] > limites[0]:
+        particoes.append(ordem[limites[0]:limites[1]])
+    return particoes
+
+
+def _executar_particao(
+    funcao: Callable[[pd.DataFrame], Tuple[pd.DataFrame, Any]],
+    quadro: QuadroCompartilhado,
+    posicoes: np.ndarray,
+    restantes: Optional[pd.DataFrame],
+) -> Tuple[pd.DataFrame, Any]:
+    # Os prints de progresso das partições só poluiriam a saída
+    with contextlib.redirect_stdout(io.StringIO()):
+        return funcao(quadro.ler(posicoes, restantes))
+
+
+def executar_particionado(
+    df: pd.DataFrame,
+    particoes: List[np.ndarray],
+    funcao: Callable[[pd.DataFrame], Tuple[pd.DataFrame, Any]],
+    n_trabalhadores: Optional[int] = 1,
+) -> Tuple[pd.DataFrame, List[Any]]:
+    """
+    Aplica funcao a cada partição e reconstrói o DataFrame.
+
+    funcao recebe a partição (índice 0..n-1) e retorna (df_particao,
+    artefato) mantendo as linhas; precisa ser serializável (função de
+    módulo ou functools.partial). Com um trabalhador, ou uma partição só,
+    roda no próprio processo.
+
+    Args:
+        df: DataFrame de entrada (não é modificado)
+        particoes: Posições de cada partição (ver particoes_por_grupo),
+            cobrindo todas as linhas uma única vez
+        funcao: Operação aplicada a cada partição
+        n_trabalhadores: Processos do pool; None/<=0 usa todos os núcleos
+
+    Returns:
+        Tupla (df, artefatos) com o índice e a ordem de linhas de df e os
+        artefatos na ordem das partições
+    """
+    ordem = np.concatenate(particoes) if particoes else np.zeros(0, dtype="int64")
+    if len(ordem) != len(df):
+        raise ValueError("As partições devem cobrir todas as linhas do DataFrame")
+    n_trabalhadores = min(resolver_trabalhadores(n_trabalhadores), len(particoes))
+
+    if n_trabalhadores <= 1:
+        resultados = [
+            funcao(df.iloc[posicoes].reset_index(drop=True)) for posicoes in particoes
+        ]
+    else:
+        with PublicacaoCompartilhada(df) as publicacao, ProcessPoolExecutor(n_trabalhadores) as pool:
+            futuros = [
+                pool.submit(
+                    _executar_particao, funcao, publicacao.quadro, posicoes, publicacao.restantes(posicoes)
+                )
+                for posicoes in particoes
+            ]
+            resultados = [futuro.result() for futuro in futuros]
+
+    if not resultados:
+        return funcao(df.copy())[0], []
+    for posicoes, (parte, _) in zip(particoes, resultados):
+        if len(parte) != len(posicoes):
+            raise ValueError("A função particionada não pode mudar o número de linhas")
+    juntas = pd.concat([parte for parte, _ in resultados], ignore_index=True)
+    inversa = np.empty(len(ordem), dtype="int64")
+    inversa[ordem] = np.arange(len(ordem))
+    return juntas.take(inversa).set_axis(df.index), [artefato for _, artefato in resultados]
+
+
+def medir_escalabilidade_features(
+    df: pd.DataFrame,
+    trabalhadores: Optional[Iterable[int]] = None,
+    repeticoes: int = 3,
+    **parametros,
+) -> pd.DataFrame:
+    """
+    Relatório de escalabilidade do pipeline de features particionado.
+
+    Args:
+        df: DataFrame processado (com a coluna de agrupamento)
+        trabalhadores: Números de processos a medir (padrão: 1..núcleos)
+        repeticoes: Repetições por número de processos (vale a melhor)
+        **parametros: Demais parâmetros de executar_pipeline_features
+
+    Returns:
+        DataFrame com trabalhadores, segundos, aceleracao e eficiencia
+        (aceleração por trabalhador), além de linhas e particoes
+    """
+    from .pipeline_features import executar_pipeline_features
+
+    def _executar(n: int) -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            executar_pipeline_features(df, particionar=True, n_trabalhadores=n, **parametros)
+
+    relatorio = medir_escalabilidade(_executar, trabalhadores, repeticoes)
+    relatorio["eficiencia"] = np.round(relatorio["aceleracao"] / relatorio["trabalhadores"], 2)
+    coluna = parametros.get("agrupamento_normalizacao", "mes-ano")
+    relatorio["linhas"] = len(df)
+    relatorio["particoes"] = len(particoes_por_grupo(df, coluna)) if coluna in df.columns else 1
+    return relatorio
+
+
+__all__ = ["particoes_por_grupo", "executar_particionado", "medir_escalabilidade_features"]
@@ -0,0 +1,305 @@
+"""
+Perfil estruturado das etapas dos pipelines.
+
+Cada etapa (e subetapa) registra tempo de parede, tempo de CPU, pico de
+memória (crescimento do RSS amostrado em segundo plano ou, com mais
+precisão e custo, alocações do tracemalloc), linhas de entrada/saída e
+colunas criadas.
+O perfil é ativado por execução, passando um PerfilEtapas ao pipeline; sem
+ele os pipelines usam PERFIL_INATIVO, cujas etapas não medem nada.
+
+Exemplo:
+    >>> perfil = PerfilEtapas()
+    >>> df_final, artefatos = executar_pipeline_completo(df, perfil=perfil)
+    >>> perfil.salvar_json("perfil.json")
+    >>> perfil.salvar_chrome_trace("perfil.trace.json")  # chrome://tracing
+"""
+import json
+import os
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+MODOS_MEMORIA = ("rss", "tracemalloc")
+_TAMANHO_PAGINA = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class _Medicao:
+    """Etapa em andamento; saida(df) informa o resultado da etapa."""
+
+    __slots__ = ("registro", "_colunas_entrada", "_pico", "_memoria_inicial")
+
+    def __init__(self, registro: Dict[str, Any], colunas_entrada: Optional[set]):
+        self.registro = registro
+        self._colunas_entrada = colunas_entrada
+        self._pico = 0
+        self._memoria_inicial = 0
+
+    def saida(self, df: pd.DataFrame) -> None:
+        self.registro["linhas_saida"] = len(df)
+        if self._colunas_entrada is not None:
+            criadas = [c for c in df.columns if c not in self._colunas_entrada]
+            self.registro["colunas_criadas"] = criadas
+
+    def anotar(self, **dados: Any) -> None:
+        """Acrescenta dados (serializáveis em JSON) ao registro da etapa."""
+        self.registro.update(dados)
+
+
+def _rss_atual() -> Optional[int]:
+    """RSS do processo em bytes (None se não houver como medir)."""
+    try:
+        with open("/proc/self/statm", "rb") as arquivo:
+            return int(arquivo.read().split()[1]) * _TAMANHO_PAGINA
+    except (OSError, IndexError, ValueError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+class _AmostradorRss(threading.Thread):
+    """Amostra o RSS e atualiza o pico de todas as etapas abertas."""
+
+    def __init__(self, pilha: List[_Medicao], intervalo: float):
+        super().__init__(name="perfil-etapas-rss", daemon=True)
+        self._pilha = pilha
+        self._intervalo = intervalo
+        self._parar = threading.Event()
+
+    def run(self) -> None:
+        while not self._parar.wait(self._intervalo):
+            rss = _rss_atual()
+            if rss is None:
+                return
+            for medicao in list(self._pilha):
+                if rss > medicao._pico:
+                    medicao._pico = rss
+
+    def parar(self) -> None:
+        self._parar.set()
+        self.join()
+
+
+class _EtapaAtiva:
+    __slots__ = ("_perfil", "_nome", "_df", "_medicao", "_inicio", "_inicio_cpu")
+
+    def __init__(self, perfil: "PerfilEtapas", nome: str, df: Optional[pd.DataFrame]):
+        self._perfil = perfil
+        self._nome = nome
+        self._df = df
+
+    def __enter__(self) -> _Medicao:
+        perfil = self._perfil
+        pilha = perfil._pilha
+        if not pilha:
+            perfil._iniciar_memoria()
+        memoria_inicial = perfil._memoria_atual(pilha)
+
+        caminho = "/".join([m.registro["nome"] for m in pilha] + [self._nome])
+        df = self._df
+        registro = {
+            "nome": self._nome,
+            "caminho": caminho,
+            "nivel": len(pilha),
+            "linhas_entrada": len(df) if df is not None else None,
+            "linhas_saida": None,
+            "colunas_criadas": [],
+        }
+        self._medicao = _Medicao(registro, set(df.columns) if df is not None else None)
+        self._medicao._memoria_inicial = self._medicao._pico = memoria_inicial
+        self._df = None
+        pilha.append(self._medicao)
+        self._inicio = time.perf_counter()
+        self._inicio_cpu = time.process_time()
+        return self._medicao
+
+    def __exit__(self, tipo, valor, traceback) -> bool:
+        fim = time.perf_counter()
+        fim_cpu = time.process_time()
+        perfil = self._perfil
+        medicao = perfil._pilha.pop()
+        registro = medicao.registro
+        registro["inicio_s"] = self._inicio - perfil._origem
+        registro["duracao_s"] = fim - self._inicio
+        registro["cpu_s"] = fim_cpu - self._inicio_cpu
+        registro["pico_memoria_bytes"] = perfil._fechar_memoria(medicao)
+        if tipo is not None:
+            registro["erro"] = tipo.__name__
+        perfil.eventos.append(registro)
+        return False
+
+
+class PerfilEtapas:
+    """
+    Coleta medições de etapas aninhadas de uma execução de pipeline.
+
+    Args:
+        medir_memoria: 'rss' (padrão) amostra o RSS do processo em segundo
+            plano, com custo desprezível; 'tracemalloc' mede as alocações
+            Python/NumPy com precisão, mas deixa o pipeline várias vezes mais
+            lento; None/False mede apenas tempos, linhas e colunas
+        intervalo_amostragem: Intervalo (s) entre amostras de RSS
+    """
+
+    ativo = True
+
+    def __init__(self, medir_memoria: Optional[str] = "rss", intervalo_amostragem: float = 0.005):
+        if medir_memoria is True:
+            medir_memoria = "tracemalloc"
+        if medir_memoria and medir_memoria not in MODOS_MEMORIA:
+            raise ValueError(f"medir_memoria inválido: {medir_memoria}. Use {MODOS_MEMORIA} ou None")
+        self.medir_memoria = medir_memoria or None
+        self.intervalo_amostragem = intervalo_amostragem
+        self.eventos: List[Dict[str, Any]] = []
+        self._pilha: List[_Medicao] = []
+        self._origem = time.perf_counter()
+        self._iniciou_tracemalloc = False
+        self._amostrador: Optional[_AmostradorRss] = None
+
+    def _iniciar_memoria(self) -> None:
+        """Chamado ao abrir a etapa mais externa."""
+        if self.medir_memoria == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._iniciou_tracemalloc = True
+        elif self.medir_memoria == "rss":
+            self._amostrador = _AmostradorRss(self._pilha, self.intervalo_amostragem)
+            self._amostrador.start()
+
+    def _memoria_atual(self, pilha: List[_Medicao]) -> int:
+        if self.medir_memoria == "tracemalloc":
+            if pilha:
+                # O pico acumulado do pai é preservado antes de reiniciar o pico
+                pilha[-1]._pico = max(pilha[-1]._pico, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            return tracemalloc.get_traced_memory()[0]
+        if self.medir_memoria == "rss":
+            return _rss_atual() or 0
+        return 0
+
+    def _fechar_memoria(self, medicao: _Medicao) -> Optional[int]:
+        """Pico da etapa recém-fechada (bytes acima do início) e repasse ao pai."""
+        if self.medir_memoria is None:
+            return None
+        if self.medir_memoria == "tracemalloc":
+            pico = max(medicao._pico, tracemalloc.get_traced_memory()[1])
+        else:
+            pico = max(medicao._pico, _rss_atual() or 0)
+        if self._pilha:
+            pai = self._pilha[-1]
+            pai._pico = max(pai._pico, pico)
+            if self.medir_memoria == "tracemalloc":
+                tracemalloc.reset_peak()
+        elif self._iniciou_tracemalloc:
+            tracemalloc.stop()
+            self._iniciou_tracemalloc = False
+        elif self._amostrador is not None:
+            self._amostrador.parar()
+            self._amostrador = None
+        return max(pico - medicao._memoria_inicial, 0)
+
+    def etapa(self, nome: str, df: Optional[pd.DataFrame] = None) -> _EtapaAtiva:
+        """
+        Mede o bloco with como uma etapa (aninhada na etapa aberta, se houver).
+
+        Args:
+            nome: Nome da etapa
+            df: DataFrame de entrada (linhas e colunas de referência)
+        """
+        return _EtapaAtiva(self, nome, df)
+
+    def resumo(self) -> pd.DataFrame:
+        """Eventos em ordem de início, um por linha."""
+        colunas = [
+            "caminho", "nivel", "inicio_s", "duracao_s", "cpu_s", "pico_memoria_bytes",
+            "linhas_entrada", "linhas_saida", "colunas_criadas",
+        ]
+        if not self.eventos:
+            return pd.DataFrame(columns=colunas)
+        resumo = pd.DataFrame(self.eventos).sort_values("inicio_s", kind="stable")
+        resumo["colunas_criadas"] = resumo["colunas_criadas"].map(len)
+        return resumo[colunas].reset_index(drop=True)
+
+    def para_dict(self) -> Dict[str, Any]:
+        return {
+            "versao": 1,
+            "medir_memoria": self.medir_memoria,
+            "eventos": sorted(self.eventos, key=lambda e: e["inicio_s"]),
+        }
+
+    def para_chrome_trace(self) -> Dict[str, Any]:
+        """Eventos no formato Trace Event (chrome://tracing, Perfetto)."""
+        pid, tid = os.getpid(), threading.get_ident()
+        eventos = []
+        for evento in sorted(self.eventos, key=lambda e: e["inicio_s"]):
+            args = {
+                chave: valor
+                for chave, valor in evento.items()
+                if chave not in {"nome", "inicio_s", "duracao_s"}
+            }
+            eventos.append({
+                "name": evento["nome"],
+                "cat": "pipeline",
+                "ph": "X",
+                "ts": evento["inicio_s"] * 1e6,
+                "dur": evento["duracao_s"] * 1e6,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            })
+        return {"traceEvents": eventos, "displayTimeUnit": "ms"}
+
+    def salvar_json(self, caminho: Union[str, Path]) -> Path:
+        caminho = Path(caminho)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        caminho.write_text(json.dumps(self.para_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        return caminho
+
+    def salvar_chrome_trace(self, caminho: Union[str, Path]) -> Path:
+        caminho = Path(caminho)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        caminho.write_text(json.dumps(self.para_chrome_trace(), ensure_ascii=False), encoding="utf-8")
+        return caminho
+
+
+class _MedicaoInativa:
+    __slots__ = ()
+
+    def saida(self, df: pd.DataFrame) -> None:
+        pass
+
+    def anotar(self, **dados: Any) -> None:
+        pass
+
+
+class _EtapaInativa:
+    __slots__ = ()
+    _medicao = _MedicaoInativa()
+
+    def __enter__(self) -> _MedicaoInativa:
+        return self._medicao
+
+    def __exit__(self, tipo, valor, traceback) -> bool:
+        return False
+
+
+class _PerfilInativo:
+    """Perfil desativado: etapa() devolve sempre o mesmo contexto vazio."""
+
+    ativo = False
+    _etapa = _EtapaInativa()
+
+    def etapa(self, nome: str, df: Optional[pd.DataFrame] = None) -> _EtapaInativa:
+        return self._etapa
+
+
+PERFIL_INATIVO = _PerfilInativo()
+
+
+__all__ = ["PerfilEtapas", "PERFIL_INATIVO", "MODOS_MEMORIA"]
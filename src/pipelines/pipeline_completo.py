@@ -6,9 +6,16 @@ Pipeline completo com duas formas de execução:
 import pandas as pd
 from typing import Any, Dict, List, Optional, Tuple
 
-from .pipeline_processamento import executar_pipeline_processamento
-from .pipeline_features import executar_pipeline_features
+from config import config_custom as config
+from .pipeline_processamento import (
+    executar_pipeline_processamento,
+    executar_pipeline_processamento_tabelas,
+)
+from .pipeline_features import executar_pipeline_features, executar_pipeline_features_tabelas
 from .pipeline_treinamento_unified import treinar_pipeline_completo
+from .cache_etapas import executar_etapa_com_cache
+from .perfil_etapas import PERFIL_INATIVO, PerfilEtapas
+from .plano_pipeline import compilar_plano, especificacao_de_parametros, executar_plano
 
 
 def executar_pipeline_completo(
@@ -23,12 +30,15 @@ def executar_pipeline_completo(
     metodo_imputacao_numerica: Optional[str] = None,
     metodo_imputacao_categorica: Optional[str] = None,
     valor_constante_categorica: Optional[str] = None,
+    config_imputacao_customizada: Optional[Dict[str, str]] = None,
     criar_agrupamento_temporal: bool = True,
     nome_coluna_agrupamento: str = "mes-ano",
+    separar_clima: Optional[bool] = None,
     # Parâmetros de features
     aplicar_codificacao: bool = True,
     metodo_codificacao: str = "label",
     sufixo_codificacao: str = "_cod",
+    onehot_esparso: Optional[bool] = None,
     aplicar_normalizacao: bool = True,
     colunas_normalizar: Optional[List[str]] = None,
     metodo_normalizacao: str = "standard",
@@ -36,6 +46,20 @@ def executar_pipeline_completo(
     sufixo_normalizacao: str = "_norm",
     criar_features_derivadas: bool = False,
     tipos_features_derivadas: Optional[List[str]] = None,
+    compactar_memoria: Optional[bool] = None,
+    tolerancia_compactacao: Optional[float] = None,
+    # Modo incremental
+    diretorio_incremental: Optional[str] = None,
+    limite_deriva_incremental: Optional[float] = None,
+    # Cache local de etapas
+    usar_cache_etapas: Optional[bool] = None,
+    # Execução paralela das operações por coluna
+    n_trabalhadores: Optional[int] = None,
+    modo_execucao: Optional[str] = None,
+    # Perfil de etapas (tempo, CPU, memória, linhas e colunas)
+    perfil: Optional[PerfilEtapas] = None,
+    # Modo de escoragem: só o que alimenta as colunas do modelo
+    features_modelo: Optional[List[str]] = None,
 ) -> Tuple[pd.DataFrame, Dict]:
     """
     Executa pipeline completo: processamento base + engenharia de features.
@@ -43,47 +67,166 @@ def executar_pipeline_completo(
     Args:
         df: DataFrame original
         ... (mesmos parâmetros dos pipelines individuais)
+        separar_clima: Processa o clima numa tabela por instante (data + hora)
+            e os respondentes noutra, unindo-as só nas features (usa
+            config.SEPARAR_TABELAS_CLIMA se None; ver
+            executar_pipeline_processamento_tabelas). Não se aplica ao modo
+            incremental
+        compactar_memoria: Compacta dtypes do resultado final (etapa de features)
+        diretorio_incremental: Se informado, usa o checkpoint dessa pasta e
+            processa apenas as linhas novas (ver executar_pipeline_incremental)
+        limite_deriva_incremental: Deriva máxima (em desvios-padrão) antes de
+            recalcular tudo no modo incremental (usa config se None)
+        usar_cache_etapas: Reaproveita resultados de processamento/features
+            gravados em disco para a mesma entrada, parâmetros e código
+            (usa CACHE_ETAPAS_ATIVO se None; ver cache_etapas)
+        n_trabalhadores: Trabalhadores para imputação, features derivadas,
+            codificação e normalização (usa config se None); não altera o
+            resultado, por isso não entra na chave do cache
+        modo_execucao: 'thread' ou 'processo' (usa config se None)
+        perfil: PerfilEtapas que mede o pipeline e suas etapas; etapas
+            recuperadas do cache não geram subetapas (None desativa)
+        features_modelo: Colunas que o modelo final usa (features_modelo
+            gravado no treino; ver extrair_features_modelo). Se informado,
+            roda o modo de escoragem: os parâmetros viram uma especificação
+            compilada com poda (ver plano_pipeline), que lê só as colunas
+            brutas e executa só as transformações de que essas colunas
+            dependem; retorna apenas elas (e as brutas que as alimentam).
+            Não usa cache, modo incremental nem separar_clima
         
     Returns:
         Tupla (df_completo, artefatos) onde artefatos contém todos os mapeamentos
     """
+    if features_modelo is not None:
+        return _executar_escoragem(
+            df,
+            features_modelo,
+            perfil,
+            substituicoes=substituicoes,
+            coluna_data=coluna_data,
+            coluna_hora=coluna_hora,
+            colunas_float=colunas_float,
+            colunas_int=colunas_int,
+            colunas_categoricas=colunas_categoricas,
+            metodo_imputacao_numerica=metodo_imputacao_numerica,
+            metodo_imputacao_categorica=metodo_imputacao_categorica,
+            valor_constante_categorica=valor_constante_categorica,
+            config_imputacao_customizada=config_imputacao_customizada,
+            criar_agrupamento_temporal=criar_agrupamento_temporal,
+            nome_coluna_agrupamento=nome_coluna_agrupamento,
+            aplicar_codificacao=aplicar_codificacao,
+            metodo_codificacao=metodo_codificacao,
+            sufixo_codificacao=sufixo_codificacao,
+            onehot_esparso=onehot_esparso,
+            aplicar_normalizacao=aplicar_normalizacao,
+            colunas_normalizar=colunas_normalizar,
+            metodo_normalizacao=metodo_normalizacao,
+            agrupamento_normalizacao=agrupamento_normalizacao,
+            sufixo_normalizacao=sufixo_normalizacao,
+            criar_features_derivadas=criar_features_derivadas,
+            tipos_features_derivadas=tipos_features_derivadas,
+            compactar_memoria=compactar_memoria,
+            tolerancia_compactacao=tolerancia_compactacao,
+        )
+
+    if diretorio_incremental:
+        from .pipeline_incremental import executar_pipeline_incremental
+
+        return executar_pipeline_incremental(
+            df,
+            diretorio_incremental,
+            limite_deriva=limite_deriva_incremental,
+            substituicoes=substituicoes,
+            coluna_data=coluna_data,
+            coluna_hora=coluna_hora,
+            colunas_float=colunas_float,
+            colunas_int=colunas_int,
+            colunas_categoricas=colunas_categoricas,
+            metodo_imputacao_numerica=metodo_imputacao_numerica,
+            metodo_imputacao_categorica=metodo_imputacao_categorica,
+            valor_constante_categorica=valor_constante_categorica,
+            config_imputacao_customizada=config_imputacao_customizada,
+            criar_agrupamento_temporal=criar_agrupamento_temporal,
+            nome_coluna_agrupamento=nome_coluna_agrupamento,
+            aplicar_codificacao=aplicar_codificacao,
+            metodo_codificacao=metodo_codificacao,
+            sufixo_codificacao=sufixo_codificacao,
+            onehot_esparso=onehot_esparso,
+            aplicar_normalizacao=aplicar_normalizacao,
+            colunas_normalizar=colunas_normalizar,
+            metodo_normalizacao=metodo_normalizacao,
+            agrupamento_normalizacao=agrupamento_normalizacao,
+            sufixo_normalizacao=sufixo_normalizacao,
+            criar_features_derivadas=criar_features_derivadas,
+            tipos_features_derivadas=tipos_features_derivadas,
+            compactar_memoria=compactar_memoria,
+            tolerancia_compactacao=tolerancia_compactacao,
+        )
+
     print("=" * 60)
     print("🚀 PIPELINE COMPLETO: Processamento + Features")
     print("=" * 60)
     
-    # FASE 1: Processamento Base
-    df_processado = executar_pipeline_processamento(
-        df,
-        substituicoes=substituicoes,
-        coluna_data=coluna_data,
-        coluna_hora=coluna_hora,
-        colunas_float=colunas_float,
-        colunas_int=colunas_int,
-        colunas_categoricas=colunas_categoricas,
-        metodo_imputacao_numerica=metodo_imputacao_numerica,
-        metodo_imputacao_categorica=metodo_imputacao_categorica,
-        valor_constante_categorica=valor_constante_categorica,
-        criar_agrupamento_temporal=criar_agrupamento_temporal,
-        nome_coluna_agrupamento=nome_coluna_agrupamento,
-    )
+    perfil = perfil or PERFIL_INATIVO
+    execucao = dict(n_trabalhadores=n_trabalhadores, modo_execucao=modo_execucao, perfil=perfil)
+    if separar_clima is None:
+        separar_clima = config.SEPARAR_TABELAS_CLIMA
+    processar = executar_pipeline_processamento_tabelas if separar_clima else executar_pipeline_processamento
+    gerar_features = executar_pipeline_features_tabelas if separar_clima else executar_pipeline_features
+
+    with perfil.etapa("pipeline_completo", df) as medicao_total:
+        # FASE 1: Processamento Base
+        parametros_processamento = dict(
+            substituicoes=substituicoes,
+            coluna_data=coluna_data,
+            coluna_hora=coluna_hora,
+            colunas_float=colunas_float,
+            colunas_int=colunas_int,
+            colunas_categoricas=colunas_categoricas,
+            metodo_imputacao_numerica=metodo_imputacao_numerica,
+            metodo_imputacao_categorica=metodo_imputacao_categorica,
+            valor_constante_categorica=valor_constante_categorica,
+            config_imputacao_customizada=config_imputacao_customizada,
+            criar_agrupamento_temporal=criar_agrupamento_temporal,
+            nome_coluna_agrupamento=nome_coluna_agrupamento,
+            compactar_memoria=False,  # compacta apenas o resultado final
+        )
+        df_processado, chave_processamento = executar_etapa_com_cache(
+            "processamento",
+            lambda: processar(df, **parametros_processamento, **execucao),
+            entrada=df,
+            parametros=dict(parametros_processamento, separar_clima=separar_clima),
+            usar_cache=usar_cache_etapas,
+        )
     
-    print()  # Linha em branco
+        print()  # Linha em branco
     
-    # FASE 2: Engenharia de Features
-    df_final, artefatos = executar_pipeline_features(
-        df_processado,
-        colunas_categoricas=colunas_categoricas,
-        aplicar_codificacao=aplicar_codificacao,
-        metodo_codificacao=metodo_codificacao,
-        sufixo_codificacao=sufixo_codificacao,
-        aplicar_normalizacao=aplicar_normalizacao,
-        colunas_normalizar=colunas_normalizar,
-        metodo_normalizacao=metodo_normalizacao,
-        agrupamento_normalizacao=agrupamento_normalizacao,
-        sufixo_normalizacao=sufixo_normalizacao,
-        criar_features_derivadas=criar_features_derivadas,
-        tipos_features_derivadas=tipos_features_derivadas,
-    )
+        # FASE 2: Engenharia de Features
+        parametros_features = dict(
+            colunas_categoricas=colunas_categoricas,
+            aplicar_codificacao=aplicar_codificacao,
+            metodo_codificacao=metodo_codificacao,
+            sufixo_codificacao=sufixo_codificacao,
+            onehot_esparso=onehot_esparso,
+            aplicar_normalizacao=aplicar_normalizacao,
+            colunas_normalizar=colunas_normalizar,
+            metodo_normalizacao=metodo_normalizacao,
+            agrupamento_normalizacao=agrupamento_normalizacao,
+            sufixo_normalizacao=sufixo_normalizacao,
+            criar_features_derivadas=criar_features_derivadas,
+            tipos_features_derivadas=tipos_features_derivadas,
+            compactar_memoria=compactar_memoria,
+            tolerancia_compactacao=tolerancia_compactacao,
+        )
+        (df_final, artefatos), _ = executar_etapa_com_cache(
+            "features",
+            lambda: gerar_features(df_processado, **parametros_features, **execucao),
+            # Encadeia pela chave do processamento (evita novo hash da saída)
+            entrada=chave_processamento or df_processado,
+            parametros=parametros_features,
+            usar_cache=usar_cache_etapas,
+        )
+        medicao_total.saida(df_final)
     
     print("=" * 60)
     print(f"✅ PIPELINE COMPLETO FINALIZADO!")
@@ -95,6 +238,26 @@ def executar_pipeline_completo(
     return df_final, artefatos
 
 
+def _executar_escoragem(
+    df: pd.DataFrame,
+    features_modelo: List[str],
+    perfil: Optional[PerfilEtapas],
+    **parametros,
+) -> Tuple[pd.DataFrame, Dict]:
+    """Pipeline completo podado pelas colunas do modelo (plano compilado)."""
+    especificacao = especificacao_de_parametros(**parametros)
+    plano = compilar_plano(especificacao, df, features_modelo=features_modelo)
+    print("🎯 PIPELINE DE ESCORAGEM (podado pelas features do modelo)")
+    print(plano)
+    df_final, artefatos = executar_plano(df, plano, perfil=perfil)
+    faltantes = [c for c in features_modelo if c not in df_final.columns]
+    if faltantes:
+        raise ValueError(f"Features do modelo ausentes após a escoragem: {faltantes}")
+    artefatos["plano"] = plano
+    print(f"✅ Escoragem concluída! Shape final: {df_final.shape}")
+    return df_final, artefatos
+
+
 def executar_pipeline_completo_ml(
     dados: pd.DataFrame,
     coluna_alvo: str,
@@ -111,9 +274,11 @@ def executar_pipeline_completo_ml(
     valor_constante_categorica: Optional[str] = None,
     criar_agrupamento_temporal: bool = True,
     nome_coluna_agrupamento: str = "mes-ano",
+    separar_clima: Optional[bool] = None,
     aplicar_codificacao: bool = True,
     metodo_codificacao: str = "label",
     sufixo_codificacao: str = "_cod",
+    onehot_esparso: Optional[bool] = None,
     aplicar_normalizacao: bool = True,
     colunas_normalizar: Optional[List[str]] = None,
     metodo_normalizacao: str = "standard",
@@ -121,6 +286,8 @@ def executar_pipeline_completo_ml(
     sufixo_normalizacao: str = "_norm",
     criar_features_derivadas: bool = False,
     tipos_features_derivadas: Optional[List[str]] = None,
+    usar_cache_etapas: Optional[bool] = None,
+    perfil: Optional[PerfilEtapas] = None,
     # parâmetros do treinamento
     params_setup: Optional[Dict[str, Any]] = None,
     n_modelos_comparar: int = 3,
@@ -134,7 +301,13 @@ def executar_pipeline_completo_ml(
     nome_modelo: str = "modelo_final",
     pasta_modelos: str = "modelos",
 ) -> Dict[str, Any]:
-    """Executa pipeline fim a fim: processamento, features e treinamento."""
+    """
+    Executa pipeline fim a fim: processamento, features e treinamento.
+
+    Com usar_cache_etapas, mudar apenas parâmetros de treinamento reaproveita
+    processamento e features do cache; o treinamento sempre executa (salva
+    modelos e registra experimentos).
+    """
     df_final, artefatos = executar_pipeline_completo(
         dados,
         substituicoes=substituicoes,
@@ -148,9 +321,11 @@ def executar_pipeline_completo_ml(
         valor_constante_categorica=valor_constante_categorica,
         criar_agrupamento_temporal=criar_agrupamento_temporal,
         nome_coluna_agrupamento=nome_coluna_agrupamento,
+        separar_clima=separar_clima,
         aplicar_codificacao=aplicar_codificacao,
         metodo_codificacao=metodo_codificacao,
         sufixo_codificacao=sufixo_codificacao,
+        onehot_esparso=onehot_esparso,
         aplicar_normalizacao=aplicar_normalizacao,
         colunas_normalizar=colunas_normalizar,
         metodo_normalizacao=metodo_normalizacao,
@@ -158,10 +333,14 @@ def executar_pipeline_completo_ml(
         sufixo_normalizacao=sufixo_normalizacao,
         criar_features_derivadas=criar_features_derivadas,
         tipos_features_derivadas=tipos_features_derivadas,
+        usar_cache_etapas=usar_cache_etapas,
+        perfil=perfil,
     )
 
+    # O PyCaret não aceita colunas esparsas: densifica só a entrada do treino
+    esparsas = {c: t.subtype for c, t in df_final.dtypes.items() if isinstance(t, pd.SparseDtype)}
     resultado_treino = treinar_pipeline_completo(
-        dados=df_final,
+        dados=df_final.astype(esparsas) if esparsas else df_final,
         coluna_alvo=coluna_alvo,
         tipo_problema=tipo_problema,
         params_setup=params_setup,
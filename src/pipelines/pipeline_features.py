@@ -8,16 +8,41 @@ Aplica transformações de features em dados já processados:
 
 Use após executar pipeline_processamento.py
 """
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
 
 from config import config_custom as config
 from ..features.codificacao import (
     aplicar_codificacao_rotulos,
     aplicar_dummy,
+    categorias_dummy,
 )
 from ..features.normalizacao import normalizar
 from ..features.criacao_features import adicionar_features_derivadas
+from ..processamento.memoria import compactar_tipos
+from ..processamento.tabelas import TabelasClima, juntar_tabelas_clima
+from .execucao_particionada import executar_particionado, particoes_por_grupo
+from .perfil_etapas import PERFIL_INATIVO, PerfilEtapas
+
+
+def _features_derivadas_particao(df: pd.DataFrame, tipos: List[str]) -> Tuple[pd.DataFrame, None]:
+    return adicionar_features_derivadas(df, tipos=tipos), None
+
+
+def _normalizar_particao(df: pd.DataFrame, **parametros) -> Tuple[pd.DataFrame, Any]:
+    return normalizar(df, **parametros)
+
+
+def _juntar_scalers(artefatos: List[Any]) -> Any:
+    """Une os {grupo: scaler} das partições (cada grupo vem de uma só)."""
+    if all(artefato is None for artefato in artefatos):
+        return None
+    scalers: Dict[Any, Any] = {}
+    for artefato in artefatos:
+        scalers.update(artefato or {})
+    return scalers
 
 
 def executar_pipeline_features(
@@ -26,6 +51,7 @@ def executar_pipeline_features(
     aplicar_codificacao: bool = True,
     metodo_codificacao: str = "label",
     sufixo_codificacao: str = "_cod",
+    onehot_esparso: Optional[bool] = None,
     aplicar_normalizacao: bool = True,
     colunas_normalizar: Optional[Dict[str, str]] = None,
     metodo_normalizacao: str = "standard",
@@ -33,6 +59,12 @@ def executar_pipeline_features(
     sufixo_normalizacao: str = "_norm",
     criar_features_derivadas: bool = False,
     tipos_features_derivadas: Optional[List[str]] = None,
+    compactar_memoria: Optional[bool] = None,
+    tolerancia_compactacao: Optional[float] = None,
+    n_trabalhadores: Optional[int] = None,
+    modo_execucao: Optional[str] = None,
+    particionar: Optional[bool] = None,
+    perfil: Optional[PerfilEtapas] = None,
 ) -> Tuple[pd.DataFrame, Dict]:
     """
     Executa o pipeline de engenharia de features.
@@ -45,6 +77,9 @@ def executar_pipeline_features(
         aplicar_codificacao: Se deve aplicar codificação categórica
         metodo_codificacao: Método de codificação ('label' ou 'onehot')
         sufixo_codificacao: Sufixo para colunas codificadas
+        onehot_esparso: Dummies do one-hot como SparseDtype (usa config se None);
+            as categorias ficam em artefatos['categorias_onehot'] para a
+            inferência gerar as mesmas colunas
         aplicar_normalizacao: Se deve aplicar normalização
         colunas_normalizar: Colunas para normalizar. Pode ser:
             - None: normaliza todas colunas numéricas
@@ -55,6 +90,22 @@ def executar_pipeline_features(
         sufixo_normalizacao: Sufixo para colunas normalizadas
         criar_features_derivadas: Se deve criar features derivadas
         tipos_features_derivadas: Tipos de features derivadas (usa config se None)
+        compactar_memoria: Se deve compactar dtypes ao final (usa config se None);
+            o relatório por coluna fica em artefatos['relatorio_compactacao']
+            (e no evento 'compactacao' do perfil)
+        tolerancia_compactacao: Erro relativo máximo em float32 (usa config se None)
+        n_trabalhadores: Trabalhadores para as operações por coluna (features
+            derivadas, codificação label e normalização); usa config se None
+        modo_execucao: 'thread' ou 'processo' (usa config se None)
+        particionar: Divide o frame por agrupamento_normalizacao e roda
+            features derivadas e normalização de cada partição em um
+            processo (n_trabalhadores processos, colunas por memória
+            compartilhada); a codificação segue sobre o frame inteiro, pois
+            códigos e categorias são globais. O resultado é idêntico ao
+            sequencial. Usa config se None; sem a coluna de agrupamento,
+            roda sem partições
+        perfil: PerfilEtapas que registra tempo, CPU, memória, linhas e
+            colunas criadas de cada etapa (None desativa a medição)
         
     Returns:
         Tupla (df_features, artefatos) onde artefatos contém mapeamentos
@@ -62,62 +113,131 @@ def executar_pipeline_features(
     # Usar configurações do config se não fornecidas
     colunas_categoricas = colunas_categoricas or config.COLUNAS_CATEGORICAS
     tipos_features_derivadas = tipos_features_derivadas or config.TIPOS_FEATURES_DERIVADAS
+    if n_trabalhadores is None:
+        n_trabalhadores = config.N_TRABALHADORES_PIPELINE
+    modo_execucao = modo_execucao or config.MODO_EXECUCAO_PARALELA
+    if onehot_esparso is None:
+        onehot_esparso = config.ONEHOT_ESPARSO
+    if particionar is None:
+        particionar = config.PARTICIONAR_FEATURES
+    particoes = None
+    if particionar and agrupamento_normalizacao and agrupamento_normalizacao in df.columns:
+        particoes = particoes_por_grupo(df, agrupamento_normalizacao)
     
-    # Copiar DataFrame para não modificar original
-    df_feat = df.copy()
+    perfil = perfil or PERFIL_INATIVO
     
     # Artefatos para retornar
     artefatos = {}
     
     print("🎨 Iniciando pipeline de FEATURES...")
-    
-    # ETAPA 1: Features Derivadas (antes de codificação/normalização)
-    if criar_features_derivadas:
-        print(f"  1️⃣ Criando features derivadas ({len(tipos_features_derivadas)} tipos)...")
-        df_feat = adicionar_features_derivadas(
-            df_feat,
-            tipos=tipos_features_derivadas
-        )
-    
-    # ETAPA 2: Codificação Categórica
-    if aplicar_codificacao and colunas_categoricas:
-        print(f"  2️⃣ Aplicando codificação ({metodo_codificacao})...")
-        cols_existentes = [c for c in colunas_categoricas if c in df_feat.columns]
+    with perfil.etapa("features", df) as medicao_total:
+        # Copiar DataFrame para não modificar original
+        df_feat = df.copy()
         
-        if metodo_codificacao == "label":
-            df_feat, mapeamentos = aplicar_codificacao_rotulos(
-                df_feat, 
-                cols_existentes, 
-                sufixo=sufixo_codificacao
-            )
-            artefatos['mapeamentos_codificacao'] = mapeamentos
-        elif metodo_codificacao == "onehot":
-            df_feat = aplicar_dummy(df_feat, cols_existentes)
-            artefatos['colunas_onehot'] = [c for c in df_feat.columns if c not in df.columns]
-    
-    # ETAPA 3: Normalização
-    if aplicar_normalizacao:
-        print(f"  3️⃣ Aplicando normalização ({metodo_normalizacao})...")
-        df_feat, scalers_normalizacao = normalizar(
-            df_feat,
-            colunas=colunas_normalizar,
-            metodo=metodo_normalizacao,
-            agrupamento=agrupamento_normalizacao,
-            sufixo=sufixo_normalizacao,
-        )
-        colunas_norm = [c for c in df_feat.columns if c.endswith(sufixo_normalizacao)]
-        artefatos['colunas_normalizadas'] = colunas_norm
-        artefatos['scalers_normalizacao'] = scalers_normalizacao
-    
-    # Adiciona estrutura aninhada para testes de integração que esperam essas chaves
-    artefatos['artefatos_codificacao'] = {
-        k: v for k, v in artefatos.items() 
-        if k in ['mapeamentos_codificacao', 'colunas_onehot']
-    }
-    artefatos['artefatos_normalizacao'] = {
-        k: v for k, v in artefatos.items() 
-        if k in ['colunas_normalizadas']
-    }
+        # ETAPA 1: Features Derivadas (antes de codificação/normalização)
+        if criar_features_derivadas:
+            with perfil.etapa("features_derivadas", df_feat) as medicao:
+                print(f"  1️⃣ Criando features derivadas ({len(tipos_features_derivadas)} tipos)...")
+                if particoes is not None:
+                    df_feat, _ = executar_particionado(
+                        df_feat,
+                        particoes,
+                        partial(_features_derivadas_particao, tipos=tipos_features_derivadas),
+                        n_trabalhadores=n_trabalhadores,
+                    )
+                else:
+                    df_feat = adicionar_features_derivadas(
+                        df_feat,
+                        tipos=tipos_features_derivadas,
+                        n_trabalhadores=n_trabalhadores,
+                        modo_execucao=modo_execucao,
+                    )
+                medicao.saida(df_feat)
+        
+        # ETAPA 2: Codificação Categórica
+        if aplicar_codificacao and colunas_categoricas:
+            cols_existentes = [c for c in colunas_categoricas if c in df_feat.columns]
+            
+            with perfil.etapa("codificacao", df_feat) as medicao:
+                print(f"  2️⃣ Aplicando codificação ({metodo_codificacao})...")
+                if metodo_codificacao == "label":
+                    df_feat, mapeamentos = aplicar_codificacao_rotulos(
+                        df_feat, 
+                        cols_existentes, 
+                        sufixo=sufixo_codificacao,
+                        n_trabalhadores=n_trabalhadores,
+                        modo_execucao=modo_execucao,
+                    )
+                    artefatos['mapeamentos_codificacao'] = mapeamentos
+                elif metodo_codificacao == "onehot":
+                    categorias = categorias_dummy(df_feat, cols_existentes)
+                    df_feat = aplicar_dummy(
+                        df_feat, cols_existentes, esparso=onehot_esparso, categorias=categorias
+                    )
+                    artefatos['categorias_onehot'] = categorias
+                    artefatos['colunas_onehot'] = [c for c in df_feat.columns if c not in df.columns]
+                medicao.saida(df_feat)
+        
+        # ETAPA 3: Normalização
+        if aplicar_normalizacao:
+            with perfil.etapa("normalizacao", df_feat) as medicao:
+                print(f"  3️⃣ Aplicando normalização ({metodo_normalizacao})...")
+                if particoes is not None:
+                    # Cada partição é um grupo: os scalers são os do frame inteiro
+                    df_feat, scalers_particoes = executar_particionado(
+                        df_feat,
+                        particoes,
+                        partial(
+                            _normalizar_particao,
+                            colunas=colunas_normalizar,
+                            metodo=metodo_normalizacao,
+                            agrupamento=agrupamento_normalizacao,
+                            sufixo=sufixo_normalizacao,
+                        ),
+                        n_trabalhadores=n_trabalhadores,
+                    )
+                    scalers_normalizacao = _juntar_scalers(scalers_particoes)
+                else:
+                    df_feat, scalers_normalizacao = normalizar(
+                        df_feat,
+                        colunas=colunas_normalizar,
+                        metodo=metodo_normalizacao,
+                        agrupamento=agrupamento_normalizacao,
+                        sufixo=sufixo_normalizacao,
+                        n_trabalhadores=n_trabalhadores,
+                        modo_execucao=modo_execucao,
+                    )
+                medicao.saida(df_feat)
+            colunas_norm = [c for c in df_feat.columns if c.endswith(sufixo_normalizacao)]
+            artefatos['colunas_normalizadas'] = colunas_norm
+            artefatos['scalers_normalizacao'] = scalers_normalizacao
+        
+        # Adiciona estrutura aninhada para testes de integração que esperam essas chaves
+        artefatos['artefatos_codificacao'] = {
+            k: v for k, v in artefatos.items() 
+            if k in ['mapeamentos_codificacao', 'colunas_onehot', 'categorias_onehot']
+        }
+        artefatos['artefatos_normalizacao'] = {
+            k: v for k, v in artefatos.items() 
+            if k in ['colunas_normalizadas']
+        }
+        
+        # ETAPA 4: Compactação de tipos (opcional)
+        if config.COMPACTAR_TIPOS if compactar_memoria is None else compactar_memoria:
+            with perfil.etapa("compactacao", df_feat) as medicao:
+                df_feat, relatorio = compactar_tipos(
+                    df_feat,
+                    tolerancia=tolerancia_compactacao or config.TOLERANCIA_COMPACTACAO,
+                    limite_cardinalidade=config.LIMITE_CARDINALIDADE_CATEGORIA,
+                )
+                medicao.saida(df_feat)
+                medicao.anotar(relatorio_compactacao=relatorio.to_dict("records"))
+            artefatos['relatorio_compactacao'] = relatorio
+            antes_mb = relatorio["bytes_antes"].sum() / 1024**2
+            depois_mb = relatorio["bytes_depois"].sum() / 1024**2
+            print(f"  4️⃣ Compactando tipos: {antes_mb:.2f} MB → {depois_mb:.2f} MB")
+        
+        medicao_total.saida(df_feat)
     
     print(f"✅ Pipeline FEATURES concluído! Shape final: {df_feat.shape}")
     print(f"   Novas colunas criadas: {df_feat.shape[1] - df.shape[1]}")
@@ -125,4 +245,67 @@ def executar_pipeline_features(
     return df_feat, artefatos
 
 
-__all__ = ['executar_pipeline_features']
+def executar_pipeline_features_tabelas(
+    tabelas: TabelasClima,
+    criar_features_derivadas: bool = False,
+    tipos_features_derivadas: Optional[List[str]] = None,
+    n_trabalhadores: Optional[int] = None,
+    modo_execucao: Optional[str] = None,
+    perfil: Optional[PerfilEtapas] = None,
+    **parametros,
+) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Pipeline de features a partir das tabelas de clima e respondentes.
+
+    As features derivadas de clima (heat index, dew point, interações) são
+    calculadas uma vez por instante na tabela de clima e as dos
+    respondentes (IMC) na tabela deles; depois as tabelas são unidas e
+    codificação, normalização e compactação seguem em
+    executar_pipeline_features sobre o DataFrame por respondente.
+
+    Args:
+        tabelas: Saída de executar_pipeline_processamento_tabelas
+        criar_features_derivadas: Se deve criar features derivadas
+        tipos_features_derivadas: Tipos de features derivadas (usa config se None)
+        n_trabalhadores: Trabalhadores das operações por coluna (usa config se None)
+        modo_execucao: 'thread' ou 'processo' (usa config se None)
+        perfil: PerfilEtapas (None desativa a medição)
+        **parametros: Demais parâmetros de executar_pipeline_features
+
+    Returns:
+        Tupla (df_features, artefatos), como executar_pipeline_features
+    """
+    tipos_features_derivadas = tipos_features_derivadas or config.TIPOS_FEATURES_DERIVADAS
+    if n_trabalhadores is None:
+        n_trabalhadores = config.N_TRABALHADORES_PIPELINE
+    modo_execucao = modo_execucao or config.MODO_EXECUCAO_PARALELA
+    perfil = perfil or PERFIL_INATIVO
+
+    if criar_features_derivadas:
+        print(f"🌦️ Features derivadas por tabela ({len(tipos_features_derivadas)} tipos)...")
+        with perfil.etapa("features_derivadas_tabelas", tabelas.respondentes):
+            derivar = dict(
+                tipos=tipos_features_derivadas,
+                n_trabalhadores=n_trabalhadores,
+                modo_execucao=modo_execucao,
+            )
+            tabelas = tabelas.substituir(
+                clima=adicionar_features_derivadas(tabelas.clima, **derivar),
+                respondentes=adicionar_features_derivadas(tabelas.respondentes, **derivar),
+            )
+
+    with perfil.etapa("juncao_clima", tabelas.respondentes) as medicao:
+        df = juntar_tabelas_clima(tabelas)
+        medicao.saida(df)
+
+    return executar_pipeline_features(
+        df,
+        criar_features_derivadas=False,
+        n_trabalhadores=n_trabalhadores,
+        modo_execucao=modo_execucao,
+        perfil=perfil,
+        **parametros,
+    )
+
+
+__all__ = ['executar_pipeline_features', 'executar_pipeline_features_tabelas']
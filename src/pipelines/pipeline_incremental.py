@@ -0,0 +1,701 @@
+"""
+Pipeline completo em modo incremental (processa apenas as linhas novas).
+
+O checkpoint guarda a marca d'agua (linhas brutas ja processadas), o estado
+ajustado de imputacao, codificacao e normalizacao e a saida processada. Em
+uma nova execucao so as linhas novas passam pelo pipeline, junto com a cauda
+de linhas antigas que ainda depende de imputacao sequencial (backward,
+forward ou interpolacao) e por isso pode mudar com os dados novos.
+"""
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from config import config_custom as config
+from ..features.codificacao import aplicar_dummy
+from ..features.codificacao.codificar_label import codificar_label
+from ..features.criacao_features import adicionar_features_derivadas, preencher_tu_stull
+from ..features.normalizacao import NormalizadorIncremental, normalizar
+from ..processamento.imputacao import imputar_interpolacao_temporal
+from ..processamento.temporal import garantir_agrupamento_temporal
+from ..utils.io.cache_disco import gravar_atomico
+from .pipeline_features import executar_pipeline_features
+from .pipeline_processamento import _imputar, _limpar_e_converter, _validar_esquema
+
+ARQUIVO_ESTADO = "estado_incremental.joblib"
+ARQUIVO_SAIDA = "dados_completos.pkl"
+
+_VERSAO_ESTADO = 3
+_COLUNA_TOTAL = "__total__"
+
+
+def _resolver_parametros(parametros: Dict[str, Any]) -> Dict[str, Any]:
+    """Preenche com o config os parametros None (mesmas regras dos pipelines)."""
+    p = {
+        "substituicoes": None,
+        "coluna_data": None,
+        "coluna_hora": None,
+        "colunas_float": None,
+        "colunas_int": None,
+        "colunas_categoricas": None,
+        "metodo_imputacao_numerica": None,
+        "metodo_imputacao_categorica": None,
+        "valor_constante_categorica": None,
+        "config_imputacao_customizada": None,
+        "criar_agrupamento_temporal": True,
+        "nome_coluna_agrupamento": "mes-ano",
+        "aplicar_codificacao": True,
+        "metodo_codificacao": "label",
+        "sufixo_codificacao": "_cod",
+        "onehot_esparso": None,
+        "aplicar_normalizacao": True,
+        "colunas_normalizar": None,
+        "metodo_normalizacao": "standard",
+        "agrupamento_normalizacao": "mes-ano",
+        "sufixo_normalizacao": "_norm",
+        "criar_features_derivadas": False,
+        "tipos_features_derivadas": None,
+        "compactar_memoria": None,
+        "tolerancia_compactacao": None,
+    }
+    desconhecidos = set(parametros) - set(p)
+    if desconhecidos:
+        raise TypeError(f"Parâmetros desconhecidos: {sorted(desconhecidos)}")
+    p.update(parametros)
+    p["substituicoes"] = p["substituicoes"] or config.SUBSTITUICOES_LIMPEZA
+    p["coluna_data"] = p["coluna_data"] or config.COLUNA_DATA
+    p["coluna_hora"] = p["coluna_hora"] or config.COLUNA_HORA
+    p["colunas_float"] = p["colunas_float"] or config.COLUNAS_PONTO_FLUTUANTE
+    p["colunas_int"] = p["colunas_int"] or config.COLUNAS_NUMEROS_INTEIROS
+    p["colunas_categoricas"] = p["colunas_categoricas"] or config.COLUNAS_CATEGORICAS
+    p["metodo_imputacao_numerica"] = p["metodo_imputacao_numerica"] or config.METODO_IMPUTACAO_NUM
+    p["metodo_imputacao_categorica"] = p["metodo_imputacao_categorica"] or config.METODO_IMPUTACAO_CAT
+    p["valor_constante_categorica"] = p["valor_constante_categorica"] or config.VALOR_CONST_CATEGORICA
+    if p["onehot_esparso"] is None:
+        p["onehot_esparso"] = config.ONEHOT_ESPARSO
+    p["tipos_features_derivadas"] = p["tipos_features_derivadas"] or config.TIPOS_FEATURES_DERIVADAS
+    return p
+
+
+def _assinatura(p: Dict[str, Any]) -> str:
+    texto = repr(sorted(p.items(), key=lambda item: item[0]))
+    return hashlib.blake2b(texto.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _hashes_linhas(df: pd.DataFrame) -> np.ndarray:
+    """Hash por linha do conteudo bruto (calculado uma vez por execucao)."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def _resumo_hashes(hashes: np.ndarray) -> str:
+    """Resumo das linhas ja processadas (detecta historico editado)."""
+    return hashlib.blake2b(hashes.tobytes(), digest_size=16).hexdigest()
+
+
+# --------------------------------------------------------------------------
+# Imputacao: valores congelados + metodos sequenciais
+# --------------------------------------------------------------------------
+
+def _valor_metodo(serie: pd.Series, metodo: Any) -> Tuple[bool, Any]:
+    """Valor que imputar_por_coluna usaria para o metodo (False se nao imputa)."""
+    if metodo == "mean":
+        return True, serie.mean()
+    if metodo == "median":
+        # Mediana legada de imputar_por_coluna: (min + max) / 2
+        validos = serie.dropna()
+        return True, np.nan if validos.empty else (validos.min() + validos.max()) / 2
+    if metodo == "mode":
+        if serie.notna().any():
+            modo = serie.mode(dropna=True)
+            if len(modo) > 0:
+                return True, modo.iloc[0]
+        return False, None
+    if metodo == "zero":
+        return True, 0
+    return True, metodo
+
+
+def ajustar_imputacao(conv: pd.DataFrame, p: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Separa as colunas em valores fixos (ajustados no historico) e metodos sequenciais.
+
+    Segue as mesmas regras de roteamento de _imputar (imputar_por_coluna com
+    metodo padrao, ou imputar_numericos/imputar_categoricos).
+
+    p usa as chaves de executar_pipeline_processamento
+    (config_imputacao_customizada, metodo_imputacao_numerica,
+    metodo_imputacao_categorica, valor_constante_categorica). Devolve
+    {'valores', 'sequenciais'} e, com configuração customizada, 'stull'.
+    """
+    valores: Dict[str, Any] = {}
+    sequenciais: Dict[str, str] = {}
+    customizada = p["config_imputacao_customizada"]
+    metodo_padrao = p["metodo_imputacao_numerica"]
+
+    if customizada:
+        # Stull é por linha (sem estado); o método padrão é ajustado depois dele
+        colunas_stull = [c for c, m in customizada.items() if m == "stull" and c in conv.columns]
+        for coluna in colunas_stull:
+            conv = preencher_tu_stull(conv, coluna_tu=coluna)
+        config_normal = {
+            c: m for c, m in customizada.items() if m not in ("rolling_mean_48", "stull")
+        }
+        for coluna, metodo in config_normal.items():
+            if coluna not in conv.columns:
+                continue
+            if metodo in ("forward", "backward"):
+                sequenciais[coluna] = metodo
+            else:
+                imputa, valor = _valor_metodo(conv[coluna], metodo)
+                if imputa:
+                    valores[coluna] = valor
+        # Colunas de média móvel são interpoladas antes do método padrão e
+        # ficam todas preenchidas quando há algum valor válido
+        media_movel = {c for c, m in customizada.items() if m == "rolling_mean_48"}
+        restantes = (
+            [c for c in conv.columns if c not in config_normal and c not in media_movel]
+            if metodo_padrao else []
+        )
+        for coluna in restantes:
+            if pd.api.types.is_numeric_dtype(conv[coluna]):
+                metodo = metodo_padrao if metodo_padrao in {"mean", "median", "zero", "forward", "backward"} else 0
+            elif metodo_padrao in {"mode", "forward", "backward"}:
+                metodo = metodo_padrao
+            elif metodo_padrao in {"mean", "median", "zero"}:
+                metodo = "mode"
+            else:
+                metodo = metodo_padrao
+            if metodo in ("forward", "backward"):
+                sequenciais[coluna] = metodo
+                continue
+            imputa, valor = _valor_metodo(conv[coluna], metodo)
+            if imputa:
+                valores[coluna] = valor
+        for coluna in media_movel:
+            if coluna in conv.columns:
+                sequenciais.setdefault(coluna, "rolling_mean_48")
+        return {"valores": valores, "sequenciais": sequenciais, "stull": colunas_stull}
+
+    metodo_num = metodo_padrao
+    if metodo_num in {"mean", "median", "zero"}:
+        for coluna in conv.select_dtypes(include=[np.number]).columns:
+            serie = conv[coluna]
+            valores[coluna] = {"mean": serie.mean(), "median": serie.median(), "zero": 0}[metodo_num]
+    metodo_cat = (p["metodo_imputacao_categorica"] or "mode").lower()
+    metodo_cat = {"most_frequent": "mode", "constant": "const"}.get(metodo_cat, metodo_cat)
+    if metodo_cat in {"mode", "const"}:
+        for coluna in conv.select_dtypes(include=["string", "object"]).columns:
+            serie = conv[coluna]
+            if metodo_cat == "mode" and serie.notna().any():
+                valores[coluna] = serie.mode(dropna=True).iloc[0]
+            else:
+                valores[coluna] = p["valor_constante_categorica"]
+    return {"valores": valores, "sequenciais": sequenciais}
+
+
+def _ultimos_validos(conv: pd.DataFrame, sequenciais: Dict[str, str], deslocamento: int) -> Dict[str, int]:
+    """Posicao absoluta do ultimo valor valido de cada coluna sequencial (0 se nenhum)."""
+    posicoes = {}
+    for coluna in sequenciais:
+        if coluna not in conv.columns:
+            continue
+        validos = np.flatnonzero(conv[coluna].notna().to_numpy())
+        # Sem valor valido: qualquer valor novo pode alterar o historico inteiro
+        posicoes[coluna] = deslocamento + int(validos[-1]) if validos.size else 0
+    return posicoes
+
+
+def _aplicar_imputacao(
+    conv: pd.DataFrame,
+    imputacao: Dict[str, Dict[str, Any]],
+    inicio: int,
+    ultimos_validos: Dict[str, int],
+    cauda: pd.DataFrame,
+    coluna_data: Optional[str] = None,
+    coluna_hora: Optional[str] = None,
+) -> pd.DataFrame:
+    """Imputa as linhas conv (posicao absoluta inicial = inicio) com o estado congelado."""
+    df = conv.copy()
+    for coluna in imputacao.get("stull", []):
+        df = preencher_tu_stull(df, coluna_tu=coluna)
+    for coluna, valor in imputacao["valores"].items():
+        if coluna not in df.columns or not df[coluna].isna().any():
+            continue
+        serie = df[coluna]
+        if pd.api.types.is_integer_dtype(serie) and isinstance(valor, float) and not float(valor).is_integer():
+            serie = serie.astype(float)
+        df[coluna] = serie.fillna(valor)
+
+    for coluna, metodo in imputacao["sequenciais"].items():
+        if coluna not in df.columns:
+            continue
+        # Linhas antes do ultimo valor valido ja estao resolvidas na cauda salva
+        corte = max(ultimos_validos.get(coluna, inicio) - inicio, 0)
+        trecho = df.iloc[corte:]
+        if metodo == "forward":
+            resolvido = trecho[coluna].ffill()
+        elif metodo == "backward":
+            resolvido = trecho[coluna].bfill()
+        else:
+            resolvido = imputar_interpolacao_temporal(
+                trecho,
+                [coluna],
+                coluna_data=coluna_data,
+                coluna_hora=coluna_hora,
+                janela_fallback=config.JANELA_INTERPOLACAO_TEMPORAL,
+            )[coluna]
+        serie = df[coluna]
+        if corte:
+            anteriores = cauda[coluna].iloc[:corte]
+            serie = pd.concat([anteriores, resolvido])
+            serie.index = df.index
+        else:
+            serie = resolvido
+        df[coluna] = serie
+    return df
+
+
+# --------------------------------------------------------------------------
+# Features com estado ajustado
+# --------------------------------------------------------------------------
+
+def _codificar_com_mapeamentos(
+    df: pd.DataFrame,
+    mapeamentos: Dict[str, Dict[int, str]],
+    sufixo: str,
+) -> Tuple[pd.DataFrame, Dict[str, Dict[int, str]]]:
+    """
+    Label encoding com os mapeamentos ajustados.
+
+    Categorias novas recebem os proximos codigos na ordem de aparicao, o que
+    coincide com codificar_label aplicado ao historico completo.
+    """
+    df = df.copy()
+    atualizados = {}
+    for coluna, inverso in mapeamentos.items():
+        if coluna not in df.columns:
+            atualizados[coluna] = inverso
+            continue
+        vocabulario = [inverso[codigo] for codigo in sorted(inverso)]
+        codigos, atualizados[coluna] = codificar_label(df[coluna], vocabulario=vocabulario, estender=True)
+        df[f"{coluna}{sufixo}"] = codigos.astype("int64")
+    return df, atualizados
+
+
+def _codigos_estaveis(
+    df: pd.DataFrame,
+    mapeamentos: Dict[str, Dict[int, str]],
+    sufixo: str,
+    fim: int,
+) -> Dict[str, int]:
+    """
+    Quantos codigos de cada coluna ja aparecem nas linhas antes da cauda.
+
+    Valores que so existem na cauda (ex.: '__faltante__' ainda nao preenchido
+    por backward) podem sumir no reprocessamento; por isso so esse prefixo
+    do vocabulario e reaproveitado.
+    """
+    estaveis = {}
+    for coluna in mapeamentos:
+        codigos = df[f"{coluna}{sufixo}"].iloc[:fim] if f"{coluna}{sufixo}" in df.columns else []
+        estaveis[coluna] = int(codigos.max()) + 1 if len(codigos) else 0
+    return estaveis
+
+
+def _formatar_scalers(scalers: Dict[Any, Dict[str, Any]], colunas_normalizar: Any, cols: List[str]):
+    """Replica o formato de normalizar (info direta quando ha uma unica coluna em lista)."""
+    if isinstance(colunas_normalizar, dict) or len(cols) != 1:
+        return scalers
+    return {grupo: infos[cols[0]] for grupo, infos in scalers.items()}
+
+
+def _modo_normalizacao(p: Dict[str, Any], df_proc: pd.DataFrame) -> str:
+    """'incremental' (estatisticas por grupo), 'global' (renormaliza tudo) ou 'recalcular'."""
+    if not p["sufixo_normalizacao"]:
+        # Sem sufixo as colunas de origem sao sobrescritas
+        return "recalcular"
+    colunas = p["colunas_normalizar"]
+    metodos = set(colunas.values()) if isinstance(colunas, dict) else {p["metodo_normalizacao"]}
+    agrupamento = p["agrupamento_normalizacao"]
+    if metodos == {"standard"} and agrupamento and agrupamento in df_proc.columns:
+        return "incremental"
+    return "global"
+
+
+def _alinhar_tipos(df: pd.DataFrame, referencia: pd.Series) -> pd.DataFrame:
+    """Converte colunas de volta aos dtypes da saida original quando possivel."""
+    for coluna, dtype in referencia.items():
+        if coluna not in df.columns or df[coluna].dtype == dtype:
+            continue
+        alvo = "category" if isinstance(dtype, pd.CategoricalDtype) else dtype
+        try:
+            df[coluna] = df[coluna].astype(alvo)
+        except (TypeError, ValueError):
+            pass
+    return df
+
+
+def _estatisticas_deriva(df_proc: pd.DataFrame) -> NormalizadorIncremental:
+    cols = df_proc.select_dtypes(include=["number"]).columns.tolist()
+    acumulado = NormalizadorIncremental(cols, agrupamento=_COLUNA_TOTAL)
+    acumulado.atualizar(df_proc[cols].assign(**{_COLUNA_TOTAL: 0}))
+    return acumulado
+
+
+def _medir_deriva(acumulado: NormalizadorIncremental, referencia: Dict[str, Dict[str, float]]) -> float:
+    """Maior deslocamento da media (em desvios-padrao de referencia) entre as colunas."""
+    medias, _ = acumulado.medias_desvios()
+    deriva = 0.0
+    for coluna, media in medias.iloc[0].items():
+        ref = referencia.get(coluna)
+        if not ref or not ref["std"] or pd.isna(media) or pd.isna(ref["mean"]):
+            continue
+        deriva = max(deriva, abs(media - ref["mean"]) / ref["std"])
+    return float(deriva)
+
+
+# --------------------------------------------------------------------------
+# Execucoes
+# --------------------------------------------------------------------------
+
+def _validar(conv: pd.DataFrame, p: Dict[str, Any]) -> None:
+    """Mesma validação de esquema do pipeline de processamento (config.VALIDAR_ESQUEMA)."""
+    if config.VALIDAR_ESQUEMA:
+        colunas = [p["coluna_data"], p["coluna_hora"], *p["colunas_float"], *p["colunas_int"], *p["colunas_categoricas"]]
+        _validar_esquema(conv, colunas, p["config_imputacao_customizada"])
+
+
+def _executar_completo(
+    df: pd.DataFrame,
+    p: Dict[str, Any],
+    hashes: np.ndarray,
+) -> Tuple[pd.DataFrame, Dict, Dict[str, Any]]:
+    """Mesmo fluxo de executar_pipeline_completo, guardando o estado ajustado."""
+    conv = _limpar_e_converter(
+        df,
+        p["substituicoes"],
+        p["coluna_data"],
+        p["coluna_hora"],
+        p["colunas_float"],
+        p["colunas_int"],
+        p["colunas_categoricas"],
+    )
+    _validar(conv, p)
+    imputacao = ajustar_imputacao(conv, p)
+    proc = _imputar(
+        conv,
+        p["config_imputacao_customizada"],
+        p["metodo_imputacao_numerica"],
+        p["metodo_imputacao_categorica"],
+        p["valor_constante_categorica"],
+        coluna_data=p["coluna_data"],
+        coluna_hora=p["coluna_hora"],
+    )
+    if p["criar_agrupamento_temporal"]:
+        proc = garantir_agrupamento_temporal(
+            proc, p["coluna_data"], p["coluna_hora"], p["nome_coluna_agrupamento"]
+        )
+
+    df_final, artefatos = executar_pipeline_features(
+        proc,
+        colunas_categoricas=p["colunas_categoricas"],
+        aplicar_codificacao=p["aplicar_codificacao"],
+        metodo_codificacao=p["metodo_codificacao"],
+        sufixo_codificacao=p["sufixo_codificacao"],
+        onehot_esparso=p["onehot_esparso"],
+        aplicar_normalizacao=p["aplicar_normalizacao"],
+        colunas_normalizar=p["colunas_normalizar"],
+        metodo_normalizacao=p["metodo_normalizacao"],
+        agrupamento_normalizacao=p["agrupamento_normalizacao"],
+        sufixo_normalizacao=p["sufixo_normalizacao"],
+        criar_features_derivadas=p["criar_features_derivadas"],
+        tipos_features_derivadas=p["tipos_features_derivadas"],
+        compactar_memoria=p["compactar_memoria"],
+        tolerancia_compactacao=p["tolerancia_compactacao"],
+    )
+
+    ultimos = _ultimos_validos(conv, imputacao["sequenciais"], 0)
+    inicio_cauda = min(ultimos.values(), default=len(df))
+
+    normalizacao: Dict[str, Any] = {"modo": None}
+    if p["aplicar_normalizacao"]:
+        sufixo = p["sufixo_normalizacao"]
+        modo = _modo_normalizacao(p, proc)
+        cols = [
+            c[: -len(sufixo)] for c in artefatos.get("colunas_normalizadas", [])
+            if sufixo and c[: -len(sufixo)] in df_final.columns
+        ]
+        normalizacao = {"modo": modo, "colunas": cols, "normalizador": None}
+        if modo == "incremental" and cols:
+            normalizador = NormalizadorIncremental(cols, p["agrupamento_normalizacao"], sufixo)
+            normalizador.atualizar(df_final)
+            normalizacao["normalizador"] = normalizador.para_dict()
+
+    acumulado = _estatisticas_deriva(proc)
+    medias, desvios = acumulado.medias_desvios()
+    referencia = {
+        c: {"mean": float(medias.iloc[0][c]), "std": float(desvios.iloc[0][c])}
+        for c in acumulado.colunas
+    }
+
+    estado = {
+        "versao": _VERSAO_ESTADO,
+        "marca_dagua": len(df),
+        "hash_prefixo": _resumo_hashes(hashes),
+        "colunas_brutas": list(df.columns),
+        "linhas_saida": len(df_final),
+        "imputacao": imputacao,
+        "ultimos_validos": ultimos,
+        "inicio_cauda": inicio_cauda,
+        "cauda": proc.iloc[inicio_cauda:],
+        "codigos_estaveis": _codigos_estaveis(
+            df_final, artefatos.get("mapeamentos_codificacao", {}), p["sufixo_codificacao"], inicio_cauda
+        ),
+        "normalizacao": normalizacao,
+        "referencia_deriva": referencia,
+        "acumulado_deriva": acumulado.para_dict(),
+        "artefatos": artefatos,
+    }
+    return df_final, artefatos, estado
+
+
+def _executar_delta(
+    df: pd.DataFrame,
+    saida: pd.DataFrame,
+    estado: Dict[str, Any],
+    p: Dict[str, Any],
+    limite_deriva: float,
+    hashes: np.ndarray,
+) -> Union[str, Tuple[pd.DataFrame, Dict, Dict[str, Any]]]:
+    """Processa linhas novas + cauda; retorna o motivo se precisar recalcular tudo."""
+    marca = estado["marca_dagua"]
+    inicio = estado["inicio_cauda"]
+
+    conv = _limpar_e_converter(
+        df.iloc[inicio:],
+        p["substituicoes"],
+        p["coluna_data"],
+        p["coluna_hora"],
+        p["colunas_float"],
+        p["colunas_int"],
+        p["colunas_categoricas"],
+    )
+    # A cauda já foi validada: só as linhas novas
+    _validar(conv.iloc[marca - inicio:], p)
+    proc = _aplicar_imputacao(
+        conv,
+        estado["imputacao"],
+        inicio,
+        estado["ultimos_validos"],
+        estado["cauda"],
+        coluna_data=p["coluna_data"],
+        coluna_hora=p["coluna_hora"],
+    )
+    if p["criar_agrupamento_temporal"]:
+        proc = garantir_agrupamento_temporal(
+            proc, p["coluna_data"], p["coluna_hora"], p["nome_coluna_agrupamento"]
+        )
+
+    # Deriva medida apenas sobre as linhas novas
+    acumulado = NormalizadorIncremental.de_dict(estado["acumulado_deriva"])
+    novas = proc.iloc[marca - inicio:]
+    acumulado.atualizar(novas.reindex(columns=acumulado.colunas).assign(**{_COLUNA_TOTAL: 0}))
+    deriva = _medir_deriva(acumulado, estado["referencia_deriva"])
+    if deriva > limite_deriva:
+        return f"deriva {deriva:.3f} acima do limite {limite_deriva}"
+
+    artefatos = dict(estado["artefatos"])
+    feat = proc
+    if p["criar_features_derivadas"]:
+        feat = adicionar_features_derivadas(feat, tipos=p["tipos_features_derivadas"])
+    if p["aplicar_codificacao"] and p["colunas_categoricas"]:
+        if p["metodo_codificacao"] == "label":
+            estaveis = estado["codigos_estaveis"]
+            base = {
+                coluna: {codigo: valor for codigo, valor in inverso.items() if codigo < estaveis.get(coluna, 0)}
+                for coluna, inverso in artefatos.get("mapeamentos_codificacao", {}).items()
+            }
+            feat, mapeamentos = _codificar_com_mapeamentos(feat, base, p["sufixo_codificacao"])
+            artefatos["mapeamentos_codificacao"] = mapeamentos
+        elif p["metodo_codificacao"] == "onehot":
+            cols = [c for c in p["colunas_categoricas"] if c in feat.columns]
+            categorias = artefatos.get("categorias_onehot", {})
+            for coluna in cols:
+                valores = feat[coluna].dropna()
+                if not valores.isin(categorias.get(coluna, [])).all():
+                    return "categorias novas na codificação one-hot"
+            feat = aplicar_dummy(feat, cols, esparso=p["onehot_esparso"], categorias=categorias)
+
+    combinado = pd.concat([saida.iloc[:inicio], feat.reindex(columns=saida.columns)])
+
+    normalizacao = estado["normalizacao"]
+    if p["aplicar_normalizacao"]:
+        sufixo = p["sufixo_normalizacao"]
+        cols = normalizacao["colunas"]
+        if normalizacao["modo"] == "recalcular":
+            return "normalização sem sufixo não permite atualização incremental"
+        if normalizacao["modo"] == "incremental" and cols:
+            agrupamento = p["agrupamento_normalizacao"]
+            normalizador = NormalizadorIncremental.de_dict(normalizacao["normalizador"])
+            afetadas = combinado[agrupamento].isin(feat[agrupamento].unique()).to_numpy()
+            normalizador.atualizar(combinado.loc[afetadas], substituir=True)
+            transformado = normalizador.transformar(combinado.loc[afetadas])
+            posicoes = np.flatnonzero(afetadas)
+            for coluna in cols:
+                destino = combinado.columns.get_loc(f"{coluna}{sufixo}")
+                combinado.iloc[posicoes, destino] = transformado[f"{coluna}{sufixo}"].to_numpy()
+            scalers = _formatar_scalers(normalizador.scalers(), p["colunas_normalizar"], cols)
+            normalizacao = {**normalizacao, "normalizador": normalizador.para_dict()}
+        else:
+            colunas = p["colunas_normalizar"] if isinstance(p["colunas_normalizar"], dict) else cols
+            combinado, scalers = normalizar(
+                combinado,
+                colunas=colunas,
+                metodo=p["metodo_normalizacao"],
+                agrupamento=p["agrupamento_normalizacao"],
+                sufixo=sufixo,
+            )
+        artefatos["scalers_normalizacao"] = scalers
+
+    combinado = _alinhar_tipos(combinado, saida.dtypes)
+    artefatos["artefatos_codificacao"] = {
+        k: v for k, v in artefatos.items() if k in ["mapeamentos_codificacao", "colunas_onehot", "categorias_onehot"]
+    }
+
+    ultimos = dict(estado["ultimos_validos"])
+    ultimos.update({
+        c: pos for c, pos in _ultimos_validos(conv, estado["imputacao"]["sequenciais"], inicio).items()
+        if conv[c].notna().any()
+    })
+    # Colunas sem valor novo mantem a posicao anterior (>= inicio)
+    inicio_cauda = min(ultimos.values(), default=len(df))
+
+    novo_estado = {
+        **estado,
+        "marca_dagua": len(df),
+        "hash_prefixo": _resumo_hashes(hashes),
+        "linhas_saida": len(combinado),
+        "ultimos_validos": ultimos,
+        "inicio_cauda": inicio_cauda,
+        "cauda": proc.iloc[inicio_cauda - inicio:],
+        "codigos_estaveis": _codigos_estaveis(
+            combinado, artefatos.get("mapeamentos_codificacao", {}), p["sufixo_codificacao"], inicio_cauda
+        ),
+        "normalizacao": normalizacao,
+        "acumulado_deriva": acumulado.para_dict(),
+        "artefatos": artefatos,
+    }
+    artefatos = {**artefatos, "incremental": {
+        "modo": "incremental",
+        "linhas_novas": len(df) - marca,
+        "linhas_reprocessadas": marca - inicio,
+        "deriva": deriva,
+    }}
+    return combinado, artefatos, novo_estado
+
+
+def _carregar_estado(pasta: Path) -> Tuple[Optional[Dict[str, Any]], Optional[pd.DataFrame]]:
+    caminho_estado, caminho_saida = pasta / ARQUIVO_ESTADO, pasta / ARQUIVO_SAIDA
+    if not (caminho_estado.exists() and caminho_saida.exists()):
+        return None, None
+    try:
+        estado = joblib.load(caminho_estado)
+        saida = pd.read_pickle(caminho_saida)
+    except Exception:
+        return None, None
+    if estado.get("versao") != _VERSAO_ESTADO or estado.get("linhas_saida") != len(saida):
+        return None, None
+    return estado, saida
+
+
+def _salvar_estado(pasta: Path, saida: pd.DataFrame, estado: Dict[str, Any]) -> None:
+    pasta.mkdir(parents=True, exist_ok=True)
+    # Saida antes do estado: 'linhas_saida' invalida um checkpoint pela metade
+    gravar_atomico(pasta / ARQUIVO_SAIDA, lambda caminho: saida.to_pickle(caminho))
+    gravar_atomico(pasta / ARQUIVO_ESTADO, lambda caminho: joblib.dump(estado, caminho))
+
+
+def _motivo_recalculo(
+    estado: Optional[Dict[str, Any]],
+    df: pd.DataFrame,
+    assinatura: str,
+    hashes: np.ndarray,
+) -> Optional[str]:
+    if estado is None:
+        return "sem checkpoint"
+    if estado.get("assinatura") != assinatura:
+        return "parâmetros alterados"
+    if list(df.columns) != estado["colunas_brutas"]:
+        return "colunas alteradas"
+    marca = estado["marca_dagua"]
+    if len(df) < marca or _resumo_hashes(hashes[:marca]) != estado["hash_prefixo"]:
+        return "histórico alterado"
+    return None
+
+
+def executar_pipeline_incremental(
+    df: pd.DataFrame,
+    diretorio_checkpoint: Union[str, Path],
+    limite_deriva: Optional[float] = None,
+    forcar_recalculo: bool = False,
+    **parametros: Any,
+) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Executa o pipeline completo processando apenas as linhas novas.
+
+    df deve conter o historico completo (linhas ja processadas seguidas das
+    novas). Com checkpoint valido, as linhas novas e a cauda dependente de
+    backward/forward/interpolacao sao processadas com o estado ajustado
+    (valores de imputacao, mapeamentos de codificacao e estatisticas de
+    normalizacao por grupo) e anexadas a saida salva. Recalcula tudo se nao
+    houver checkpoint, se parametros/colunas/historico mudarem ou se a media
+    de alguma coluna numerica se deslocar mais que limite_deriva desvios.
+
+    Args:
+        df: DataFrame bruto com o historico completo
+        diretorio_checkpoint: Pasta do checkpoint (estado + saida processada)
+        limite_deriva: Deslocamento maximo da media em desvios-padrao
+            (usa config.LIMITE_DERIVA_INCREMENTAL se None)
+        forcar_recalculo: Ignora o checkpoint e recalcula tudo
+        **parametros: Mesmos parametros de executar_pipeline_completo
+
+    Returns:
+        Tupla (df_completo, artefatos); artefatos['incremental'] descreve a
+        execucao (modo, linhas novas/reprocessadas, deriva ou motivo)
+    """
+    pasta = Path(diretorio_checkpoint)
+    limite = config.LIMITE_DERIVA_INCREMENTAL if limite_deriva is None else limite_deriva
+    p = _resolver_parametros(parametros)
+    assinatura = _assinatura(p)
+    hashes = _hashes_linhas(df)
+
+    estado, saida = (None, None) if forcar_recalculo else _carregar_estado(pasta)
+    motivo = "recálculo forçado" if forcar_recalculo else _motivo_recalculo(estado, df, assinatura, hashes)
+
+    if motivo is None and len(df) == estado["marca_dagua"]:
+        print("♻️ Pipeline incremental: nenhuma linha nova")
+        artefatos = {**estado["artefatos"], "incremental": {"modo": "sem_alteracoes", "linhas_novas": 0}}
+        return saida, artefatos
+
+    if motivo is None:
+        print(f"♻️ Pipeline incremental: {len(df) - estado['marca_dagua']} linhas novas")
+        resultado = _executar_delta(df, saida, estado, p, limite, hashes)
+        if not isinstance(resultado, str):
+            df_final, artefatos, novo_estado = resultado
+            _salvar_estado(pasta, df_final, novo_estado)
+            return df_final, artefatos
+        motivo = resultado
+
+    print(f"🔁 Pipeline incremental: recalculando tudo ({motivo})")
+    df_final, artefatos, novo_estado = _executar_completo(df, p, hashes)
+    novo_estado["assinatura"] = assinatura
+    _salvar_estado(pasta, df_final, novo_estado)
+    artefatos = {**artefatos, "incremental": {"modo": "completo", "motivo": motivo, "linhas_novas": len(df)}}
+    return df_final, artefatos
+
+
+__all__ = ["executar_pipeline_incremental", "ajustar_imputacao"]
@@ -13,6 +13,7 @@ from ..processamento.limpeza import (
     converter_colunas_float,
     converter_colunas_int,
     converter_colunas_categoricas,
+    limpar_e_converter_arrow,
 )
 from ..processamento.temporal import (
     converter_colunas_temporais,
@@ -22,8 +23,15 @@ from ..processamento.imputacao import (
     imputar_numericos,
     imputar_categoricos,
     imputar_por_coluna,
-    imputar_media_movel_interpolada,
+    imputar_interpolacao_temporal,
 )
+from ..processamento.memoria import compactar_tipos
+from ..features.criacao_features.calcular_tu_stull import preencher_tu_stull
+from ..processamento.tabelas import TabelasClima, separar_tabelas_clima
+from ..processamento.validacao import compilar_esquema
+from .perfil_etapas import PERFIL_INATIVO, PerfilEtapas
+
+BACKENDS_PROCESSAMENTO = ("pandas", "arrow")
 
 
 def executar_pipeline_processamento(
@@ -40,6 +48,14 @@ def executar_pipeline_processamento(
     config_imputacao_customizada: Optional[Dict[str, str]] = None,
     criar_agrupamento_temporal: bool = True,
     nome_coluna_agrupamento: str = "mes-ano",
+    coluna_data_hora: Optional[str] = None,
+    compactar_memoria: Optional[bool] = None,
+    tolerancia_compactacao: Optional[float] = None,
+    n_trabalhadores: Optional[int] = None,
+    modo_execucao: Optional[str] = None,
+    perfil: Optional[PerfilEtapas] = None,
+    backend: Optional[str] = None,
+    validar_esquema: Optional[bool] = None,
 ) -> pd.DataFrame:
     """
     Executa o pipeline de processamento base (sem engenharia de features).
@@ -47,6 +63,7 @@ def executar_pipeline_processamento(
     Inclui:
     - Limpeza (substituições)
     - Conversões de tipo (temporal, float, int, categórica)
+    - Validação do esquema (tipos, faixas e faltantes)
     - Imputação (numérica e categórica)
     - Criação de agrupamento temporal (opcional)
     
@@ -71,6 +88,23 @@ def executar_pipeline_processamento(
             Se fornecido, tem prioridade sobre métodos globais
         criar_agrupamento_temporal: Se deve criar coluna de agrupamento temporal
         nome_coluna_agrupamento: Nome da coluna de agrupamento temporal
+        coluna_data_hora: Se informado, cria coluna datetime combinando data e hora
+            (ex.: 'data_cplt')
+        compactar_memoria: Se deve compactar dtypes ao final (usa config se None);
+            o relatório por coluna fica no evento 'compactacao' do perfil,
+            em registro['relatorio_compactacao']
+        tolerancia_compactacao: Erro relativo máximo em float32 (usa config se None)
+        n_trabalhadores: Trabalhadores para a imputação por coluna (usa config se None)
+        modo_execucao: 'thread' ou 'processo' (usa config se None)
+        perfil: PerfilEtapas que registra tempo, CPU, memória, linhas e
+            colunas criadas de cada etapa (None desativa a medição)
+        backend: 'pandas' ou 'arrow' para limpeza e conversões (usa config
+            se None); o resultado é o mesmo
+        validar_esquema: Confere as colunas convertidas contra TYPE_DICT,
+            LIMITES_VALORES e TAXA_MAXIMA_FALTANTES antes da imputação e
+            levanta ErroValidacaoEsquema com o relatório por coluna (usa
+            config se None); colunas de config_imputacao_customizada não
+            têm taxa máxima de faltantes, pois a imputação as preenche
         
     Returns:
         DataFrame processado (sem features de engenharia)
@@ -85,57 +119,279 @@ def executar_pipeline_processamento(
     metodo_imputacao_numerica = metodo_imputacao_numerica or config.METODO_IMPUTACAO_NUM
     metodo_imputacao_categorica = metodo_imputacao_categorica or config.METODO_IMPUTACAO_CAT
     valor_constante_categorica = valor_constante_categorica or config.VALOR_CONST_CATEGORICA
+    if n_trabalhadores is None:
+        n_trabalhadores = config.N_TRABALHADORES_PIPELINE
+    modo_execucao = modo_execucao or config.MODO_EXECUCAO_PARALELA
+    
+    perfil = perfil or PERFIL_INATIVO
+    
+    print("🔄 Iniciando pipeline de processamento BASE...")
+    with perfil.etapa("processamento", df) as medicao_total:
+        # ETAPA 1: Limpeza e conversões de tipo (uma passada só)
+        with perfil.etapa("limpeza_conversao", df) as medicao:
+            print("  1️⃣ Aplicando substituições de limpeza e convertendo tipos...")
+            df_proc = _limpar_e_converter(
+                df,
+                substituicoes,
+                coluna_data,
+                coluna_hora,
+                colunas_float,
+                colunas_int,
+                colunas_categoricas,
+                coluna_data_hora=coluna_data_hora,
+                backend=backend,
+            )
+            medicao.saida(df_proc)
+        
+        # Validação do esquema: falha antes de imputar um lote inválido
+        if config.VALIDAR_ESQUEMA if validar_esquema is None else validar_esquema:
+            with perfil.etapa("validacao", df_proc):
+                _validar_esquema(
+                    df_proc,
+                    [coluna_data, coluna_hora, *colunas_float, *colunas_int, *colunas_categoricas],
+                    config_imputacao_customizada,
+                )
+        
+        # ETAPA 2: Imputação
+        with perfil.etapa("imputacao", df_proc) as medicao:
+            print("  2️⃣ Imputando valores faltantes...")
+            df_proc = _imputar(
+                df_proc,
+                config_imputacao_customizada,
+                metodo_imputacao_numerica,
+                metodo_imputacao_categorica,
+                valor_constante_categorica,
+                n_trabalhadores=n_trabalhadores,
+                modo_execucao=modo_execucao,
+                coluna_data=coluna_data,
+                coluna_hora=coluna_hora,
+            )
+            medicao.saida(df_proc)
+        
+        # ETAPA 3: Features Temporais (agrupamento)
+        if criar_agrupamento_temporal:
+            with perfil.etapa("agrupamento_temporal", df_proc) as medicao:
+                print("  3️⃣ Criando agrupamento temporal...")
+                df_proc = garantir_agrupamento_temporal(
+                    df_proc, 
+                    coluna_data, 
+                    coluna_hora, 
+                    nome_coluna_agrupamento
+                )
+                medicao.saida(df_proc)
+        
+        # ETAPA 4: Compactação de tipos (opcional)
+        if config.COMPACTAR_TIPOS if compactar_memoria is None else compactar_memoria:
+            with perfil.etapa("compactacao", df_proc) as medicao:
+                df_proc, relatorio = compactar_tipos(
+                    df_proc,
+                    tolerancia=tolerancia_compactacao or config.TOLERANCIA_COMPACTACAO,
+                    limite_cardinalidade=config.LIMITE_CARDINALIDADE_CATEGORIA,
+                )
+                medicao.saida(df_proc)
+                medicao.anotar(relatorio_compactacao=relatorio.to_dict("records"))
+            antes_mb = relatorio["bytes_antes"].sum() / 1024**2
+            depois_mb = relatorio["bytes_depois"].sum() / 1024**2
+            print(f"  4️⃣ Compactando tipos: {antes_mb:.2f} MB → {depois_mb:.2f} MB")
+        
+        medicao_total.saida(df_proc)
     
+    print(f"✅ Pipeline BASE concluído! Shape final: {df_proc.shape}")
+    
+    return df_proc
+
+
+def executar_pipeline_processamento_tabelas(
+    df: pd.DataFrame,
+    colunas_clima: Optional[List[str]] = None,
+    coluna_data: Optional[str] = None,
+    coluna_hora: Optional[str] = None,
+    criar_agrupamento_temporal: bool = True,
+    nome_coluna_agrupamento: str = "mes-ano",
+    perfil: Optional[PerfilEtapas] = None,
+    **parametros,
+) -> TabelasClima:
+    """
+    Processamento base com o clima numa tabela própria (uma linha por instante).
+
+    O lote é separado por data + hora antes da limpeza: limpeza, conversão,
+    validação e imputação das colunas de clima rodam uma vez por instante, e
+    as dos respondentes, na tabela de respondentes. As tabelas só são unidas
+    na materialização das features (executar_pipeline_features_tabelas).
+
+    Estatísticas das imputações padrão (mediana, moda) das colunas de clima
+    passam a ser por instante, não ponderadas pelo número de respondentes;
+    a interpolação temporal já era por instante e não muda.
+
+    Args:
+        df: DataFrame original (uma linha por respondente)
+        colunas_clima: Colunas meteorológicas (usa config.COLUNAS_CLIMA se None)
+        coluna_data: Nome da coluna de data (usa config se None)
+        coluna_hora: Nome da coluna de hora (usa config se None)
+        criar_agrupamento_temporal: Cria o agrupamento na tabela de respondentes
+        nome_coluna_agrupamento: Nome da coluna de agrupamento temporal
+        perfil: PerfilEtapas (None desativa a medição)
+        **parametros: Demais parâmetros de executar_pipeline_processamento,
+            aplicados às duas tabelas
+
+    Returns:
+        TabelasClima com as duas tabelas processadas
+    """
+    colunas_clima = colunas_clima or config.COLUNAS_CLIMA
+    coluna_data = coluna_data or config.COLUNA_DATA
+    coluna_hora = coluna_hora or config.COLUNA_HORA
+    perfil = perfil or PERFIL_INATIVO
+
+    with perfil.etapa("processamento_tabelas", df) as medicao_total:
+        with perfil.etapa("separacao_clima", df):
+            tabelas = separar_tabelas_clima(
+                df.set_axis(padronizar_nomes(df.columns), axis=1),
+                colunas_clima,
+                chave=(coluna_data, coluna_hora),
+            )
+        print(
+            f"🌦️ Clima: {len(tabelas.clima)} instantes para {len(tabelas.respondentes)} "
+            f"respondentes ({tabelas.fator_repeticao:.1f}x)"
+        )
+        processar = dict(parametros, coluna_data=coluna_data, coluna_hora=coluna_hora, perfil=perfil)
+        clima = executar_pipeline_processamento(
+            tabelas.clima, criar_agrupamento_temporal=False, **processar
+        )
+        respondentes = executar_pipeline_processamento(
+            tabelas.respondentes,
+            criar_agrupamento_temporal=criar_agrupamento_temporal,
+            nome_coluna_agrupamento=nome_coluna_agrupamento,
+            **processar,
+        )
+        tabelas = tabelas.substituir(clima=clima, respondentes=respondentes)
+        medicao_total.saida(respondentes)
+    return tabelas
+
+
+def padronizar_nomes(colunas: pd.Index) -> List[str]:
+    """Nomes internos das colunas: minúsculas, sem espaços nas pontas, '_' no lugar de espaço."""
+    return [c.lower().strip().replace(" ", "_") for c in colunas]
+
+
+def _limpar_e_converter(
+    df: pd.DataFrame,
+    substituicoes: Dict,
+    coluna_data: str,
+    coluna_hora: str,
+    colunas_float: List[str],
+    colunas_int: List[str],
+    colunas_categoricas: List[str],
+    coluna_data_hora: Optional[str] = None,
+    backend: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Padroniza nomes, aplica substituições e converte tipos (operações por linha).
+
+    backend 'arrow' faz substituições e conversões float/int/categórica com
+    pyarrow.compute (resultado idêntico ao 'pandas'); data e hora são
+    convertidas no pandas nos dois casos.
+    """
+    backend = backend or config.BACKEND_PROCESSAMENTO
+    if backend not in BACKENDS_PROCESSAMENTO:
+        raise ValueError(f"Backend inválido: {backend}. Use {BACKENDS_PROCESSAMENTO}")
+
     # Copiar DataFrame para não modificar original
     df_proc = df.copy()
     
     # Padronizar nomes de colunas
-    df_proc.columns = [c.lower().strip().replace(" ", "_") for c in df_proc.columns]
-    
-    print("🔄 Iniciando pipeline de processamento BASE...")
+    df_proc.columns = padronizar_nomes(df_proc.columns)
     
-    # ETAPA 1: Limpeza - Substituições
-    print("  1️⃣ Aplicando substituições de limpeza...")
-    df_proc = aplicar_substituicoes(df_proc, substituicoes)
-    
-    # ETAPA 2: Conversões de Tipo
-    print("  2️⃣ Convertendo tipos de dados...")
-    df_proc = converter_colunas_temporais(df_proc, coluna_data, coluna_hora)
+    if backend == "arrow":
+        temporais = [coluna_data, coluna_hora]
+        df_proc = limpar_e_converter_arrow(
+            df_proc, substituicoes, colunas_float, colunas_int, colunas_categoricas,
+            colunas_temporais=temporais,
+        )
+        df_proc = converter_colunas_temporais(
+            df_proc, coluna_data, coluna_hora, coluna_data_hora=coluna_data_hora
+        )
+        # Data/hora que também estejam nas listas seguem a ordem do backend pandas
+        colunas_float = [c for c in colunas_float or [] if c in temporais]
+        colunas_int = [c for c in colunas_int or [] if c in temporais]
+        colunas_categoricas = [c for c in colunas_categoricas or [] if c in temporais]
+    else:
+        df_proc = aplicar_substituicoes(df_proc, substituicoes)
+        df_proc = converter_colunas_temporais(
+            df_proc, coluna_data, coluna_hora, coluna_data_hora=coluna_data_hora
+        )
     df_proc = converter_colunas_float(df_proc, colunas_float)
     df_proc = converter_colunas_int(df_proc, colunas_int)
     df_proc = converter_colunas_categoricas(df_proc, colunas_categoricas)
-    
-    # ETAPA 3: Imputação
-    print("  3️⃣ Imputando valores faltantes...")
-    
+    return df_proc
+
+
+def _validar_esquema(
+    df_proc: pd.DataFrame,
+    colunas: List[str],
+    config_imputacao_customizada: Optional[Dict[str, str]],
+) -> pd.DataFrame:
+    """Valida as colunas convertidas contra o esquema do config (ErroValidacaoEsquema)."""
+    esquema = compilar_esquema(
+        config.TYPE_DICT,
+        config.LIMITES_VALORES,
+        config.TAXA_MAXIMA_FALTANTES,
+        colunas=colunas,
+        isentas_faltantes=config_imputacao_customizada,
+    )
+    return esquema.validar(df_proc)
+
+
+def _imputar(
+    df_proc: pd.DataFrame,
+    config_imputacao_customizada: Optional[Dict[str, str]],
+    metodo_imputacao_numerica: str,
+    metodo_imputacao_categorica: str,
+    valor_constante_categorica: str,
+    n_trabalhadores: Optional[int] = 1,
+    modo_execucao: str = "thread",
+    coluna_data: Optional[str] = None,
+    coluna_hora: Optional[str] = None,
+) -> pd.DataFrame:
+    """Imputação por coluna (config customizada) ou pelos métodos globais."""
     if config_imputacao_customizada:
         # Separar configurações especiais (média móvel) das normais
         config_normal = {}
         colunas_media_movel = []
+        colunas_stull = []
         
         for coluna, metodo in config_imputacao_customizada.items():
             if metodo == "rolling_mean_48":
                 colunas_media_movel.append(coluna)
+            elif metodo == "stull":
+                colunas_stull.append(coluna)
             else:
                 config_normal[coluna] = metodo
         
+        # Séries meteorológicas: interpolação no tempo, todas as colunas de uma
+        # vez; vem antes do método padrão, que só cobre o que sobrar
+        if colunas_media_movel:
+            df_proc = imputar_interpolacao_temporal(
+                df_proc,
+                colunas_media_movel,
+                coluna_data=coluna_data or config.COLUNA_DATA,
+                coluna_hora=coluna_hora or config.COLUNA_HORA,
+                janela_fallback=config.JANELA_INTERPOLACAO_TEMPORAL,
+            )
+        
+        # Bulbo úmido (Stull) a partir de tmedia e ur, vetorizado; linhas sem
+        # entrada válida ou fora do domínio seguem para o método padrão
+        for coluna in colunas_stull:
+            df_proc = preencher_tu_stull(df_proc, coluna_tu=coluna)
+        
         # Aplicar imputação normal
         if config_normal:
             df_proc = imputar_por_coluna(
                 df_proc,
                 config_normal,
-                metodo_padrao=metodo_imputacao_numerica
+                metodo_padrao=metodo_imputacao_numerica,
+                n_trabalhadores=n_trabalhadores,
+                modo_execucao=modo_execucao,
             )
-        
-        # Aplicar média móvel + interpolação para séries temporais
-        for coluna in colunas_media_movel:
-            if coluna in df_proc.columns:
-                df_proc = imputar_media_movel_interpolada(
-                    df_proc,
-                    coluna,
-                    window=48,
-                    metodo_interpolacao="linear"
-                )
     else:
         # Usa métodos globais (antigo comportamento)
         df_proc = imputar_numericos(df_proc, metodo_imputacao_numerica)
@@ -144,20 +400,7 @@ def executar_pipeline_processamento(
             metodo_imputacao_categorica, 
             valor_constante_categorica
         )
-    
-    # ETAPA 4: Features Temporais (agrupamento)
-    if criar_agrupamento_temporal:
-        print("  4️⃣ Criando agrupamento temporal...")
-        df_proc = garantir_agrupamento_temporal(
-            df_proc, 
-            coluna_data, 
-            coluna_hora, 
-            nome_coluna_agrupamento
-        )
-    
-    print(f"✅ Pipeline BASE concluído! Shape final: {df_proc.shape}")
-    
     return df_proc
 
 
-__all__ = ['executar_pipeline_processamento']
+__all__ = ['executar_pipeline_processamento', 'executar_pipeline_processamento_tabelas', 'padronizar_nomes']
@@ -10,7 +10,8 @@ from config.config_gerais import METRICAS_CLASSIFICACAO, METRICAS_REGRESSAO
 from src.treinamento.configuracao import criar_experimento
 from src.treinamento.treino import treinar_modelo_base, otimizar_modelo, finalizar_modelo
 from src.treinamento.avaliacao import classificar_metricas
-from src.treinamento.persistencia import salvar_modelo
+from src.treinamento.persistencia import salvar_features_modelo, salvar_modelo
+from src.treinamento.utils import extrair_features_modelo
 
 # Tipo literal para validação
 TipoProblema = Literal["classificacao", "regressao"]
@@ -69,6 +70,9 @@ def treinar_pipeline_completo(
             - modelo_otimizado: Modelo após otimização (se aplicável)
             - modelo_finalizado: Modelo após finalização (se aplicável)
             - caminho_modelo: Caminho do modelo salvo (se aplicável)
+            - features_modelo: colunas_entrada do pipeline PyCaret e as
+              features_modelo que o estimador usa (ver extrair_features_modelo)
+            - caminho_features: JSON com features_modelo, ao lado do modelo
             - tipo_problema: Tipo de problema usado
             
     Examples:
@@ -129,6 +133,8 @@ def treinar_pipeline_completo(
         "metricas_otimizacao": None,
         "modelo_finalizado": None,
         "caminho_modelo": None,
+        "features_modelo": None,
+        "caminho_features": None,
     }
     
     # ETAPA 1: Setup do experimento
@@ -214,6 +220,15 @@ def treinar_pipeline_completo(
     else:
         logger.info("\nETAPA 4: Finalização PULADA")
     
+    # Colunas que o modelo final usa (poda do pipeline na escoragem)
+    features_modelo = extrair_features_modelo(melhor_modelo, coluna_alvo)
+    resultado["features_modelo"] = features_modelo
+    if features_modelo is not None:
+        logger.info(
+            f"  Features usadas pelo modelo: {len(features_modelo['features_modelo'])}"
+            f" de {len(features_modelo['colunas_entrada'])}"
+        )
+    
     # ETAPA 5: Salvamento do modelo
     if salvar_modelo_final:
         logger.info(f"\nETAPA 5: Salvando modelo em '{pasta_modelos}/{nome_modelo}.pkl'...")
@@ -225,6 +240,8 @@ def treinar_pipeline_completo(
         )
         resultado["caminho_modelo"] = caminho_salvo
         logger.info(f"✓ Modelo salvo: {caminho_salvo}")
+        if features_modelo is not None:
+            resultado["caminho_features"] = salvar_features_modelo(features_modelo, caminho_salvo)
     else:
         logger.info("\nETAPA 5: Salvamento PULADO")
     
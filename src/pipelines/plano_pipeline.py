@@ -0,0 +1,900 @@
+"""
+Especificação declarativa do pipeline (YAML) compilada em plano de execução.
+
+A especificação lista as etapas, suas colunas e métodos; valores
+"config:NOME" são lidos de config_custom. A compilação:
+- descarta etapas e operações sem efeito (colunas ausentes, listas vazias);
+- une etapas consecutivas do mesmo tipo numa passada (limpeza + conversão,
+  imputações, features derivadas, codificações e normalizações);
+- converte cada coluna de texto uma única vez (data/hora primeiro, e a
+  última conversão declarada de uma coluna prevalece);
+- com features_modelo, poda as colunas de que nenhuma etapa posterior nem o
+  modelo precisam, logo após a leitura.
+
+O plano pode ser impresso, com o custo estimado de cada passo, antes de
+executar_plano rodá-lo com as mesmas funções dos pipelines.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from config import config_custom as config
+from ..features.codificacao import aplicar_codificacao_rotulos, aplicar_dummy, categorias_dummy
+from ..features.criacao_features import adicionar_features_derivadas, colunas_clima
+from ..features.normalizacao import normalizar
+from ..processamento.memoria import compactar_tipos
+from ..processamento.temporal import garantir_agrupamento_temporal
+from ..processamento.validacao import compilar_esquema
+from .perfil_etapas import PERFIL_INATIVO, PerfilEtapas
+from .pipeline_processamento import _imputar, _limpar_e_converter, padronizar_nomes
+
+ETAPAS_ESPECIFICACAO = (
+    "limpeza",
+    "conversao",
+    "validacao",
+    "imputacao",
+    "agrupamento_temporal",
+    "features_derivadas",
+    "codificacao",
+    "normalizacao",
+    "compactacao",
+)
+
+# Custo aproximado por célula (linha x coluna) de cada operação, em ns,
+# medido no benchmark sintético (python -m src.utils.benchmark); serve para
+# comparar passos, não para prever o tempo exato
+CUSTO_CELULA_NS = {
+    "projecao": 1,
+    "limpeza": 100,
+    "conversao": 800,
+    "validacao": 10,
+    "imputacao": 200,
+    "agrupamento_temporal": 500,
+    "codificacao": 350,
+    "normalizacao": 100,
+    "compactacao": 50,
+}
+CUSTO_FEATURE_DERIVADA_NS = {
+    "imc": 15_000,
+    "imc_classe": 1_000,
+    "heat_index": 15_000,
+    "dew_point": 15_000,
+    "tu_stull": 50,
+    "t*u": 20,
+    "t/u": 20,
+}
+
+_PREFIXO_CONFIG = "config:"
+_RAIZ_PROJETO = Path(__file__).resolve().parents[2]
+_NUMERICAS = "numericas"
+
+
+@dataclass(frozen=True)
+class PassoPlano:
+    """
+    Passo do plano: operação, colunas que ela toca e parâmetros resolvidos.
+
+    origem lista as etapas da especificação unidas neste passo.
+    """
+
+    nome: str
+    colunas: Tuple[str, ...]
+    parametros: Dict[str, Any]
+    custo_estimado_ms: float
+    origem: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class PlanoExecucao:
+    """Plano compilado; str(plano) mostra passos, custos e otimizações."""
+
+    passos: Tuple[PassoPlano, ...]
+    n_linhas: int
+    colunas_entrada: Tuple[str, ...]
+    colunas_podadas: Tuple[str, ...]
+    otimizacoes: Tuple[str, ...]
+    features_modelo: Optional[Tuple[str, ...]] = None
+    alvo: Optional[str] = None
+
+    @property
+    def custo_total_ms(self) -> float:
+        return float(sum(passo.custo_estimado_ms for passo in self.passos))
+
+    def tabela(self) -> pd.DataFrame:
+        """Um passo por linha: nome, colunas, custo estimado e origem."""
+        return pd.DataFrame(
+            {
+                "passo": [p.nome for p in self.passos],
+                "colunas": [len(p.colunas) for p in self.passos],
+                "custo_estimado_ms": [round(p.custo_estimado_ms, 1) for p in self.passos],
+                "origem": [" + ".join(p.origem) for p in self.passos],
+            },
+            index=pd.RangeIndex(1, len(self.passos) + 1, name="#"),
+        )
+
+    def __str__(self) -> str:
+        linhas = [
+            f"Plano de execução: {self.n_linhas} linhas, "
+            f"{len(self.colunas_entrada)} colunas de entrada, {len(self.colunas_podadas)} podadas",
+            self.tabela().to_string(),
+            f"Custo estimado total: {self.custo_total_ms:.1f} ms",
+        ]
+        if self.otimizacoes:
+            linhas.append("Otimizações:")
+            linhas.extend(f"  - {texto}" for texto in self.otimizacoes)
+        return "\n".join(linhas)
+
+
+@dataclass
+class _Operacao:
+    """Operação por coluna de uma etapa, usada na poda e nos custos."""
+
+    chave: Any
+    entradas: Tuple[str, ...]
+    saidas: Tuple[str, ...]
+    custo_ns: float
+    sumidouro: bool = False  # só lê (validação): não torna colunas vivas
+
+
+@dataclass
+class _Etapa:
+    nome: str
+    parametros: Dict[str, Any]
+    origem: List[str]
+    operacoes: List[_Operacao] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Especificação
+# ---------------------------------------------------------------------------
+
+
+def _resolver_config(valor: Any) -> Any:
+    """Troca 'config:NOME' pelo valor de config_custom (recursivo)."""
+    if isinstance(valor, str) and valor.startswith(_PREFIXO_CONFIG):
+        nome = valor[len(_PREFIXO_CONFIG):].strip()
+        if not hasattr(config, nome):
+            raise ValueError(f"Referência de config inexistente: {valor}")
+        return getattr(config, nome)
+    if isinstance(valor, dict):
+        return {chave: _resolver_config(v) for chave, v in valor.items()}
+    if isinstance(valor, list):
+        return [_resolver_config(v) for v in valor]
+    return valor
+
+
+def _caminho_especificacao(caminho: Union[str, Path]) -> Path:
+    """Caminho do YAML: relativo ao diretório atual ou, se não existir, à raiz do projeto."""
+    caminho = Path(caminho)
+    if caminho.exists() or caminho.is_absolute():
+        return caminho
+    na_raiz = _RAIZ_PROJETO / caminho
+    return na_raiz if na_raiz.exists() else caminho
+
+
+def carregar_especificacao(especificacao: Union[str, Path, Mapping, None] = None) -> Dict[str, Any]:
+    """
+    Lê e valida a especificação (caminho YAML, texto YAML ou dicionário).
+
+    None usa config.ESPECIFICACAO_PIPELINE. Um texto terminado em .yaml/.yml
+    (sem quebras de linha) é um caminho; se o arquivo não existir, levanta
+    FileNotFoundError em vez de interpretá-lo como YAML.
+
+    Returns:
+        Dicionário com 'etapas' (lista de {'etapa': nome, ...}) e, se
+        declarados, 'alvo', 'features_modelo' e 'backend', com as
+        referências 'config:' resolvidas
+    """
+    if especificacao is None:
+        especificacao = config.ESPECIFICACAO_PIPELINE
+    if isinstance(especificacao, Mapping):
+        bruta = dict(especificacao)
+    else:
+        import yaml
+
+        texto = str(especificacao)
+        if isinstance(especificacao, Path) or (texto.endswith((".yaml", ".yml")) and "\n" not in texto):
+            caminho = _caminho_especificacao(especificacao)
+            if not caminho.is_file():
+                raise FileNotFoundError(f"Especificação do pipeline não encontrada: {caminho}")
+            texto = caminho.read_text(encoding="utf-8")
+        bruta = yaml.safe_load(texto)
+    if not isinstance(bruta, dict) or not isinstance(bruta.get("etapas"), list):
+        raise ValueError("A especificação precisa de uma lista 'etapas'")
+
+    etapas = []
+    for i, etapa in enumerate(bruta["etapas"], start=1):
+        if not isinstance(etapa, dict) or "etapa" not in etapa:
+            raise ValueError(f"Etapa {i} sem o campo 'etapa'")
+        if etapa["etapa"] not in ETAPAS_ESPECIFICACAO:
+            raise ValueError(f"Etapa {i} desconhecida: {etapa['etapa']}. Use {ETAPAS_ESPECIFICACAO}")
+        etapas.append(_resolver_config(etapa))
+    resolvida = {k: _resolver_config(v) for k, v in bruta.items() if k != "etapas"}
+    resolvida["etapas"] = etapas
+    return resolvida
+
+
+# ---------------------------------------------------------------------------
+# Operações por etapa
+# ---------------------------------------------------------------------------
+
+
+def _lista(valor: Any) -> List[str]:
+    if valor is None:
+        return []
+    if isinstance(valor, str):
+        return [valor]
+    return list(valor)
+
+
+def _operacoes_derivadas(tipos: List[str], disponiveis: Set[str]) -> List[_Operacao]:
+    temp, umidade = colunas_clima(disponiveis)
+    clima = (temp, umidade)
+    tem_clima = set(clima) <= disponiveis
+    definicoes = {
+        "imc": (("peso", "altura"), ("imc",), {"peso", "altura"} <= disponiveis),
+        "imc_classe": (("imc",), ("imc_classe",), "imc" in disponiveis),
+        "tu_stull": (clima + (("tu",) if "tu" in disponiveis else ()), ("tu",), tem_clima),
+        "heat_index": (clima, ("heat_index",), tem_clima),
+        "dew_point": (clima, ("dew_point",), tem_clima),
+        "t*u": (clima, ("t*u", "t_u"), tem_clima),
+        "t/u": (clima, ("t/u",), tem_clima),
+    }
+    operacoes = []
+    for tipo in dict.fromkeys(tipos):
+        if tipo not in definicoes:
+            continue
+        entradas, saidas, aplicavel = definicoes[tipo]
+        if tipo == "imc_classe":
+            # imc pode vir do próprio passo
+            aplicavel = aplicavel or any(o.chave == "imc" for o in operacoes)
+        if aplicavel:
+            operacoes.append(_Operacao(tipo, entradas, saidas, CUSTO_FEATURE_DERIVADA_NS[tipo]))
+    return operacoes
+
+
+def _numericas_previstas(etapas_anteriores: List[_Etapa], disponiveis: Set[str], tipos_entrada: Dict[str, Any]) -> List[str]:
+    """Colunas que devem ser numéricas na normalização 'numericas' (para poda e custo)."""
+    numericas = {c for c, t in tipos_entrada.items() if pd.api.types.is_numeric_dtype(t)}
+    for etapa in etapas_anteriores:
+        if etapa.nome == "conversao":
+            numericas |= set(etapa.parametros["float"]) | set(etapa.parametros["int"])
+            numericas -= set(etapa.parametros["categoricas"])
+        elif etapa.nome == "features_derivadas":
+            numericas |= {s for o in etapa.operacoes for s in o.saidas if s != "imc_classe"}
+        elif etapa.nome == "codificacao" and etapa.parametros["metodo"] == "label":
+            numericas |= {s for o in etapa.operacoes for s in o.saidas}
+    return [c for c in sorted(numericas) if c in disponiveis]
+
+
+def _montar_etapa(
+    indice: int,
+    bruta: Dict[str, Any],
+    disponiveis: Set[str],
+    anteriores: List[_Etapa],
+    tipos_entrada: Dict[str, Any],
+    backend: Optional[str],
+) -> _Etapa:
+    """Resolve os padrões da etapa e lista suas operações sobre as colunas disponíveis."""
+    nome = bruta["etapa"]
+    origem = [f"{indice}:{nome}"]
+    custo = CUSTO_CELULA_NS.get(nome, 100)
+
+    if nome == "limpeza":
+        substituicoes = bruta.get("substituicoes", config.SUBSTITUICOES_LIMPEZA) or {}
+        substituicoes = {k: (np.nan if v is None else v) for k, v in substituicoes.items()}
+        # Custo calculado no plano, pelas colunas que chegam à limpeza
+        operacoes = [_Operacao("substituicoes", (), (), 0)] if substituicoes else []
+        return _Etapa(nome, {"substituicoes": substituicoes}, origem, operacoes)
+
+    if nome == "conversao":
+        parametros = {
+            "data": bruta.get("data", config.COLUNA_DATA),
+            "hora": bruta.get("hora", config.COLUNA_HORA),
+            "data_hora": bruta.get("data_hora"),
+            "float": _lista(bruta.get("float")),
+            "int": _lista(bruta.get("int")),
+            "categoricas": _lista(bruta.get("categoricas")),
+            "backend": bruta.get("backend", backend),
+        }
+        colunas = [parametros["data"], parametros["hora"], *parametros["float"], *parametros["int"], *parametros["categoricas"]]
+        operacoes = [
+            _Operacao(c, (c,), (c,), custo)
+            for c in dict.fromkeys(c for c in colunas if c and c in disponiveis)
+        ]
+        return _Etapa(nome, parametros, origem, operacoes)
+
+    if nome == "validacao":
+        convertidas = [c for e in anteriores if e.nome == "conversao" for o in e.operacoes for c in o.saidas]
+        colunas = _lista(bruta.get("colunas")) or convertidas
+        parametros = {
+            "taxa_maxima_faltantes": bruta.get("taxa_maxima_faltantes", config.TAXA_MAXIMA_FALTANTES),
+            "isentas_faltantes": _lista(bruta.get("isentas_faltantes")),
+        }
+        operacoes = [
+            _Operacao(c, (c,), (), custo, sumidouro=True)
+            for c in dict.fromkeys(colunas) if c in disponiveis
+        ]
+        return _Etapa(nome, parametros, origem, operacoes)
+
+    if nome == "imputacao":
+        data = next((e.parametros["data"] for e in anteriores if e.nome == "conversao"), config.COLUNA_DATA)
+        hora = next((e.parametros["hora"] for e in anteriores if e.nome == "conversao"), config.COLUNA_HORA)
+        parametros = {
+            "colunas": dict(bruta["colunas"]) if bruta.get("colunas") else None,
+            "numerica": bruta.get("numerica", config.METODO_IMPUTACAO_NUM),
+            "categorica": bruta.get("categorica", config.METODO_IMPUTACAO_CAT),
+            "constante": bruta.get("constante", config.VALOR_CONST_CATEGORICA),
+            "data": data,
+            "hora": hora,
+        }
+        # Cada coluna é imputada independentemente (método da coluna ou o
+        # padrão); só média móvel (data/hora) e Stull (clima) leem outras
+        metodos = dict(parametros["colunas"] or {})
+        temp, umidade = colunas_clima(disponiveis)
+        operacoes = []
+        for coluna in dict.fromkeys([*sorted(disponiveis), *metodos]):
+            metodo = metodos.get(coluna)
+            extras: Tuple[str, ...] = ()
+            if metodo == "stull":
+                extras = (temp, umidade)
+                if not set(extras) <= disponiveis:
+                    continue
+            elif metodo == "rolling_mean_48":
+                extras = tuple(c for c in (data, hora) if c in disponiveis)
+            elif coluna not in disponiveis:
+                continue
+            entradas = tuple(dict.fromkeys((coluna, *extras)))
+            operacoes.append(_Operacao(coluna, entradas, (coluna,), custo))
+        return _Etapa(nome, parametros, origem, operacoes)
+
+    if nome == "agrupamento_temporal":
+        data = next((e.parametros["data"] for e in anteriores if e.nome == "conversao"), config.COLUNA_DATA)
+        hora = next((e.parametros["hora"] for e in anteriores if e.nome == "conversao"), config.COLUNA_HORA)
+        parametros = {
+            "data": bruta.get("data", data),
+            "hora": bruta.get("hora", hora),
+            "coluna": bruta.get("coluna", "mes-ano"),
+        }
+        operacoes = []
+        if parametros["coluna"] not in disponiveis and parametros["data"] in disponiveis:
+            entradas = tuple(c for c in (parametros["data"], parametros["hora"]) if c in disponiveis)
+            operacoes.append(_Operacao(parametros["coluna"], entradas, (parametros["coluna"],), custo))
+        return _Etapa(nome, parametros, origem, operacoes)
+
+    if nome == "features_derivadas":
+        tipos = _lista(bruta.get("tipos", config.TIPOS_FEATURES_DERIVADAS))
+        return _Etapa(nome, {"tipos": tipos}, origem, _operacoes_derivadas(tipos, disponiveis))
+
+    if nome == "codificacao":
+        parametros = {
+            "metodo": bruta.get("metodo", "label"),
+            "colunas": _lista(bruta.get("colunas", config.COLUNAS_CATEGORICAS)),
+            "sufixo": bruta.get("sufixo", "_cod"),
+            "esparso": bruta.get("esparso", config.ONEHOT_ESPARSO),
+        }
+        if parametros["metodo"] not in ("label", "onehot"):
+            raise ValueError(f"Método de codificação inválido: {parametros['metodo']}")
+        operacoes = []
+        for coluna in dict.fromkeys(parametros["colunas"]):
+            if coluna not in disponiveis:
+                continue
+            # One-hot troca a coluna pelas dummies "<coluna>_<categoria>"
+            saidas = (f"{coluna}{parametros['sufixo']}",) if parametros["metodo"] == "label" else (f"{coluna}_*",)
+            operacoes.append(_Operacao(coluna, (coluna,), saidas, custo))
+        return _Etapa(nome, parametros, origem, operacoes)
+
+    if nome == "normalizacao":
+        metodo = bruta.get("metodo", "standard")
+        colunas = bruta.get("colunas", _NUMERICAS)
+        parametros = {
+            "agrupamento": bruta.get("agrupamento", "mes-ano"),
+            "sufixo": bruta.get("sufixo", "_norm"),
+            "metodo": metodo,
+            "numericas": colunas == _NUMERICAS,
+        }
+        if colunas == _NUMERICAS:
+            metodos = {c: metodo for c in _numericas_previstas(anteriores, disponiveis, tipos_entrada)}
+        elif isinstance(colunas, dict):
+            metodos = dict(colunas)
+        else:
+            metodos = {c: metodo for c in _lista(colunas)}
+        parametros["metodos"] = metodos
+        grupo = (parametros["agrupamento"],) if parametros["agrupamento"] in disponiveis else ()
+        operacoes = [
+            _Operacao(c, (c, *grupo), (f"{c}{parametros['sufixo']}",), custo)
+            for c in metodos if c in disponiveis
+        ]
+        return _Etapa(nome, parametros, origem, operacoes)
+
+    # compactacao
+    parametros = {"tolerancia": bruta.get("tolerancia", config.TOLERANCIA_COMPACTACAO)}
+    ativa = bruta.get("ativo", True)
+    operacoes = [_Operacao("todas", (), (), custo * max(len(disponiveis), 1))] if ativa else []
+    return _Etapa(nome, parametros, origem, operacoes)
+
+
+def _aplicar_disponibilidade(etapa: _Etapa, disponiveis: Set[str]) -> Set[str]:
+    """Colunas disponíveis depois da etapa."""
+    disponiveis = set(disponiveis)
+    for operacao in etapa.operacoes:
+        if etapa.nome == "codificacao" and etapa.parametros["metodo"] == "onehot":
+            disponiveis.discard(operacao.chave)
+        disponiveis |= {s for s in operacao.saidas if not s.endswith("_*")}
+    return disponiveis
+
+
+def especificacao_de_parametros(
+    substituicoes: Optional[Dict] = None,
+    coluna_data: Optional[str] = None,
+    coluna_hora: Optional[str] = None,
+    colunas_float: Optional[List[str]] = None,
+    colunas_int: Optional[List[str]] = None,
+    colunas_categoricas: Optional[List[str]] = None,
+    metodo_imputacao_numerica: Optional[str] = None,
+    metodo_imputacao_categorica: Optional[str] = None,
+    valor_constante_categorica: Optional[str] = None,
+    config_imputacao_customizada: Optional[Dict[str, str]] = None,
+    criar_agrupamento_temporal: bool = True,
+    nome_coluna_agrupamento: str = "mes-ano",
+    aplicar_codificacao: bool = True,
+    metodo_codificacao: str = "label",
+    sufixo_codificacao: str = "_cod",
+    onehot_esparso: Optional[bool] = None,
+    aplicar_normalizacao: bool = True,
+    colunas_normalizar: Optional[Union[List[str], Dict[str, str]]] = None,
+    metodo_normalizacao: str = "standard",
+    agrupamento_normalizacao: Optional[str] = "mes-ano",
+    sufixo_normalizacao: str = "_norm",
+    criar_features_derivadas: bool = False,
+    tipos_features_derivadas: Optional[List[str]] = None,
+    compactar_memoria: Optional[bool] = None,
+    tolerancia_compactacao: Optional[float] = None,
+    backend: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Especificação equivalente aos parâmetros de executar_pipeline_completo.
+
+    Os padrões (None) são os mesmos dos pipelines de processamento e de
+    features; a validação segue config.VALIDAR_ESQUEMA.
+    """
+    categoricas = colunas_categoricas or config.COLUNAS_CATEGORICAS
+    etapas: List[Dict[str, Any]] = [
+        {"etapa": "limpeza", "substituicoes": substituicoes or config.SUBSTITUICOES_LIMPEZA},
+        {
+            "etapa": "conversao",
+            "data": coluna_data or config.COLUNA_DATA,
+            "hora": coluna_hora or config.COLUNA_HORA,
+            "float": colunas_float or config.COLUNAS_PONTO_FLUTUANTE,
+            "int": colunas_int or config.COLUNAS_NUMEROS_INTEIROS,
+            "categoricas": categoricas,
+        },
+    ]
+    if config.VALIDAR_ESQUEMA:
+        etapas.append({"etapa": "validacao", "isentas_faltantes": list(config_imputacao_customizada or [])})
+    etapas.append({
+        "etapa": "imputacao",
+        "colunas": config_imputacao_customizada,
+        "numerica": metodo_imputacao_numerica or config.METODO_IMPUTACAO_NUM,
+        "categorica": metodo_imputacao_categorica or config.METODO_IMPUTACAO_CAT,
+        "constante": valor_constante_categorica or config.VALOR_CONST_CATEGORICA,
+    })
+    if criar_agrupamento_temporal:
+        etapas.append({"etapa": "agrupamento_temporal", "coluna": nome_coluna_agrupamento})
+    if criar_features_derivadas:
+        etapas.append({"etapa": "features_derivadas", "tipos": tipos_features_derivadas or config.TIPOS_FEATURES_DERIVADAS})
+    if aplicar_codificacao:
+        etapas.append({
+            "etapa": "codificacao",
+            "metodo": metodo_codificacao,
+            "colunas": categoricas,
+            "sufixo": sufixo_codificacao,
+            "esparso": config.ONEHOT_ESPARSO if onehot_esparso is None else onehot_esparso,
+        })
+    if aplicar_normalizacao:
+        etapas.append({
+            "etapa": "normalizacao",
+            "metodo": metodo_normalizacao,
+            "colunas": _NUMERICAS if colunas_normalizar is None else colunas_normalizar,
+            "agrupamento": agrupamento_normalizacao,
+            "sufixo": sufixo_normalizacao,
+        })
+    etapas.append({
+        "etapa": "compactacao",
+        "ativo": config.COMPACTAR_TIPOS if compactar_memoria is None else compactar_memoria,
+        "tolerancia": tolerancia_compactacao or config.TOLERANCIA_COMPACTACAO,
+    })
+    return {"backend": backend, "etapas": etapas}
+
+
+# ---------------------------------------------------------------------------
+# Compilação
+# ---------------------------------------------------------------------------
+
+
+def _viva(saida: str, vivas: Set[str]) -> bool:
+    if saida.endswith("_*"):
+        prefixo = saida[:-1]
+        return any(v.startswith(prefixo) for v in vivas)
+    return saida in vivas
+
+
+def _resumir(nomes: List[str], limite: int = 6) -> str:
+    if len(nomes) <= limite:
+        return ", ".join(nomes)
+    return f"{len(nomes)} colunas: {', '.join(nomes[:limite])}, ..."
+
+
+def _podar(etapas: List[_Etapa], vivas: Set[str], otimizacoes: List[str]) -> Set[str]:
+    """Remove (de trás para frente) operações cujas saídas ninguém usa."""
+    for etapa in reversed(etapas):
+        if etapa.nome in ("limpeza", "compactacao"):
+            continue
+        mantidas = []
+        # De trás para frente também dentro da etapa (imc_classe lê imc)
+        for operacao in reversed(etapa.operacoes):
+            if operacao.sumidouro:
+                manter = any(c in vivas for c in operacao.entradas)
+            else:
+                manter = any(_viva(s, vivas) for s in operacao.saidas)
+            if manter:
+                mantidas.append(operacao)
+                if not operacao.sumidouro:
+                    vivas |= set(operacao.entradas)
+        mantidas.reverse()
+        removidas = [str(o.chave) for o in etapa.operacoes if o not in mantidas]
+        if removidas:
+            otimizacoes.append(f"{etapa.origem[0]}: sem uso pelo modelo ({_resumir(removidas)})")
+        etapa.operacoes = mantidas
+        if etapa.nome == "normalizacao":
+            # As numéricas que sobraram viram lista explícita
+            etapa.parametros["numericas"] = False
+    return vivas
+
+
+def _podar_parametros(etapa: _Etapa) -> None:
+    """Restringe os parâmetros da etapa às operações que sobraram."""
+    chaves = [o.chave for o in etapa.operacoes]
+    if etapa.nome == "conversao":
+        for lista in ("float", "int", "categoricas"):
+            etapa.parametros[lista] = [c for c in etapa.parametros[lista] if c in chaves]
+        for temporal in ("data", "hora"):
+            if etapa.parametros[temporal] not in chaves:
+                etapa.parametros[temporal] = None
+    elif etapa.nome == "imputacao" and etapa.parametros["colunas"]:
+        # Métodos especiais criariam/leriam colunas podadas; os demais são
+        # ignorados sem a coluna e mantêm o método padrão ligado
+        etapa.parametros["colunas"] = {
+            c: m for c, m in etapa.parametros["colunas"].items()
+            if c in chaves or m not in ("stull", "rolling_mean_48")
+        }
+    elif etapa.nome == "features_derivadas":
+        etapa.parametros["tipos"] = [t for t in etapa.parametros["tipos"] if t in chaves]
+    elif etapa.nome in ("codificacao",):
+        etapa.parametros["colunas"] = chaves
+    elif etapa.nome == "normalizacao":
+        etapa.parametros["metodos"] = {c: m for c, m in etapa.parametros["metodos"].items() if c in chaves}
+    elif etapa.nome == "validacao":
+        etapa.parametros["colunas"] = chaves
+
+
+def _unir_conversoes(etapa: _Etapa, outra: _Etapa, otimizacoes: List[str]) -> None:
+    """Une duas conversões: cada coluna fica só na última lista em que aparece."""
+    destino: Dict[str, str] = {}
+    for parte in (etapa, outra):
+        for lista in ("float", "int", "categoricas"):
+            for coluna in parte.parametros[lista]:
+                if coluna in destino and destino[coluna] != lista:
+                    otimizacoes.append(f"conversão repetida de '{coluna}' ({destino[coluna]} -> {lista}) feita uma vez")
+                destino[coluna] = lista
+    for lista in ("float", "int", "categoricas"):
+        etapa.parametros[lista] = [c for c, d in destino.items() if d == lista]
+    for chave in ("data", "hora", "data_hora", "backend"):
+        etapa.parametros[chave] = outra.parametros.get(chave) or etapa.parametros.get(chave)
+    vistas = {o.chave for o in etapa.operacoes}
+    etapa.operacoes += [o for o in outra.operacoes if o.chave not in vistas]
+
+
+def _imputa_todas(metodos: Optional[Dict[str, str]]) -> bool:
+    """True se _imputar aplica o método padrão às colunas fora de metodos."""
+    return not metodos or any(m not in ("stull", "rolling_mean_48") for m in metodos.values())
+
+
+def _unir(etapas: List[_Etapa], otimizacoes: List[str]) -> List[_Etapa]:
+    """Une etapas consecutivas que podem rodar numa única passada."""
+    unidas: List[_Etapa] = []
+    for etapa in etapas:
+        anterior = unidas[-1] if unidas else None
+        if anterior is None:
+            unidas.append(etapa)
+            continue
+        tipos = (anterior.nome, etapa.nome)
+        if tipos == ("limpeza", "conversao") or (anterior.nome == "limpeza_conversao" and etapa.nome == "conversao"):
+            if anterior.nome == "limpeza":
+                anterior.nome = "limpeza_conversao"
+                anterior.parametros.update({k: v for k, v in etapa.parametros.items()})
+                anterior.operacoes += etapa.operacoes
+            else:
+                _unir_conversoes(anterior, etapa, otimizacoes)
+        elif tipos == ("conversao", "conversao"):
+            _unir_conversoes(anterior, etapa, otimizacoes)
+        elif tipos == ("imputacao", "imputacao") and (
+            _imputa_todas(anterior.parametros["colunas"]) or etapa.parametros["colunas"]
+        ):
+            metodos = anterior.parametros["colunas"]
+            if _imputa_todas(metodos):
+                # A anterior já passa o método padrão em todas as colunas
+                otimizacoes.append(f"{' + '.join(etapa.origem)} sem efeito após {anterior.origem[0]}, removida")
+                continue
+            # Só métodos especiais antes: eles vêm primeiro também na passada única
+            for coluna, metodo in etapa.parametros["colunas"].items():
+                metodos.setdefault(coluna, metodo)
+            for chave in ("numerica", "categorica", "constante"):
+                anterior.parametros[chave] = etapa.parametros[chave]
+            vistas = {o.chave for o in anterior.operacoes}
+            anterior.operacoes += [o for o in etapa.operacoes if o.chave not in vistas]
+        elif tipos == ("features_derivadas", "features_derivadas"):
+            anterior.parametros["tipos"] = list(dict.fromkeys(anterior.parametros["tipos"] + etapa.parametros["tipos"]))
+            vistas = {o.chave for o in anterior.operacoes}
+            anterior.operacoes += [o for o in etapa.operacoes if o.chave not in vistas]
+        elif tipos == ("codificacao", "codificacao") and all(
+            anterior.parametros[k] == etapa.parametros[k] for k in ("metodo", "sufixo", "esparso")
+        ):
+            anterior.parametros["colunas"] = list(dict.fromkeys(anterior.parametros["colunas"] + etapa.parametros["colunas"]))
+            vistas = {o.chave for o in anterior.operacoes}
+            anterior.operacoes += [o for o in etapa.operacoes if o.chave not in vistas]
+        elif tipos == ("normalizacao", "normalizacao") and all(
+            anterior.parametros[k] == etapa.parametros[k] for k in ("agrupamento", "sufixo")
+        ) and not (anterior.parametros["numericas"] or etapa.parametros["numericas"]) and not (
+            set(etapa.parametros["metodos"]) & {s for o in anterior.operacoes for s in o.saidas}
+        ):
+            anterior.parametros["metodos"].update(etapa.parametros["metodos"])
+            vistas = {o.chave for o in anterior.operacoes}
+            anterior.operacoes += [o for o in etapa.operacoes if o.chave not in vistas]
+        else:
+            unidas.append(etapa)
+            continue
+        otimizacoes.append(f"{' + '.join(etapa.origem)} unida a {anterior.origem[0]} numa passada")
+        anterior.origem += etapa.origem
+    return unidas
+
+
+def compilar_plano(
+    especificacao: Union[str, Path, Mapping, None],
+    colunas_entrada: Union[pd.DataFrame, Iterable[str]],
+    n_linhas: Optional[int] = None,
+    features_modelo: Optional[Iterable[str]] = None,
+) -> PlanoExecucao:
+    """
+    Compila a especificação num plano para uma entrada.
+
+    Args:
+        especificacao: Caminho/texto YAML ou dicionário (None: o padrão do
+            config; ver carregar_especificacao)
+        colunas_entrada: DataFrame de entrada (colunas, tipos e linhas) ou
+            lista das colunas
+        n_linhas: Linhas para a estimativa de custo (padrão: len do DataFrame)
+        features_modelo: Colunas que o modelo usa (padrão: 'features_modelo'
+            da especificação); se houver, tudo o que não leva a elas nem ao
+            alvo é podado
+
+    Returns:
+        PlanoExecucao
+    """
+    espec = carregar_especificacao(especificacao)
+    tipos_entrada: Dict[str, Any] = {}
+    if isinstance(colunas_entrada, pd.DataFrame):
+        n_linhas = len(colunas_entrada) if n_linhas is None else n_linhas
+        tipos_entrada = dict(zip(padronizar_nomes(colunas_entrada.columns), colunas_entrada.dtypes))
+        entrada = list(tipos_entrada)
+    else:
+        entrada = padronizar_nomes(pd.Index(list(colunas_entrada)))
+    n_linhas = int(n_linhas or 0)
+    features_modelo = features_modelo if features_modelo is not None else espec.get("features_modelo")
+    alvo = espec.get("alvo")
+    otimizacoes: List[str] = []
+
+    # Passo 1: operações de cada etapa sobre as colunas disponíveis até ela
+    disponiveis = set(entrada)
+    etapas: List[_Etapa] = []
+    for indice, bruta in enumerate(espec["etapas"], start=1):
+        etapa = _montar_etapa(indice, bruta, disponiveis, etapas, tipos_entrada, espec.get("backend"))
+        etapas.append(etapa)
+        disponiveis = _aplicar_disponibilidade(etapa, disponiveis)
+
+    # Passo 2: poda pelas colunas do modelo (liveness de trás para frente)
+    podadas: List[str] = []
+    if features_modelo is not None:
+        vivas = set(features_modelo) | ({alvo} if alvo else set())
+        onehot = [s[:-1] for e in etapas for o in e.operacoes for s in o.saidas if s.endswith("_*")]
+        faltantes = [c for c in vivas if c not in disponiveis and not c.startswith(tuple(onehot))]
+        if faltantes:
+            raise ValueError(f"Colunas do modelo que o plano não produz: {sorted(faltantes)}")
+        vivas = _podar(etapas, vivas, otimizacoes)
+        podadas = [c for c in entrada if c not in vivas]
+        if podadas:
+            otimizacoes.append(f"{len(podadas)} colunas de entrada podadas na leitura")
+
+    # Passo 3: sem efeito -> fora; consecutivas -> uma passada
+    ativas = []
+    for etapa in etapas:
+        _podar_parametros(etapa)
+        if etapa.operacoes:
+            ativas.append(etapa)
+        else:
+            otimizacoes.append(f"{etapa.origem[0]} sem efeito, removida")
+    ativas = _unir(ativas, otimizacoes)
+
+    passos: List[PassoPlano] = []
+    if podadas:
+        mantidas = tuple(c for c in entrada if c not in set(podadas))
+        passos.append(
+            PassoPlano("projecao", mantidas, {"colunas": list(mantidas)},
+                       n_linhas * len(mantidas) * CUSTO_CELULA_NS["projecao"] / 1e6, ("poda",))
+        )
+    for etapa in ativas:
+        nome = etapa.nome
+        if nome == "limpeza":
+            # Sem conversão logo depois: substituições sozinhas, mesma função
+            nome = "limpeza_conversao"
+            etapa.parametros.update(data=None, hora=None, data_hora=None, float=[], int=[], categoricas=[], backend=espec.get("backend"))
+        elif nome == "conversao":
+            nome = "limpeza_conversao"
+            etapa.parametros["substituicoes"] = {}
+        colunas = tuple(dict.fromkeys(
+            c for o in etapa.operacoes for c in (o.saidas or o.entradas) if not c.endswith("_*")
+        )) or tuple(str(o.chave) for o in etapa.operacoes)
+        custo_celulas = sum(o.custo_ns for o in etapa.operacoes)
+        if etapa.nome == "limpeza" or (nome == "limpeza_conversao" and etapa.parametros.get("substituicoes")):
+            # Substituições passam por todas as colunas que chegam a esta etapa
+            custo_celulas += CUSTO_CELULA_NS["limpeza"] * (len(entrada) - len(podadas))
+        passos.append(PassoPlano(nome, colunas, etapa.parametros, n_linhas * custo_celulas / 1e6, tuple(etapa.origem)))
+
+    return PlanoExecucao(
+        passos=tuple(passos),
+        n_linhas=n_linhas,
+        colunas_entrada=tuple(entrada),
+        colunas_podadas=tuple(podadas),
+        otimizacoes=tuple(otimizacoes),
+        features_modelo=tuple(features_modelo) if features_modelo is not None else None,
+        alvo=alvo,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Execução
+# ---------------------------------------------------------------------------
+
+
+def executar_passo(df: pd.DataFrame, passo: PassoPlano, artefatos: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Executa um passo do plano sobre df.
+
+    Os ajustes do passo (mapeamentos de codificação, scalers, relatório de
+    validação) são gravados em artefatos, como em executar_plano.
+    """
+    p = passo.parametros
+    if passo.nome == "projecao":
+        df = df.set_axis(padronizar_nomes(df.columns), axis=1)
+        return df[p["colunas"]]
+    if passo.nome == "limpeza_conversao":
+        return _limpar_e_converter(
+            df, p["substituicoes"], p["data"], p["hora"], p["float"], p["int"], p["categoricas"],
+            coluna_data_hora=p["data_hora"], backend=p["backend"],
+        )
+    if passo.nome == "validacao":
+        esquema = compilar_esquema(
+            config.TYPE_DICT, config.LIMITES_VALORES, p["taxa_maxima_faltantes"], colunas=p["colunas"],
+            isentas_faltantes=p["isentas_faltantes"],
+        )
+        artefatos["relatorio_validacao"] = esquema.validar(df)
+        return df
+    if passo.nome == "imputacao":
+        return _imputar(
+            df, p["colunas"], p["numerica"], p["categorica"], p["constante"],
+            coluna_data=p["data"], coluna_hora=p["hora"],
+        )
+    if passo.nome == "agrupamento_temporal":
+        return garantir_agrupamento_temporal(df, p["data"], p["hora"], p["coluna"])
+    if passo.nome == "features_derivadas":
+        return adicionar_features_derivadas(df, tipos=p["tipos"])
+    if passo.nome == "codificacao":
+        colunas = [c for c in p["colunas"] if c in df.columns]
+        if p["metodo"] == "label":
+            df, mapeamentos = aplicar_codificacao_rotulos(df, colunas, sufixo=p["sufixo"])
+            artefatos.setdefault("mapeamentos_codificacao", {}).update(mapeamentos)
+            return df
+        categorias = categorias_dummy(df, colunas)
+        artefatos.setdefault("categorias_onehot", {}).update(categorias)
+        return aplicar_dummy(df, colunas, esparso=p["esparso"], categorias=categorias)
+    if passo.nome == "normalizacao":
+        # Sem poda, 'numericas' resolve as colunas nos dados (colunas=None)
+        colunas = None if p["numericas"] else {c: m for c, m in p["metodos"].items() if c in df.columns}
+        df, scalers = normalizar(
+            df, colunas=colunas, metodo=p["metodo"], agrupamento=p["agrupamento"], sufixo=p["sufixo"]
+        )
+        artefatos["scalers_normalizacao"] = scalers
+        artefatos["colunas_normalizadas"] = [c for c in df.columns if c.endswith(p["sufixo"])]
+        return df
+    # compactacao
+    df, relatorio = compactar_tipos(
+        df, tolerancia=p["tolerancia"], limite_cardinalidade=config.LIMITE_CARDINALIDADE_CATEGORIA
+    )
+    artefatos["relatorio_compactacao"] = relatorio
+    return df
+
+
+def executar_plano(
+    df: pd.DataFrame,
+    plano: PlanoExecucao,
+    perfil: Optional[PerfilEtapas] = None,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Executa o plano compilado.
+
+    Args:
+        df: DataFrame bruto (o mesmo formato usado na compilação)
+        plano: Saída de compilar_plano
+        perfil: PerfilEtapas (uma etapa por passo; None desativa)
+
+    Returns:
+        Tupla (df, artefatos) com mapeamentos, scalers e relatórios
+    """
+    perfil = perfil or PERFIL_INATIVO
+    artefatos: Dict[str, Any] = {}
+    df_plano = df.set_axis(padronizar_nomes(df.columns), axis=1) if len(df.columns) else df.copy()
+    with perfil.etapa("plano", df_plano) as medicao_total:
+        for passo in plano.passos:
+            with perfil.etapa(passo.nome, df_plano) as medicao:
+                df_plano = executar_passo(df_plano, passo, artefatos)
+                medicao.saida(df_plano)
+        medicao_total.saida(df_plano)
+    return df_plano, artefatos
+
+
+def executar_especificacao(
+    df: pd.DataFrame,
+    especificacao: Union[str, Path, Mapping, None] = None,
+    features_modelo: Optional[Iterable[str]] = None,
+    mostrar_plano: bool = True,
+    perfil: Optional[PerfilEtapas] = None,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Compila a especificação para df, imprime o plano e o executa.
+
+    Args:
+        df: DataFrame bruto
+        especificacao: YAML ou dicionário (usa config.ESPECIFICACAO_PIPELINE se None)
+        features_modelo: Colunas do modelo (poda; ver compilar_plano)
+        mostrar_plano: Imprime o plano com os custos antes de executar
+        perfil: PerfilEtapas (None desativa)
+
+    Returns:
+        Tupla (df, artefatos); artefatos['plano'] guarda o plano executado
+    """
+    plano = compilar_plano(
+        especificacao if especificacao is not None else config.ESPECIFICACAO_PIPELINE,
+        df,
+        features_modelo=features_modelo,
+    )
+    if mostrar_plano:
+        print(plano)
+    df_final, artefatos = executar_plano(df, plano, perfil=perfil)
+    artefatos["plano"] = plano
+    return df_final, artefatos
+
+
+__all__ = [
+    "ETAPAS_ESPECIFICACAO",
+    "PassoPlano",
+    "PlanoExecucao",
+    "carregar_especificacao",
+    "especificacao_de_parametros",
+    "compilar_plano",
+    "executar_plano",
+    "executar_passo",
+    "executar_especificacao",
+]
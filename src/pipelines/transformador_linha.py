@@ -0,0 +1,573 @@
+"""
+Transformador de linha compilado: do registro bruto ao vetor do modelo.
+
+compilar_transformador_linha ajusta o pipeline no histórico (o plano podado
+pelas features do modelo, ver plano_pipeline) e gera o código Python de uma
+função em linha reta para um único registro: leitura das colunas vivas,
+substituições, conversões, imputação com os valores ajustados, features
+derivadas, códigos e normalização com as estatísticas ajustadas, todos como
+constantes. A função roda sobre um dict (nomes internos, originais ou da API,
+ex.: 'peso_kg') ou uma linha NumPy, sem montar DataFrame, e devolve o vetor
+float64 na ordem das features do modelo.
+
+Cada operação repete a aritmética da versão em lote (as features derivadas
+chamam as mesmas funções por linha), então o vetor é igual ao da linha em
+executar_pipeline_completo, com duas diferenças próprias de um
+registro isolado:
+- imputações sequenciais (forward/backward, média móvel no tempo) dependem
+  das linhas vizinhas e deixam o faltante como está, como no lote com uma
+  linha só;
+- o grupo da normalização vem de 'mes-ano' ou da data do registro; sem data
+  (caso da API) ou com mês fora do histórico, usa grupo_padrao (o mês mais
+  recente do ajuste).
+"""
+import math
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from config import config_custom as config
+from ..features.codificacao.codificar_label import CODIGO_DESCONHECIDO, FALTANTE
+from ..features.criacao_features import (
+    FUNCOES_FEATURES_DERIVADAS,
+    calcular_tu_stull_vetorizado,
+    colunas_clima,
+    entradas_feature_derivada,
+)
+from ..features.criacao_features.calcular_tu_stull import FAIXA_TEMPERATURA_STULL, FAIXA_UMIDADE_STULL
+from ..processamento.temporal import garantir_agrupamento_temporal
+from .pipeline_incremental import ajustar_imputacao
+from .pipeline_processamento import padronizar_nomes
+from .plano_pipeline import PlanoExecucao, carregar_especificacao, compilar_plano, executar_passo
+
+_NAN = float("nan")
+_INF = float("inf")
+_FLOAT64 = np.float64
+_PADRAO_MES_ANO = re.compile(r"^\d{4}-\d{2}$")
+
+# Parâmetros (a, b) por método: standard/robust -> (x - a) / b,
+# minmax -> x * a + b, max -> x / b
+_METODOS_NORMALIZACAO = ("standard", "minmax", "robust", "max")
+
+
+# ---------------------------------------------------------------------------
+# Funções usadas pelo código gerado
+# ---------------------------------------------------------------------------
+
+
+def _para_float(valor: Any) -> float:
+    """Mesmo resultado de _converter_para_float (vírgula decimal, inválido -> NaN)."""
+    if valor is None:
+        return _NAN
+    if valor.__class__ is int:
+        return float(valor)
+    texto = str(valor).replace(",", ".")
+    if "_" in texto:
+        # float() aceita separador de milhar com '_', to_numeric não
+        return _NAN
+    try:
+        return float(texto)
+    except ValueError:
+        return _NAN
+
+
+def _para_inteiro(valor: Any) -> float:
+    """Conversão das colunas Int64 (valor não inteiro falha, como no lote)."""
+    numero = valor if valor.__class__ is float else _para_float(valor)
+    if numero == numero and not numero.is_integer():
+        raise ValueError(f"Valor não inteiro em coluna inteira: {valor!r}")
+    return numero
+
+
+def _para_texto(valor: Any) -> Optional[str]:
+    """astype('string'): None para faltantes."""
+    if valor is None or valor is pd.NA or (isinstance(valor, float) and valor != valor):
+        return None
+    return valor if valor.__class__ is str else str(valor)
+
+
+@lru_cache(maxsize=4096)
+def _mes_ano(data: Any, coluna_data: str, coluna: str) -> Any:
+    """Rótulo mes-ano de uma data bruta (mesma conversão do lote; caminho lento, em cache por data)."""
+    quadro = garantir_agrupamento_temporal(pd.DataFrame({coluna_data: [data]}), coluna_data, "", coluna)
+    return quadro[coluna].iloc[0]
+
+
+def _tu_stull(temperatura: float, umidade_relativa: float) -> float:
+    """Stull pelo mesmo kernel de arrays do lote (preencher_tu_stull)."""
+    return float(calcular_tu_stull_vetorizado([temperatura], [umidade_relativa])[0])
+
+
+def _float32(valor: float) -> float:
+    return float(np.float32(valor))
+
+
+_AMBIENTE = {
+    "_NAN": _NAN,
+    "_INF": _INF,
+    "_FLOAT64": _FLOAT64,
+    "_array": np.array,
+    "_ndarray": np.ndarray,
+    "_para_float": _para_float,
+    "_para_inteiro": _para_inteiro,
+    "_para_texto": _para_texto,
+    "_tu_stull": _tu_stull,
+    "_mes_ano": _mes_ano,
+    "_float32": _float32,
+}
+
+
+# ---------------------------------------------------------------------------
+# Transformador
+# ---------------------------------------------------------------------------
+
+
+class TransformadorLinha:
+    """
+    Transformador compilado de um registro bruto no vetor do modelo.
+
+    Chame com um dict (transformar) ou uma sequência/linha NumPy na ordem de
+    colunas_brutas (transformar_array). codigo guarda o fonte gerado; o
+    objeto é serializável com joblib/pickle (o código é recompilado).
+    """
+
+    def __init__(
+        self,
+        codigo: str,
+        constantes: Dict[str, Any],
+        features_modelo: Sequence[str],
+        colunas_brutas: Sequence[str],
+        grupo_padrao: Any = None,
+    ):
+        self.codigo = codigo
+        self.constantes = constantes
+        self.features_modelo = list(features_modelo)
+        self.colunas_brutas = list(colunas_brutas)
+        self.grupo_padrao = grupo_padrao
+        self._compilar()
+
+    def _compilar(self) -> None:
+        ambiente = {**_AMBIENTE, **self.constantes}
+        exec(compile(self.codigo, "<transformador_linha>", "exec"), ambiente)
+        self.transformar = ambiente["transformar"]
+        self.transformar_array = ambiente["transformar_array"]
+
+    def __call__(self, linha: Mapping[str, Any]) -> np.ndarray:
+        return self.transformar(linha)
+
+    def transformar_lote(self, linhas: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        """Matriz (n_linhas x n_features) de uma lista de registros."""
+        if not linhas:
+            return np.empty((0, len(self.features_modelo)))
+        return np.vstack([self.transformar(linha) for linha in linhas])
+
+    def __getstate__(self) -> Dict[str, Any]:
+        estado = dict(self.__dict__)
+        estado.pop("transformar", None)
+        estado.pop("transformar_array", None)
+        return estado
+
+    def __setstate__(self, estado: Dict[str, Any]) -> None:
+        self.__dict__.update(estado)
+        self._compilar()
+
+    def __repr__(self) -> str:
+        return (
+            f"TransformadorLinha({len(self.colunas_brutas)} colunas brutas -> "
+            f"{len(self.features_modelo)} features)"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Geração de código
+# ---------------------------------------------------------------------------
+
+
+def _escalar(valor: Any) -> Any:
+    return valor.item() if isinstance(valor, np.generic) else valor
+
+
+def _literal(valor: Any) -> str:
+    valor = _escalar(valor)
+    if valor is None or valor is pd.NA:
+        return "None"
+    if isinstance(valor, float):
+        if valor != valor:
+            return "_NAN"
+        if math.isinf(valor):
+            return "_INF" if valor > 0 else "-_INF"
+        return repr(valor)
+    if isinstance(valor, (bool, int, str)):
+        return repr(valor)
+    raise ValueError(f"Constante não suportada no transformador de linha: {valor!r}")
+
+
+class _Gerador:
+    """Acumula o corpo da função e acompanha a variável de cada coluna."""
+
+    def __init__(self):
+        self.linhas: List[str] = []
+        self.constantes: Dict[str, Any] = {}
+        self.variaveis: Dict[str, str] = {}
+        self.tipos: Dict[str, str] = {}  # 'num', 'txt' ou 'tempo'
+        self.brutas: Dict[str, str] = {}
+        self.grupo: Optional[str] = None
+        self._contador = 0
+
+    def nova(self, coluna: str, tipo: str) -> str:
+        self._contador += 1
+        nome = f"v{self._contador}"
+        self.variaveis[coluna] = nome
+        self.tipos[coluna] = tipo
+        return nome
+
+    def constante(self, valor: Any) -> str:
+        nome = f"K{len(self.constantes) + 1}"
+        self.constantes[nome] = valor
+        return nome
+
+    def emitir(self, linha: str, comentario: Optional[str] = None) -> None:
+        self.linhas.append(f"    {linha}" + (f"  # {comentario}" if comentario else ""))
+
+    def faltante(self, coluna: str) -> str:
+        variavel = self.variaveis[coluna]
+        return f"{variavel} is None" if self.tipos[coluna] == "txt" else f"{variavel} != {variavel}"
+
+
+def _emitir_leitura(gerador: _Gerador, colunas: Dict[str, Any]) -> None:
+    """Colunas brutas: tipo inicial pelo dtype do histórico."""
+    for coluna, dtype in colunas.items():
+        tipo = "num" if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype) else "txt"
+        gerador.nova(coluna, tipo)
+
+
+def _emitir_limpeza_conversao(gerador: _Gerador, p: Dict[str, Any], convertidas: set) -> None:
+    substituicoes = {k: (None if isinstance(v, float) and v != v else v) for k, v in p["substituicoes"].items()}
+    if substituicoes:
+        tabela = gerador.constante(substituicoes)
+        classes = {type(k) for k in substituicoes}
+        teste = "{v}.__class__ is str" if classes == {str} else f"{{v}}.__class__ in {gerador.constante(frozenset(classes))}"
+        for coluna, variavel in gerador.variaveis.items():
+            if gerador.tipos[coluna] != "tempo":
+                gerador.emitir(f"if {teste.format(v=variavel)}: {variavel} = {tabela}.get({variavel}, {variavel})", coluna)
+    for temporal in (p["data"], p["hora"]):
+        if temporal in gerador.variaveis:
+            # Só alimenta o rótulo mes-ano (convertido no caminho lento)
+            gerador.tipos[temporal] = "tempo"
+            convertidas.add(temporal)
+    for coluna in p["float"]:
+        if coluna in gerador.variaveis:
+            v = gerador.variaveis[coluna]
+            gerador.emitir(f"{v} = {v} if {v}.__class__ is float else _para_float({v})", coluna)
+            gerador.tipos[coluna] = "num"
+            convertidas.add(coluna)
+    for coluna in p["int"]:
+        if coluna in gerador.variaveis:
+            v = gerador.variaveis[coluna]
+            gerador.emitir(f"{v} = _para_inteiro({v})", coluna)
+            gerador.tipos[coluna] = "num"
+            convertidas.add(coluna)
+    for coluna in p["categoricas"]:
+        if coluna in gerador.variaveis:
+            v = gerador.variaveis[coluna]
+            gerador.emitir(f"{v} = _para_texto({v})", coluna)
+            gerador.tipos[coluna] = "txt"
+            convertidas.add(coluna)
+
+
+def _emitir_brutas(gerador: _Gerador, convertidas: set) -> None:
+    """Colunas sem conversão declarada: número ou texto conforme o histórico."""
+    for coluna, variavel in gerador.brutas.items():
+        if coluna in convertidas:
+            continue
+        funcao = "_para_float" if gerador.tipos[coluna] == "num" else "_para_texto"
+        gerador.emitir(f"{variavel} = {funcao}({variavel})", coluna)
+        convertidas.add(coluna)
+
+
+def _emitir_stull(gerador: _Gerador, coluna_tu: str, temp: str, umidade: str) -> None:
+    if not {temp, umidade} <= set(gerador.variaveis):
+        return
+    if coluna_tu not in gerador.variaveis:
+        gerador.emitir(f"{gerador.nova(coluna_tu, 'num')} = _NAN", coluna_tu)
+    tu, t, u = (gerador.variaveis[c] for c in (coluna_tu, temp, umidade))
+    gerador.emitir(
+        f"if {tu} != {tu} and {_literal(FAIXA_TEMPERATURA_STULL[0])} <= {t} <= {_literal(FAIXA_TEMPERATURA_STULL[1])}"
+        f" and {_literal(FAIXA_UMIDADE_STULL[0])} <= {u} <= {_literal(FAIXA_UMIDADE_STULL[1])}:"
+        f" {tu} = _tu_stull({t}, {u})",
+        f"{coluna_tu} (Stull)",
+    )
+
+
+def _emitir_imputacao(gerador: _Gerador, ajuste: Dict[str, Any]) -> None:
+    for coluna in ajuste.get("stull", []):
+        _emitir_stull(gerador, coluna, "tmedia", "ur")
+    for coluna, valor in ajuste["valores"].items():
+        if coluna not in gerador.variaveis or gerador.tipos[coluna] == "tempo":
+            continue
+        valor = _escalar(valor)
+        if gerador.tipos[coluna] == "num" and isinstance(valor, str):
+            continue
+        v = gerador.variaveis[coluna]
+        gerador.emitir(f"if {gerador.faltante(coluna)}: {v} = {_literal(valor)}", coluna)
+    # ajuste['sequenciais'] dependem das linhas vizinhas: faltante fica
+
+
+def _emitir_derivadas(gerador: _Gerador, tipos: List[str]) -> None:
+    """Chama a mesma função por linha do lote (FUNCOES_FEATURES_DERIVADAS)."""
+    temp, umidade = colunas_clima(gerador.variaveis)
+    for tipo in dict.fromkeys(tipos):
+        if tipo == "tu_stull":
+            _emitir_stull(gerador, "tu", temp, umidade)
+            continue
+        if tipo not in FUNCOES_FEATURES_DERIVADAS:
+            continue
+        entradas = entradas_feature_derivada(tipo, temp, umidade)
+        if not set(entradas) <= set(gerador.variaveis):
+            continue
+        chamada = f"{gerador.constante(FUNCOES_FEATURES_DERIVADAS[tipo])}({', '.join(gerador.variaveis[c] for c in entradas)})"
+        if tipo == "imc_classe":
+            gerador.emitir(f"{gerador.nova(tipo, 'txt')} = _para_texto({chamada})", tipo)
+            continue
+        saida = gerador.nova(tipo, "num")
+        gerador.emitir(f"{saida} = {chamada}", tipo)
+        if tipo == "t*u":
+            gerador.variaveis["t_u"], gerador.tipos["t_u"] = saida, "num"
+
+
+def _emitir_codificacao(gerador: _Gerador, p: Dict[str, Any], artefatos: Dict[str, Any]) -> None:
+    for coluna in p["colunas"]:
+        if coluna not in gerador.variaveis:
+            continue
+        v = gerador.variaveis[coluna]
+        texto = v if gerador.tipos[coluna] == "txt" else f"_para_texto({v})"
+        if p["metodo"] == "label":
+            mapeamento = artefatos["mapeamentos_codificacao"][coluna]
+            vocabulario = gerador.constante({str(valor): int(codigo) for codigo, valor in mapeamento.items()})
+            codigo = gerador.nova(f"{coluna}{p['sufixo']}", "num")
+            gerador.emitir(
+                f"{codigo} = {vocabulario}.get({FALTANTE!r} if {texto} is None else {texto}, {CODIGO_DESCONHECIDO})",
+                f"{coluna}{p['sufixo']}",
+            )
+            continue
+        for categoria in artefatos["categorias_onehot"][coluna]:
+            dummy = gerador.nova(f"{coluna}_{categoria}", "num")
+            gerador.emitir(f"{dummy} = 1.0 if {texto} == {_literal(categoria)} else 0.0", f"{coluna}_{categoria}")
+        del gerador.variaveis[coluna]
+
+
+def _parametros_normalizacao(metodo: str, info: Any) -> Tuple[float, Optional[float]]:
+    if metodo == "standard":
+        desvio = float(info["std"])
+        # Desvio nulo (ou de grupo com uma linha): saída 0.0
+        return float(info["mean"]), (None if desvio == 0 else desvio)
+    if metodo == "minmax":
+        return float(info.scale_[0]), float(info.min_[0])
+    if metodo == "robust":
+        return float(info.center_[0]), float(info.scale_[0])
+    return 0.0, float(info.scale_[0])
+
+
+def _formula_normalizacao(metodo: str, v: str, a: str, b: str) -> str:
+    if metodo == "standard":
+        return f"0.0 if {b} is None else ({v} - {a}) / {b}"
+    if metodo == "minmax":
+        return f"{v} * {a} + {b}"
+    if metodo == "robust":
+        return f"({v} - {a}) / {b}"
+    return f"{v} / {b}"
+
+
+def _escolher_grupo_padrao(grupos: Sequence[Any]) -> Any:
+    meses = sorted(g for g in grupos if isinstance(g, str) and _PADRAO_MES_ANO.match(g))
+    if meses:
+        return meses[-1]
+    return list(grupos)[-1] if len(grupos) else None
+
+
+def _emitir_grupo(gerador: _Gerador, coluna: str, agrupamento: Dict[str, str], padrao: Any) -> str:
+    """Variável com o rótulo do grupo (mes-ano informado, derivado da data ou padrão)."""
+    if gerador.grupo is not None:
+        return gerador.grupo
+    gerador.grupo = "grupo"
+    if coluna in gerador.variaveis and gerador.tipos[coluna] != "tempo":
+        gerador.emitir(f"grupo = {gerador.variaveis[coluna]}", coluna)
+    else:
+        gerador.emitir("grupo = grupo_informado", coluna)
+    data = agrupamento.get("data")
+    if data in gerador.variaveis:
+        v = gerador.variaveis[data]
+        gerador.emitir(
+            f"if grupo is None: grupo = {_literal(padrao)} if {v} is None else _mes_ano({v}, {data!r}, {coluna!r})"
+        )
+    else:
+        gerador.emitir(f"if grupo is None: grupo = {_literal(padrao)}")
+    return gerador.grupo
+
+
+def _emitir_normalizacao(
+    gerador: _Gerador,
+    p: Dict[str, Any],
+    scalers: Any,
+    agrupado: bool,
+    agrupamento: Dict[str, str],
+    grupo_padrao: Any,
+) -> Any:
+    for coluna, metodo in p["metodos"].items():
+        if coluna not in gerador.variaveis:
+            continue
+        metodo = (metodo or "standard").lower()
+        if metodo not in _METODOS_NORMALIZACAO:
+            raise ValueError(f"Normalização '{metodo}' não suportada no transformador de linha ({coluna})")
+        v = gerador.variaveis[coluna]
+        saida = gerador.nova(f"{coluna}{p['sufixo']}", "num")
+        if agrupado:
+            por_grupo = {
+                _escalar(grupo): _parametros_normalizacao(metodo, infos[coluna])
+                for grupo, infos in scalers.items()
+            }
+            if grupo_padrao is None:
+                grupo_padrao = _escolher_grupo_padrao(list(por_grupo))
+            grupo = _emitir_grupo(gerador, p["agrupamento"], agrupamento, grupo_padrao)
+            tabela = gerador.constante(por_grupo)
+            padrao = gerador.constante(por_grupo.get(grupo_padrao, (_NAN, _NAN)))
+            gerador.emitir(f"a, b = {tabela}.get({grupo}, {padrao})")
+            gerador.emitir(f"{saida} = {_formula_normalizacao(metodo, v, 'a', 'b')}", f"{coluna}{p['sufixo']}")
+        else:
+            a, b = _parametros_normalizacao(metodo, scalers[coluna])
+            gerador.emitir(
+                f"{saida} = {_formula_normalizacao(metodo, v, _literal(a), _literal(b))}", f"{coluna}{p['sufixo']}"
+            )
+    return grupo_padrao
+
+
+def _chaves_entrada(coluna: str, original: str) -> List[str]:
+    """Nomes aceitos no dict: interno, original do histórico e o da API."""
+    return list(dict.fromkeys([coluna, original, config.NOVOS_CABECALHOS.get(coluna, coluna)]))
+
+
+def _montar_codigo(
+    gerador: _Gerador,
+    colunas_brutas: Dict[str, str],
+    saidas: List[str],
+    coluna_grupo: Optional[str],
+) -> str:
+    corpo = gerador.linhas
+    retorno = f"    return _array(({', '.join(saidas)},), _FLOAT64)"
+
+    leitura_dict = ["def transformar(linha):", "    g = linha.get"]
+    for coluna, original in colunas_brutas.items():
+        v = gerador.brutas[coluna]
+        chaves = _chaves_entrada(coluna, original)
+        leitura_dict.append(f"    {v} = g({chaves[0]!r})")
+        for chave in chaves[1:]:
+            leitura_dict.append(f"    if {v} is None: {v} = g({chave!r})")
+    leitura_dict.append(f"    grupo_informado = g({coluna_grupo!r})" if coluna_grupo else "    grupo_informado = None")
+
+    leitura_array = ["def transformar_array(valores):", "    if valores.__class__ is _ndarray: valores = valores.tolist()"]
+    for i, coluna in enumerate(colunas_brutas):
+        leitura_array.append(f"    {gerador.brutas[coluna]} = valores[{i}]")
+    leitura_array.append("    grupo_informado = None")
+
+    partes = [*leitura_dict, *corpo, retorno, "", *leitura_array, *corpo, retorno, ""]
+    return "\n".join(partes)
+
+
+def compilar_transformador_linha(
+    df_bruto: pd.DataFrame,
+    features_modelo: Sequence[str],
+    especificacao: Union[str, Path, Mapping, None] = None,
+    grupo_padrao: Any = None,
+) -> TransformadorLinha:
+    """
+    Ajusta o pipeline no histórico e compila o transformador de uma linha.
+
+    Args:
+        df_bruto: Histórico bruto usado no ajuste (o mesmo do treino)
+        features_modelo: Colunas do vetor de saída, na ordem do modelo (ex.:
+            carregar_features_modelo(caminho)['features_modelo'])
+        especificacao: Especificação do pipeline (padrão:
+            config.ESPECIFICACAO_PIPELINE; ver especificacao_de_parametros
+            para os parâmetros de executar_pipeline_completo)
+        grupo_padrao: Grupo da normalização para registros sem mes-ano/data
+            ou de mês fora do histórico (padrão: o mês mais recente)
+
+    Returns:
+        TransformadorLinha
+
+    Raises:
+        ValueError: features_modelo vazio, feature que o plano não produz, não numérica (texto,
+            classe de IMC) ou de normalização sem fórmula por linha ('l2')
+    """
+    features_modelo = list(features_modelo)
+    if not features_modelo:
+        raise ValueError("features_modelo vazio")
+    espec = carregar_especificacao(
+        especificacao if especificacao is not None else config.ESPECIFICACAO_PIPELINE
+    )
+    # O alvo não é entrada do modelo: fica fora das colunas vivas
+    plano: PlanoExecucao = compilar_plano({**espec, "alvo": None}, df_bruto, features_modelo=features_modelo)
+
+    originais = dict(zip(padronizar_nomes(df_bruto.columns), df_bruto.columns))
+    tipos = dict(zip(padronizar_nomes(df_bruto.columns), df_bruto.dtypes))
+    vivas = [c for c in plano.colunas_entrada if c not in set(plano.colunas_podadas)]
+
+    gerador = _Gerador()
+    _emitir_leitura(gerador, {c: tipos[c] for c in vivas})
+    gerador.brutas = dict(gerador.variaveis)
+    convertidas: set = set()
+    agrupamento: Dict[str, str] = {}
+    coluna_grupo: Optional[str] = None
+
+    df = df_bruto.set_axis(padronizar_nomes(df_bruto.columns), axis=1) if len(df_bruto.columns) else df_bruto.copy()
+    artefatos: Dict[str, Any] = {}
+    for passo in plano.passos:
+        p = passo.parametros
+        if passo.nome not in ("projecao", "limpeza_conversao"):
+            _emitir_brutas(gerador, convertidas)
+        if passo.nome == "limpeza_conversao":
+            _emitir_limpeza_conversao(gerador, p, convertidas)
+            agrupamento.setdefault("data", p["data"])
+        elif passo.nome == "imputacao":
+            ajuste = ajustar_imputacao(df, {
+                "config_imputacao_customizada": p["colunas"],
+                "metodo_imputacao_numerica": p["numerica"],
+                "metodo_imputacao_categorica": p["categorica"],
+                "valor_constante_categorica": p["constante"],
+            })
+            _emitir_imputacao(gerador, ajuste)
+        elif passo.nome == "agrupamento_temporal":
+            agrupamento["data"] = p["data"]
+        elif passo.nome == "features_derivadas":
+            _emitir_derivadas(gerador, p["tipos"])
+        elif passo.nome == "normalizacao":
+            agrupado = bool(p["agrupamento"]) and p["agrupamento"] in df.columns
+            coluna_grupo = p["agrupamento"] if agrupado else coluna_grupo
+        df = executar_passo(df, passo, artefatos)
+        if passo.nome == "codificacao":
+            _emitir_codificacao(gerador, p, artefatos)
+        elif passo.nome == "normalizacao":
+            grupo_padrao = _emitir_normalizacao(
+                gerador, p, artefatos["scalers_normalizacao"], agrupado, agrupamento, grupo_padrao
+            )
+    _emitir_brutas(gerador, convertidas)
+
+    saidas = []
+    for feature in features_modelo:
+        if feature not in gerador.variaveis:
+            raise ValueError(f"Feature sem cálculo por linha no transformador: {feature}")
+        if gerador.tipos[feature] != "num":
+            raise ValueError(f"Feature não numérica no transformador de linha: {feature}")
+        variavel = gerador.variaveis[feature]
+        # Compactação float32 no lote: mesmo arredondamento
+        saidas.append(f"_float32({variavel})" if df[feature].dtype == "float32" else variavel)
+
+    codigo = _montar_codigo(gerador, {c: originais[c] for c in vivas}, saidas, coluna_grupo)
+    return TransformadorLinha(codigo, gerador.constantes, features_modelo, vivas, grupo_padrao)
+
+
+__all__ = ["TransformadorLinha", "compilar_transformador_linha"]
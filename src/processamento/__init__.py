@@ -6,29 +6,49 @@ from .limpeza import (
     converter_colunas_categoricas,
     converter_colunas_float,
     converter_colunas_int,
+    limpar_e_converter_arrow,
 )
 from .imputacao import (
     imputar_numericos,
     imputar_categoricos,
     imputar_por_coluna,
     imputar_media_movel_interpolada,
+    imputar_interpolacao_temporal,
 )
 from .temporal import (
     converter_colunas_temporais,
     garantir_agrupamento_temporal,
     adicionar_mes_ano,
 )
+from .memoria import compactar_tipos
+from .tabelas import TabelasClima, separar_tabelas_clima, juntar_tabelas_clima
+from .validacao import (
+    EsquemaCompilado,
+    ErroValidacaoEsquema,
+    compilar_esquema,
+    validar_esquema,
+)
 
 __all__ = [
     "aplicar_substituicoes",
     "converter_colunas_categoricas",
     "converter_colunas_float",
     "converter_colunas_int",
+    "limpar_e_converter_arrow",
     "imputar_numericos",
     "imputar_categoricos",
     "imputar_por_coluna",
     "imputar_media_movel_interpolada",
+    "imputar_interpolacao_temporal",
     "converter_colunas_temporais",
     "garantir_agrupamento_temporal",
     "adicionar_mes_ano",
+    "compactar_tipos",
+    "TabelasClima",
+    "separar_tabelas_clima",
+    "juntar_tabelas_clima",
+    "EsquemaCompilado",
+    "ErroValidacaoEsquema",
+    "compilar_esquema",
+    "validar_esquema",
 ]
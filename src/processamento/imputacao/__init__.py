@@ -5,10 +5,12 @@ from .imputar_numericos import imputar_numericos
 from .imputar_categoricos import imputar_categoricos
 from .imputar_por_coluna import imputar_por_coluna
 from .imputar_media_movel_interpolada import imputar_media_movel_interpolada
+from .imputar_interpolacao_temporal import imputar_interpolacao_temporal
 
 __all__ = [
     "imputar_numericos",
     "imputar_categoricos",
     "imputar_por_coluna",
     "imputar_media_movel_interpolada",
+    "imputar_interpolacao_temporal",
 ]
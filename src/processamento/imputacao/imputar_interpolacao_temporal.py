@@ -0,0 +1,120 @@
+"""
+Imputação por interpolação no eixo do tempo, várias colunas de uma vez.
+
+Cada linha é um respondente e vários respondentes compartilham o mesmo
+instante (data + hora), então a posição da linha não é tempo. As colunas são
+reduzidas a uma série por instante único, interpoladas com method='time' e
+devolvidas a todas as linhas do instante.
+"""
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# Janela (em pontos) da média móvel de fallback quando não há coluna de tempo
+JANELA_PONTOS_SEM_TEMPO = 48
+
+
+def _eixo_tempo(
+    df: pd.DataFrame,
+    coluna_data: Optional[str],
+    coluna_hora: Optional[str],
+    coluna_tempo: Optional[str],
+) -> Optional[pd.Series]:
+    """Instante de cada linha (NaT se desconhecido) ou None se não houver tempo."""
+    if coluna_tempo and coluna_tempo in df.columns:
+        return pd.to_datetime(df[coluna_tempo], errors="coerce")
+    if not coluna_data or coluna_data not in df.columns:
+        return None
+    data = pd.to_datetime(df[coluna_data], errors="coerce")
+    if not coluna_hora or coluna_hora not in df.columns:
+        return data
+    hora = df[coluna_hora]
+    if not pd.api.types.is_datetime64_any_dtype(hora):
+        hora = pd.to_datetime(hora.astype("string"), format="mixed", errors="coerce")
+    horario = (hora - hora.dt.normalize()).fillna(pd.Timedelta(0))
+    return data.dt.normalize() + horario
+
+
+def imputar_interpolacao_temporal(
+    df: pd.DataFrame,
+    colunas: Iterable[str],
+    coluna_data: Optional[str] = "data",
+    coluna_hora: Optional[str] = "hora",
+    coluna_tempo: Optional[str] = None,
+    limite: Optional[int] = None,
+    janela_fallback: Optional[Union[str, int]] = "48h",
+) -> pd.DataFrame:
+    """
+    Imputa colunas numéricas interpolando no tempo real das observações.
+
+    Os valores válidos de cada instante (média, se houver mais de um) formam
+    uma série por instante único; ela é interpolada com method='time'
+    (extremos recebem o valor válido mais próximo) e os faltantes de cada
+    linha recebem o valor do seu instante. Valores existentes não mudam.
+
+    Args:
+        df: DataFrame
+        colunas: Colunas a imputar (ausentes ou não numéricas são ignoradas)
+        coluna_data: Coluna de data (datetime ou texto)
+        coluna_hora: Coluna de hora, combinada com a data se existir
+        coluna_tempo: Coluna datetime completa; tem prioridade sobre data/hora
+        limite: Máximo de instantes consecutivos interpolados (None = todos)
+        janela_fallback: Janela da média móvel centrada aplicada ao que a
+            interpolação deixou sem valor (ex.: '48h'); None desativa. Sem
+            coluna de tempo a interpolação é por posição e a janela, em pontos
+            (str vira JANELA_PONTOS_SEM_TEMPO)
+
+    Returns:
+        DataFrame com as colunas imputadas (linhas com instante desconhecido
+        e colunas sem nenhum valor válido ficam como estão)
+    """
+    colunas = [
+        c for c in dict.fromkeys(colunas)
+        if c in df.columns and pd.api.types.is_numeric_dtype(df[c]) and df[c].isna().any()
+    ]
+    if not colunas:
+        return df.copy()
+
+    tempo = _eixo_tempo(df, coluna_data, coluna_hora, coluna_tempo)
+    if tempo is None:
+        codigos = np.arange(len(df))
+        instantes = pd.RangeIndex(len(df))
+    else:
+        codigos, instantes = pd.factorize(tempo, sort=True)
+
+    com_instante = codigos >= 0
+    n_instantes = len(instantes)
+    originais = df[colunas].to_numpy(dtype="float64", na_value=np.nan)
+
+    # Média dos valores válidos por instante (constantes na sessão, em geral)
+    por_instante = np.full((n_instantes, len(colunas)), np.nan)
+    for j in range(len(colunas)):
+        validos = com_instante & ~np.isnan(originais[:, j])
+        soma = np.bincount(codigos[validos], weights=originais[validos, j], minlength=n_instantes)
+        contagem = np.bincount(codigos[validos], minlength=n_instantes)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            por_instante[:, j] = soma / contagem
+
+    tabela = pd.DataFrame(por_instante, index=instantes, columns=colunas)
+    metodo = "time" if tempo is not None else "linear"
+    tabela = tabela.interpolate(method=metodo, limit=limite, limit_direction="both")
+    if janela_fallback is not None and tabela.isna().to_numpy().any():
+        if tempo is None and isinstance(janela_fallback, str):
+            janela_fallback = JANELA_PONTOS_SEM_TEMPO
+        media_movel = tabela.rolling(janela_fallback, min_periods=1, center=True).mean()
+        tabela = tabela.fillna(media_movel)
+
+    df = df.copy()
+    valores_instante = tabela.to_numpy()
+    for j, coluna in enumerate(colunas):
+        preencher = np.isnan(originais[:, j]) & com_instante
+        if not preencher.any():
+            continue
+        valores = originais[:, j].copy()
+        valores[preencher] = valores_instante[codigos[preencher], j]
+        df[coluna] = valores
+    return df
+
+
+__all__ = ["imputar_interpolacao_temporal", "JANELA_PONTOS_SEM_TEMPO"]
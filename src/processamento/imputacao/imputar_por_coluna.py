@@ -1,15 +1,154 @@
 """
 Imputação de valores faltantes com controle por coluna.
 """
-from typing import Any, Dict, Optional
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
 import numpy as np
 import pandas as pd
+from ...utils.executor_dag import NoColuna, executar_grafo, resolver_trabalhadores
+
+
+def _valor_median_legado(serie: pd.Series) -> Any:
+    serie_valida = serie.dropna()
+    if serie_valida.empty:
+        return np.nan
+    return (serie_valida.min() + serie_valida.max()) / 2
+
+
+def _fillna_compat(serie: pd.Series, valor: Any) -> pd.Series:
+    if pd.api.types.is_integer_dtype(serie) and isinstance(valor, float) and not float(valor).is_integer():
+        return serie.astype(float).fillna(valor)
+    return serie.fillna(valor)
+
+
+def _imputar_serie(serie: pd.Series, metodo: Any) -> pd.Series:
+    if metodo == "mean":
+        return _fillna_compat(serie, serie.mean())
+    if metodo == "median":
+        return _fillna_compat(serie, _valor_median_legado(serie))
+    if metodo == "mode":
+        if serie.notna().any():
+            modo = serie.mode(dropna=True)
+            if len(modo) > 0:
+                return _fillna_compat(serie, modo.iloc[0])
+        return serie
+    if metodo == "zero":
+        return _fillna_compat(serie, 0)
+    if metodo == "forward":
+        return serie.ffill()
+    if metodo == "backward":
+        return serie.bfill()
+    return _fillna_compat(serie, metodo)
+
+
+def _metodo_padrao_coluna(serie: pd.Series, metodo_padrao: str) -> Any:
+    """Roteia o método padrão conforme o tipo da coluna."""
+    if pd.api.types.is_numeric_dtype(serie):
+        if metodo_padrao in {"mean", "median", "zero", "forward", "backward"}:
+            return metodo_padrao
+        return 0
+    if metodo_padrao in {"mode", "forward", "backward"}:
+        return metodo_padrao
+    if metodo_padrao in {"mean", "median", "zero"}:
+        return "mode"
+    return metodo_padrao
+
+
+def _imputar_coluna(df: pd.DataFrame, coluna: str, metodo: Any) -> Tuple[Dict[str, pd.Series], None]:
+    return {coluna: _imputar_serie(df[coluna], metodo)}, None
+
+
+def _preencher_constante(serie: pd.Series, faltantes: np.ndarray, valor: Any) -> pd.Series:
+    """Equivale a _fillna_compat em colunas object, reaproveitando a máscara de faltantes."""
+    # Em object, fillna preenche e infere o tipo (mesma conversão de infer_objects)
+    valores = serie.to_numpy(dtype=object, copy=True)
+    valores[faltantes] = valor
+    return pd.Series(valores, index=serie.index, name=serie.name).infer_objects()
+
+
+def _imputar_em_uma_passada(
+    df: pd.DataFrame, metodos: Dict[str, Any], faltantes: Dict[str, np.ndarray]
+) -> pd.DataFrame:
+    """
+    Mesmo resultado do laço por coluna, com as estatísticas agregadas.
+
+    Média e mediana legada de todas as colunas numéricas saem de uma redução
+    só, moda de uma contagem por coluna, os preenchimentos constantes saem de
+    um fillna(dict) (colunas object usam a máscara de faltantes já calculada)
+    e ffill/bfill rodam em bloco.
+    """
+    def _numerica(coluna: str) -> bool:
+        return pd.api.types.is_numeric_dtype(df[coluna]) and not pd.api.types.is_bool_dtype(df[coluna])
+
+    por_metodo: Dict[Any, list] = {}
+    for coluna, metodo in metodos.items():
+        chave = metodo if isinstance(metodo, str) and metodo in {"mean", "median", "forward", "backward"} else None
+        if chave in ("mean", "median") and not _numerica(coluna):
+            chave = None
+        por_metodo.setdefault(chave, []).append(coluna)
+
+    valores: Dict[str, Any] = {}
+    saidas: Dict[str, pd.Series] = {}
+    agregados: Dict[str, Any] = {}
+    if por_metodo.get("mean"):
+        agregados.update(df[por_metodo["mean"]].mean().items())
+    if por_metodo.get("median"):
+        colunas = por_metodo["median"]
+        minimos, maximos = df[colunas].min(), df[colunas].max()
+        agregados.update({c: (minimos[c] + maximos[c]) / 2 for c in colunas})
+    for coluna, valor in agregados.items():
+        if pd.isna(valor):
+            # Coluna sem valor válido: o NaN/NA do caminho original depende do
+            # dtype da coluna (e decide o upcast de _fillna_compat)
+            saidas[coluna] = _imputar_serie(df[coluna], metodos[coluna])
+        else:
+            valores[coluna] = valor
+
+    for coluna in por_metodo.get(None, []):
+        metodo = metodos[coluna]
+        if metodo == "mode":
+            if not faltantes[coluna].all():
+                modo = df[coluna].mode(dropna=True)
+                if len(modo) > 0:
+                    valores[coluna] = modo.iloc[0]
+        elif isinstance(metodo, str) and metodo in {"mean", "median"}:
+            # Colunas não numéricas seguem o caminho original (inclusive erros)
+            saidas[coluna] = _imputar_serie(df[coluna], metodo)
+        else:
+            valores[coluna] = 0 if metodo == "zero" else metodo
+
+    # Constantes em colunas não object: um fillna(dict) só; inteiras com valor
+    # fracionário passam por _fillna_compat (upcast para float)
+    bloco: Dict[str, Any] = {}
+    for coluna, valor in valores.items():
+        serie = df[coluna]
+        if serie.dtype == object:
+            saidas[coluna] = _preencher_constante(serie, faltantes[coluna], valor)
+        elif pd.api.types.is_integer_dtype(serie) and isinstance(valor, float) and not float(valor).is_integer():
+            saidas[coluna] = _fillna_compat(serie, valor)
+        else:
+            bloco[coluna] = valor
+    if bloco:
+        saidas.update(df[list(bloco)].fillna(bloco).items())
+    for metodo, preencher in (("forward", "ffill"), ("backward", "bfill")):
+        if por_metodo.get(metodo):
+            bloco = getattr(df[por_metodo[metodo]], preencher)()
+            saidas.update(bloco.items())
+
+    # Colunas gravadas na ordem de metodos, como no executor por coluna
+    for coluna in metodos:
+        if coluna in saidas:
+            df[coluna] = saidas[coluna]
+    return df
 
 
 def imputar_por_coluna(
     df: pd.DataFrame,
     config_imputacao: Dict[str, Any],
-    metodo_padrao: Optional[str] = None
+    metodo_padrao: Optional[str] = None,
+    n_trabalhadores: Optional[int] = 1,
+    modo_execucao: str = "thread",
+    vetorizado: bool = True,
 ) -> pd.DataFrame:
     """
     Imputa valores faltantes com métodos específicos por coluna.
@@ -26,6 +165,13 @@ def imputar_por_coluna(
             - 'backward': Backward fill
             - Valor específico: ex: 'desconhecido', 0, -1
         metodo_padrao: Método para colunas não especificadas
+        n_trabalhadores: Cada coluna com faltantes é imputada de forma
+            independente; com n_trabalhadores > 1 as colunas rodam em paralelo
+        modo_execucao: 'thread' ou 'processo' (ver utils.executor_dag)
+        vetorizado: Sequencialmente, imputa todas as colunas em uma passada
+            (estatísticas agregadas, um fillna(dict) para as constantes e
+            ffill/bfill em bloco), com o mesmo resultado do laço por
+            coluna; False mantém o laço
         
     Returns:
         DataFrame com valores imputados
@@ -41,67 +187,30 @@ def imputar_por_coluna(
         >>> df_imp = imputar_por_coluna(df, config)
     """
     df = df.copy()
-    
-    def _valor_median_legado(serie: pd.Series) -> Any:
-        serie_valida = serie.dropna()
-        if serie_valida.empty:
-            return np.nan
-        return (serie_valida.min() + serie_valida.max()) / 2
-
-    def _fillna_compat(serie: pd.Series, valor: Any) -> pd.Series:
-        if pd.api.types.is_integer_dtype(serie) and isinstance(valor, float) and not float(valor).is_integer():
-            return serie.astype(float).fillna(valor)
-        return serie.fillna(valor)
-
-    def _imputar_serie(serie: pd.Series, metodo: Any) -> pd.Series:
-        if metodo == "mean":
-            return _fillna_compat(serie, serie.mean())
-        if metodo == "median":
-            return _fillna_compat(serie, _valor_median_legado(serie))
-        if metodo == "mode":
-            if serie.notna().any():
-                modo = serie.mode(dropna=True)
-                if len(modo) > 0:
-                    return _fillna_compat(serie, modo.iloc[0])
-            return serie
-        if metodo == "zero":
-            return _fillna_compat(serie, 0)
-        if metodo == "forward":
-            return serie.ffill()
-        if metodo == "backward":
-            return serie.bfill()
-        return _fillna_compat(serie, metodo)
 
-    for coluna, metodo in config_imputacao.items():
-        if coluna not in df.columns:
-            continue
-            
-        if df[coluna].isna().sum() == 0:
-            continue  # Sem valores faltantes
-        
-        df[coluna] = _imputar_serie(df[coluna], metodo)
+    # Máscara de faltantes calculada uma vez por coluna candidata
+    candidatas = [c for c in config_imputacao if c in df.columns]
+    if metodo_padrao is not None:
+        candidatas += [c for c in df.columns if c not in config_imputacao]
+    faltantes = {coluna: df[coluna].isna().to_numpy() for coluna in candidatas}
 
-    if metodo_padrao is None:
-        return df
+    metodos: Dict[str, Any] = {}
+    for coluna, metodo in config_imputacao.items():
+        if coluna in df.columns and faltantes[coluna].any():
+            metodos[coluna] = metodo
 
-    # Imputa colunas não especificadas com método padrão (quando definido)
-    colunas_restantes = [c for c in df.columns if c not in config_imputacao]
+    # Colunas não especificadas usam o método padrão (quando definido)
+    if metodo_padrao is not None:
+        for coluna in df.columns:
+            if coluna not in config_imputacao and faltantes[coluna].any():
+                metodos[coluna] = _metodo_padrao_coluna(df[coluna], metodo_padrao)
 
-    for coluna in colunas_restantes:
-        if df[coluna].isna().sum() == 0:
-            continue
+    if vetorizado and resolver_trabalhadores(n_trabalhadores) <= 1:
+        return _imputar_em_uma_passada(df, metodos, faltantes)
 
-        if pd.api.types.is_numeric_dtype(df[coluna]):
-            if metodo_padrao in {"mean", "median", "zero", "forward", "backward"}:
-                df[coluna] = _imputar_serie(df[coluna], metodo_padrao)
-            else:
-                df[coluna] = _imputar_serie(df[coluna], 0)
-        else:
-            if metodo_padrao in {"mode", "forward", "backward"}:
-                df[coluna] = _imputar_serie(df[coluna], metodo_padrao)
-            elif metodo_padrao in {"mean", "median", "zero"}:
-                df[coluna] = _imputar_serie(df[coluna], "mode")
-            else:
-                df[coluna] = _imputar_serie(df[coluna], metodo_padrao)
-    
+    nos = [
+        NoColuna(coluna, partial(_imputar_coluna, coluna=coluna, metodo=metodo), (coluna,), (coluna,))
+        for coluna, metodo in metodos.items()
+    ]
+    df, _ = executar_grafo(df, nos, n_trabalhadores=n_trabalhadores, modo=modo_execucao)
     return df
@@ -4,10 +4,12 @@ from .aplicar_substituicoes import aplicar_substituicoes
 from .converter_colunas_categoricas import converter_colunas_categoricas
 from .converter_colunas_float import converter_colunas_float
 from .converter_colunas_int import converter_colunas_int
+from .limpar_converter_arrow import limpar_e_converter_arrow
 
 __all__ = [
     "aplicar_substituicoes",
     "converter_colunas_categoricas",
     "converter_colunas_float",
     "converter_colunas_int",
+    "limpar_e_converter_arrow",
 ]
@@ -0,0 +1,209 @@
+"""
+Limpeza e conversão de tipos em colunas Arrow (pyarrow.compute).
+
+Alternativa ao caminho pandas (aplicar_substituicoes + converter_colunas_*)
+com resultado idêntico. As colunas de texto viram pa.StringArray uma vez;
+substituições, vírgula decimal, casts e a codificação em dicionário rodam no
+Arrow e só o resultado final é convertido para pandas (sem cópia quando não
+há nulos). Colunas que o Arrow não reproduz exatamente seguem pelas funções
+pandas, coluna a coluna.
+"""
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .aplicar_substituicoes import aplicar_substituicoes
+from .converter_colunas_categoricas import converter_colunas_categoricas
+from .converter_colunas_float import converter_colunas_float
+from .converter_colunas_int import converter_colunas_int
+
+# Formas numéricas em que pandas.to_numeric e o cast do Arrow coincidem bit a
+# bit; com até 15 caracteres a mantissa é exata nos dois parsers
+_PADRAO_INTEIRO = r"^-?\d+$"
+_PADRAO_DECIMAL = r"^-?\d+(\.\d+)?$"
+_MAXIMO_CARACTERES_NUMERO = 15
+
+
+def _substituicoes_compativeis(substituicoes: Optional[Dict]) -> bool:
+    """Só texto -> texto ou texto -> NaN tem a mesma semântica do df.replace."""
+    for origem, destino in (substituicoes or {}).items():
+        if not isinstance(origem, str):
+            return False
+        if not (isinstance(destino, str) or (isinstance(destino, float) and np.isnan(destino))):
+            return False
+    return True
+
+
+def _para_arrow(serie: pd.Series, exigir_nan: bool) -> Optional[pa.Array]:
+    """
+    Coluna object só com texto e NaN como pa.string(); None se não for o caso.
+
+    Com exigir_nan, faltantes que não sejam NaN (ex.: None) também recusam a
+    coluna, pois o caminho pandas os preserva como estão.
+    """
+    if serie.dtype != object or not len(serie):
+        return None
+    try:
+        arr = pa.array(serie.to_numpy(), type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    if exigir_nan and arr.null_count:
+        faltantes = serie.to_numpy()[pd.isna(serie.to_numpy())]
+        if not all(isinstance(v, float) for v in faltantes):
+            return None
+    return arr
+
+
+def _substituir(arr: pa.Array, substituicoes: Dict) -> pa.Array:
+    """Substituições de célula inteira, todas avaliadas sobre os valores originais."""
+    resultado = arr
+    for origem, destino in substituicoes.items():
+        mascara = pc.fill_null(pc.equal(arr, origem), False)
+        valor = pa.scalar(None if isinstance(destino, float) else destino, type=pa.string())
+        resultado = pc.if_else(mascara, valor, resultado)
+    return resultado
+
+
+def _todos_casam(arr: pa.Array, padrao: str) -> bool:
+    validos = arr.drop_null()
+    if not len(validos):
+        return True
+    casam = pc.and_(
+        pc.match_substring_regex(validos, padrao),
+        pc.less_equal(pc.utf8_length(validos), _MAXIMO_CARACTERES_NUMERO),
+    )
+    return pc.all(casam).as_py()
+
+
+def _objetos(arr: pa.Array, faltante) -> np.ndarray:
+    """Array object via dicionário: só as categorias únicas viram str do Python."""
+    dicionario = pc.dictionary_encode(arr)
+    categorias = np.array(dicionario.dictionary.to_pylist() + [faltante], dtype=object)
+    indices = pc.fill_null(dicionario.indices, len(categorias) - 1).to_numpy()
+    return categorias[indices]
+
+
+def _texto_para_pandas(arr: pa.Array, substituiu: bool) -> pd.Series:
+    """Coluna de texto como o df.replace deixa: object com NaN (float64 se toda nula)."""
+    if substituiu and arr.null_count == len(arr):
+        return pd.Series(np.full(len(arr), np.nan))
+    return pd.Series(_objetos(arr, np.nan), dtype=object)
+
+
+def _float_para_pandas(arr: pa.Array) -> Optional[pd.Series]:
+    """Equivalente a converter_colunas_float (int64 se não houver faltantes, como to_numeric)."""
+    arr = pc.replace_substring(arr, ",", ".")
+    if not _todos_casam(arr, _PADRAO_DECIMAL):
+        return None
+    if not arr.null_count and _todos_casam(arr, _PADRAO_INTEIRO):
+        return pd.Series(pc.cast(arr, pa.int64()).to_numpy())
+    return pd.Series(pc.cast(arr, pa.float64()).to_numpy(zero_copy_only=False))
+
+
+def _int_para_pandas(arr: pa.Array) -> Optional[pd.Series]:
+    """Equivalente a converter_colunas_int (Int64 com máscara de nulos)."""
+    if not _todos_casam(arr, _PADRAO_INTEIRO):
+        return None
+    inteiros = pc.cast(arr, pa.int64())
+    valores = pc.fill_null(inteiros, 0).to_numpy()
+    mascara = pc.is_null(inteiros).to_numpy(zero_copy_only=False)
+    return pd.Series(pd.arrays.IntegerArray(valores, mascara))
+
+
+def _categorica_para_pandas(arr: pa.Array) -> pd.Series:
+    """Equivalente a converter_colunas_categoricas (dtype 'string')."""
+    return pd.Series(pd.array(_objetos(arr, pd.NA), dtype="string"))
+
+
+def limpar_e_converter_arrow(
+    df: pd.DataFrame,
+    substituicoes: Optional[Dict],
+    colunas_float: Iterable[str],
+    colunas_int: Iterable[str],
+    colunas_categoricas: Iterable[str],
+    colunas_temporais: Iterable[str] = (),
+) -> pd.DataFrame:
+    """
+    Aplica substituições e conversões float/int/categórica no Arrow.
+
+    O resultado é idêntico a aplicar_substituicoes seguido dos conversores
+    pandas. Colunas temporais recebem só as substituições: quem chama
+    converte data/hora (converter_colunas_temporais) e depois aplica a elas
+    os conversores das listas em que estiverem. Colunas que não são
+    texto puro, números fora das formas exatas, colunas em mais de uma lista
+    e substituições que não sejam texto -> texto/NaN usam o caminho pandas.
+
+    Args:
+        df: DataFrame com nomes já padronizados
+        substituicoes: Dicionário valor -> valor (como em aplicar_substituicoes)
+        colunas_float: Colunas para float (vírgula decimal)
+        colunas_int: Colunas para Int64
+        colunas_categoricas: Colunas para 'string'
+        colunas_temporais: Colunas que só recebem as substituições
+
+    Returns:
+        DataFrame com as colunas na ordem original
+    """
+    colunas_float, colunas_int = list(colunas_float or []), list(colunas_int or [])
+    colunas_categoricas = list(colunas_categoricas or [])
+    temporais = set(colunas_temporais)
+    listas = [
+        [c for c in colunas if c not in temporais]
+        for colunas in (colunas_float, colunas_int, colunas_categoricas)
+    ]
+    if not _substituicoes_compativeis(substituicoes) or not len(df) or df.columns.has_duplicates:
+        return _converter_pandas(df, substituicoes, *listas)
+
+    destinos = {}
+    for lista, destino in zip(listas, ("float", "int", "categorica")):
+        for coluna in lista:
+            destinos[coluna] = destino if coluna not in destinos else None
+
+    convertidas: Dict[str, pd.Series] = {}
+    restantes: List[str] = []
+    for coluna in df.columns:
+        destino = destinos.get(coluna, "texto")
+        if destino is None:
+            restantes.append(coluna)
+            continue
+        arr = _para_arrow(df[coluna], exigir_nan=destino == "texto")
+        if arr is None:
+            restantes.append(coluna)
+            continue
+        arr = _substituir(arr, substituicoes or {})
+        if destino == "float":
+            serie = _float_para_pandas(arr)
+        elif destino == "int":
+            serie = _int_para_pandas(arr)
+        elif destino == "categorica":
+            serie = _categorica_para_pandas(arr)
+        else:
+            serie = _texto_para_pandas(arr, substituiu=bool(substituicoes))
+        if serie is None:
+            restantes.append(coluna)
+            continue
+        convertidas[coluna] = serie.set_axis(df.index)
+
+    if restantes:
+        pandas = _converter_pandas(df[restantes], substituicoes, *listas)
+        convertidas.update({coluna: pandas[coluna] for coluna in restantes})
+    return pd.DataFrame({coluna: convertidas[coluna] for coluna in df.columns}, index=df.index)
+
+
+def _converter_pandas(
+    df: pd.DataFrame,
+    substituicoes: Optional[Dict],
+    colunas_float: List[str],
+    colunas_int: List[str],
+    colunas_categoricas: List[str],
+) -> pd.DataFrame:
+    df = aplicar_substituicoes(df, substituicoes)
+    df = converter_colunas_float(df, colunas_float)
+    df = converter_colunas_int(df, colunas_int)
+    return converter_colunas_categoricas(df, colunas_categoricas)
+
+
+__all__ = ["limpar_e_converter_arrow"]
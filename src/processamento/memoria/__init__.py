@@ -0,0 +1,8 @@
+"""
+Compactacao de tipos para reduzir memoria dos DataFrames processados.
+"""
+from .compactar_tipos import compactar_tipos
+
+__all__ = [
+    "compactar_tipos",
+]
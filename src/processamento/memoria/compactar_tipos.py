@@ -0,0 +1,118 @@
+"""
+Compactacao automatica de dtypes com relatorio de memoria por coluna.
+"""
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Ordem de preferencia: do menor para o maior
+_INTEIROS = ("int8", "int16", "int32")
+_INTEIROS_NULLABLE = {"int8": "Int8", "int16": "Int16", "int32": "Int32"}
+
+
+def _menor_inteiro(minimo, maximo) -> Optional[str]:
+    for dtype in _INTEIROS:
+        info = np.iinfo(dtype)
+        if info.min <= minimo and maximo <= info.max:
+            return dtype
+    return None
+
+
+def _compactar_inteiro(serie: pd.Series) -> pd.Series:
+    valores = serie.dropna()
+    if valores.empty:
+        return serie
+    dtype = _menor_inteiro(valores.min(), valores.max())
+    if dtype is None:
+        return serie
+    if isinstance(serie.dtype, pd.api.extensions.ExtensionDtype):
+        dtype = _INTEIROS_NULLABLE[dtype]
+    if serie.dtype == dtype:
+        return serie
+    return serie.astype(dtype)
+
+
+def _compactar_float(serie: pd.Series, tolerancia: float) -> pd.Series:
+    if serie.dtype == "float32":
+        return serie
+    original = serie.to_numpy(dtype="float64", na_value=np.nan)
+    finitos = original[np.isfinite(original)]
+    if finitos.size and np.abs(finitos).max() > np.finfo("float32").max:
+        return serie
+    convertido = original.astype("float32")
+    if not np.allclose(original, convertido, rtol=tolerancia, atol=0.0, equal_nan=True):
+        return serie
+    return pd.Series(convertido, index=serie.index, name=serie.name)
+
+
+def _compactar_texto(serie: pd.Series, limite_cardinalidade: float) -> pd.Series:
+    if serie.dtype == object and not serie.dropna().map(type).eq(str).all():
+        return serie
+    n_validos = serie.notna().sum()
+    if n_validos == 0:
+        return serie
+    if serie.nunique(dropna=True) > limite_cardinalidade * n_validos:
+        return serie
+    return serie.astype("category")
+
+
+def compactar_tipos(
+    df: pd.DataFrame,
+    tolerancia: float = 1e-6,
+    limite_cardinalidade: float = 0.5,
+    colunas: Optional[Iterable[str]] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Reduz os dtypes ao menor tipo seguro observado nos dados.
+
+    - Inteiros (int64/Int64): menor int8/int16/int32 que cabe no intervalo
+      observado; inteiros nullable continuam nullable (Int8, ...)
+    - Floats: float32 somente se todos os valores voltarem a float64 com erro
+      relativo <= tolerancia
+    - Texto (string/object): category se n_unicos <= limite_cardinalidade * n_validos
+
+    Datas, booleanos e categorias existentes nao sao alterados.
+
+    Args:
+        df: DataFrame a compactar
+        tolerancia: Erro relativo maximo aceito na conversao para float32
+        limite_cardinalidade: Proporcao maxima de valores unicos para category
+        colunas: Colunas a considerar (None = todas)
+
+    Returns:
+        Tupla (df_compactado, relatorio) onde relatorio tem uma linha por coluna
+        com dtype_antes, dtype_depois, bytes_antes, bytes_depois e economia_bytes
+    """
+    df = df.copy()
+    cols = [c for c in (colunas if colunas is not None else df.columns) if c in df.columns]
+    linhas = []
+    for col in cols:
+        serie = df[col]
+        if pd.api.types.is_bool_dtype(serie) or isinstance(serie.dtype, pd.CategoricalDtype):
+            nova = serie
+        elif pd.api.types.is_integer_dtype(serie):
+            nova = _compactar_inteiro(serie)
+        elif pd.api.types.is_float_dtype(serie):
+            nova = _compactar_float(serie, tolerancia)
+        elif pd.api.types.is_string_dtype(serie):
+            nova = _compactar_texto(serie, limite_cardinalidade)
+        else:
+            nova = serie
+
+        bytes_antes = int(serie.memory_usage(index=False, deep=True))
+        if nova is not serie:
+            df[col] = nova
+        linhas.append({
+            "coluna": col,
+            "dtype_antes": str(serie.dtype),
+            "dtype_depois": str(nova.dtype),
+            "bytes_antes": bytes_antes,
+            "bytes_depois": int(nova.memory_usage(index=False, deep=True)),
+        })
+
+    relatorio = pd.DataFrame(
+        linhas, columns=["coluna", "dtype_antes", "dtype_depois", "bytes_antes", "bytes_depois"]
+    )
+    relatorio["economia_bytes"] = relatorio["bytes_antes"] - relatorio["bytes_depois"]
+    return df, relatorio
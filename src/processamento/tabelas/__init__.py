@@ -0,0 +1,10 @@
+"""
+Separacao do lote em tabela de clima (por instante) e tabela de respondentes.
+"""
+from .tabelas_clima import TabelasClima, juntar_tabelas_clima, separar_tabelas_clima
+
+__all__ = [
+    "TabelasClima",
+    "separar_tabelas_clima",
+    "juntar_tabelas_clima",
+]
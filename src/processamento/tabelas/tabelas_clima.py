@@ -0,0 +1,114 @@
+"""
+Separação das medições meteorológicas em uma tabela própria.
+
+Cada respondente repete as colunas de clima do seu instante (data + hora).
+A tabela de clima guarda uma linha por combinação distinta de instante e
+valores de clima; a de respondentes guarda o restante, mais a chave. A
+posição da linha de clima de cada respondente é registrada na separação,
+então a junção é um take posicional, sem merge.
+"""
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class TabelasClima:
+    """
+    Tabelas de clima e de respondentes de um mesmo lote.
+
+    posicao_clima[i] é a linha de clima do respondente i; colunas guarda a
+    ordem original das colunas para a junção.
+    """
+
+    clima: pd.DataFrame
+    respondentes: pd.DataFrame
+    posicao_clima: np.ndarray
+    chave: Tuple[str, ...]
+    colunas: Tuple[str, ...]
+
+    @property
+    def fator_repeticao(self) -> float:
+        """Respondentes por linha de clima (ganho de memória/cálculo do clima)."""
+        return len(self.respondentes) / len(self.clima) if len(self.clima) else 1.0
+
+    def substituir(
+        self,
+        clima: Optional[pd.DataFrame] = None,
+        respondentes: Optional[pd.DataFrame] = None,
+    ) -> "TabelasClima":
+        """
+        Cópia com as tabelas trocadas (ex.: após processar cada uma).
+
+        As novas tabelas precisam manter as linhas na mesma ordem e quantidade.
+        """
+        clima = self.clima if clima is None else clima
+        respondentes = self.respondentes if respondentes is None else respondentes
+        if len(clima) != len(self.clima) or len(respondentes) != len(self.respondentes):
+            raise ValueError("As tabelas processadas devem manter o número de linhas")
+        return TabelasClima(clima, respondentes, self.posicao_clima, self.chave, self.colunas)
+
+
+def separar_tabelas_clima(
+    df: pd.DataFrame,
+    colunas_clima: Iterable[str],
+    chave: Iterable[str] = ("data", "hora"),
+) -> TabelasClima:
+    """
+    Separa df em tabela de clima (uma linha por instante) e de respondentes.
+
+    Linhas de um mesmo instante com valores de clima diferentes geram linhas
+    de clima distintas, então nenhum valor se perde.
+
+    Args:
+        df: DataFrame com uma linha por respondente
+        colunas_clima: Colunas meteorológicas (ausentes são ignoradas)
+        chave: Colunas que identificam o instante (ausentes são ignoradas)
+
+    Returns:
+        TabelasClima
+    """
+    chave = tuple(c for c in chave if c in df.columns)
+    colunas_clima = [c for c in dict.fromkeys(colunas_clima) if c in df.columns and c not in chave]
+    colunas_respondentes = [c for c in df.columns if c not in set(colunas_clima)]
+    agrupamento = list(chave) + colunas_clima
+
+    if agrupamento and len(df):
+        posicao = df.groupby(agrupamento, sort=False, dropna=False).ngroup().to_numpy()
+        # Com sort=False os grupos são numerados na ordem da primeira aparição
+        _, primeiras = np.unique(posicao, return_index=True)
+    else:
+        posicao = np.zeros(len(df), dtype="int64")
+        primeiras = np.zeros(min(len(df), 1), dtype="int64")
+
+    clima = df[agrupamento].iloc[primeiras].reset_index(drop=True)
+    return TabelasClima(
+        clima=clima,
+        respondentes=df[colunas_respondentes],
+        posicao_clima=posicao.astype("int64"),
+        chave=chave,
+        colunas=tuple(df.columns),
+    )
+
+
+def juntar_tabelas_clima(tabelas: TabelasClima) -> pd.DataFrame:
+    """
+    Reconstrói o DataFrame por respondente.
+
+    As colunas originais voltam na ordem original; colunas criadas depois
+    da separação vêm ao final (primeiro as dos respondentes). Colunas
+    presentes nas duas tabelas (ex.: a chave) vêm dos respondentes.
+    """
+    respondentes = tabelas.respondentes
+    clima = tabelas.clima.drop(columns=[c for c in tabelas.clima.columns if c in respondentes.columns])
+    bloco = clima.take(tabelas.posicao_clima).set_axis(respondentes.index)
+    df = pd.concat([respondentes, bloco], axis=1)
+
+    originais = [c for c in tabelas.colunas if c in df.columns]
+    novas = [c for c in df.columns if c not in set(tabelas.colunas)]
+    return df[originais + novas]
+
+
+__all__ = ["TabelasClima", "separar_tabelas_clima", "juntar_tabelas_clima"]
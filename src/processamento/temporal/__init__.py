@@ -4,9 +4,11 @@ Rotinas temporais: parsing de data/hora e coluna mes-ano.
 from .converter_colunas_temporais import converter_colunas_temporais
 from .adicionar_mes_ano import adicionar_mes_ano
 from .garantir_agrupamento_temporal import garantir_agrupamento_temporal
+from .converter_valores_unicos import converter_por_valores_unicos
 
 __all__ = [
     "converter_colunas_temporais",
     "adicionar_mes_ano",
     "garantir_agrupamento_temporal",
+    "converter_por_valores_unicos",
 ]
@@ -1,14 +1,30 @@
 """
 Adicao de coluna mes-ano.
 """
+import numpy as np
 import pandas as pd
 
+from .converter_valores_unicos import converter_por_valores_unicos
+
 
 def adicionar_mes_ano(df: pd.DataFrame, coluna_data: str = "data", nome_coluna: str = "mes-ano") -> pd.DataFrame:
-    """Adiciona coluna mes-ano (YYYY-MM) se coluna de data existir."""
+    """Adiciona coluna mes-ano (YYYY-MM) se coluna de data existir.
+
+    Reaproveita a coluna se ja estiver em datetime; o rotulo e formatado uma
+    vez por mes distinto e propagado pelos codigos.
+    """
     if coluna_data not in df.columns:
         return df
     df = df.copy()
-    dt = pd.to_datetime(df[coluna_data], errors="coerce")
-    df[nome_coluna] = dt.dt.strftime("%Y-%m").fillna("desconhecido")
+    dt = df[coluna_data]
+    if not pd.api.types.is_datetime64_any_dtype(dt):
+        dt = converter_por_valores_unicos(dt, formatos=(), dayfirst=False)
+    if getattr(dt.dt, "tz", None) is not None:
+        df[nome_coluna] = dt.dt.strftime("%Y-%m").fillna("desconhecido")
+        return df
+
+    meses = dt.to_numpy(dtype="datetime64[ns]").astype("datetime64[M]")
+    codigos, unicos = pd.factorize(meses, use_na_sentinel=True)
+    rotulos = np.append(np.datetime_as_string(unicos, unit="M").astype(object), "desconhecido")
+    df[nome_coluna] = rotulos[codigos]
     return df
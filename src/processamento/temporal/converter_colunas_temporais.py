@@ -1,20 +1,40 @@
 """
 Conversao de colunas temporais.
 """
+from typing import Optional
+
 import pandas as pd
 
+from .converter_valores_unicos import (
+    FORMATOS_DATA,
+    FORMATOS_HORA,
+    converter_por_valores_unicos,
+)
+
+
+def converter_colunas_temporais(
+    df: pd.DataFrame,
+    coluna_data: str = "data",
+    coluna_hora: str = "hora",
+    coluna_data_hora: Optional[str] = None,
+) -> pd.DataFrame:
+    """Converte colunas de data/hora se existirem (formato brasileiro dia-first).
 
-def converter_colunas_temporais(df: pd.DataFrame, coluna_data: str = "data", coluna_hora: str = "hora") -> pd.DataFrame:
-    """Converte colunas de data/hora se existirem (formato brasileiro dia-first)."""
+    Cada valor distinto e interpretado uma unica vez (ver
+    converter_por_valores_unicos); colunas ja em datetime sao mantidas.
+    Se coluna_data_hora for informada, cria uma coluna datetime combinando
+    a data com o horario.
+    """
     df = df.copy()
     if coluna_data in df.columns:
-        df[coluna_data] = pd.to_datetime(df[coluna_data], errors="coerce", dayfirst=True)
+        df[coluna_data] = converter_por_valores_unicos(
+            df[coluna_data], FORMATOS_DATA, dayfirst=True
+        )
     if coluna_hora in df.columns:
-        hora_convertida = pd.to_datetime(df[coluna_hora], errors="coerce", format="%H:%M:%S")
-        faltantes = hora_convertida.isna()
-        if faltantes.any():
-            hora_convertida.loc[faltantes] = pd.to_datetime(
-                df.loc[faltantes, coluna_hora], errors="coerce", format="%H:%M"
-            )
-        df[coluna_hora] = hora_convertida
+        df[coluna_hora] = converter_por_valores_unicos(
+            df[coluna_hora], FORMATOS_HORA, fallback_generico=False
+        )
+    if coluna_data_hora and {coluna_data, coluna_hora}.issubset(df.columns):
+        hora = df[coluna_hora]
+        df[coluna_data_hora] = df[coluna_data].dt.normalize() + (hora - hora.dt.normalize())
     return df
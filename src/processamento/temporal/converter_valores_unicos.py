@@ -0,0 +1,71 @@
+"""
+Conversao temporal memoizada: interpreta apenas valores unicos e propaga por codigos.
+"""
+import warnings
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+# Cadeias de formatos tentadas em ordem (padrao brasileiro primeiro)
+FORMATOS_DATA = ("%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y", "%d/%m/%y", "%Y/%m/%d", "%Y-%m-%d %H:%M:%S")
+FORMATOS_HORA = ("%H:%M:%S", "%H:%M")
+
+
+def _interpretar_unicos(
+    unicos: pd.Index,
+    formatos: Sequence[str],
+    dayfirst: bool,
+    fallback_generico: bool,
+) -> np.ndarray:
+    resultado = np.full(len(unicos), np.datetime64("NaT"), dtype="datetime64[ns]")
+    pendentes = np.arange(len(unicos))
+    for formato in formatos:
+        if pendentes.size == 0:
+            break
+        convertidos = pd.to_datetime(unicos[pendentes], format=formato, errors="coerce")
+        validos = ~convertidos.isna()
+        resultado[pendentes[validos]] = convertidos[validos].to_numpy(dtype="datetime64[ns]")
+        pendentes = pendentes[~validos]
+
+    if fallback_generico and pendentes.size:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            convertidos = pd.to_datetime(
+                unicos[pendentes], errors="coerce", dayfirst=dayfirst, format="mixed"
+            )
+        validos = ~convertidos.isna()
+        resultado[pendentes[validos]] = convertidos[validos].to_numpy(dtype="datetime64[ns]")
+    return resultado
+
+
+def converter_por_valores_unicos(
+    serie: pd.Series,
+    formatos: Sequence[str] = FORMATOS_DATA,
+    dayfirst: bool = True,
+    fallback_generico: bool = True,
+) -> pd.Series:
+    """
+    Converte uma serie para datetime interpretando cada valor distinto uma vez.
+
+    Os valores unicos sao convertidos pela cadeia de formatos (cada formato so
+    recebe o que os anteriores nao reconheceram); o que sobrar passa pelo
+    parser generico do pandas. O resultado e propagado pelos codigos de
+    pd.factorize, entao o custo depende do numero de valores distintos.
+
+    Args:
+        serie: Serie com datas/horas em texto
+        formatos: Formatos strptime tentados em ordem
+        dayfirst: Usado no fallback generico (formato brasileiro)
+        fallback_generico: Se valores fora da cadeia usam o parser generico
+
+    Returns:
+        Serie datetime64[ns] (valores invalidos viram NaT)
+    """
+    if pd.api.types.is_datetime64_any_dtype(serie):
+        return serie
+    codigos, unicos = pd.factorize(serie, use_na_sentinel=True)
+    convertidos = _interpretar_unicos(pd.Index(unicos), formatos, dayfirst, fallback_generico)
+    # Codigo -1 (nulo) aponta para o NaT adicionado ao final
+    valores = np.append(convertidos, np.datetime64("NaT", "ns"))[codigos]
+    return pd.Series(valores, index=serie.index, name=serie.name)
@@ -0,0 +1,16 @@
+"""
+Validacao de esquema (tipos, faixas de valores e faltantes) dos lotes processados.
+"""
+from .validar_esquema import (
+    EsquemaCompilado,
+    ErroValidacaoEsquema,
+    compilar_esquema,
+    validar_esquema,
+)
+
+__all__ = [
+    "EsquemaCompilado",
+    "ErroValidacaoEsquema",
+    "compilar_esquema",
+    "validar_esquema",
+]
@@ -0,0 +1,259 @@
+"""
+Validação de esquema: tipos (TYPE_DICT), faixas de valores e faltantes.
+
+O esquema é compilado uma vez (família de tipo de cada coluna e vetores de
+mínimos/máximos); a validação confere todas as colunas numa passada, com as
+colunas numéricas empilhadas numa única matriz e máscaras vetorizadas, e
+devolve um relatório compacto por coluna.
+"""
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Colunas do relatório de validar_esquema
+COLUNAS_RELATORIO = [
+    "tipo_esperado",
+    "tipo_atual",
+    "tipo_ok",
+    "taxa_faltantes",
+    "abaixo",
+    "acima",
+    "ok",
+]
+
+
+class ErroValidacaoEsquema(ValueError):
+    """Lote fora do esquema; relatorio traz o resultado de todas as colunas."""
+
+    def __init__(
+        self,
+        relatorio: pd.DataFrame,
+        taxa_maxima_faltantes: float,
+        isentas_faltantes: Iterable[str] = (),
+    ):
+        self.relatorio = relatorio
+        isentas = set(isentas_faltantes)
+        falhas = relatorio[~relatorio["ok"]]
+        linhas = [
+            _descrever_falha(coluna, r, 1.0 if coluna in isentas else taxa_maxima_faltantes)
+            for coluna, r in falhas.iterrows()
+        ]
+        super().__init__(
+            f"{len(falhas)} coluna(s) fora do esquema:\n" + "\n".join(f"  - {l}" for l in linhas)
+        )
+
+
+def _descrever_falha(coluna: str, r: pd.Series, taxa_maxima_faltantes: float) -> str:
+    problemas = []
+    if not r["tipo_ok"]:
+        problemas.append(f"tipo {r['tipo_atual']} (esperado {r['tipo_esperado']})")
+    if r["abaixo"]:
+        problemas.append(f"{r['abaixo']} abaixo do mínimo")
+    if r["acima"]:
+        problemas.append(f"{r['acima']} acima do máximo")
+    if r["taxa_faltantes"] > taxa_maxima_faltantes:
+        problemas.append(f"faltantes {r['taxa_faltantes']:.1%} > {taxa_maxima_faltantes:.1%}")
+    return f"{coluna}: " + "; ".join(problemas)
+
+
+def _familia(tipo: str) -> str:
+    """Família do tipo declarado: data, booleano, numerico ou texto."""
+    dtype = pd.api.types.pandas_dtype(tipo)
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "data"
+    if pd.api.types.is_bool_dtype(dtype):
+        return "booleano"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numerico"
+    return "texto"
+
+
+def _tipo_compativel(dtype, familia: str) -> bool:
+    """
+    Se o dtype atual atende à família declarada.
+
+    Inteiros e reais aceitam qualquer numérico: to_numeric devolve int64
+    quando não há faltantes e float64 quando há (ex.: 'peso' é Int64 em
+    TYPE_DICT, mas o pipeline o converte como float).
+    """
+    tipos = pd.api.types
+    if familia == "data":
+        return tipos.is_datetime64_any_dtype(dtype)
+    if familia == "booleano":
+        return tipos.is_bool_dtype(dtype)
+    if familia == "numerico":
+        return tipos.is_numeric_dtype(dtype) and not tipos.is_bool_dtype(dtype)
+    return (
+        tipos.is_string_dtype(dtype)
+        or dtype == object
+        or isinstance(dtype, pd.CategoricalDtype)
+    )
+
+
+@dataclass(frozen=True)
+class EsquemaCompilado:
+    """
+    Esquema pronto para validar lotes.
+
+    colunas e tipos seguem a ordem declarada; minimos/maximos são vetores
+    alinhados a colunas (-inf/+inf quando não há limite). Colunas em
+    isentas_faltantes não têm taxa máxima de faltantes.
+    """
+
+    colunas: Tuple[str, ...]
+    tipos: Tuple[str, ...]
+    familias: Tuple[str, ...]
+    minimos: np.ndarray
+    maximos: np.ndarray
+    taxa_maxima_faltantes: float
+    isentas_faltantes: FrozenSet[str] = frozenset()
+
+    def validar(self, df: pd.DataFrame, falhar: bool = True) -> pd.DataFrame:
+        """
+        Confere tipos, faixas e taxa de faltantes das colunas presentes.
+
+        Colunas do esquema ausentes em df são ignoradas. Faixas só são
+        conferidas em colunas de tipo compatível.
+
+        Args:
+            df: DataFrame a validar
+            falhar: Levanta ErroValidacaoEsquema se alguma coluna falhar
+
+        Returns:
+            Relatório indexado pela coluna (COLUNAS_RELATORIO)
+        """
+        posicoes = [i for i, c in enumerate(self.colunas) if c in df.columns]
+        colunas = [self.colunas[i] for i in posicoes]
+        n = len(df)
+
+        tipo_ok = np.array(
+            [_tipo_compativel(df[self.colunas[i]].dtype, self.familias[i]) for i in posicoes],
+            dtype=bool,
+        )
+        faltantes = np.zeros(len(colunas), dtype=int)
+        abaixo = np.zeros(len(colunas), dtype=int)
+        acima = np.zeros(len(colunas), dtype=int)
+        numericas = np.array(
+            [
+                ok and self.familias[i] == "numerico"
+                for ok, i in zip(tipo_ok, posicoes)
+            ],
+            dtype=bool,
+        )
+
+        # Colunas numéricas compatíveis numa matriz só: faltantes e faixas
+        # saem de máscaras sobre o mesmo bloco float64
+        if numericas.any() and n:
+            indices = np.flatnonzero(numericas)
+            selecionadas = [posicoes[k] for k in indices]
+            matriz = df[[self.colunas[i] for i in selecionadas]].to_numpy(dtype="float64", na_value=np.nan)
+            with np.errstate(invalid="ignore"):
+                faltantes[indices] = np.isnan(matriz).sum(axis=0)
+                abaixo[indices] = (matriz < self.minimos[selecionadas]).sum(axis=0)
+                acima[indices] = (matriz > self.maximos[selecionadas]).sum(axis=0)
+        for k in np.flatnonzero(~numericas):
+            faltantes[k] = df[colunas[k]].isna().sum()
+
+        taxa = faltantes / n if n else np.zeros(len(colunas))
+        taxa_maxima = np.array(
+            [1.0 if c in self.isentas_faltantes else self.taxa_maxima_faltantes for c in colunas]
+        )
+        relatorio = pd.DataFrame(
+            {
+                "tipo_esperado": [self.tipos[i] for i in posicoes],
+                "tipo_atual": [str(df[c].dtype) for c in colunas],
+                "tipo_ok": tipo_ok,
+                "taxa_faltantes": taxa.astype("float64"),
+                "abaixo": abaixo,
+                "acima": acima,
+            },
+            index=pd.Index(colunas, name="coluna"),
+        )
+        relatorio["ok"] = (
+            relatorio["tipo_ok"]
+            & (relatorio["abaixo"] == 0)
+            & (relatorio["acima"] == 0)
+            & (relatorio["taxa_faltantes"].to_numpy() <= taxa_maxima)
+        )
+        if falhar and not relatorio["ok"].all():
+            raise ErroValidacaoEsquema(relatorio, self.taxa_maxima_faltantes, self.isentas_faltantes)
+        return relatorio
+
+
+def compilar_esquema(
+    tipos: Mapping[str, str],
+    limites: Optional[Mapping[str, Tuple[Optional[float], Optional[float]]]] = None,
+    taxa_maxima_faltantes: float = 1.0,
+    colunas: Optional[Iterable[str]] = None,
+    isentas_faltantes: Optional[Iterable[str]] = None,
+) -> EsquemaCompilado:
+    """
+    Compila TYPE_DICT e os limites de valores num EsquemaCompilado.
+
+    Args:
+        tipos: {coluna: dtype} (ex.: config.TYPE_DICT)
+        limites: {coluna: (minimo, maximo)}, None = sem limite naquele lado
+        taxa_maxima_faltantes: Fração máxima de faltantes por coluna
+        colunas: Restringe o esquema a estas colunas (ex.: as que o
+            pipeline converte)
+        isentas_faltantes: Colunas sem taxa máxima de faltantes (ex.: as
+            que a imputação configurada preenche)
+
+    Returns:
+        EsquemaCompilado
+    """
+    limites = dict(limites or {})
+    if colunas is not None:
+        selecionadas = set(colunas)
+        tipos = {c: t for c, t in tipos.items() if c in selecionadas}
+        limites = {c: l for c, l in limites.items() if c in selecionadas}
+    sem_tipo = [c for c in limites if c not in tipos]
+    if sem_tipo:
+        raise ValueError(f"Colunas com limites sem tipo declarado: {sem_tipo}")
+    if not 0 <= taxa_maxima_faltantes <= 1:
+        raise ValueError(f"taxa_maxima_faltantes deve estar entre 0 e 1: {taxa_maxima_faltantes}")
+
+    nomes = tuple(tipos)
+    familias = tuple(_familia(tipos[c]) for c in nomes)
+    minimos = np.full(len(nomes), -np.inf)
+    maximos = np.full(len(nomes), np.inf)
+    for i, coluna in enumerate(nomes):
+        if coluna not in limites:
+            continue
+        if familias[i] != "numerico":
+            raise ValueError(f"Limites só se aplicam a colunas numéricas: {coluna} ({tipos[coluna]})")
+        minimo, maximo = limites[coluna]
+        minimos[i] = -np.inf if minimo is None else minimo
+        maximos[i] = np.inf if maximo is None else maximo
+        if minimos[i] > maximos[i]:
+            raise ValueError(f"Limites inválidos para {coluna}: {limites[coluna]}")
+
+    return EsquemaCompilado(
+        colunas=nomes,
+        tipos=tuple(str(tipos[c]) for c in nomes),
+        familias=familias,
+        minimos=minimos,
+        maximos=maximos,
+        taxa_maxima_faltantes=float(taxa_maxima_faltantes),
+        isentas_faltantes=frozenset(isentas_faltantes or ()),
+    )
+
+
+def validar_esquema(
+    df: pd.DataFrame,
+    esquema: EsquemaCompilado,
+    falhar: bool = True,
+) -> pd.DataFrame:
+    """Atalho para esquema.validar(df, falhar)."""
+    return esquema.validar(df, falhar=falhar)
+
+
+__all__ = [
+    "EsquemaCompilado",
+    "ErroValidacaoEsquema",
+    "compilar_esquema",
+    "validar_esquema",
+    "COLUNAS_RELATORIO",
+]
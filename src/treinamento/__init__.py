@@ -18,12 +18,19 @@ from .treino import (
 
 from .avaliacao import avaliar_modelo, classificar_metricas, fazer_predicoes
 
-from .persistencia import carregar_modelo, salvar_modelo
+from .persistencia import (
+    carregar_features_modelo,
+    carregar_modelo,
+    salvar_features_modelo,
+    salvar_modelo,
+)
 
 from .visualizacao import salvar_plots_modelo
 
 from .utils import (
     extrair_estimador,
+    alinhar_entrada_modelo,
+    extrair_features_modelo,
     extrair_importancia_features,
     extrair_info_modelo,
 )
@@ -45,8 +52,12 @@ __all__ = [
     "fazer_predicoes",
     "salvar_modelo",
     "carregar_modelo",
+    "salvar_features_modelo",
+    "carregar_features_modelo",
     "salvar_plots_modelo",
     "extrair_estimador",
     "extrair_info_modelo",
     "extrair_importancia_features",
+    "extrair_features_modelo",
+    "alinhar_entrada_modelo",
 ]
@@ -1,8 +1,11 @@
 """Submódulo de persistência de modelos."""
 from .carregar_modelo import carregar_modelo
 from .salvar_modelo import salvar_modelo
+from .salvar_features_modelo import carregar_features_modelo, salvar_features_modelo
 
 __all__ = [
     "carregar_modelo",
     "salvar_modelo",
+    "salvar_features_modelo",
+    "carregar_features_modelo",
 ]
@@ -0,0 +1,47 @@
+"""
+Salva e carrega a lista de features do modelo (JSON ao lado do .pkl).
+"""
+import json
+import os
+from typing import Any, Dict
+
+from config.logger_config import logger
+
+
+def _caminho_features(caminho_modelo: str) -> str:
+    if caminho_modelo.endswith(".pkl"):
+        caminho_modelo = caminho_modelo[:-4]
+    return f"{caminho_modelo}_features.json"
+
+
+def salvar_features_modelo(features: Dict[str, Any], caminho_modelo: str) -> str:
+    """
+    Grava as features do modelo (ver extrair_features_modelo).
+
+    Args:
+        features: Dict com colunas_entrada, features_modelo e alvo
+        caminho_modelo: Caminho do modelo (com ou sem .pkl)
+
+    Returns:
+        str: Caminho do JSON (<modelo>_features.json)
+    """
+    caminho = _caminho_features(caminho_modelo)
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(features, arquivo, ensure_ascii=False, indent=2)
+    logger.info(f"Features do modelo salvas em: {caminho}")
+    return caminho
+
+
+def carregar_features_modelo(caminho_modelo: str) -> Dict[str, Any]:
+    """
+    Lê as features gravadas por salvar_features_modelo.
+
+    Args:
+        caminho_modelo: Caminho do modelo (com ou sem .pkl)
+
+    Returns:
+        Dict com colunas_entrada, features_modelo e alvo
+    """
+    with open(_caminho_features(caminho_modelo), encoding="utf-8") as arquivo:
+        return json.load(arquivo)
@@ -2,9 +2,12 @@
 from .extrair_estimador import extrair_estimador
 from .extrair_info_modelo import extrair_info_modelo
 from .extrair_importancia_features import extrair_importancia_features
+from .extrair_features_modelo import alinhar_entrada_modelo, extrair_features_modelo
 
 __all__ = [
     "extrair_estimador",
     "extrair_info_modelo",
     "extrair_importancia_features",
+    "extrair_features_modelo",
+    "alinhar_entrada_modelo",
 ]
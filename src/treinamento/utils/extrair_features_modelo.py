@@ -0,0 +1,71 @@
+"""
+Extrai as colunas que o modelo final realmente usa.
+"""
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .extrair_estimador import extrair_estimador
+
+
+def _nomes(objeto: Any) -> Optional[List[str]]:
+    nomes = getattr(objeto, "feature_names_in_", None)
+    if isinstance(nomes, (list, tuple, np.ndarray, pd.Index)):
+        return [str(nome) for nome in nomes]
+    return None
+
+
+def extrair_features_modelo(modelo: Any, coluna_alvo: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Colunas de entrada do pipeline PyCaret e as que chegam ao estimador.
+
+    Cada coluna que chega ao estimador é ligada à coluna de entrada de mesmo
+    nome ou, se veio de one-hot, à coluna de que é prefixo ('sexo_m' ->
+    'sexo'). Se alguma não puder ser ligada (PCA, polinomiais), todas as
+    entradas contam como usadas.
+
+    Args:
+        modelo: Pipeline PyCaret finalizado (ou estimador sklearn)
+        coluna_alvo: Alvo, retirado das entradas (o PyCaret o inclui)
+
+    Returns:
+        Dict com colunas_entrada (o que o pipeline exige em predict),
+        features_modelo (subconjunto usado) e alvo; None se o modelo não
+        expuser os nomes das colunas
+    """
+    entradas = _nomes(modelo)
+    if entradas is None:
+        return None
+    finais = _nomes(extrair_estimador(modelo))
+    entradas = [c for c in entradas if c != coluna_alvo]
+
+    usadas = set()
+    for feature in finais if finais is not None else entradas:
+        if feature in entradas:
+            usadas.add(feature)
+            continue
+        origens = [c for c in entradas if feature.startswith(f"{c}_")]
+        if not origens:
+            usadas = set(entradas)
+            break
+        usadas.add(max(origens, key=len))
+
+    return {
+        "colunas_entrada": entradas,
+        "features_modelo": [c for c in entradas if c in usadas],
+        "alvo": coluna_alvo,
+    }
+
+
+def alinhar_entrada_modelo(df: pd.DataFrame, features: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Reordena df nas colunas_entrada do modelo para o predict do PyCaret.
+
+    Colunas de entrada que o modelo não usa (podadas no modo de escoragem)
+    entram vazias; as features_modelo precisam estar em df.
+    """
+    faltantes = [c for c in features["features_modelo"] if c not in df.columns]
+    if faltantes:
+        raise ValueError(f"Features do modelo ausentes: {faltantes}")
+    return df.reindex(columns=features["colunas_entrada"])
@@ -0,0 +1,16 @@
+"""
+Benchmark de desempenho dos pipelines, com baseline versionado.
+"""
+from .casos_benchmark import CASOS_BENCHMARK, CasoBenchmark, DadosBenchmark
+from .comparar_benchmark import comparar_benchmark
+from .executar_benchmark import carregar_resultado, executar_benchmark, salvar_resultado
+
+__all__ = [
+    "CASOS_BENCHMARK",
+    "CasoBenchmark",
+    "DadosBenchmark",
+    "executar_benchmark",
+    "comparar_benchmark",
+    "salvar_resultado",
+    "carregar_resultado",
+]
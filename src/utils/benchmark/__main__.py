@@ -0,0 +1,112 @@
+"""
+Linha de comando do benchmark.
+
+    python -m src.utils.benchmark executar --tamanhos 1000 10000 --saida relatorios/benchmark.json
+    python -m src.utils.benchmark comparar relatorios/benchmark.json
+    python -m src.utils.benchmark executar --saida benchmarks/baseline.json   # novo baseline
+    python -m src.utils.benchmark escalabilidade --tamanho 100000 --trabalhadores 1 2 4
+
+comparar sai com código 1 se houver regressão acima do limiar.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from config import config_custom as config
+from .casos_benchmark import CASOS_BENCHMARK, DadosBenchmark
+from .comparar_benchmark import comparar_benchmark
+from .executar_benchmark import carregar_resultado, executar_benchmark, salvar_resultado
+
+
+def _criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.utils.benchmark")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    executar = comandos.add_parser("executar", help="Roda os casos e grava o JSON de resultado")
+    executar.add_argument("--casos", nargs="+", choices=list(CASOS_BENCHMARK))
+    executar.add_argument("--tamanhos", nargs="+", type=int)
+    executar.add_argument("--repeticoes", type=int)
+    executar.add_argument("--memoria", choices=["tracemalloc", "rss", "nenhuma"], default="tracemalloc")
+    executar.add_argument("--semente", type=int, default=42)
+    executar.add_argument("--saida", default="relatorios/benchmark.json")
+
+    comparar = comandos.add_parser("comparar", help="Compara um resultado com o baseline")
+    comparar.add_argument("resultado")
+    comparar.add_argument("--baseline", default=config.BENCHMARK_BASELINE)
+    comparar.add_argument("--limiar", type=float)
+    comparar.add_argument("--limiar-memoria", type=float)
+    comparar.add_argument(
+        "--normalizar-maquina", action="store_true",
+        help="Desconta a diferença de CPU entre as máquinas pela calibração",
+    )
+
+    escalabilidade = comandos.add_parser(
+        "escalabilidade", help="Mede o pipeline de features particionado por número de processos"
+    )
+    escalabilidade.add_argument("--tamanho", type=int, default=100_000)
+    escalabilidade.add_argument("--trabalhadores", nargs="+", type=int)
+    escalabilidade.add_argument("--repeticoes", type=int, default=3)
+    escalabilidade.add_argument("--semente", type=int, default=42)
+    escalabilidade.add_argument("--saida", default="relatorios/escalabilidade_features.csv")
+    return parser
+
+
+def _escalabilidade(args) -> int:
+    from ...pipelines.execucao_particionada import medir_escalabilidade_features
+
+    dados = DadosBenchmark(semente=args.semente)
+    try:
+        relatorio = medir_escalabilidade_features(
+            dados.processado(args.tamanho),
+            trabalhadores=args.trabalhadores,
+            repeticoes=args.repeticoes,
+            criar_features_derivadas=True,
+        )
+    finally:
+        dados.fechar()
+    caminho = Path(args.saida)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    relatorio.to_csv(caminho, index=False)
+    print(relatorio.to_string(index=False))
+    print(f"\nRelatório salvo em {caminho}")
+    return 0
+
+
+def principal(argumentos=None) -> int:
+    args = _criar_parser().parse_args(argumentos)
+    if args.comando == "escalabilidade":
+        return _escalabilidade(args)
+    if args.comando == "executar":
+        resultado = executar_benchmark(
+            casos=args.casos,
+            tamanhos=args.tamanhos,
+            repeticoes=args.repeticoes,
+            medir_memoria=None if args.memoria == "nenhuma" else args.memoria,
+            semente=args.semente,
+        )
+        caminho = salvar_resultado(resultado, args.saida)
+        tabela = pd.DataFrame(resultado["resultados"])
+        print(tabela[["caso", "tamanho", "tempo_mediano_s", "vazao_por_s", "pico_memoria_bytes"]].to_string(index=False))
+        print(f"\nResultado salvo em {caminho}")
+        return 0
+
+    comparacao = comparar_benchmark(
+        carregar_resultado(args.resultado),
+        carregar_resultado(args.baseline),
+        limiar=args.limiar,
+        limiar_memoria=args.limiar_memoria,
+        normalizar_maquina=args.normalizar_maquina,
+    )
+    print(comparacao.to_string(index=False))
+    regressoes = comparacao[comparacao["situacao"] == "regressao"]
+    if len(regressoes):
+        print(f"\n❌ {len(regressoes)} regressão(ões) acima do limiar")
+        return 1
+    print("\n✅ Sem regressões acima do limiar")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(principal())
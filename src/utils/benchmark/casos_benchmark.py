@@ -0,0 +1,202 @@
+"""
+Casos do benchmark de desempenho dos pipelines.
+
+Cada caso separa a preparação (não medida) da execução (medida). As entradas
+vêm de dados sintéticos ajustados à base real (ver dados_sinteticos), então
+o benchmark roda offline, em CPU, em qualquer tamanho, sem ClearML.
+"""
+import contextlib
+import io
+import logging
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from config import config_custom as config
+from ..dados_sinteticos.ajustar_modelo_sintetico import ajustar_modelo_sintetico
+from ..dados_sinteticos.gerar_dados_sinteticos import gerar_dados_sinteticos
+
+BASE_REAL_PADRAO = Path("dados/2025.05.14_thermal_confort_santa_maria_brazil_.csv")
+
+# Campos da API e as colunas processadas correspondentes
+CAMPOS_API = {
+    "idade_anos": "idade",
+    "peso_kg": "peso",
+    "altura_cm": "altura",
+    "sexo_biologico": "sexo",
+    "temperatura_media_c": "tmedia",
+    "umidade_relativa_percent": "ur",
+    "radiacao_solar_media_wm2": "rsolarmed",
+}
+
+
+@dataclass(frozen=True)
+class CasoBenchmark:
+    """
+    Caso de benchmark.
+
+    preparar(dados, quantidade) monta a entrada fora da medição;
+    executar(entrada) é a parte medida. quantidade = tamanho * escala, na
+    unidade do caso, é a base da vazão (a API usa uma fração do tamanho em
+    requisições, que custam bem mais que uma linha).
+    """
+
+    nome: str
+    preparar: Callable[["DadosBenchmark", int], Any]
+    executar: Callable[[Any], Any]
+    unidade: str = "linhas"
+    escala: float = 1.0
+
+    def quantidade(self, tamanho: int) -> int:
+        return max(1, int(round(tamanho * self.escala)))
+
+
+class DadosBenchmark:
+    """Entradas sintéticas determinísticas, geradas uma vez por tamanho."""
+
+    def __init__(
+        self,
+        base: Union[str, Path, pd.DataFrame] = BASE_REAL_PADRAO,
+        semente: int = 42,
+        diretorio: Optional[Union[str, Path]] = None,
+    ):
+        if not isinstance(base, pd.DataFrame):
+            base = pd.read_csv(base, sep=";", dtype=str, keep_default_na=False)
+        self.modelo = ajustar_modelo_sintetico(base)
+        self.semente = semente
+        self._temporario = None if diretorio else tempfile.TemporaryDirectory(prefix="benchmark_")
+        self.diretorio = Path(diretorio or self._temporario.name)
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        self.bruto = lru_cache(maxsize=None)(self._bruto)
+        self.processado = lru_cache(maxsize=None)(self._processado)
+        self.arquivo = lru_cache(maxsize=None)(self._arquivo)
+
+    def _bruto(self, tamanho: int) -> pd.DataFrame:
+        return gerar_dados_sinteticos(self.modelo, tamanho, semente=self.semente)
+
+    def _processado(self, tamanho: int) -> pd.DataFrame:
+        from ...pipelines.pipeline_processamento import executar_pipeline_processamento
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            return executar_pipeline_processamento(self.bruto(tamanho))
+
+    def _arquivo(self, tamanho: int, formato: str) -> Path:
+        caminho = self.diretorio / f"bruto_{tamanho}.{formato}"
+        if formato == "csv":
+            self.bruto(tamanho).to_csv(caminho, sep=";", index=False)
+        else:
+            self.bruto(tamanho).to_parquet(caminho, index=False)
+        return caminho
+
+    def fechar(self) -> None:
+        if self._temporario is not None:
+            self._temporario.cleanup()
+
+
+def _silencioso(funcao: Callable, *args, **kwargs) -> Any:
+    """Executa sem os prints de progresso dos pipelines."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return funcao(*args, **kwargs)
+
+
+def _executar_processamento(df: pd.DataFrame) -> pd.DataFrame:
+    from ...pipelines.pipeline_processamento import executar_pipeline_processamento
+
+    return _silencioso(executar_pipeline_processamento, df)
+
+
+def _executar_features(df: pd.DataFrame) -> Any:
+    from ...pipelines.pipeline_features import executar_pipeline_features
+
+    return _silencioso(executar_pipeline_features, df, criar_features_derivadas=True)
+
+
+def _executar_normalizar(df: pd.DataFrame) -> Any:
+    from ...features.normalizacao import normalizar
+
+    colunas = [c for c in config.COLUNAS_PONTO_FLUTUANTE if c in df.columns]
+    return _silencioso(
+        normalizar, df, colunas, metodo=config.METODO_NORMALIZACAO,
+        agrupamento=config.AGRUPAMENTO_NORMALIZAR, sufixo=config.SUFIXO_NORMALIZADAS,
+    )
+
+
+def _executar_features_derivadas(df: pd.DataFrame) -> pd.DataFrame:
+    from ...features.criacao_features import adicionar_features_derivadas
+
+    return _silencioso(adicionar_features_derivadas, df, config.TIPOS_FEATURES_DERIVADAS)
+
+
+def _executar_load_dataframe(caminho: Path) -> pd.DataFrame:
+    from ..io.io_local import load_dataframe
+
+    return load_dataframe(str(caminho), usar_cache=False)
+
+
+class PreditorBenchmark:
+    """Árvore de decisão treinada nos dados sintéticos (substitui o PyCaret offline)."""
+
+    def __init__(self, df: pd.DataFrame):
+        from sklearn.tree import DecisionTreeClassifier
+
+        entrada = df.rename(columns={v: k for k, v in CAMPOS_API.items()})
+        self._modelo = DecisionTreeClassifier(max_depth=8, random_state=0)
+        self._modelo.fit(self._matriz(entrada), df["p1"].astype(str))
+
+    @staticmethod
+    def _matriz(dados: pd.DataFrame) -> np.ndarray:
+        numericos = dados[[c for c in CAMPOS_API if c != "sexo_biologico"]].astype(float)
+        sexo = dados["sexo_biologico"].astype(str).str.lower().isin(["1", "m", "masculino"])
+        return np.column_stack([numericos.to_numpy(), sexo.to_numpy(dtype=float)])
+
+    def prever_rotulo(self, dados: pd.DataFrame) -> str:
+        return str(self._modelo.predict(self._matriz(dados))[0])
+
+
+def _preparar_api(dados: DadosBenchmark, tamanho: int) -> Dict[str, Any]:
+    from fastapi.testclient import TestClient
+
+    from ...api.aplicacao import criar_aplicacao
+
+    # Um log por requisição do cliente de teste distorceria a medição
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    df = dados.processado(max(tamanho, 100))
+    cliente = TestClient(criar_aplicacao(PreditorBenchmark(df)))
+    linhas = df[list(CAMPOS_API.values())].rename(columns={v: k for k, v in CAMPOS_API.items()})
+    linhas["sexo_biologico"] = linhas["sexo_biologico"].astype(str)
+    cargas = linhas.astype(object).to_dict("records")
+    return {"cliente": cliente, "cargas": [cargas[i % len(cargas)] for i in range(tamanho)]}
+
+
+def _executar_api(entrada: Dict[str, Any]) -> List[int]:
+    cliente = entrada["cliente"]
+    codigos = [cliente.post("/predict", json=carga).status_code for carga in entrada["cargas"]]
+    if any(codigo != 200 for codigo in codigos):
+        raise RuntimeError(f"API respondeu com erro: {sorted(set(codigos))}")
+    return codigos
+
+
+CASOS_BENCHMARK: Dict[str, CasoBenchmark] = {
+    caso.nome: caso
+    for caso in [
+        CasoBenchmark("processamento", lambda d, n: d.bruto(n), _executar_processamento),
+        CasoBenchmark("features", lambda d, n: d.processado(n), _executar_features),
+        CasoBenchmark("normalizar", lambda d, n: d.processado(n), _executar_normalizar),
+        CasoBenchmark(
+            "adicionar_features_derivadas", lambda d, n: d.processado(n), _executar_features_derivadas
+        ),
+        CasoBenchmark("load_dataframe_csv", lambda d, n: d.arquivo(n, "csv"), _executar_load_dataframe),
+        CasoBenchmark(
+            "load_dataframe_parquet", lambda d, n: d.arquivo(n, "parquet"), _executar_load_dataframe
+        ),
+        CasoBenchmark("api_predict", _preparar_api, _executar_api, unidade="requisicoes", escala=0.01),
+    ]
+}
+
+
+__all__ = ["CasoBenchmark", "DadosBenchmark", "CASOS_BENCHMARK", "PreditorBenchmark"]
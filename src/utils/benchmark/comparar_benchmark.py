@@ -0,0 +1,91 @@
+"""
+Comparação de um resultado de benchmark com o baseline versionado.
+"""
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from config import config_custom as config
+
+# Métricas comparadas (maior = pior) e a diferença absoluta mínima para contar
+# como regressão: variações abaixo disso são ruído de medição
+METRICAS_COMPARADAS = {
+    "tempo_mediano_s": 0.005,
+    "pico_memoria_bytes": 1_048_576,
+}
+
+
+def comparar_benchmark(
+    atual: Dict[str, Any],
+    baseline: Dict[str, Any],
+    limiar: Optional[float] = None,
+    limiar_memoria: Optional[float] = None,
+    normalizar_maquina: bool = False,
+) -> pd.DataFrame:
+    """
+    Compara métricas por (caso, tamanho) e marca regressões acima do limiar.
+
+    Args:
+        atual: Resultado de executar_benchmark
+        baseline: Resultado de referência (ex.: benchmarks/baseline.json)
+        limiar: Aumento relativo de tempo tolerado (usa config se None; 0.25 = +25%)
+        limiar_memoria: Aumento relativo de memória tolerado (None = limiar)
+        normalizar_maquina: Divide os tempos pela calibração de CPU de cada
+            resultado, para comparar execuções de máquinas diferentes
+
+    Returns:
+        DataFrame com caso, tamanho, metrica, baseline, atual, variacao e
+        situacao ('regressao', 'melhora', 'estavel', 'novo' ou 'ausente')
+    """
+    limiar = config.BENCHMARK_LIMIAR_REGRESSAO if limiar is None else limiar
+    limiares = {
+        "tempo_mediano_s": limiar,
+        "pico_memoria_bytes": limiar if limiar_memoria is None else limiar_memoria,
+    }
+    escala_tempo = 1.0
+    if normalizar_maquina and atual.get("calibracao_s") and baseline.get("calibracao_s"):
+        escala_tempo = baseline["calibracao_s"] / atual["calibracao_s"]
+
+    def _indexar(resultado: Dict[str, Any]) -> Dict[tuple, Dict[str, Any]]:
+        return {(r["caso"], r["tamanho"]): r for r in resultado.get("resultados", [])}
+
+    base, novo = _indexar(baseline), _indexar(atual)
+    linhas = []
+    for chave in sorted(set(base) | set(novo)):
+        for metrica, minimo_absoluto in METRICAS_COMPARADAS.items():
+            valor_base = base.get(chave, {}).get(metrica)
+            valor_atual = novo.get(chave, {}).get(metrica)
+            if valor_atual is not None and metrica == "tempo_mediano_s":
+                valor_atual *= escala_tempo
+            variacao = None
+            if chave not in novo:
+                situacao = "ausente"
+            elif chave not in base:
+                situacao = "novo"
+            elif valor_base is None or valor_atual is None:
+                continue
+            else:
+                diferenca = valor_atual - valor_base
+                variacao = diferenca / valor_base if valor_base else None
+                relativo = variacao if variacao is not None else (float("inf") if diferenca > 0 else 0.0)
+                if diferenca > minimo_absoluto and relativo > limiares[metrica]:
+                    situacao = "regressao"
+                elif -diferenca > minimo_absoluto and -relativo > limiares[metrica]:
+                    situacao = "melhora"
+                else:
+                    situacao = "estavel"
+            linhas.append({
+                "caso": chave[0],
+                "tamanho": chave[1],
+                "metrica": metrica,
+                "baseline": valor_base,
+                "atual": valor_atual,
+                "variacao": variacao,
+                "situacao": situacao,
+            })
+    return pd.DataFrame(
+        linhas, columns=["caso", "tamanho", "metrica", "baseline", "atual", "variacao", "situacao"]
+    )
+
+
+__all__ = ["comparar_benchmark", "METRICAS_COMPARADAS"]
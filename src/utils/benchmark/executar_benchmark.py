@@ -0,0 +1,165 @@
+"""
+Execução do benchmark: tempo, vazão e pico de memória por caso e tamanho.
+
+Os tempos vêm de repetições sem instrumentação de memória; o pico de memória
+vem de uma execução extra medida pelo PerfilEtapas ('tracemalloc' dá picos
+estáveis de alocações Python/NumPy; 'rss' inclui memória nativa, como a do
+Arrow, mas oscila mais). Uma calibração fixa de CPU acompanha o resultado
+para que a comparação possa descontar a diferença entre máquinas.
+"""
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from config import config_custom as config
+from ...pipelines.perfil_etapas import PerfilEtapas
+from .casos_benchmark import CASOS_BENCHMARK, DadosBenchmark
+
+VERSAO_RESULTADO = 1
+
+
+def calibrar_cpu(repeticoes: int = 5) -> float:
+    """Mediana (s) de uma carga fixa de pandas/NumPy; referência da máquina."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"g": rng.integers(0, 100, 200_000), "x": rng.normal(size=200_000)})
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        df.groupby("g")["x"].transform("mean")
+        np.sort(df["x"].to_numpy())
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos)
+
+
+def _commit_atual() -> Optional[str]:
+    try:
+        saida = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return saida.stdout.strip() or None
+
+
+def _ambiente() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "processador": platform.processor() or platform.machine(),
+        "nucleos": os.cpu_count(),
+        "commit": _commit_atual(),
+    }
+
+
+def executar_benchmark(
+    casos: Optional[Iterable[str]] = None,
+    tamanhos: Optional[Iterable[int]] = None,
+    repeticoes: Optional[int] = None,
+    aquecimento: int = 1,
+    medir_memoria: Optional[str] = "tracemalloc",
+    dados: Optional[DadosBenchmark] = None,
+    semente: int = 42,
+) -> Dict[str, Any]:
+    """
+    Executa os casos do benchmark em cada tamanho.
+
+    Args:
+        casos: Nomes em CASOS_BENCHMARK (None = todos)
+        tamanhos: Tamanhos de entrada em linhas (usa config se None)
+        repeticoes: Execuções medidas por caso e tamanho (usa config se None)
+        aquecimento: Execuções descartadas antes das medidas
+        medir_memoria: 'tracemalloc', 'rss' ou None (sem execução de memória)
+        dados: Fonte das entradas (None = sintéticos ajustados à base real)
+        semente: Semente dos dados sintéticos
+
+    Returns:
+        Dicionário serializável com ambiente, calibração e resultados
+    """
+    nomes = list(casos) if casos is not None else list(CASOS_BENCHMARK)
+    desconhecidos = sorted(set(nomes) - set(CASOS_BENCHMARK))
+    if desconhecidos:
+        raise ValueError(f"Casos desconhecidos: {desconhecidos}. Use {list(CASOS_BENCHMARK)}")
+    tamanhos = sorted(tamanhos or config.BENCHMARK_TAMANHOS)
+    repeticoes = repeticoes or config.BENCHMARK_REPETICOES
+
+    proprio = dados is None
+    dados = dados or DadosBenchmark(semente=semente)
+    resultados = []
+    try:
+        for nome in nomes:
+            caso = CASOS_BENCHMARK[nome]
+            for tamanho in tamanhos:
+                quantidade = caso.quantidade(tamanho)
+                entrada = caso.preparar(dados, quantidade)
+                for _ in range(aquecimento):
+                    caso.executar(entrada)
+
+                tempos, tempos_cpu = [], []
+                for _ in range(repeticoes):
+                    gc.collect()
+                    inicio, inicio_cpu = time.perf_counter(), time.process_time()
+                    caso.executar(entrada)
+                    tempos.append(time.perf_counter() - inicio)
+                    tempos_cpu.append(time.process_time() - inicio_cpu)
+
+                pico = None
+                if medir_memoria:
+                    gc.collect()
+                    perfil = PerfilEtapas(medir_memoria=medir_memoria)
+                    with perfil.etapa(nome):
+                        caso.executar(entrada)
+                    pico = perfil.eventos[0]["pico_memoria_bytes"]
+
+                mediana = statistics.median(tempos)
+                resultados.append({
+                    "caso": nome,
+                    "tamanho": tamanho,
+                    "quantidade": quantidade,
+                    "unidade": caso.unidade,
+                    "repeticoes": repeticoes,
+                    "tempo_mediano_s": mediana,
+                    "tempo_min_s": min(tempos),
+                    "tempo_max_s": max(tempos),
+                    "cpu_mediano_s": statistics.median(tempos_cpu),
+                    "vazao_por_s": quantidade / mediana if mediana > 0 else None,
+                    "pico_memoria_bytes": pico,
+                })
+    finally:
+        if proprio:
+            dados.fechar()
+
+    return {
+        "versao": VERSAO_RESULTADO,
+        "criado_em": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "ambiente": _ambiente(),
+        "calibracao_s": calibrar_cpu(),
+        "medir_memoria": medir_memoria,
+        "semente": semente,
+        "resultados": resultados,
+    }
+
+
+def salvar_resultado(resultado: Dict[str, Any], caminho: Union[str, Path]) -> Path:
+    caminho = Path(caminho)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    caminho.write_text(json.dumps(resultado, ensure_ascii=False, indent=2), encoding="utf-8")
+    return caminho
+
+
+def carregar_resultado(caminho: Union[str, Path]) -> Dict[str, Any]:
+    return json.loads(Path(caminho).read_text(encoding="utf-8"))
+
+
+__all__ = ["executar_benchmark", "salvar_resultado", "carregar_resultado", "calibrar_cpu"]
@@ -0,0 +1,256 @@
+"""
+Ajuste do modelo de dados sintéticos de conforto térmico a partir da base real.
+
+O modelo separa as colunas em duas tabelas:
+- clima: variáveis constantes em cada sessão (data + hora), geradas uma vez
+  por sessão, condicionadas ao mês e ao horário;
+- respondente: demografia e respostas, geradas por linha, condicionadas às
+  variáveis climáticas indicadas (ex.: temperatura e umidade).
+
+Cada tabela usa cópula gaussiana: marginais empíricas (quantis observados) e
+correlação entre os escores normais das colunas. Faltantes são ajustados em
+três níveis (dia inteiro e sessão para o clima, linha para o respondente),
+com a frequência de cada token ('99', 'x', '', 'NAN', ...) por coluna.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtri
+
+from config import config_custom as config
+
+# Tokens que a limpeza do pipeline converte em NaN
+TOKENS_FALTANTES = tuple(
+    token for token, valor in config.SUBSTITUICOES_LIMPEZA.items()
+    if isinstance(valor, float) and np.isnan(valor)
+)
+
+
+def _texto(serie: pd.Series) -> pd.Series:
+    return serie.astype("string").fillna("").str.strip()
+
+
+def _faltante(texto: pd.Series, tokens: Sequence[str]) -> np.ndarray:
+    return texto.isin(list(tokens)).to_numpy()
+
+
+def _numerico(texto: pd.Series) -> np.ndarray:
+    valores = pd.to_numeric(texto.str.replace(",", ".", regex=False), errors="coerce")
+    return valores.astype("Float64").to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _decimais(texto: pd.Series) -> int:
+    partes = texto.str.split(",", n=1).str[1].dropna()
+    return int(partes.str.len().max()) if len(partes) else 0
+
+
+def escores_normais(valores: np.ndarray, validos: np.ndarray) -> np.ndarray:
+    """Φ⁻¹ dos postos médios dos valores válidos; faltantes recebem 0."""
+    escores = np.zeros(len(valores))
+    if validos.sum() > 1:
+        postos = pd.Series(valores[validos]).rank(method="average").to_numpy()
+        escores[validos] = ndtri(postos / (validos.sum() + 1))
+    return escores
+
+
+def correlacao_valida(escores: np.ndarray) -> np.ndarray:
+    """Matriz de correlação dos escores, projetada para positiva definida."""
+    if escores.shape[1] == 0:
+        return np.zeros((0, 0))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        correlacao = np.corrcoef(escores, rowvar=False)
+    correlacao = np.nan_to_num(np.atleast_2d(correlacao))
+    np.fill_diagonal(correlacao, 1.0)
+    autovalores, autovetores = np.linalg.eigh(correlacao)
+    correlacao = (autovetores * np.clip(autovalores, 1e-6, None)) @ autovetores.T
+    desvios = np.sqrt(np.diag(correlacao))
+    return correlacao / np.outer(desvios, desvios)
+
+
+def condicional_gaussiana(
+    correlacao: np.ndarray, n_condicionantes: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fatores para amostrar Z_g | Z_c de uma normal com a correlação dada.
+
+    As n_condicionantes primeiras posições são Z_c. Retorna (A, L) tais que
+    Z_g = Z_c @ A.T + E @ L.T, com E normal padrão.
+    """
+    c = n_condicionantes
+    r_cc, r_gc, r_gg = correlacao[:c, :c], correlacao[c:, :c], correlacao[c:, c:]
+    if c:
+        a = r_gc @ np.linalg.pinv(r_cc)
+        residual = r_gg - a @ r_gc.T
+    else:
+        a = np.zeros((len(r_gg), 0))
+        residual = r_gg
+    autovalores, autovetores = np.linalg.eigh((residual + residual.T) / 2)
+    l = autovetores * np.sqrt(np.clip(autovalores, 0, None))
+    return a, l
+
+
+def _marginal(valores: np.ndarray, textos: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """Valores ordenados (quantis empíricos) e, se dados, os textos originais alinhados."""
+    ordem = np.argsort(valores, kind="stable")
+    marginal = {"valores": valores[ordem]}
+    if textos is not None:
+        marginal["textos"] = textos[ordem]
+    return marginal
+
+
+def _tokens(texto: np.ndarray, faltante: np.ndarray) -> Dict[str, float]:
+    """Frequência relativa de cada token entre os faltantes."""
+    frequencias = pd.Series(texto[faltante]).value_counts(normalize=True, sort=False)
+    return {str(k): float(v) for k, v in frequencias.sort_index().items()}
+
+
+def _colunas_de_sessao(
+    texto: Dict[str, pd.Series],
+    faltantes: Dict[str, np.ndarray],
+    sessao: np.ndarray,
+    candidatas: Iterable[str],
+) -> List[str]:
+    """Colunas numéricas com no máximo um valor válido distinto por sessão."""
+    clima = []
+    for coluna in candidatas:
+        validos = ~faltantes[coluna]
+        distintos = pd.Series(texto[coluna].to_numpy()[validos]).groupby(sessao[validos]).nunique()
+        if len(distintos) and distintos.max() <= 1:
+            clima.append(coluna)
+    return clima
+
+
+def ajustar_modelo_sintetico(
+    df: pd.DataFrame,
+    coluna_data: str = "DATA",
+    coluna_hora: str = "HORA",
+    colunas_condicionantes: Sequence[str] = ("Tmedia", "UR"),
+    tokens_faltantes: Sequence[str] = TOKENS_FALTANTES,
+    formato_data: str = "%d/%m/%Y",
+) -> Dict[str, Any]:
+    """
+    Ajusta o modelo gerador à base bruta (texto, como lida do CSV original).
+
+    Args:
+        df: Base bruta (valores em texto, decimal com vírgula)
+        coluna_data: Coluna de data (define dias e meses)
+        coluna_hora: Coluna de hora (HH:MM; com a data define a sessão)
+        colunas_condicionantes: Colunas de clima que condicionam as colunas
+            de respondente (ignoradas se não forem de clima)
+        tokens_faltantes: Textos tratados como faltantes
+        formato_data: Formato da coluna de data
+
+    Returns:
+        Dicionário com marginais, correlações, faltantes e estrutura das sessões
+    """
+    colunas = [c for c in df.columns if c not in (coluna_data, coluna_hora)]
+    texto = {c: _texto(df[c]) for c in colunas}
+    faltantes = {c: _faltante(texto[c], tokens_faltantes) for c in colunas}
+    numericos = {c: _numerico(texto[c]) for c in colunas}
+
+    datas = pd.to_datetime(df[coluna_data], format=formato_data)
+    horas = df[coluna_hora].astype(str).str.strip()
+    minutos = (
+        horas.str.split(":").str[0].astype(int) * 60 + horas.str.split(":").str[1].astype(int)
+    ).to_numpy()
+    chave_sessao = datas.dt.strftime("%Y%m%d").to_numpy() + "_" + horas.to_numpy()
+    sessao = pd.factorize(chave_sessao)[0]
+    dia = pd.factorize(datas.to_numpy())[0]
+
+    e_numerica = {
+        c: not np.isnan(numericos[c][~faltantes[c]]).any() and bool((~faltantes[c]).any())
+        for c in colunas
+    }
+    clima = _colunas_de_sessao(texto, faltantes, sessao, [c for c in colunas if e_numerica[c]])
+    respondente = [c for c in colunas if c not in clima]
+
+    # Tabela de sessões (primeira linha de cada sessão)
+    primeira = pd.Series(np.arange(len(df))).groupby(sessao).first().to_numpy()
+    sessao_dia = dia[primeira]
+    sessao_mes = datas.dt.month.to_numpy()[primeira]
+    sessao_minutos = minutos[primeira]
+
+    modelo_clima: Dict[int, Dict[str, Any]] = {}
+    for mes in np.unique(sessao_mes):
+        no_mes = sessao_mes == mes
+        escores = [escores_normais(sessao_minutos[no_mes].astype(float), np.ones(no_mes.sum(), bool))]
+        marginais = {"__minutos__": _marginal(sessao_minutos[no_mes].astype(float))}
+        for coluna in clima:
+            valores = numericos[coluna][primeira][no_mes]
+            validos = ~faltantes[coluna][primeira][no_mes]
+            if not validos.any():
+                # Mês sem nenhum valor observado: usa a marginal de todos os meses
+                valores = numericos[coluna][primeira]
+                validos = ~faltantes[coluna][primeira]
+                escores.append(np.zeros(no_mes.sum()))
+            else:
+                escores.append(escores_normais(valores, validos))
+            marginais[coluna] = _marginal(valores[validos])
+        correlacao = correlacao_valida(np.column_stack(escores))
+        a, l = condicional_gaussiana(correlacao, 1)
+        modelo_clima[int(mes)] = {"marginais": marginais, "a": a, "l": l}
+
+    # Respondentes: condicionados às colunas de clima escolhidas (escore global)
+    condicionantes = [c for c in colunas_condicionantes if c in clima]
+    escores = [escores_normais(numericos[c], ~faltantes[c]) for c in condicionantes]
+    marginais_condicionantes = {
+        c: np.sort(numericos[c][~faltantes[c]]) for c in condicionantes
+    }
+    marginais_respondente = {}
+    for coluna in respondente:
+        validos = ~faltantes[coluna]
+        textos = np.asarray(texto[coluna].to_numpy(), dtype=object)
+        if e_numerica[coluna]:
+            valores = numericos[coluna]
+        else:
+            valores = pd.factorize(texto[coluna], sort=True)[0].astype(float)
+        escores.append(escores_normais(valores, validos))
+        marginais_respondente[coluna] = _marginal(valores[validos], textos[validos])
+    correlacao = correlacao_valida(np.column_stack(escores)) if escores else np.zeros((0, 0))
+    a_resp, l_resp = condicional_gaussiana(correlacao, len(condicionantes))
+
+    # Faltantes: clima por dia inteiro e por sessão; respondente por linha
+    faltantes_clima = {}
+    for coluna in clima:
+        falta_sessao = faltantes[coluna][primeira]
+        dia_todo = pd.Series(falta_sessao).groupby(sessao_dia).all()
+        restantes = ~dia_todo.reindex(sessao_dia).to_numpy()
+        faltantes_clima[coluna] = {
+            "p_dia": float(dia_todo.mean()),
+            "p_sessao": float(falta_sessao[restantes].mean()) if restantes.any() else 0.0,
+            "tokens": _tokens(texto[coluna].to_numpy()[primeira], falta_sessao),
+        }
+    faltantes_respondente = {
+        coluna: {
+            "p_linha": float(faltantes[coluna].mean()),
+            "tokens": _tokens(texto[coluna].to_numpy(), faltantes[coluna]),
+        }
+        for coluna in respondente
+    }
+
+    sessoes_por_dia = pd.Series(sessao_dia).value_counts(sort=False).to_numpy()
+    return {
+        "colunas": list(df.columns),
+        "coluna_data": coluna_data,
+        "coluna_hora": coluna_hora,
+        "clima": clima,
+        "respondente": respondente,
+        "decimais": {c: _decimais(texto[c]) for c in clima},
+        "meses": sorted(modelo_clima),
+        "data_inicial": datas.min(),
+        "horarios": np.unique(sessao_minutos),
+        "sessoes_por_dia": sessoes_por_dia,
+        "respondentes_por_sessao": np.bincount(sessao),
+        "modelo_clima": modelo_clima,
+        "condicionantes": condicionantes,
+        "marginais_condicionantes": marginais_condicionantes,
+        "marginais_respondente": marginais_respondente,
+        "a_respondente": a_resp,
+        "l_respondente": l_resp,
+        "faltantes_clima": faltantes_clima,
+        "faltantes_respondente": faltantes_respondente,
+    }
+
+
+__all__ = ["ajustar_modelo_sintetico", "TOKENS_FALTANTES"]
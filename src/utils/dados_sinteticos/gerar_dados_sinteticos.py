@@ -0,0 +1,272 @@
+"""
+Geração vetorizada de dados sintéticos de conforto térmico em lotes.
+
+Usa o modelo de ajustar_modelo_sintetico: dias de campanha nos meses
+observados, sessões por dia e respondentes por sessão empíricos, clima por
+sessão e respondentes por linha via cópula gaussiana, e faltantes com os
+mesmos tokens da base bruta. A saída imita o CSV original (texto, decimal
+com vírgula, cabeçalhos originais), pronta para load_dataframe e para o
+pipeline de processamento.
+
+Exemplo:
+    >>> df_real = pd.read_csv("dados/base.csv", sep=";", dtype=str, keep_default_na=False)
+    >>> gerar_dados_sinteticos(df_real, 10_000_000, "dados/sinteticos.parquet", semente=7)
+"""
+import math
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from scipy.special import ndtr, ndtri
+
+from .ajustar_modelo_sintetico import ajustar_modelo_sintetico
+
+# Tokens de ruído de digitação (todos tratados como faltantes pela limpeza)
+TOKENS_RUIDO = ("99", "x", "-")
+# Último dia representável com folga em datetime64[ns]
+_DATA_LIMITE = pd.Timestamp("2261-12-31")
+
+
+def _escore_empirico(valores_ordenados: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Escore normal de x pela CDF empírica (posto médio)."""
+    n = len(valores_ordenados)
+    if n == 0:
+        return np.zeros(len(x))
+    esquerda = np.searchsorted(valores_ordenados, x, side="left")
+    direita = np.searchsorted(valores_ordenados, x, side="right")
+    u = np.clip((esquerda + direita) / (2 * n), 0.5 / n, 1 - 0.5 / n)
+    return ndtri(u)
+
+
+def _quantil_continuo(valores_ordenados: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """Quantil empírico com interpolação linear entre estatísticas de ordem."""
+    n = len(valores_ordenados)
+    if n == 1:
+        return np.full(len(u), valores_ordenados[0])
+    return np.interp(u * (n - 1), np.arange(n), valores_ordenados)
+
+
+def _calendario(inicio: pd.Timestamp, meses: list, n_dias: int) -> pd.DatetimeIndex:
+    """Próximos n_dias dias (a partir de inicio) nos meses de campanha."""
+    dias = []
+    cursor = inicio
+    while sum(len(d) for d in dias) < n_dias:
+        if cursor > _DATA_LIMITE:
+            raise ValueError(
+                "Datas sintéticas ultrapassam o limite do pandas; "
+                "aumente respondentes_por_sessao para gerar mais linhas por dia"
+            )
+        fim = min(cursor + pd.Timedelta(days=max(366, 2 * n_dias)), _DATA_LIMITE)
+        bloco = pd.date_range(cursor, fim, freq="D")
+        dias.append(bloco[bloco.month.isin(meses)])
+        cursor = bloco[-1] + pd.Timedelta(days=1)
+    return pd.DatetimeIndex(np.concatenate([d.to_numpy() for d in dias])[:n_dias])
+
+
+def _com_tokens(
+    textos: pa.Array,
+    faltante: np.ndarray,
+    tokens: Dict[str, float],
+    rng: np.random.Generator,
+) -> pa.Array:
+    """Substitui as posições faltantes por tokens sorteados ('' vira nulo)."""
+    if not faltante.any() or not tokens:
+        return textos
+    escolhas = rng.choice(np.array(list(tokens), dtype=object), size=int(faltante.sum()), p=list(tokens.values()))
+    substitutos = np.full(len(faltante), None, dtype=object)
+    substitutos[faltante] = [t if t != "" else None for t in escolhas]
+    return pc.if_else(pa.array(faltante), pa.array(substitutos, type=pa.string()), textos)
+
+
+def _gerar_lote(
+    modelo: Dict[str, Any],
+    rng: np.random.Generator,
+    dias: pd.DatetimeIndex,
+    n_max: int,
+    respondentes_por_sessao: Optional[int],
+    taxa_ruido: float,
+    fator_respondentes: int = 1,
+) -> pa.Table:
+    n_dias = len(dias)
+    horarios = modelo["horarios"]
+
+    # Sessões: quantidade por dia empírica, horários espaçados no dia
+    por_dia = rng.choice(modelo["sessoes_por_dia"], size=n_dias)
+    sessao_dia = np.repeat(np.arange(n_dias), por_dia)
+    posicao = np.arange(len(sessao_dia)) - np.repeat(np.cumsum(por_dia) - por_dia, por_dia)
+    k = por_dia[sessao_dia]
+    slot = np.where(k > 1, np.round(posicao * (len(horarios) - 1) / np.maximum(k - 1, 1)), 0).astype(int)
+    sessao_minutos = horarios[slot]
+
+    # Respondentes por sessão, cortando no total pedido
+    if respondentes_por_sessao:
+        por_sessao = np.full(len(sessao_dia), int(respondentes_por_sessao))
+    else:
+        empirico = modelo["respondentes_por_sessao"]
+        por_sessao = rng.choice(empirico[empirico > 0], size=len(sessao_dia)) * fator_respondentes
+    acumulado = np.cumsum(por_sessao)
+    n_sessoes = int(np.searchsorted(acumulado, n_max, side="left")) + 1
+    n_sessoes = min(n_sessoes, len(sessao_dia))
+    sessao_dia, sessao_minutos, por_sessao = (
+        sessao_dia[:n_sessoes], sessao_minutos[:n_sessoes], por_sessao[:n_sessoes].copy()
+    )
+    por_sessao[-1] -= max(int(por_sessao.sum()) - n_max, 0)
+    linha_sessao = np.repeat(np.arange(n_sessoes), por_sessao)
+    n_linhas = len(linha_sessao)
+    sessao_mes = dias.month.to_numpy()[sessao_dia]
+
+    colunas: Dict[str, pa.Array] = {}
+
+    # Data e hora
+    textos_dias = pa.array([f"{d.day}/{d.month}/{d.year}" for d in dias])
+    textos_horas = pa.array([f"{m // 60:02d}:{m % 60:02d}" for m in horarios])
+    colunas[modelo["coluna_data"]] = pc.take(textos_dias, pa.array(sessao_dia[linha_sessao]))
+    colunas[modelo["coluna_hora"]] = pc.take(textos_horas, pa.array(slot[:n_sessoes][linha_sessao]))
+
+    # Clima por sessão, condicionado ao mês e ao horário
+    clima = modelo["clima"]
+    valores_clima = np.empty((n_sessoes, len(clima)))
+    for mes in np.unique(sessao_mes):
+        nas_sessoes = np.flatnonzero(sessao_mes == mes)
+        ajuste = modelo["modelo_clima"][int(mes)]
+        z_min = _escore_empirico(ajuste["marginais"]["__minutos__"]["valores"], sessao_minutos[nas_sessoes])
+        ruido = rng.standard_normal((len(nas_sessoes), len(clima)))
+        u = ndtr(z_min[:, None] @ ajuste["a"].T + ruido @ ajuste["l"].T)
+        for j, coluna in enumerate(clima):
+            valores_clima[nas_sessoes, j] = _quantil_continuo(ajuste["marginais"][coluna]["valores"], u[:, j])
+
+    indice_linhas = pa.array(linha_sessao)
+    for j, coluna in enumerate(clima):
+        valores = np.round(valores_clima[:, j], modelo["decimais"][coluna]) + 0.0
+        textos = pc.replace_substring(pc.cast(pa.array(valores), pa.string()), ".", ",")
+        faltas = modelo["faltantes_clima"][coluna]
+        dia_faltante = rng.random(n_dias) < faltas["p_dia"]
+        faltante = dia_faltante[sessao_dia] | (rng.random(n_sessoes) < faltas["p_sessao"])
+        textos = _com_tokens(textos, faltante, faltas["tokens"], rng)
+        colunas[coluna] = pc.take(textos, indice_linhas)
+
+    # Respondentes por linha, condicionados ao clima da sessão
+    condicionantes = modelo["condicionantes"]
+    z_cond = np.column_stack([
+        _escore_empirico(modelo["marginais_condicionantes"][c], valores_clima[:, clima.index(c)])[linha_sessao]
+        for c in condicionantes
+    ]) if condicionantes else np.zeros((n_linhas, 0))
+    respondente = modelo["respondente"]
+    ruido = rng.standard_normal((n_linhas, len(respondente)))
+    u = ndtr(z_cond @ modelo["a_respondente"].T + ruido @ modelo["l_respondente"].T)
+    for j, coluna in enumerate(respondente):
+        marginal = modelo["marginais_respondente"][coluna]
+        n = len(marginal["textos"])
+        if n:
+            indices = np.minimum((u[:, j] * n).astype(np.int64), n - 1)
+            textos = pc.take(pa.array(marginal["textos"], type=pa.string()), pa.array(indices))
+        else:
+            textos = pa.nulls(n_linhas, pa.string())
+        faltas = modelo["faltantes_respondente"][coluna]
+        textos = _com_tokens(textos, rng.random(n_linhas) < faltas["p_linha"], faltas["tokens"], rng)
+        if taxa_ruido:
+            ruido_digitacao = {token: 1 / len(TOKENS_RUIDO) for token in TOKENS_RUIDO}
+            textos = _com_tokens(textos, rng.random(n_linhas) < taxa_ruido, ruido_digitacao, rng)
+        colunas[coluna] = textos
+
+    return pa.table({c: colunas[c] for c in modelo["colunas"]})
+
+
+def iterar_lotes_sinteticos(
+    modelo: Dict[str, Any],
+    n_linhas: int,
+    semente: int = 42,
+    linhas_por_lote: int = 1_000_000,
+    respondentes_por_sessao: Optional[int] = None,
+    taxa_ruido: float = 0.0005,
+) -> Iterator[pa.Table]:
+    """
+    Gera os dados em tabelas Arrow de até ~linhas_por_lote linhas.
+
+    Cada lote usa um gerador próprio derivado de (semente, índice do lote),
+    então a mesma semente e o mesmo linhas_por_lote reproduzem os dados.
+    Com respondentes empíricos, se os dias de campanha até o limite de datas
+    do pandas não comportarem n_linhas, os respondentes por sessão são
+    multiplicados pelo menor fator inteiro que comporta.
+    """
+    inicio = pd.Timestamp(modelo["data_inicial"]).normalize()
+    fator = 1
+    if respondentes_por_sessao:
+        por_sessao = float(respondentes_por_sessao)
+    else:
+        empirico = modelo["respondentes_por_sessao"]
+        por_sessao = float(empirico[empirico > 0].mean())
+        calendario = pd.date_range(inicio, _DATA_LIMITE, freq="D")
+        dias_disponiveis = int(calendario.month.isin(modelo["meses"]).sum())
+        linhas_por_dia = float(np.mean(modelo["sessoes_por_dia"])) * por_sessao
+        # Folga de 10% para a variação de sessões/respondentes
+        fator = max(1, math.ceil(1.1 * n_linhas / (linhas_por_dia * dias_disponiveis)))
+        por_sessao *= fator
+    linhas_por_dia = float(np.mean(modelo["sessoes_por_dia"])) * por_sessao
+    dias_por_lote = max(1, math.ceil(min(linhas_por_lote, n_linhas) / linhas_por_dia))
+
+    restantes, indice = int(n_linhas), 0
+    while restantes > 0:
+        dias = _calendario(inicio, modelo["meses"], dias_por_lote)
+        inicio = dias[-1] + pd.Timedelta(days=1)
+        rng = np.random.default_rng([semente, indice])
+        lote = _gerar_lote(modelo, rng, dias, restantes, respondentes_por_sessao, taxa_ruido, fator)
+        restantes -= lote.num_rows
+        indice += 1
+        yield lote
+
+
+def gerar_dados_sinteticos(
+    base: Union[pd.DataFrame, Dict[str, Any]],
+    n_linhas: int,
+    caminho: Optional[Union[str, Path]] = None,
+    semente: int = 42,
+    linhas_por_lote: int = 1_000_000,
+    respondentes_por_sessao: Optional[int] = None,
+    taxa_ruido: float = 0.0005,
+    compressao: str = "zstd",
+) -> Union[pd.DataFrame, Path]:
+    """
+    Gera n_linhas de dados sintéticos no formato da base bruta.
+
+    Args:
+        base: Base bruta (texto) para ajustar o modelo, ou modelo já ajustado
+        n_linhas: Total de linhas (ex.: 10_000 a 100_000_000)
+        caminho: Arquivo Parquet de saída (um row group por lote); se None,
+            retorna um DataFrame (apenas para volumes que cabem na memória)
+        semente: Semente dos geradores
+        linhas_por_lote: Linhas aproximadas por lote
+        respondentes_por_sessao: Fixa respondentes por sessão (None = empírico,
+            escalado automaticamente quando o período de datas não comporta)
+        taxa_ruido: Fração de células de respondente trocadas por '99'/'x'/'-'
+        compressao: Codec do Parquet
+
+    Returns:
+        Caminho do Parquet gravado ou DataFrame gerado
+    """
+    modelo = ajustar_modelo_sintetico(base) if isinstance(base, pd.DataFrame) else base
+    lotes = iterar_lotes_sinteticos(
+        modelo, n_linhas, semente, linhas_por_lote, respondentes_por_sessao, taxa_ruido
+    )
+    if caminho is None:
+        return pa.concat_tables(list(lotes)).to_pandas()
+
+    caminho = Path(caminho)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    escritor = None
+    try:
+        for lote in lotes:
+            if escritor is None:
+                escritor = pq.ParquetWriter(caminho, lote.schema, compression=compressao)
+            escritor.write_table(lote)
+    finally:
+        if escritor is not None:
+            escritor.close()
+    return caminho
+
+
+__all__ = ["gerar_dados_sinteticos", "iterar_lotes_sinteticos", "TOKENS_RUIDO"]
@@ -0,0 +1,198 @@
+"""
+Executor de operações por coluna organizadas em grafo de dependências.
+
+Cada nó lê um conjunto de colunas e produz colunas novas (ou substitui as
+que lê). Nós sem dependência entre si rodam em paralelo (threads ou
+processos); os resultados são gravados no DataFrame de trabalho na ordem
+em que os nós foram declarados, então a saída não depende do escalonamento.
+"""
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+MODOS_EXECUCAO = ("thread", "processo")
+
+
+@dataclass(frozen=True)
+class NoColuna:
+    """
+    Operação sobre colunas.
+
+    funcao recebe um DataFrame com (ao menos) as colunas de entradas e
+    retorna (colunas, artefato): colunas mapeia nome -> valores das saídas
+    e artefato é qualquer informação ajustada (ex.: mapeamento, scaler).
+    No modo 'processo' a funcao precisa ser serializável (função de módulo
+    ou functools.partial, não lambda).
+    """
+
+    nome: str
+    funcao: Callable[[pd.DataFrame], Tuple[Dict[str, Any], Any]]
+    entradas: Tuple[str, ...]
+    saidas: Tuple[str, ...]
+
+
+def montar_niveis(nos: Sequence[NoColuna]) -> List[List[int]]:
+    """
+    Agrupa os nós em níveis executáveis em paralelo.
+
+    Um nó depende de qualquer nó declarado antes dele que escreva uma coluna
+    que ele lê ou escreve, ou que leia uma coluna que ele sobrescreve.
+
+    Returns:
+        Lista de níveis, cada um com os índices dos nós (ordem de declaração)
+    """
+    niveis_nos: List[int] = []
+    for j, no in enumerate(nos):
+        entradas, saidas = set(no.entradas), set(no.saidas)
+        nivel = 0
+        for i in range(j):
+            anterior = nos[i]
+            conflito = (
+                entradas & set(anterior.saidas)
+                or saidas & set(anterior.saidas)
+                or saidas & set(anterior.entradas)
+            )
+            if conflito:
+                nivel = max(nivel, niveis_nos[i] + 1)
+        niveis_nos.append(nivel)
+
+    niveis: List[List[int]] = [[] for _ in range(max(niveis_nos, default=-1) + 1)]
+    for indice, nivel in enumerate(niveis_nos):
+        niveis[nivel].append(indice)
+    return niveis
+
+
+def _executar_no(funcao: Callable, df: pd.DataFrame) -> Tuple[Dict[str, Any], Any]:
+    return funcao(df)
+
+
+def _gravar_colunas(df: pd.DataFrame, colunas: Dict[str, Any]) -> None:
+    """Grava no próprio df: existentes coluna a coluna, novas em um único bloco."""
+    novas = {}
+    for nome, valores in colunas.items():
+        if nome in df.columns:
+            df[nome] = valores
+        else:
+            novas[nome] = valores
+    if novas:
+        df[list(novas)] = pd.DataFrame(novas, index=df.index)
+
+
+def resolver_trabalhadores(n_trabalhadores: Optional[int]) -> int:
+    """None ou <= 0 usa todos os núcleos disponíveis."""
+    if n_trabalhadores is None or n_trabalhadores <= 0:
+        return os.cpu_count() or 1
+    return int(n_trabalhadores)
+
+
+def executar_grafo(
+    df: pd.DataFrame,
+    nos: Sequence[NoColuna],
+    n_trabalhadores: Optional[int] = 1,
+    modo: str = "thread",
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Executa os nós respeitando as dependências.
+
+    O DataFrame recebido é usado como área de trabalho (sem cópias extras
+    do frame inteiro): as colunas produzidas em cada nível são gravadas nele
+    antes do nível seguinte. No modo 'processo' cada nó recebe apenas as
+    colunas que lê.
+
+    Args:
+        df: DataFrame de trabalho (modificado e retornado)
+        nos: Nós na ordem de declaração (define a ordem de gravação)
+        n_trabalhadores: 1 executa em sequência; None/<=0 usa todos os núcleos
+        modo: 'thread' ou 'processo'
+
+    Returns:
+        Tupla (df, artefatos) com artefatos por nome de nó (ordem de declaração)
+    """
+    if modo not in MODOS_EXECUCAO:
+        raise ValueError(f"Modo inválido: {modo}. Use {MODOS_EXECUCAO}")
+    n_trabalhadores = resolver_trabalhadores(n_trabalhadores)
+    artefatos_nos: Dict[int, Any] = {}
+    niveis = montar_niveis(nos)
+
+    # Com mais de um nível, as colunas novas são reservadas antes na ordem de
+    # declaração; assim a ordem final não depende dos níveis
+    if len(niveis) > 1:
+        reservadas = list(dict.fromkeys(
+            s for no in nos for s in no.saidas if s not in df.columns
+        ))
+        if reservadas:
+            df[reservadas] = pd.DataFrame(np.nan, index=df.index, columns=reservadas)
+
+    def _entrada(no: NoColuna) -> pd.DataFrame:
+        if modo == "processo":
+            return df[[c for c in no.entradas if c in df.columns]]
+        return df
+
+    pool: Optional[Executor] = None
+    maior_nivel = max((len(nivel) for nivel in niveis), default=0)
+    if n_trabalhadores > 1 and maior_nivel > 1:
+        classe = ProcessPoolExecutor if modo == "processo" else ThreadPoolExecutor
+        pool = classe(max_workers=min(n_trabalhadores, maior_nivel))
+    try:
+        for nivel in niveis:
+            if pool is None or len(nivel) == 1:
+                resultados = [_executar_no(nos[i].funcao, _entrada(nos[i])) for i in nivel]
+            else:
+                futuros = [pool.submit(_executar_no, nos[i].funcao, _entrada(nos[i])) for i in nivel]
+                resultados = [futuro.result() for futuro in futuros]
+            colunas_nivel: Dict[str, Any] = {}
+            for i, (colunas, artefato) in zip(nivel, resultados):
+                colunas_nivel.update(colunas)
+                artefatos_nos[i] = artefato
+            _gravar_colunas(df, colunas_nivel)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    artefatos = {nos[i].nome: artefatos_nos[i] for i in sorted(artefatos_nos)}
+    return df, artefatos
+
+
+def medir_escalabilidade(
+    executar: Callable[[int], Any],
+    trabalhadores: Optional[Iterable[int]] = None,
+    repeticoes: int = 3,
+) -> pd.DataFrame:
+    """
+    Mede o tempo de executar(n) para n trabalhadores (melhor de repeticoes).
+
+    Args:
+        executar: Função que roda a carga com n trabalhadores
+        trabalhadores: Valores de n (padrão: 1..núcleos disponíveis)
+        repeticoes: Repetições por valor de n
+
+    Returns:
+        DataFrame com trabalhadores, segundos e aceleracao (relativa a n=1)
+    """
+    trabalhadores = list(trabalhadores or range(1, (os.cpu_count() or 1) + 1))
+    linhas = []
+    for n in trabalhadores:
+        tempos = []
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            executar(n)
+            tempos.append(time.perf_counter() - inicio)
+        linhas.append({"trabalhadores": n, "segundos": min(tempos)})
+    resultado = pd.DataFrame(linhas)
+    base = resultado.loc[resultado["trabalhadores"] == trabalhadores[0], "segundos"].iloc[0]
+    resultado["aceleracao"] = np.round(base / resultado["segundos"], 2)
+    return resultado
+
+
+__all__ = [
+    "NoColuna",
+    "MODOS_EXECUCAO",
+    "montar_niveis",
+    "executar_grafo",
+    "resolver_trabalhadores",
+    "medir_escalabilidade",
+]
@@ -2,8 +2,22 @@
 Funções de I/O para carregar e salvar DataFrames.
 """
 from .io_local import load_dataframe, save_dataframe
+from .cache_leitura import limpar_cache_leitura
+from .dataset_particionado import (
+    carregar_dados_etapa,
+    filtros_ultimos_meses,
+    ler_dataset_particionado,
+    salvar_dados_etapa,
+    salvar_dataset_particionado,
+)
 
 __all__ = [
     "load_dataframe",
     "save_dataframe",
+    "limpar_cache_leitura",
+    "salvar_dataset_particionado",
+    "ler_dataset_particionado",
+    "filtros_ultimos_meses",
+    "salvar_dados_etapa",
+    "carregar_dados_etapa",
 ]
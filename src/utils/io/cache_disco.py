@@ -0,0 +1,71 @@
+"""
+Gravação atômica e descarte LRU para os caches em disco.
+
+Usado pelo cache de leitura (Feather, utils.io.cache_leitura), pelo cache de
+etapas (joblib, pipelines.cache_etapas) e pelo checkpoint incremental.
+"""
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+
+def gravar_atomico(destino: Path, gravar: Callable[[str], Any]) -> Path:
+    """
+    Grava via arquivo temporário na mesma pasta e os.replace.
+
+    Leitores concorrentes veem o arquivo anterior ou o novo, nunca um
+    arquivo parcial; o temporário é removido se a gravação falhar.
+
+    Args:
+        destino: Caminho final (a pasta deve existir)
+        gravar: Função que grava no caminho temporário recebido
+
+    Returns:
+        destino
+    """
+    descritor, temporario = tempfile.mkstemp(dir=destino.parent, suffix=".tmp")
+    os.close(descritor)
+    try:
+        gravar(temporario)
+        os.replace(temporario, destino)
+    finally:
+        if os.path.exists(temporario):
+            os.unlink(temporario)
+    return destino
+
+
+def aplicar_limite_lru(pasta: Path, padrao: str, limite_bytes: int) -> int:
+    """
+    Remove os arquivos menos usados (mtime) até a pasta caber no limite.
+
+    Args:
+        pasta: Diretório do cache
+        padrao: Glob das entradas (ex.: '*.feather')
+        limite_bytes: Tamanho máximo somado das entradas
+
+    Returns:
+        Quantidade de entradas removidas
+    """
+    if not pasta.exists():
+        return 0
+    entradas = []
+    for caminho in pasta.glob(padrao):
+        try:
+            info = caminho.stat()
+        except FileNotFoundError:
+            continue
+        entradas.append((info.st_mtime, info.st_size, caminho))
+
+    total = sum(tamanho for _, tamanho, _ in entradas)
+    removidas = 0
+    for _, tamanho, caminho in sorted(entradas, key=lambda e: e[0]):
+        if total <= limite_bytes:
+            break
+        caminho.unlink(missing_ok=True)
+        total -= tamanho
+        removidas += 1
+    return removidas
+
+
+__all__ = ["gravar_atomico", "aplicar_limite_lru"]
@@ -0,0 +1,162 @@
+"""
+Cache colunar (Feather) para arquivos de origem já interpretados.
+
+A chave de cada entrada é o hash do conteúdo do arquivo somado às opções do
+parser; leituras seguintes abrem o Feather via memory mapping. O diretório
+tem tamanho máximo e descarta as entradas menos usadas (LRU por mtime).
+
+Variáveis de ambiente:
+    CACHE_DADOS_ATIVO: "0"/"false" desativa o cache (padrão: ativo)
+    CACHE_DADOS_DIR: diretório do cache (padrão: .cache/dados)
+    CACHE_DADOS_LIMITE_MB: tamanho máximo do diretório em MB (padrão: 512)
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .cache_disco import aplicar_limite_lru as _aplicar_limite_lru, gravar_atomico
+from .leitura_colunar import Filtros, ler_feather
+
+DIRETORIO_CACHE_PADRAO = os.path.join(".cache", "dados")
+LIMITE_CACHE_MB_PADRAO = 512
+EXTENSOES_CACHEAVEIS = ("csv", "txt", "xls", "xlsx")
+
+# Incrementar quando o formato gravado ou o parser mudar de forma incompatível
+_VERSAO_CACHE = "1"
+_TAMANHO_BLOCO_HASH = 1 << 20
+
+
+def cache_ativo(usar_cache: Optional[bool] = None) -> bool:
+    """Resolve se o cache deve ser usado (argumento explícito tem prioridade)."""
+    if usar_cache is not None:
+        return bool(usar_cache)
+    valor = os.environ.get("CACHE_DADOS_ATIVO")
+    if valor is None:
+        return True
+    return valor.strip().lower() in {"1", "true", "sim", "yes", "on"}
+
+
+def diretorio_cache(diretorio: Optional[str] = None) -> Path:
+    """Retorna o diretório do cache (argumento > ambiente > padrão)."""
+    return Path(diretorio or os.environ.get("CACHE_DADOS_DIR") or DIRETORIO_CACHE_PADRAO)
+
+
+def _limite_bytes(limite_mb: Optional[float] = None) -> int:
+    if limite_mb is None:
+        limite_mb = float(os.environ.get("CACHE_DADOS_LIMITE_MB", LIMITE_CACHE_MB_PADRAO))
+    return int(limite_mb * 1024 * 1024)
+
+
+def _hash_arquivo(caminho: str) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    with open(caminho, "rb") as arquivo:
+        for bloco in iter(lambda: arquivo.read(_TAMANHO_BLOCO_HASH), b""):
+            digest.update(bloco)
+    return digest.hexdigest()
+
+
+def chave_cache(caminho: str, ext: str, opcoes: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Calcula a chave do cache para um arquivo.
+
+    Args:
+        caminho: Caminho local do arquivo de origem
+        ext: Extensão normalizada (define o parser usado)
+        opcoes: Opções repassadas ao parser
+
+    Returns:
+        Hash hexadecimal de conteúdo + parser + opções
+    """
+    opcoes_txt = json.dumps(opcoes or {}, sort_keys=True, default=repr)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{_VERSAO_CACHE}|{ext}|{opcoes_txt}|".encode("utf-8"))
+    digest.update(_hash_arquivo(caminho).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _restaurar_nulos_objeto(df: pd.DataFrame) -> pd.DataFrame:
+    """Arrow devolve None em colunas texto; pandas (read_csv) usa NaN."""
+    for col in df.columns[df.dtypes == object]:
+        if df[col].hasnans:
+            df[col] = df[col].fillna(np.nan)
+    return df
+
+
+def ler_do_cache(
+    chave: str,
+    diretorio: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filtros] = None,
+    sem_copia: bool = False,
+) -> Optional[pd.DataFrame]:
+    """
+    Lê uma entrada do cache via memory mapping.
+
+    Projeção (columns) e filtros são aplicados no pyarrow antes da
+    conversão para pandas (ver leitura_colunar.ler_feather).
+
+    Returns:
+        DataFrame em cache ou None se a entrada não existir/estiver corrompida
+    """
+    caminho = diretorio_cache(diretorio) / f"{chave}.feather"
+    if not caminho.exists():
+        return None
+    try:
+        df = ler_feather(str(caminho), columns=columns, filters=filters, sem_copia=sem_copia)
+    except Exception:
+        # Com projeção/filtros o erro pode ser do chamador (coluna inexistente);
+        # a releitura pelo parser original reporta o erro adequado.
+        if columns is None and not filters:
+            caminho.unlink(missing_ok=True)
+        return None
+    # Marca uso recente para a política LRU
+    os.utime(caminho)
+    return _restaurar_nulos_objeto(df)
+
+
+def gravar_no_cache(
+    df: pd.DataFrame,
+    chave: str,
+    diretorio: Optional[str] = None,
+    limite_mb: Optional[float] = None,
+) -> Optional[Path]:
+    """
+    Grava o DataFrame no cache (Feather sem compressão, apto a memory mapping).
+
+    Falhas de serialização (ex.: colunas com tipos mistos) são ignoradas:
+    o cache é apenas uma otimização e nunca deve interromper a leitura.
+
+    Returns:
+        Caminho gravado ou None se não foi possível gravar
+    """
+    import pyarrow.feather as feather
+
+    pasta = diretorio_cache(diretorio)
+    destino = pasta / f"{chave}.feather"
+    try:
+        pasta.mkdir(parents=True, exist_ok=True)
+        gravar_atomico(destino, lambda caminho: feather.write_feather(df, caminho, compression="uncompressed"))
+    except Exception:
+        return None
+    aplicar_limite_lru(diretorio, limite_mb)
+    return destino
+
+
+def aplicar_limite_lru(diretorio: Optional[str] = None, limite_mb: Optional[float] = None) -> int:
+    """
+    Remove as entradas menos usadas até o cache caber no limite.
+
+    Returns:
+        Quantidade de entradas removidas
+    """
+    return _aplicar_limite_lru(diretorio_cache(diretorio), "*.feather", _limite_bytes(limite_mb))
+
+
+def limpar_cache_leitura(diretorio: Optional[str] = None) -> int:
+    """Remove todas as entradas do cache. Retorna quantas foram removidas."""
+    return aplicar_limite_lru(diretorio, limite_mb=0)
@@ -0,0 +1,227 @@
+"""
+Datasets Parquet particionados no estilo Hive (ano=AAAA/mes-ano=AAAA-MM/).
+
+Dados processados e de features são gravados um diretório por partição,
+com estatísticas de coluna (mínimo/máximo/nulos) em cada row group. Na
+leitura, filtros sobre as colunas de partição descartam diretórios inteiros
+sem abri-los e os demais filtros usam as estatísticas para pular row
+groups; só as colunas pedidas são decodificadas.
+
+A coluna de ano é derivada do rótulo mes-ano apenas para o particionamento
+(permite filtrar por ano) e não volta na leitura, a menos que já existisse
+no DataFrame gravado.
+"""
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .leitura_colunar import Filtros, filtros_para_expressao
+
+# Chave dos metadados do esquema Parquet com a descrição das partições
+CHAVE_METADADOS = b"dataset_particionado"
+COLUNA_ANO = "ano"
+
+_PADRAO_MES_ANO = re.compile(r"^\d{4}-\d{2}$")
+
+
+def _anos(rotulos: pd.Series) -> np.ndarray:
+    """Ano de cada rótulo AAAA-MM (-1 para rótulos fora do formato)."""
+    texto = rotulos.astype("string")
+    validos = texto.str.fullmatch(_PADRAO_MES_ANO.pattern).fillna(False).to_numpy(dtype=bool)
+    anos = np.full(len(rotulos), -1, dtype="int16")
+    anos[validos] = texto[validos].str.slice(0, 4).astype(int).to_numpy()
+    return anos
+
+
+def salvar_dataset_particionado(
+    df: pd.DataFrame,
+    diretorio: str,
+    coluna_particao: str = "mes-ano",
+    compressao: str = "zstd",
+    linhas_por_grupo: int = 128 * 1024,
+    substituir: bool = True,
+) -> Path:
+    """
+    Grava df como dataset Parquet particionado por ano e coluna_particao.
+
+    Args:
+        df: DataFrame processado ou de features (com coluna_particao)
+        diretorio: Diretório raiz do dataset
+        coluna_particao: Rótulo AAAA-MM do mês (rótulos fora do formato,
+            como 'desconhecido', ficam em ano=-1)
+        compressao: Codec Parquet ('zstd', 'snappy', ...)
+        linhas_por_grupo: Linhas por row group (unidade das estatísticas)
+        substituir: True apaga o dataset existente; False substitui só as
+            partições presentes em df (atualização incremental por mês)
+
+    Returns:
+        Caminho do diretório gravado
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    if coluna_particao not in df.columns:
+        raise ValueError(f"Coluna de partição ausente: {coluna_particao}")
+    if df[coluna_particao].isna().any():
+        raise ValueError(f"Coluna de partição com faltantes: {coluna_particao}")
+
+    # Parquet não tem colunas esparsas: as dummies esparsas vão densas
+    esparsas = [c for c in df.columns if isinstance(df[c].dtype, pd.SparseDtype)]
+    if esparsas:
+        df = df.assign(**{c: df[c].sparse.to_dense() for c in esparsas})
+
+    particoes = [coluna_particao] if COLUNA_ANO in df.columns else [COLUNA_ANO, coluna_particao]
+    tabela = pa.Table.from_pandas(df, preserve_index=False)
+    if COLUNA_ANO not in df.columns:
+        tabela = tabela.append_column(COLUNA_ANO, pa.array(_anos(df[coluna_particao])))
+    descricao = {
+        "particoes": particoes,
+        "derivadas": [c for c in particoes if c not in df.columns],
+        "colunas": [str(c) for c in df.columns],
+    }
+    tabela = tabela.replace_schema_metadata(
+        {**(tabela.schema.metadata or {}), CHAVE_METADADOS: json.dumps(descricao).encode("utf-8")}
+    )
+
+    caminho = Path(diretorio)
+    if substituir and caminho.exists():
+        shutil.rmtree(caminho)
+    formato = ds.ParquetFileFormat()
+    ds.write_dataset(
+        tabela,
+        str(caminho),
+        format=formato,
+        partitioning=ds.partitioning(tabela.select(particoes).schema, flavor="hive"),
+        file_options=formato.make_write_options(compression=compressao, write_statistics=True),
+        basename_template="parte-{i}.parquet",
+        existing_data_behavior="delete_matching",
+        max_rows_per_group=linhas_por_grupo,
+        min_rows_per_group=min(linhas_por_grupo, max(len(df), 1)),
+    )
+    return caminho
+
+
+def _abrir(diretorio: str):
+    import pyarrow.dataset as ds
+
+    return ds.dataset(os.path.abspath(diretorio), format="parquet", partitioning="hive")
+
+
+def _descricao(dataset) -> Dict:
+    metadados = dataset.schema.metadata or {}
+    if CHAVE_METADADOS not in metadados:
+        return {"particoes": [], "derivadas": [], "colunas": list(dataset.schema.names)}
+    return json.loads(metadados[CHAVE_METADADOS])
+
+
+def valores_particao(diretorio: str, coluna: str = "mes-ano") -> List:
+    """Valores distintos de uma coluna de partição, pelos diretórios (sem ler dados)."""
+    import pyarrow.dataset as ds
+
+    valores = set()
+    for fragmento in _abrir(diretorio).get_fragments():
+        chaves = ds.get_partition_keys(fragmento.partition_expression)
+        if coluna in chaves:
+            valores.add(chaves[coluna])
+    return sorted(valores)
+
+
+def filtros_ultimos_meses(diretorio: str, n: int, coluna_particao: str = "mes-ano") -> Filtros:
+    """
+    Filtro DNF dos n meses mais recentes do dataset.
+
+    Só rótulos AAAA-MM contam; use com load_dataframe(diretorio, filters=...)
+    para ler apenas as partições desses meses.
+    """
+    if n <= 0:
+        raise ValueError(f"n deve ser positivo: {n}")
+    meses = [m for m in valores_particao(diretorio, coluna_particao) if _PADRAO_MES_ANO.match(str(m))]
+    return [(coluna_particao, "in", meses[-n:])]
+
+
+def ler_dataset_particionado(
+    diretorio: str,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filtros] = None,
+) -> pd.DataFrame:
+    """
+    Lê um dataset gravado por salvar_dataset_particionado.
+
+    Filtros podem usar qualquer coluna, inclusive as de partição (mesmo a de
+    ano derivada); as linhas voltam agrupadas por partição, na ordem dos
+    diretórios, e as colunas na ordem do DataFrame gravado.
+
+    Args:
+        diretorio: Diretório raiz do dataset
+        columns: Colunas a materializar (None = todas as gravadas)
+        filters: Filtros DNF (ver leitura_colunar)
+
+    Returns:
+        DataFrame com as partições e colunas selecionadas
+    """
+    dataset = _abrir(diretorio)
+    descricao = _descricao(dataset)
+    colunas = list(columns) if columns is not None else [
+        c for c in descricao["colunas"] if c in dataset.schema.names
+    ]
+    tabela = dataset.to_table(columns=colunas, filter=filtros_para_expressao(filters))
+    return tabela.to_pandas()
+
+
+def salvar_dados_etapa(
+    df: pd.DataFrame,
+    diretorio: str,
+    coluna_particao: str = "mes-ano",
+    compressao: str = "zstd",
+) -> Path:
+    """
+    Grava a saída de uma etapa do pipeline em diretorio.
+
+    Com coluna_particao presente e sem faltantes, grava o dataset Parquet
+    particionado; caso contrário, um CSV único (diretorio/<nome>.csv), o
+    formato anterior das etapas.
+
+    Returns:
+        Caminho do diretório gravado
+    """
+    if coluna_particao in df.columns and df[coluna_particao].notna().all():
+        return salvar_dataset_particionado(df, diretorio, coluna_particao, compressao)
+    caminho = Path(diretorio)
+    if caminho.exists():
+        shutil.rmtree(caminho)
+    caminho.mkdir(parents=True)
+    df.to_csv(caminho / f"{caminho.name}.csv", index=False)
+    return caminho
+
+
+def carregar_dados_etapa(diretorio: str, coluna_ordem: Optional[str] = None) -> pd.DataFrame:
+    """
+    Lê um diretório gravado por salvar_dados_etapa.
+
+    O Parquet particionado volta agrupado por partição; com coluna_ordem
+    (ex.: a data) as linhas são reordenadas de forma estável por ela, como
+    no CSV gravado em ordem cronológica. O CSV volta na ordem gravada.
+    """
+    arquivos_csv = sorted(Path(diretorio).glob("*.csv"))
+    if arquivos_csv:
+        return pd.read_csv(arquivos_csv[0])
+    df = ler_dataset_particionado(diretorio)
+    if coluna_ordem is not None and coluna_ordem in df.columns:
+        df = df.sort_values(coluna_ordem, kind="stable", ignore_index=True)
+    return df
+
+
+__all__ = [
+    "salvar_dataset_particionado",
+    "ler_dataset_particionado",
+    "salvar_dados_etapa",
+    "carregar_dados_etapa",
+    "valores_particao",
+    "filtros_ultimos_meses",
+]
@@ -3,65 +3,73 @@ Carrega um DataFrame de um caminho local ou URL.
 """
 import io
 import os
+from typing import Optional, Sequence
+
 import pandas as pd
 import requests
 
+from .cache_leitura import (
+    EXTENSOES_CACHEAVEIS,
+    cache_ativo,
+    chave_cache,
+    gravar_no_cache,
+    ler_do_cache,
+)
+from .dataset_particionado import ler_dataset_particionado
+from .leitura_colunar import (
+    Filtros,
+    filtrar_dataframe,
+    ler_csv_filtrado,
+    ler_feather,
+    opcoes_csv,
+)
+
 
 def _read_csv_robust(file_path_or_buffer) -> pd.DataFrame:
-    """Lê CSV com detecção automática de delimitador e tratamento robusto de erros."""
-    import csv as _csv
+    """Lê CSV com detecção automática de delimitador/codificação e tratamento robusto de erros."""
+    # Mesmas opções da leitura filtrada (ler_csv_filtrado)
+    opcoes = opcoes_csv(file_path_or_buffer)
 
-    # Se for string (caminho), detecta delimitador do arquivo
-    if isinstance(file_path_or_buffer, str):
-        delim = ","
-        try:
-            with open(file_path_or_buffer, 'r', encoding='utf-8') as f:
-                sample = f.read(4096)
-                sniff = _csv.Sniffer()
-                delim = sniff.sniff(sample).delimiter
-        except Exception:
-            delim = ","
-        
-        # Tenta ler com engine python (mais permissivo)
-        try:
-            return pd.read_csv(file_path_or_buffer, delimiter=delim, engine="python")
-        except Exception:
-            try:
-                return pd.read_csv(file_path_or_buffer, delimiter=delim, on_bad_lines="warn")
-            except TypeError:
-                # pandas antigo
-                return pd.read_csv(file_path_or_buffer, delimiter=delim, error_bad_lines=False)
-    
-    # Se for buffer (BytesIO, StringIO), usa o método original
-    else:
-        delim = ","
-        try:
-            sample = file_path_or_buffer.read(4096)
-            if isinstance(sample, bytes):
-                sample = sample.decode("utf-8", errors="replace")
-            sniff = _csv.Sniffer()
-            delim = sniff.sniff(sample).delimiter
-        except Exception:
-            delim = ","
-
-        # Reseta buffer e lê
-        try:
+    def _ler(**kwargs) -> pd.DataFrame:
+        if not isinstance(file_path_or_buffer, (str, os.PathLike)):
             file_path_or_buffer.seek(0)
-            return pd.read_csv(file_path_or_buffer, delimiter=delim, engine="python")
-        except Exception:
-            try:
-                file_path_or_buffer.seek(0)
-                return pd.read_csv(file_path_or_buffer, delimiter=delim, on_bad_lines="warn")
-            except TypeError:
-                file_path_or_buffer.seek(0)
-                return pd.read_csv(file_path_or_buffer, delimiter=delim, error_bad_lines=False)
+        return pd.read_csv(file_path_or_buffer, **opcoes, **kwargs)
+
+    # Tenta ler com engine python (mais permissivo)
+    try:
+        return _ler(engine="python")
+    except Exception:
+        try:
+            return _ler(on_bad_lines="warn")
+        except TypeError:
+            # pandas antigo
+            return _ler(error_bad_lines=False)
 
 
-def load_dataframe(path_or_buffer: str, **kwargs) -> pd.DataFrame:
+def load_dataframe(
+    path_or_buffer: str,
+    usar_cache: Optional[bool] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filtros] = None,
+    sem_copia: bool = False,
+    **kwargs,
+) -> pd.DataFrame:
     """Carrega um DataFrame de um caminho local ou URL.
 
     Suporta: .csv, .xls/.xlsx, .feather, .parquet, .pkl/.pickle
     Se for uma URL (http/https), faz download temporário e carrega.
+
+    Arquivos locais CSV/Excel passam por um cache colunar (ver cache_leitura):
+    a primeira leitura grava o resultado em Feather e as seguintes o abrem
+    via memory mapping. usar_cache=False (ou CACHE_DADOS_ATIVO=0) desativa.
+
+    columns/filters (DNF, ver leitura_colunar) são repassados ao pyarrow em
+    Parquet/Feather e ao cache; CSV sem cache é filtrado bloco a bloco.
+    sem_copia=True permite colunas Feather zero-copy (somente leitura).
+
+    Um diretório é lido como dataset Parquet particionado (ver
+    dataset_particionado): filtros nas colunas de partição (mes-ano, ano)
+    descartam diretórios inteiros e só as colunas pedidas são lidas.
     """
     # Verifica se é URL
     if path_or_buffer.startswith(("http://", "https://")):
@@ -84,20 +92,47 @@ def load_dataframe(path_or_buffer: str, **kwargs) -> pd.DataFrame:
                 # Mantém o caminho original (deixa falhar com erro claro)
                 path = Path(path_or_buffer)
         
+        if path.is_dir():
+            return ler_dataset_particionado(str(path), columns=columns, filters=filters)
+
         buffer = str(path)
         ext = path.suffix.lower().replace(".", "")
 
-    # Lê conforme extensão
+        if ext in EXTENSOES_CACHEAVEIS and cache_ativo(usar_cache) and path.is_file():
+            chave = chave_cache(buffer, ext, kwargs)
+            df = ler_do_cache(chave, columns=columns, filters=filters, sem_copia=sem_copia)
+            if df is None:
+                df = _ler_por_extensao(buffer, ext, **kwargs)
+                gravar_no_cache(df, chave)
+                df = filtrar_dataframe(df, columns, filters)
+            return df
+
+    return _ler_por_extensao(
+        buffer, ext, columns=columns, filters=filters, sem_copia=sem_copia, **kwargs
+    )
+
+
+def _ler_por_extensao(
+    buffer,
+    ext: str,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filtros] = None,
+    sem_copia: bool = False,
+    **kwargs,
+) -> pd.DataFrame:
+    """Lê caminho ou buffer com o parser correspondente à extensão."""
     if ext in ("csv", "txt"):
+        if columns is not None or filters:
+            return ler_csv_filtrado(buffer, columns=columns, filters=filters)
         return _read_csv_robust(buffer)
     elif ext in ("xls", "xlsx"):
-        return pd.read_excel(buffer, **kwargs)
+        return filtrar_dataframe(pd.read_excel(buffer, **kwargs), columns, filters)
     elif ext == "feather":
-        return pd.read_feather(buffer, **kwargs)
+        return ler_feather(buffer, columns=columns, filters=filters, sem_copia=sem_copia)
     elif ext == "parquet":
-        return pd.read_parquet(buffer, **kwargs)
+        return pd.read_parquet(buffer, columns=columns, filters=filters, **kwargs)
     elif ext in ("pkl", "pickle"):
-        return pd.read_pickle(buffer, **kwargs)
+        return filtrar_dataframe(pd.read_pickle(buffer, **kwargs), columns, filters)
     else:
         raise ValueError(f"Formato não suportado: {ext}")
 
@@ -0,0 +1,320 @@
+"""
+Projeção de colunas e filtros de linhas na leitura de DataFrames.
+
+Filtros seguem a convenção DNF do pyarrow/pandas:
+    [("coluna", "op", valor), ...]            -> AND entre as condições
+    [[(...), (...)], [(...)]]                 -> OR entre grupos de AND
+Operadores: ==, =, !=, <, <=, >, >=, in, not in.
+
+Parquet e Feather recebem projeção e filtros diretamente no pyarrow (dados
+descartados nunca são decodificados); CSV é filtrado bloco a bloco.
+"""
+import codecs
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+Filtro = Tuple[str, str, Any]
+Filtros = Sequence[Any]
+
+TAMANHO_BLOCO_CSV = 100_000
+TAMANHO_AMOSTRA_CSV = 4096
+
+_OPERADORES = {"==", "=", "!=", "<", "<=", ">", ">=", "in", "not in"}
+
+
+def normalizar_filtros(filters: Optional[Filtros]) -> Optional[List[List[Filtro]]]:
+    """Converte filtros para a forma DNF completa (lista de listas de tuplas)."""
+    if not filters:
+        return None
+    if all(isinstance(f, tuple) for f in filters):
+        grupos = [list(filters)]
+    else:
+        grupos = [list(grupo) for grupo in filters]
+    for grupo in grupos:
+        for coluna, operador, _ in grupo:
+            if operador not in _OPERADORES:
+                raise ValueError(f"Operador de filtro invalido: {operador} (coluna {coluna})")
+    return grupos
+
+
+def colunas_dos_filtros(filters: Optional[Filtros]) -> List[str]:
+    """Lista as colunas referenciadas pelos filtros (ordem de aparição)."""
+    colunas: List[str] = []
+    for grupo in normalizar_filtros(filters) or []:
+        for coluna, _, _ in grupo:
+            if coluna not in colunas:
+                colunas.append(coluna)
+    return colunas
+
+
+def filtros_para_expressao(filters: Optional[Filtros]):
+    """Converte filtros DNF em expressão pyarrow.compute (ou None)."""
+    grupos = normalizar_filtros(filters)
+    if grupos is None:
+        return None
+    import pyarrow.parquet as pq
+
+    conversor = getattr(pq, "filters_to_expression", None) or pq._filters_to_expression
+    return conversor(grupos)
+
+
+def _valor_eh_temporal(valor: Any) -> bool:
+    if isinstance(valor, (list, tuple, set)):
+        return any(_valor_eh_temporal(v) for v in valor)
+    return isinstance(valor, (pd.Timestamp, np.datetime64)) or hasattr(valor, "isoformat")
+
+
+def _mascara_condicao(df: pd.DataFrame, coluna: str, operador: str, valor: Any) -> np.ndarray:
+    serie = df[coluna]
+    if _valor_eh_temporal(valor):
+        valor = (
+            [pd.Timestamp(v) for v in valor]
+            if isinstance(valor, (list, tuple, set))
+            else pd.Timestamp(valor)
+        )
+        # Datas ainda em texto (CSV bruto) são comparadas como datas dia-primeiro
+        if not pd.api.types.is_datetime64_any_dtype(serie):
+            serie = pd.to_datetime(serie, errors="coerce", dayfirst=True)
+    if operador in {"==", "="}:
+        mascara = serie == valor
+    elif operador == "!=":
+        mascara = serie != valor
+    elif operador == "<":
+        mascara = serie < valor
+    elif operador == "<=":
+        mascara = serie <= valor
+    elif operador == ">":
+        mascara = serie > valor
+    elif operador == ">=":
+        mascara = serie >= valor
+    elif operador == "in":
+        mascara = serie.isin(list(valor))
+    else:
+        mascara = ~serie.isin(list(valor))
+    return np.asarray(mascara.fillna(False), dtype=bool)
+
+
+def mascara_filtros(df: pd.DataFrame, filters: Optional[Filtros]) -> np.ndarray:
+    """Avalia filtros DNF sobre um DataFrame já carregado."""
+    grupos = normalizar_filtros(filters)
+    if grupos is None:
+        return np.ones(len(df), dtype=bool)
+    mascara = np.zeros(len(df), dtype=bool)
+    for grupo in grupos:
+        mascara_grupo = np.ones(len(df), dtype=bool)
+        for coluna, operador, valor in grupo:
+            mascara_grupo &= _mascara_condicao(df, coluna, operador, valor)
+        mascara |= mascara_grupo
+    return mascara
+
+
+def filtrar_dataframe(
+    df: pd.DataFrame,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filtros] = None,
+) -> pd.DataFrame:
+    """Aplica filtros e projeção em um DataFrame já materializado."""
+    if filters:
+        df = df.loc[mascara_filtros(df, filters)].reset_index(drop=True)
+    if columns is not None:
+        df = df[list(columns)]
+    return df
+
+
+def _data_em_texto(esquema, filters: Optional[Filtros]) -> bool:
+    """Se algum filtro temporal cai numa coluna que não é data no arquivo (ex.: CSV em cache)."""
+    import pyarrow as pa
+
+    for grupo in normalizar_filtros(filters) or []:
+        for coluna, _, valor in grupo:
+            if not _valor_eh_temporal(valor) or coluna not in esquema.names:
+                continue
+            tipo = esquema.field(coluna).type
+            if not (pa.types.is_timestamp(tipo) or pa.types.is_date(tipo)):
+                return True
+    return False
+
+
+def _com_filtros(colunas: Optional[List[str]], filters: Optional[Filtros]) -> Optional[List[str]]:
+    if colunas is None:
+        return None
+    return list(dict.fromkeys(colunas + colunas_dos_filtros(filters)))
+
+
+def _filtrar_datas_em_texto(tabela, columns: Optional[Sequence[str]], filters: Optional[Filtros]) -> pd.DataFrame:
+    """
+    Filtros com datas em texto: o pyarrow não compara texto com data, então
+    a projeção vem do Arrow e os filtros de mascara_filtros (dia-primeiro).
+    """
+    tabela = tabela.select(_com_filtros(list(columns), filters)) if columns is not None else tabela
+    return filtrar_dataframe(tabela.to_pandas(), columns, filters)
+
+
+def ler_feather(
+    caminho_ou_buffer,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filtros] = None,
+    sem_copia: bool = False,
+) -> pd.DataFrame:
+    """
+    Lê Feather com memory mapping, projeção e filtros no pyarrow.
+
+    Args:
+        caminho_ou_buffer: Caminho local ou buffer binário
+        columns: Colunas a materializar (None = todas)
+        filters: Filtros DNF avaliados antes da conversão para pandas
+        sem_copia: Se True, colunas numéricas sem nulos viram views somente
+            leitura sobre o arquivo mapeado (zero-copy)
+
+    Filtros temporais sobre colunas gravadas como texto (datas do CSV bruto)
+    são avaliados em pandas, como em filtrar_dataframe.
+
+    Returns:
+        DataFrame com as colunas/linhas selecionadas
+    """
+    import pyarrow.dataset as ds
+    import pyarrow.feather as feather
+    import pyarrow.fs as pafs
+
+    colunas = list(columns) if columns is not None else None
+    if isinstance(caminho_ou_buffer, (str, os.PathLike)):
+        expressao = filtros_para_expressao(filters)
+        if expressao is None:
+            tabela = feather.read_table(str(caminho_ou_buffer), columns=colunas, memory_map=True)
+        else:
+            dataset = ds.dataset(
+                os.path.abspath(caminho_ou_buffer),
+                format="feather",
+                filesystem=pafs.LocalFileSystem(use_mmap=True),
+            )
+            if _data_em_texto(dataset.schema, filters):
+                return _filtrar_datas_em_texto(dataset.to_table(columns=_com_filtros(colunas, filters)), columns, filters)
+            tabela = dataset.to_table(columns=colunas, filter=expressao)
+    else:
+        tabela = feather.read_table(caminho_ou_buffer)
+        expressao = filtros_para_expressao(filters)
+        if expressao is not None and _data_em_texto(tabela.schema, filters):
+            return _filtrar_datas_em_texto(tabela, columns, filters)
+        if expressao is not None:
+            tabela = tabela.filter(expressao)
+        if colunas is not None:
+            tabela = tabela.select(colunas)
+
+    if sem_copia:
+        return tabela.to_pandas(split_blocks=True, self_destruct=True)
+    return tabela.to_pandas()
+
+
+def _detectar_delimitador(amostra: str) -> str:
+    import csv as _csv
+
+    try:
+        return _csv.Sniffer().sniff(amostra).delimiter
+    except Exception:
+        return ","
+
+
+def opcoes_csv(caminho_ou_buffer) -> Dict[str, str]:
+    """
+    Delimitador e codificação de um CSV, detectados nos primeiros 4 KB.
+
+    A leitura completa (io_local) e a filtrada usam as mesmas opções, para
+    interpretar o arquivo da mesma forma. Buffers voltam ao início.
+    """
+    if isinstance(caminho_ou_buffer, (str, os.PathLike)):
+        with open(caminho_ou_buffer, "rb") as arquivo:
+            amostra = arquivo.read(TAMANHO_AMOSTRA_CSV)
+    else:
+        amostra = caminho_ou_buffer.read(TAMANHO_AMOSTRA_CSV)
+        caminho_ou_buffer.seek(0)
+
+    codificacao = "utf-8"
+    if isinstance(amostra, bytes):
+        try:
+            # Decodificador incremental: a amostra pode cortar um caractere
+            amostra = codecs.getincrementaldecoder(codificacao)().decode(amostra)
+        except UnicodeDecodeError:
+            codificacao = "latin-1"
+            amostra = amostra.decode(codificacao)
+    return {"delimiter": _detectar_delimitador(amostra), "encoding": codificacao}
+
+
+def _ler_blocos_csv(
+    caminho_ou_buffer,
+    opcoes: Dict[str, str],
+    usecols: Optional[List[str]],
+    filters: Optional[Filtros],
+    tamanho_bloco: int,
+    dtype: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[pd.DataFrame], Dict[str, List[np.dtype]]]:
+    """Blocos filtrados e os dtypes que cada coluna teve em todos os blocos."""
+    if not isinstance(caminho_ou_buffer, (str, os.PathLike)):
+        caminho_ou_buffer.seek(0)
+    blocos, tipos = [], {}
+    leitor = pd.read_csv(
+        caminho_ou_buffer,
+        usecols=usecols,
+        dtype=dtype,
+        chunksize=tamanho_bloco,
+        on_bad_lines="warn",
+        **opcoes,
+    )
+    with leitor:
+        for bloco in leitor:
+            for coluna, tipo in bloco.dtypes.items():
+                tipos.setdefault(coluna, []).append(tipo)
+            if filters:
+                bloco = bloco.loc[mascara_filtros(bloco, filters)]
+            blocos.append(bloco)
+    return blocos, tipos
+
+
+def ler_csv_filtrado(
+    caminho_ou_buffer,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filtros] = None,
+    tamanho_bloco: int = TAMANHO_BLOCO_CSV,
+) -> pd.DataFrame:
+    """
+    Lê CSV em blocos, lendo só as colunas necessárias e filtrando cada bloco.
+
+    Apenas as linhas aprovadas pelos filtros de cada bloco são mantidas,
+    então a memória de pico é proporcional ao resultado + um bloco.
+
+    Delimitador e codificação são os da leitura completa (opcoes_csv) e o
+    dtype de cada coluna considera todos os blocos, inclusive os filtrados
+    por inteiro: o resultado é igual a ler o arquivo inteiro e filtrar.
+    Coluna numérica em um bloco e texto em outro é relida como texto.
+    """
+    opcoes = opcoes_csv(caminho_ou_buffer)
+
+    usecols = None
+    if columns is not None:
+        usecols = list(dict.fromkeys(list(columns) + colunas_dos_filtros(filters)))
+
+    blocos, tipos = _ler_blocos_csv(caminho_ou_buffer, opcoes, usecols, filters, tamanho_bloco)
+    mistas = [
+        coluna for coluna, tipos_coluna in tipos.items()
+        if any(t == object for t in tipos_coluna) and any(t.kind in "iuf" for t in tipos_coluna)
+    ]
+    if mistas:
+        blocos, tipos = _ler_blocos_csv(
+            caminho_ou_buffer, opcoes, usecols, filters, tamanho_bloco, dtype=dict.fromkeys(mistas, object)
+        )
+
+    if not blocos:
+        return pd.DataFrame(columns=usecols or [])
+    df = pd.concat(blocos, ignore_index=True)
+    # Inteiro em um bloco e real (com faltantes) em outro: real, como na leitura completa
+    numericas = {
+        coluna: np.result_type(*tipos_coluna)
+        for coluna, tipos_coluna in tipos.items()
+        if all(t.kind in "iuf" for t in tipos_coluna)
+    }
+    df = df.astype({c: t for c, t in numericas.items() if df[c].dtype != t})
+    if columns is not None:
+        df = df[list(columns)]
+    return df
\ No newline at end of file
@@ -0,0 +1,188 @@
+"""
+Transferência de DataFrames para processos via memória compartilhada.
+
+As colunas com buffer numpy (numéricas, booleanas, datetime64 e as
+nullable Int64/Float64/boolean, pelos arrays de dados e máscara) são
+copiadas uma única vez para um segmento multiprocessing.shared_memory. Os
+processos recebem só um descritor pequeno e leem as linhas de que precisam
+direto do segmento, sem serializar as colunas. As demais colunas (texto,
+object, category) não têm buffer fixo e seguem serializadas.
+"""
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Alinhamento dos arrays dentro do segmento
+_ALINHAMENTO = 64
+
+
+@dataclass(frozen=True)
+class ArrayCompartilhado:
+    """Posição de um array no segmento (deslocamento em bytes, dtype e tamanho)."""
+
+    deslocamento: int
+    dtype: str
+    tamanho: int
+
+
+@dataclass(frozen=True)
+class ColunaCompartilhada:
+    """Coluna no segmento: dados e, nas nullable, a máscara de faltantes."""
+
+    nome: str
+    dtype: str
+    dados: ArrayCompartilhado
+    mascara: Optional[ArrayCompartilhado] = None
+
+
+@dataclass(frozen=True)
+class QuadroCompartilhado:
+    """
+    Descritor serializável de um DataFrame publicado em memória compartilhada.
+
+    Não guarda dados: ler() anexa o segmento pelo nome e copia as linhas
+    pedidas. colunas mantém a ordem original; as ausentes de compartilhadas
+    precisam vir em ler(restantes=...).
+    """
+
+    segmento: str
+    colunas: Tuple[str, ...]
+    compartilhadas: Tuple[ColunaCompartilhada, ...]
+
+    def ler(
+        self,
+        posicoes: np.ndarray,
+        restantes: Optional[pd.DataFrame] = None,
+    ) -> pd.DataFrame:
+        """
+        DataFrame com as linhas posicoes (cópia, índice 0..n-1).
+
+        Args:
+            posicoes: Posições das linhas no DataFrame publicado
+            restantes: Colunas não compartilhadas, já restritas a posicoes
+
+        Returns:
+            DataFrame com as colunas na ordem original
+        """
+        memoria = shared_memory.SharedMemory(name=self.segmento)
+        try:
+            colunas = {
+                coluna.nome: _ler_coluna(memoria.buf, coluna, posicoes)
+                for coluna in self.compartilhadas
+            }
+        finally:
+            memoria.close()
+        indice = pd.RangeIndex(len(posicoes))
+        if restantes is not None:
+            for nome in restantes.columns:
+                colunas[nome] = restantes[nome].set_axis(indice)
+        return pd.DataFrame({nome: colunas[nome] for nome in self.colunas}, index=indice)
+
+
+def _array(buffer, local: ArrayCompartilhado) -> np.ndarray:
+    return np.ndarray(local.tamanho, dtype=np.dtype(local.dtype), buffer=buffer, offset=local.deslocamento)
+
+
+def _ler_coluna(buffer, coluna: ColunaCompartilhada, posicoes: np.ndarray) -> pd.Series:
+    # take copia: nada do resultado aponta para o segmento depois do close
+    dados = _array(buffer, coluna.dados).take(posicoes)
+    if coluna.mascara is None:
+        return pd.Series(dados, dtype=coluna.dtype, copy=False)
+    mascara = _array(buffer, coluna.mascara).take(posicoes)
+    dtype = pd.api.types.pandas_dtype(coluna.dtype)
+    return pd.Series(dtype.construct_array_type()(dados, mascara), copy=False)
+
+
+def _arrays_da_coluna(serie: pd.Series) -> Optional[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """(dados, mascara) com buffer numpy, ou None se a coluna não tiver um."""
+    dtype = serie.dtype
+    if isinstance(dtype, np.dtype):
+        return (serie.to_numpy(), None) if dtype.kind in "biufcmM" else None
+    valores = serie.array
+    if isinstance(valores, (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)):
+        return valores._data, valores._mask
+    return None
+
+
+class PublicacaoCompartilhada:
+    """
+    DataFrame publicado em memória compartilhada (gerenciador de contexto).
+
+    O segmento vive enquanto o bloco estiver aberto e é removido na saída;
+    os processos só devem ler dele dentro do bloco.
+
+        with PublicacaoCompartilhada(df) as publicacao:
+            pool.submit(funcao, publicacao.quadro, posicoes, publicacao.restantes(posicoes))
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        if df.columns.has_duplicates:
+            raise ValueError("Colunas duplicadas não podem ser publicadas")
+        blocos: List[Tuple[str, np.ndarray, Optional[np.ndarray]]] = []
+        nao_compartilhadas = []
+        for nome in df.columns:
+            arrays = _arrays_da_coluna(df[nome])
+            if arrays is None:
+                nao_compartilhadas.append(nome)
+            else:
+                blocos.append((nome, *arrays))
+
+        tamanho = 0
+        locais = []
+        for _, dados, mascara in blocos:
+            posicoes_arrays = []
+            for array in (dados, mascara):
+                if array is None:
+                    posicoes_arrays.append(None)
+                    continue
+                tamanho = -(-tamanho // _ALINHAMENTO) * _ALINHAMENTO
+                posicoes_arrays.append(ArrayCompartilhado(tamanho, array.dtype.str, len(array)))
+                tamanho += array.nbytes
+            locais.append(posicoes_arrays)
+
+        self._memoria = shared_memory.SharedMemory(create=True, size=max(tamanho, 1))
+        compartilhadas = []
+        for (nome, dados, mascara), (local_dados, local_mascara) in zip(blocos, locais):
+            _array(self._memoria.buf, local_dados)[:] = dados
+            if mascara is not None:
+                _array(self._memoria.buf, local_mascara)[:] = mascara
+            compartilhadas.append(
+                ColunaCompartilhada(nome, str(df[nome].dtype), local_dados, local_mascara)
+            )
+
+        self.quadro = QuadroCompartilhado(
+            segmento=self._memoria.name,
+            colunas=tuple(df.columns),
+            compartilhadas=tuple(compartilhadas),
+        )
+        self._restantes = df[nao_compartilhadas]
+
+    @property
+    def colunas_serializadas(self) -> List[str]:
+        """Colunas que não couberam no segmento (vão serializadas)."""
+        return list(self._restantes.columns)
+
+    def restantes(self, posicoes: Sequence[int]) -> Optional[pd.DataFrame]:
+        """Colunas não compartilhadas nas linhas posicoes (None se não houver)."""
+        if not len(self._restantes.columns):
+            return None
+        return self._restantes.iloc[np.asarray(posicoes)]
+
+    def fechar(self) -> None:
+        """Libera e remove o segmento."""
+        if self._memoria is not None:
+            self._memoria.close()
+            self._memoria.unlink()
+            self._memoria = None
+
+    def __enter__(self) -> "PublicacaoCompartilhada":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.fechar()
+
+
+__all__ = ["PublicacaoCompartilhada", "QuadroCompartilhado"]
@@ -60,3 +60,19 @@ class TestAplicarCodificacaoLabel:
         aplicar_codificacao_rotulos(df, ["col"])
         
         pd.testing.assert_frame_equal(df, df_original)
+
+    def test_inferencia_com_vocabulario_e_hashing(self):
+        """Testa que vocabulários ajustados são reaplicados e o hashing tem prioridade"""
+        from src.features.codificacao.aplicar_codificacao_rotulos import aplicar_codificacao_rotulos
+        from src.features.codificacao.codificar_label import CODIGO_DESCONHECIDO
+
+        treino = pd.DataFrame({"sexo": ["m", "f", "m"], "id": ["a", "b", "c"]})
+        _, vocabularios = aplicar_codificacao_rotulos(treino, ["sexo", "id"], buckets_hash={"id": 8})
+
+        novo = pd.DataFrame({"sexo": ["f", "x"], "id": ["a", "zz"]})
+        df_resultado, _ = aplicar_codificacao_rotulos(
+            novo, ["sexo", "id"], vocabularios=vocabularios, buckets_hash={"id": 8}
+        )
+
+        assert df_resultado["sexo_cod"].tolist() == [1, CODIGO_DESCONHECIDO]
+        assert df_resultado["id_cod"].between(0, 7).all()
@@ -62,3 +62,39 @@ def test_aplicar_dummy_valores_binarios(df_categorico):
     colunas_dummy = [c for c in resultado.columns if c.startswith('cor_')]
     for col in colunas_dummy:
         assert resultado[col].isin([0, 1]).all()
+
+
+def test_aplicar_dummy_esparso_igual_ao_get_dummies(df_categorico):
+    """Testa que o modo esparso gera as mesmas colunas SparseDtype do get_dummies."""
+    resultado = aplicar_dummy(df_categorico, ['cor', 'tamanho'], esparso=True)
+    esperado = pd.get_dummies(df_categorico, columns=['cor', 'tamanho'], sparse=True)
+
+    pd.testing.assert_frame_equal(resultado, esperado)
+    assert all(isinstance(t, pd.SparseDtype) for t in resultado.filter(like='cor_').dtypes)
+
+
+def test_aplicar_dummy_com_categorias_do_treino(df_categorico):
+    """Testa que as categorias persistidas definem exatamente as colunas geradas."""
+    from src.features.codificacao.aplicar_dummy import categorias_dummy
+
+    categorias = categorias_dummy(df_categorico, ['cor'])
+    novo = pd.DataFrame({'cor': ['verde', 'roxo'], 'valor': [1, 2]})
+
+    resultado = aplicar_dummy(novo, ['cor'], categorias=categorias)
+
+    assert list(resultado.columns) == ['valor', 'cor_azul', 'cor_verde', 'cor_vermelho']
+    assert resultado.loc[0, 'cor_verde']
+    assert not resultado.iloc[1, 1:].any()  # categoria desconhecida zera todas
+
+
+def test_matriz_esparsa_sem_densificar(df_categorico):
+    """Testa a conversão das dummies esparsas em matriz CSR com nomes."""
+    from src.features.codificacao.aplicar_dummy import matriz_esparsa
+
+    df = aplicar_dummy(df_categorico.drop(columns='tamanho'), ['cor'], esparso=True)
+    matriz, nomes = matriz_esparsa(df)
+
+    assert nomes == ['valor', 'cor_azul', 'cor_verde', 'cor_vermelho']
+    assert matriz.format == 'csr'
+    esperado = pd.get_dummies(df_categorico.drop(columns='tamanho'), columns=['cor']).astype(float)
+    assert (matriz.toarray() == esperado.to_numpy()).all()
@@ -47,3 +47,44 @@ class TestCodificarLabel:
         # Verifica se podemos reverter o código para categoria
         for codigo, categoria_original in zip(codigos, serie):
             assert mapeamento[int(codigo)] == str(categoria_original)
+
+    def test_vocabulario_mantem_codigos_e_marca_desconhecidas(self):
+        """Testa que categorias fora do vocabulário recebem o código reservado"""
+        from src.features.codificacao.codificar_label import CODIGO_DESCONHECIDO, codificar_label
+
+        serie = pd.Series(["B", "Z", None, "A"])
+        codigos, mapeamento = codificar_label(serie, vocabulario=["A", "B", "__faltante__"])
+
+        assert codigos.tolist() == [1, CODIGO_DESCONHECIDO, 2, 0]
+        assert mapeamento == {0: "A", 1: "B", 2: "__faltante__"}
+
+    def test_vocabulario_estendido(self):
+        """Testa que estender acrescenta as categorias novas em ordem de aparição"""
+        from src.features.codificacao.codificar_label import codificar_label
+
+        serie = pd.Series(["C", "A", "D", "C"])
+        codigos, mapeamento = codificar_label(serie, vocabulario=["A", "B"], estender=True)
+
+        assert codigos.tolist() == [2, 0, 3, 2]
+        assert mapeamento == {0: "A", 1: "B", 2: "C", 3: "D"}
+
+    def test_modo_hashing_estavel(self):
+        """Testa que o hashing dá códigos no intervalo e iguais entre chamadas"""
+        from src.features.codificacao.codificar_label import codificar_label
+
+        serie = pd.Series([f"cat{i}" for i in range(200)])
+        codigos, _ = codificar_label(serie, n_buckets_hash=16)
+        outra_ordem, _ = codificar_label(serie[::-1], n_buckets_hash=16)
+
+        assert codigos.between(0, 15).all()
+        assert codigos.tolist() == outra_ordem[::-1].tolist()
+
+    def test_textos_distintos_em_coluna_object(self):
+        """Testa que 1, 1.0 e True continuam categorias diferentes"""
+        from src.features.codificacao.codificar_label import codificar_label
+
+        serie = pd.Series([1, 1.0, True, "1"], dtype=object)
+        codigos, mapeamento = codificar_label(serie)
+
+        assert codigos.tolist() == [0, 1, 2, 0]
+        assert mapeamento == {0: "1", 1: "1.0", 2: "True"}
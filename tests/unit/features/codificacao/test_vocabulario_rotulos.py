@@ -0,0 +1,49 @@
+"""
+Testes unitários para a persistência de vocabulários de codificação.
+"""
+import json
+
+import pandas as pd
+import pytest
+
+from src.features.codificacao import (
+    CODIGO_DESCONHECIDO,
+    aplicar_codificacao_rotulos,
+    carregar_vocabulario,
+    salvar_vocabulario,
+)
+
+
+@pytest.mark.unit
+class TestVocabularioRotulos:
+    """Testes para salvar_vocabulario e carregar_vocabulario"""
+
+    def test_ida_e_volta_preserva_codigos(self, tmp_path):
+        """Testa que a inferência com o vocabulário salvo repete os códigos do treino"""
+        treino = pd.DataFrame({"sexo": ["m", None, "f", "m"], "cidade": ["x", "y", "x", "z"]})
+        df_treino, mapeamentos = aplicar_codificacao_rotulos(
+            treino, ["sexo", "cidade"], buckets_hash={"cidade": 4}
+        )
+
+        caminho = salvar_vocabulario(mapeamentos, tmp_path / "vocab.json", buckets_hash={"cidade": 4})
+        vocabularios, buckets = carregar_vocabulario(caminho)
+
+        assert "cidade" not in vocabularios
+        assert buckets == {"cidade": 4}
+        df_inferencia, _ = aplicar_codificacao_rotulos(
+            treino, ["sexo", "cidade"], vocabularios=vocabularios, buckets_hash=buckets
+        )
+        pd.testing.assert_frame_equal(df_inferencia, df_treino)
+
+        novo, _ = aplicar_codificacao_rotulos(
+            pd.DataFrame({"sexo": ["outro"]}), ["sexo"], vocabularios=vocabularios
+        )
+        assert novo["sexo_cod"].tolist() == [CODIGO_DESCONHECIDO]
+
+    def test_versao_desconhecida(self, tmp_path):
+        """Testa erro ao ler arquivo de versão não suportada"""
+        caminho = tmp_path / "vocab.json"
+        caminho.write_text(json.dumps({"versao": 99, "categorias": {}}), encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            carregar_vocabulario(caminho)
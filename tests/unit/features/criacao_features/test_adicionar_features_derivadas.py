@@ -36,6 +36,23 @@ class TestAdicionarFeaturesDerivadas:
         
         assert "heat_index" in df_resultado.columns
         
+    def test_tu_stull_preenche_faltantes(self):
+        """tu_stull preenche só os faltantes de tu (dentro do domínio)"""
+        from src.features.criacao_features.adicionar_features_derivadas import adicionar_features_derivadas
+        from src.features.criacao_features.calcular_tu_stull import calcular_tu_stull
+        
+        df = pd.DataFrame({
+            "tmedia": [25.0, 30.0, 30.0],
+            "ur": [60.0, 70.0, 2.0],
+            "tu": [20.0, None, None],
+        })
+        
+        df_resultado = adicionar_features_derivadas(df, ["tu_stull"])
+        
+        assert df_resultado["tu"].iloc[0] == 20.0
+        assert df_resultado["tu"].iloc[1] == calcular_tu_stull(30.0, 70.0)
+        assert pd.isna(df_resultado["tu"].iloc[2])
+        
     def test_multiplas_features(self):
         """Testa adição de múltiplas features"""
         from src.features.criacao_features.adicionar_features_derivadas import adicionar_features_derivadas
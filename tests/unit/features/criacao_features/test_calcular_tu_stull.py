@@ -2,7 +2,12 @@
 import pytest
 import pandas as pd
 import numpy as np
-from src.features.criacao_features.calcular_tu_stull import calcular_tu_stull
+from src.features.criacao_features.calcular_tu_stull import (
+    calcular_tu_stull,
+    calcular_tu_stull_vetorizado,
+    dominio_stull,
+    preencher_tu_stull,
+)
 
 
 def test_calcular_tu_stull():
@@ -15,3 +20,38 @@ def test_calcular_tu_stull():
     # Valor esperado aproximado para T=25°C e UR=60%
     assert 10.0 < result < 25.0
 
+
+def test_vetorizado_igual_ao_escalar():
+    """A versão vetorizada reproduz a escalar (até 1 ulp; faltantes iguais)."""
+    rng = np.random.default_rng(0)
+    temperatura = rng.uniform(-30, 60, 5000)
+    umidade = rng.uniform(0, 100, 5000)
+    temperatura[::17] = np.nan
+    umidade[::23] = np.nan
+    
+    vetor = calcular_tu_stull_vetorizado(pd.Series(temperatura), umidade)
+    escalar = np.array([calcular_tu_stull(t, u) for t, u in zip(temperatura.tolist(), umidade.tolist())])
+    
+    np.testing.assert_array_equal(np.isnan(vetor), np.isnan(escalar))
+    np.testing.assert_allclose(vetor, escalar, rtol=0, atol=1e-13)
+
+
+def test_dominio_stull():
+    mascara = dominio_stull([25.0, -25.0, 25.0, np.nan], pd.array([60, 60, 100, 60], dtype="Int64"))
+    assert mascara.tolist() == [True, False, False, False]
+
+
+def test_preencher_tu_stull():
+    """Só faltantes com entradas válidas e dentro do domínio recebem valor."""
+    df = pd.DataFrame({
+        "tmedia": [25.0, 25.0, 25.0, np.nan],
+        "ur": [60.0, 60.0, 100.0, 60.0],
+        "tu": [18.0, np.nan, np.nan, np.nan],
+    })
+    
+    resultado = preencher_tu_stull(df)
+    
+    assert resultado["tu"].iloc[0] == 18.0
+    assert resultado["tu"].iloc[1] == pytest.approx(calcular_tu_stull(25.0, 60.0), rel=0, abs=1e-13)
+    assert resultado["tu"].iloc[2:].isna().all()
+    assert df["tu"].isna().sum() == 3
@@ -0,0 +1,102 @@
+"""Testes para NormalizadorIncremental."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.normalizacao.normalizador_incremental import NormalizadorIncremental
+from src.features.normalizacao.normalizar import normalizar
+
+
+@pytest.fixture
+def df_grupos():
+    rng = np.random.default_rng(0)
+    n = 600
+    df = pd.DataFrame({
+        "mes-ano": rng.choice(["2015-01", "2015-02", "2015-03", "2015-04"], n),
+        "tmedia": rng.normal(25, 5, n),
+        "ur": rng.uniform(30, 100, n),
+    })
+    df.loc[rng.choice(n, 40, replace=False), "ur"] = np.nan
+    # Grupo com uma unica linha (desvio indefinido)
+    df.loc[n] = ["2015-05", 20.0, 50.0]
+    return df
+
+
+def test_incremental_igual_ajuste_completo(df_grupos):
+    """Atualizacoes em lotes coincidem com normalizar no dataset inteiro."""
+    cols = ["tmedia", "ur"]
+    esperado, scalers_esperados = normalizar(
+        df_grupos, {c: "standard" for c in cols}, agrupamento="mes-ano", sufixo="_norm"
+    )
+
+    norm = NormalizadorIncremental(cols, agrupamento="mes-ano")
+    for lote in np.array_split(df_grupos, 5):
+        norm.atualizar(lote)
+    resultado = norm.transformar(df_grupos)
+
+    for col in cols:
+        np.testing.assert_allclose(
+            resultado[f"{col}_norm"], esperado[f"{col}_norm"], rtol=1e-9, atol=1e-12
+        )
+    scalers = norm.scalers()
+    assert list(scalers) == list(scalers_esperados)
+    for grupo, infos in scalers_esperados.items():
+        for col, info in infos.items():
+            assert scalers[grupo][col]["mean"] == pytest.approx(info["mean"])
+            assert scalers[grupo][col]["std"] == pytest.approx(info["std"])
+
+
+def test_atualizar_retorna_grupos_afetados(df_grupos):
+    norm = NormalizadorIncremental(["tmedia"])
+    norm.atualizar(df_grupos[df_grupos["mes-ano"] != "2015-05"])
+    afetados = norm.atualizar(df_grupos[df_grupos["mes-ano"] == "2015-05"])
+    assert afetados == ["2015-05"]
+    assert "2015-05" in norm.grupos
+
+    parcial = norm.transformar(df_grupos, grupos=afetados)
+    fora = parcial["mes-ano"] != "2015-05"
+    assert parcial.loc[fora, "tmedia_norm"].isna().all()
+    assert (parcial.loc[~fora, "tmedia_norm"] == 0.0).all()
+
+
+def test_mesclar_particoes(df_grupos):
+    """Estados de particoes mescladas equivalem a um unico ajuste."""
+    cols = ["tmedia", "ur"]
+    metade = len(df_grupos) // 2
+    a = NormalizadorIncremental(cols)
+    a.atualizar(df_grupos.iloc[:metade])
+    b = NormalizadorIncremental(cols)
+    b.atualizar(df_grupos.iloc[metade:])
+    completo = NormalizadorIncremental(cols)
+    completo.atualizar(df_grupos)
+
+    a.mesclar(b)
+    media_a, desvio_a = a.medias_desvios()
+    media_c, desvio_c = completo.medias_desvios()
+    pd.testing.assert_frame_equal(media_a, media_c, rtol=1e-12)
+    pd.testing.assert_frame_equal(desvio_a, desvio_c, rtol=1e-12)
+    pd.testing.assert_frame_equal(a._estatisticas["minimo"], completo._estatisticas["minimo"])
+    pd.testing.assert_frame_equal(a._estatisticas["maximo"], completo._estatisticas["maximo"])
+
+
+def test_mesclar_colunas_diferentes(df_grupos):
+    a = NormalizadorIncremental(["tmedia"])
+    a.atualizar(df_grupos)
+    b = NormalizadorIncremental(["ur"])
+    b.atualizar(df_grupos)
+    with pytest.raises(ValueError):
+        a.mesclar(b)
+
+
+def test_serializacao(df_grupos):
+    norm = NormalizadorIncremental(["tmedia", "ur"])
+    norm.atualizar(df_grupos)
+    restaurado = NormalizadorIncremental.de_dict(norm.para_dict())
+    pd.testing.assert_frame_equal(
+        restaurado.transformar(df_grupos), norm.transformar(df_grupos)
+    )
+
+
+def test_transformar_sem_estado():
+    with pytest.raises(ValueError):
+        NormalizadorIncremental(["x"]).transformar(pd.DataFrame({"x": [1.0], "mes-ano": ["a"]}))
@@ -37,3 +37,73 @@ def test_normalizar_com_agrupamento():
     assert isinstance(scalers, dict)
     assert 'A' in scalers
     assert 'B' in scalers
+
+
+@pytest.fixture
+def df_grupos():
+    rng = np.random.default_rng(42)
+    n = 300
+    df = pd.DataFrame({
+        'a': rng.normal(20, 5, n),
+        'b': rng.normal(60, 10, n),
+        'c': pd.array(rng.integers(-3, 4, n), dtype='Int64'),
+        'const': 1.0,
+        'mes-ano': rng.choice(['2015-08', '2015-09', '2016-01', None], n),
+    })
+    df.loc[::7, 'b'] = np.nan
+    df.loc[0, 'mes-ano'] = '2017-01'  # grupo com uma única linha
+    return df
+
+
+def _assert_infos_iguais(esperado, obtido):
+    assert list(esperado) == list(obtido)
+    for grupo in esperado:
+        info_e, info_o = esperado[grupo], obtido[grupo]
+        if 'mean' in info_e:
+            info_e, info_o = {'_': info_e}, {'_': info_o}
+        assert list(info_e) == list(info_o)
+        for col in info_e:
+            np.testing.assert_allclose(
+                [info_e[col]['mean'], info_e[col]['std']],
+                [info_o[col]['mean'], info_o[col]['std']],
+                rtol=1e-12,
+            )
+
+
+@pytest.mark.parametrize('colunas', [None, ['a'], ['a', 'b', 'const']])
+def test_normalizar_vetorizado_igual_ao_laco(df_grupos, colunas):
+    """Caminho vetorizado reproduz valores e scaler info do laço por grupo."""
+    esperado_df, esperado_info = normalizar(
+        df_grupos, colunas, agrupamento='mes-ano', sufixo='_norm', vetorizado=False
+    )
+    obtido_df, obtido_info = normalizar(df_grupos, colunas, agrupamento='mes-ano', sufixo='_norm')
+
+    pd.testing.assert_frame_equal(obtido_df, esperado_df, check_exact=False, rtol=1e-12)
+    _assert_infos_iguais(esperado_info, obtido_info)
+
+
+def test_normalizar_vetorizado_dicionario(df_grupos):
+    """Caminho por dicionário (métodos mistos) mantém formato {grupo: {coluna: info}}."""
+    colunas = {'a': 'standard', 'b': 'minmax', 'const': 'standard'}
+    esperado_df, esperado_info = normalizar(
+        df_grupos, colunas, agrupamento='mes-ano', sufixo='_norm', vetorizado=False
+    )
+    obtido_df, obtido_info = normalizar(df_grupos, colunas, agrupamento='mes-ano', sufixo='_norm')
+
+    pd.testing.assert_frame_equal(obtido_df, esperado_df, check_exact=False, rtol=1e-12)
+    assert list(obtido_info) == list(esperado_info)
+    for grupo in esperado_info:
+        assert list(obtido_info[grupo]) == ['a', 'b', 'const']
+        assert obtido_info[grupo]['a'] == pytest.approx(esperado_info[grupo]['a'])
+        np.testing.assert_allclose(
+            obtido_info[grupo]['b'].data_min_, esperado_info[grupo]['b'].data_min_
+        )
+
+
+def test_normalizar_vetorizado_grupo_constante_zera(df_grupos):
+    """Grupo sem variância (ou com uma linha) resulta em 0.0."""
+    df, info = normalizar(df_grupos, ['a', 'const'], agrupamento='mes-ano', sufixo='_norm')
+
+    assert (df['const_norm'].dropna() == 0.0).all()
+    assert df.loc[0, 'a_norm'] == 0.0
+    assert info['2017-01']['a']['std'] == 0.0
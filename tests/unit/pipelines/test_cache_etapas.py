@@ -0,0 +1,105 @@
+"""
+Testes unitários para cache_etapas.py
+"""
+import os
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipelines.cache_etapas import (
+    aplicar_limite_lru_etapas,
+    cache_etapas_ativo,
+    chave_etapa,
+    executar_etapa_com_cache,
+    gravar_etapa,
+    impressao_digital,
+    ler_etapa,
+    limpar_cache_etapas,
+)
+
+
+@pytest.fixture
+def df_exemplo():
+    return pd.DataFrame({
+        "a": [1.0, 2.0, np.nan],
+        "b": pd.array([1, None, 3], dtype="Int64"),
+        "c": ["x", None, "z"],
+        "d": pd.to_datetime(["2020-01-01", "2020-02-01", None]),
+    })
+
+
+def test_impressao_digital_detecta_mudancas(df_exemplo):
+    base = impressao_digital(df_exemplo)
+    assert impressao_digital(df_exemplo.copy()) == base
+
+    alterado = df_exemplo.copy()
+    alterado.loc[1, "c"] = "y"
+    assert impressao_digital(alterado) != base
+    assert impressao_digital(df_exemplo.astype({"a": "float32"})) != base
+    assert impressao_digital(df_exemplo.rename(columns={"a": "A"})) != base
+    assert impressao_digital(df_exemplo.set_index(pd.Index([5, 6, 7]))) != base
+
+
+def test_chave_depende_de_parametros_e_codigo(df_exemplo, tmp_path):
+    fonte = tmp_path / "etapa.py"
+    fonte.write_text("x = 1\n")
+    with patch("src.pipelines.cache_etapas._RAIZ_PROJETO", tmp_path):
+        chave = chave_etapa("teste", df_exemplo, {"p": 1}, fontes=["etapa.py"])
+        assert chave_etapa("teste", df_exemplo, {"p": 2}, fontes=["etapa.py"]) != chave
+        fonte.write_text("x = 22\n")
+        assert chave_etapa("teste", df_exemplo, {"p": 1}, fontes=["etapa.py"]) != chave
+
+
+def test_executar_com_cache_reaproveita_resultado(df_exemplo, tmp_path):
+    chamadas = []
+
+    def etapa():
+        chamadas.append(1)
+        return df_exemplo.assign(e=1), {"artefato": [1, 2]}
+
+    r1, chave1 = executar_etapa_com_cache(
+        "teste", etapa, df_exemplo, {"p": 1}, usar_cache=True, diretorio=str(tmp_path)
+    )
+    r2, chave2 = executar_etapa_com_cache(
+        "teste", etapa, df_exemplo, {"p": 1}, usar_cache=True, diretorio=str(tmp_path)
+    )
+    assert chave1 == chave2
+    assert len(chamadas) == 1
+    pd.testing.assert_frame_equal(r1[0], r2[0])
+    assert r2[1] == {"artefato": [1, 2]}
+
+    executar_etapa_com_cache("teste", etapa, df_exemplo, {"p": 2}, usar_cache=True, diretorio=str(tmp_path))
+    assert len(chamadas) == 2
+
+
+def test_cache_desativado_nao_grava(df_exemplo, tmp_path, monkeypatch):
+    monkeypatch.delenv("CACHE_ETAPAS_ATIVO", raising=False)
+    assert not cache_etapas_ativo()
+    resultado, chave = executar_etapa_com_cache(
+        "teste", lambda: 42, df_exemplo, diretorio=str(tmp_path)
+    )
+    assert resultado == 42 and chave is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_entrada_corrompida_e_descartada(tmp_path):
+    (tmp_path / "abc.joblib").write_bytes(b"lixo")
+    assert ler_etapa("abc", str(tmp_path)) is None
+    assert not (tmp_path / "abc.joblib").exists()
+
+
+def test_limite_lru_remove_menos_usadas(tmp_path):
+    dados = np.zeros(200_000)  # ~1.6 MB por entrada
+    for i, chave in enumerate(["antiga", "media", "nova"]):
+        caminho = gravar_etapa(dados, chave, str(tmp_path), limite_mb=100)
+        os.utime(caminho, (time.time() - 100 + i, time.time() - 100 + i))
+
+    ler_etapa("antiga", str(tmp_path))  # uso recente protege a entrada
+    removidas = aplicar_limite_lru_etapas(str(tmp_path), limite_mb=3.5)
+    assert removidas == 1
+    assert not (tmp_path / "media.joblib").exists()
+    assert (tmp_path / "antiga.joblib").exists()
+    assert limpar_cache_etapas(str(tmp_path)) == 2
@@ -0,0 +1,64 @@
+"""
+Testes unitários para execucao_particionada.py
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipelines.execucao_particionada import (
+    executar_particionado,
+    medir_escalabilidade_features,
+    particoes_por_grupo,
+)
+
+
+def _somar_media(df):
+    return df.assign(centrado=df["x"] - df["x"].mean()), {df["g"].iloc[0]: len(df)}
+
+
+@pytest.fixture
+def df_grupos():
+    return pd.DataFrame(
+        {
+            "g": ["b", "a", None, "b", "a", "b"],
+            "x": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "n": pd.array([1, None, 3, 4, 5, 6], dtype="Int64"),
+        },
+        index=[10, 11, 12, 13, 14, 15],
+    )
+
+
+def test_particoes_ordenadas_com_nulos_ao_final(df_grupos):
+    particoes = particoes_por_grupo(df_grupos, "g")
+
+    assert [p.tolist() for p in particoes] == [[1, 4], [0, 3, 5], [2]]
+
+
+@pytest.mark.parametrize("n_trabalhadores", [1, 2])
+def test_executar_particionado_restaura_ordem(df_grupos, n_trabalhadores):
+    particoes = particoes_por_grupo(df_grupos, "g")
+
+    resultado, artefatos = executar_particionado(df_grupos, particoes, _somar_media, n_trabalhadores)
+
+    esperado = df_grupos.assign(
+        centrado=df_grupos["x"] - df_grupos.groupby("g", dropna=False)["x"].transform("mean")
+    )
+    pd.testing.assert_frame_equal(resultado, esperado)
+    assert artefatos == [{"a": 2}, {"b": 3}, {None: 1}]
+
+
+def test_executar_particionado_exige_cobertura(df_grupos):
+    with pytest.raises(ValueError, match="cobrir"):
+        executar_particionado(df_grupos, [np.array([0, 1])], _somar_media)
+
+
+def test_relatorio_escalabilidade(df_grupos):
+    df = df_grupos.dropna(subset=["g"]).rename(columns={"g": "mes-ano"})
+
+    relatorio = medir_escalabilidade_features(
+        df, trabalhadores=[1, 2], repeticoes=1, aplicar_codificacao=False
+    )
+
+    assert list(relatorio["trabalhadores"]) == [1, 2]
+    assert {"segundos", "aceleracao", "eficiencia", "linhas", "particoes"} <= set(relatorio.columns)
+    assert relatorio["particoes"].iloc[0] == 2
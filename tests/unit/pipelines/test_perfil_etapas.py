@@ -0,0 +1,99 @@
+"""
+Testes unitários para perfil_etapas.py
+"""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipelines.perfil_etapas import PERFIL_INATIVO, PerfilEtapas
+from src.pipelines.pipeline_completo import executar_pipeline_completo
+from src.pipelines.pipeline_processamento import executar_pipeline_processamento
+
+
+@pytest.fixture
+def df_bruto():
+    n = 30
+    return pd.DataFrame({
+        "DATA": [f"{d}/1/2020" for d in range(1, n + 1)],
+        "HORA": ["09:10"] * n,
+        "IDADE": [str(20 + i) for i in range(n)],
+        "SEXO": ["m", "f"] * (n // 2),
+        "TMEDIA": [str(20 + i / 10) for i in range(n)],
+    })
+
+
+@pytest.mark.parametrize("memoria", ["rss", "tracemalloc", None])
+def test_etapas_aninhadas(memoria):
+    perfil = PerfilEtapas(medir_memoria=memoria)
+    df = pd.DataFrame({"a": np.arange(1000)})
+    with perfil.etapa("total", df) as total:
+        with perfil.etapa("dobrar", df) as medicao:
+            saida = df.assign(b=np.ones(100_000)[:1000] * 2)
+            medicao.saida(saida)
+        total.saida(saida.iloc[:10])
+
+    dobrar, externo = perfil.eventos
+    assert dobrar["caminho"] == "total/dobrar" and dobrar["nivel"] == 1
+    assert dobrar["colunas_criadas"] == ["b"]
+    assert (externo["linhas_entrada"], externo["linhas_saida"]) == (1000, 10)
+    assert externo["duracao_s"] >= dobrar["duracao_s"] >= 0
+    if memoria is None:
+        assert externo["pico_memoria_bytes"] is None
+    else:
+        assert externo["pico_memoria_bytes"] >= dobrar["pico_memoria_bytes"] >= 0
+    if memoria == "tracemalloc":
+        # Array temporário de 800 KB entra no pico das duas etapas
+        assert dobrar["pico_memoria_bytes"] >= 800_000
+
+
+def test_memoria_invalida():
+    with pytest.raises(ValueError):
+        PerfilEtapas(medir_memoria="heap")
+
+
+def test_perfil_inativo_nao_registra():
+    with PERFIL_INATIVO.etapa("x", pd.DataFrame()) as medicao:
+        medicao.saida(pd.DataFrame({"a": [1]}))
+    assert not PERFIL_INATIVO.ativo
+
+
+def test_pipeline_completo_gera_json_e_chrome_trace(df_bruto, tmp_path):
+    perfil = PerfilEtapas()
+    esperado, _ = executar_pipeline_completo(df_bruto, colunas_float=["tmedia"], colunas_int=["idade"])
+    resultado, _ = executar_pipeline_completo(
+        df_bruto, colunas_float=["tmedia"], colunas_int=["idade"], perfil=perfil
+    )
+    pd.testing.assert_frame_equal(resultado, esperado)
+
+    caminhos = perfil.resumo()["caminho"].tolist()
+    assert caminhos[:3] == [
+        "pipeline_completo",
+        "pipeline_completo/processamento",
+        "pipeline_completo/processamento/limpeza_conversao",
+    ]
+    assert "pipeline_completo/features/normalizacao" in caminhos
+
+    dados = json.loads(perfil.salvar_json(tmp_path / "perfil.json").read_text(encoding="utf-8"))
+    assert len(dados["eventos"]) == len(caminhos)
+
+    trace = json.loads(perfil.salvar_chrome_trace(tmp_path / "trace.json").read_text(encoding="utf-8"))
+    evento = trace["traceEvents"][0]
+    assert evento["ph"] == "X" and evento["name"] == "pipeline_completo"
+    assert evento["args"]["linhas_saida"] == len(df_bruto)
+
+
+def test_relatorio_compactacao_no_perfil(df_bruto, tmp_path):
+    perfil = PerfilEtapas(medir_memoria=None)
+    executar_pipeline_processamento(
+        df_bruto, colunas_float=["tmedia"], colunas_int=["idade"], compactar_memoria=True, perfil=perfil
+    )
+
+    evento = next(e for e in perfil.eventos if e["caminho"] == "processamento/compactacao")
+    relatorio = pd.DataFrame(evento["relatorio_compactacao"])
+    assert {"coluna", "dtype_antes", "dtype_depois", "bytes_antes", "bytes_depois"} <= set(relatorio.columns)
+    assert relatorio["bytes_depois"].sum() <= relatorio["bytes_antes"].sum()
+    dados = json.loads(perfil.salvar_json(tmp_path / "perfil.json").read_text(encoding="utf-8"))
+    salvo = next(e for e in dados["eventos"] if e["caminho"] == "processamento/compactacao")
+    assert salvo["relatorio_compactacao"] == evento["relatorio_compactacao"]
@@ -45,3 +45,72 @@ def test_pipeline_completo_mock(mock_treino, mock_features, mock_proc, df_exempl
     
     # Verifica resultado
     assert 'melhor_modelo' in resultado
+
+
+def test_separar_clima_igual_ao_pipeline_por_linha():
+    """Tabelas de clima/respondentes dão o mesmo resultado (até arredondamento)."""
+    from src.pipelines.pipeline_completo import executar_pipeline_completo
+
+    instantes = [("5/8/2015", "09:10"), ("5/8/2015", "09:20"), ("5/8/2015", "09:40"), ("6/8/2015", "10:00")]
+    clima = [("19,5", "80", "300"), ("20,1", "78", "-"), ("21,0", "75", "320"), ("18,2", "90", "100")]
+    linhas = []
+    for i, ((data, hora), (tmedia, ur, rsolar)) in enumerate(zip(instantes, clima)):
+        for j in range(3):
+            linhas.append({
+                "DATA": data, "HORA": hora, "IDADE": str(20 + 5 * i + j), "PESO": str(60 + j),
+                "ALTURA": str(165 + i), "SEXO": "mf"[j % 2], "TMEDIA": tmedia, "UR": ur,
+                "RSOLARMED": rsolar,
+            })
+    df = pd.DataFrame(linhas)
+    parametros = dict(
+        config_imputacao_customizada={"rsolarmed": "rolling_mean_48", "idade": "median"},
+        criar_features_derivadas=True,
+        tipos_features_derivadas=["imc", "heat_index", "dew_point"],
+        usar_cache_etapas=False,
+    )
+
+    esperado, _ = executar_pipeline_completo(df, separar_clima=False, **parametros)
+    resultado, _ = executar_pipeline_completo(df, separar_clima=True, **parametros)
+
+    assert set(resultado.columns) == set(esperado.columns)
+    pd.testing.assert_frame_equal(resultado[esperado.columns], esperado, check_exact=False)
+
+
+def test_modo_escoragem_calcula_so_as_features_do_modelo():
+    """Com features_modelo, só as colunas que alimentam o modelo são calculadas."""
+    from src.pipelines.pipeline_completo import executar_pipeline_completo
+    from src.utils.benchmark import DadosBenchmark
+
+    dados = DadosBenchmark()
+    try:
+        df = dados.bruto(500)
+    finally:
+        dados.fechar()
+    parametros = dict(criar_features_derivadas=True, tipos_features_derivadas=["imc", "t*u"], usar_cache_etapas=False)
+    features = ["idade", "imc", "t_u", "sexo_cod", "tmedia_norm"]
+
+    esperado, _ = executar_pipeline_completo(df, **parametros)
+    resultado, artefatos = executar_pipeline_completo(df, features_modelo=features, **parametros)
+
+    assert "rsolartot" not in resultado.columns and "vestimenta_cod" not in resultado.columns
+    assert "rsolartot" in artefatos["plano"].colunas_podadas
+    pd.testing.assert_frame_equal(resultado[features], esperado[features])
+
+
+def test_modo_escoragem_com_feature_derivada_de_derivada():
+    """imc_classe depende de imc, calculado na mesma etapa."""
+    from src.pipelines.pipeline_completo import executar_pipeline_completo
+    from src.utils.benchmark import DadosBenchmark
+
+    dados = DadosBenchmark()
+    try:
+        df = dados.bruto(500)
+    finally:
+        dados.fechar()
+    parametros = dict(criar_features_derivadas=True, usar_cache_etapas=False)
+
+    esperado, _ = executar_pipeline_completo(df, **parametros)
+    resultado, _ = executar_pipeline_completo(df, features_modelo=["imc_classe"], **parametros)
+
+    assert len(resultado) == len(df)
+    pd.testing.assert_series_equal(resultado["imc_classe"], esperado["imc_classe"])
@@ -186,3 +186,39 @@ class TestPipelineFeatures:
         # Deve processar apenas colunas existentes
         assert 'sexo_cod' in df_feat.columns
         assert 'coluna_inexistente_cod' not in df_feat.columns
+    
+    def test_compactacao_opcional(self, df_processado):
+        """Testa compactação de tipos ao final com relatório nos artefatos."""
+        df_feat, artefatos = executar_pipeline_features(
+            df_processado,
+            aplicar_codificacao=True,
+            aplicar_normalizacao=False,
+            criar_features_derivadas=False,
+            compactar_memoria=True,
+        )
+        
+        relatorio = artefatos['relatorio_compactacao']
+        assert set(relatorio['coluna']) == set(df_feat.columns)
+        assert relatorio['bytes_depois'].sum() <= relatorio['bytes_antes'].sum()
+        assert df_feat['sexo_cod'].dtype == 'int8'
+    
+    def test_particionado_igual_ao_sequencial(self, df_processado):
+        """Testa execução particionada por mes-ano em processos com saída idêntica."""
+        df = df_processado.rename(columns={'temperatura': 'tmedia', 'umidade': 'ur'})
+        df = df.sample(frac=1, random_state=0)
+        df.loc[df.index[:5], 'mes-ano'] = None
+        parametros = dict(
+            colunas_categoricas=['sexo', 'vestimenta'],
+            criar_features_derivadas=True,
+            tipos_features_derivadas=['imc', 'heat_index', 't*u'],
+        )
+        
+        sequencial, artefatos_seq = executar_pipeline_features(df, particionar=False, **parametros)
+        particionado, artefatos_par = executar_pipeline_features(
+            df, particionar=True, n_trabalhadores=2, **parametros
+        )
+        
+        pd.testing.assert_frame_equal(sequencial, particionado, check_exact=True)
+        assert artefatos_par['scalers_normalizacao'] == artefatos_seq['scalers_normalizacao']
+        assert list(artefatos_par['scalers_normalizacao']) == list(artefatos_seq['scalers_normalizacao'])
+        assert artefatos_par['mapeamentos_codificacao'] == artefatos_seq['mapeamentos_codificacao']
@@ -0,0 +1,184 @@
+"""
+Testes unitários para pipeline_incremental.py
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipelines.pipeline_completo import executar_pipeline_completo
+from src.pipelines.pipeline_incremental import executar_pipeline_incremental
+from src.processamento.validacao import ErroValidacaoEsquema
+
+PARAMETROS = dict(
+    coluna_data="data",
+    coluna_hora="hora",
+    colunas_float=["tmedia"],
+    colunas_int=["p5", "idade"],
+    colunas_categoricas=["sexo", "vestimenta"],
+    config_imputacao_customizada={
+        "p5": "backward",
+        "vestimenta": "backward",
+        "idade": "median",
+        "sexo": "mode",
+    },
+)
+
+
+@pytest.fixture
+def df_bruto():
+    """Questionários de três meses; o corte em 40 deixa 'p5' sem valor no fim."""
+    rng = np.random.default_rng(7)
+    n = 60
+    datas = [f"{d}/{m}/2020" for m, d in zip(np.repeat([1, 2, 3], 20), np.tile(range(1, 21), 3))]
+    df = pd.DataFrame({
+        "DATA": datas,
+        "HORA": ["09:10"] * n,
+        "P5": rng.integers(-3, 4, n).astype(str),
+        "VESTIMENTA": rng.choice(["leve", "media"], n),
+        "IDADE": rng.integers(20, 60, n).astype(str),
+        "SEXO": ["m", "f"] * (n // 2),
+        "TMEDIA": np.round(rng.normal(22, 4, n), 1).astype(str),
+    })
+    # Extremos de idade no histórico: mediana legada não muda com linhas novas
+    df.loc[0, "IDADE"], df.loc[1, "IDADE"] = "18", "70"
+    df.loc[[37, 38, 39], "P5"] = "99"
+    df.loc[[39, 45], "VESTIMENTA"] = "x"
+    df.loc[[5, 50], "IDADE"] = "-"
+    return df
+
+
+def _comparar(resultado, esperado):
+    assert list(resultado.columns) == list(esperado.columns)
+    for coluna in esperado.columns:
+        if pd.api.types.is_float_dtype(esperado[coluna]):
+            np.testing.assert_allclose(
+                resultado[coluna].astype(float), esperado[coluna].astype(float), rtol=1e-9
+            )
+        else:
+            pd.testing.assert_series_equal(resultado[coluna], esperado[coluna])
+
+
+def test_incremental_igual_ao_completo(df_bruto, tmp_path):
+    """Linhas novas anexadas coincidem com o pipeline completo no histórico todo."""
+    executar_pipeline_incremental(df_bruto.iloc[:40], tmp_path, limite_deriva=10, **PARAMETROS)
+    resultado, artefatos = executar_pipeline_incremental(
+        df_bruto, tmp_path, limite_deriva=10, **PARAMETROS
+    )
+    esperado, artefatos_esperados = executar_pipeline_completo(df_bruto, **PARAMETROS)
+
+    assert artefatos["incremental"]["modo"] == "incremental"
+    assert artefatos["incremental"]["linhas_novas"] == 20
+    _comparar(resultado, esperado)
+    assert artefatos["mapeamentos_codificacao"] == artefatos_esperados["mapeamentos_codificacao"]
+
+
+def test_backward_fill_na_fronteira(df_bruto, tmp_path):
+    """Faltantes no fim do histórico são preenchidos pelo primeiro valor novo."""
+    parcial, _ = executar_pipeline_incremental(
+        df_bruto.iloc[:40], tmp_path, limite_deriva=10, **PARAMETROS
+    )
+    assert parcial["p5"].iloc[37:40].isna().all()
+
+    resultado, artefatos = executar_pipeline_incremental(
+        df_bruto, tmp_path, limite_deriva=10, **PARAMETROS
+    )
+    assert artefatos["incremental"]["linhas_reprocessadas"] == 4
+    assert (resultado["p5"].iloc[37:40] == int(df_bruto["P5"].iloc[40])).all()
+
+
+def test_sem_linhas_novas(df_bruto, tmp_path):
+    executar_pipeline_incremental(df_bruto, tmp_path, **PARAMETROS)
+    _, artefatos = executar_pipeline_incremental(df_bruto, tmp_path, **PARAMETROS)
+    assert artefatos["incremental"]["modo"] == "sem_alteracoes"
+
+
+def test_recalcula_quando_historico_muda(df_bruto, tmp_path):
+    executar_pipeline_incremental(df_bruto.iloc[:40], tmp_path, limite_deriva=10, **PARAMETROS)
+    alterado = df_bruto.copy()
+    alterado.loc[3, "TMEDIA"] = "35.0"
+    _, artefatos = executar_pipeline_incremental(alterado, tmp_path, limite_deriva=10, **PARAMETROS)
+    assert artefatos["incremental"]["modo"] == "completo"
+    assert artefatos["incremental"]["motivo"] == "histórico alterado"
+
+
+def test_recalcula_quando_estatisticas_derivam(df_bruto, tmp_path):
+    executar_pipeline_incremental(df_bruto.iloc[:40], tmp_path, **PARAMETROS)
+    deslocado = df_bruto.copy()
+    deslocado.loc[40:, "TMEDIA"] = "45.0"
+    resultado, artefatos = executar_pipeline_incremental(
+        deslocado, tmp_path, limite_deriva=0.5, **PARAMETROS
+    )
+    assert artefatos["incremental"]["modo"] == "completo"
+    assert artefatos["incremental"]["motivo"].startswith("deriva")
+    esperado, _ = executar_pipeline_completo(deslocado, **PARAMETROS)
+    _comparar(resultado, esperado)
+
+
+def test_categoria_nova_recebe_proximo_codigo(df_bruto, tmp_path):
+    executar_pipeline_incremental(df_bruto.iloc[:40], tmp_path, limite_deriva=10, **PARAMETROS)
+    novo = df_bruto.copy()
+    novo.loc[55, "VESTIMENTA"] = "pesada"
+    resultado, artefatos = executar_pipeline_incremental(novo, tmp_path, limite_deriva=10, **PARAMETROS)
+    esperado, artefatos_esperados = executar_pipeline_completo(novo, **PARAMETROS)
+    assert artefatos["mapeamentos_codificacao"] == artefatos_esperados["mapeamentos_codificacao"]
+    assert resultado["vestimenta_cod"].equals(esperado["vestimenta_cod"])
+
+
+def test_interpolacao_temporal_igual_ao_completo(df_bruto, tmp_path):
+    """Radiação faltante nas duas pontas do corte é interpolada como no histórico todo."""
+    rng = np.random.default_rng(3)
+    df = df_bruto.assign(
+        HORA=np.tile(["09:10", "14:30", "16:40"], 20),
+        RSOLARTOT=np.round(rng.uniform(100, 800, 60), 1).astype(str),
+    )
+    df.loc[[10, 11, 36, 37, 38, 39, 44], "RSOLARTOT"] = "NAN"
+    parametros = dict(
+        PARAMETROS,
+        colunas_float=["tmedia", "rsolartot"],
+        config_imputacao_customizada={
+            **PARAMETROS["config_imputacao_customizada"], "rsolartot": "rolling_mean_48"
+        },
+    )
+    executar_pipeline_incremental(df.iloc[:40], tmp_path, limite_deriva=10, **parametros)
+    resultado, artefatos = executar_pipeline_incremental(df, tmp_path, limite_deriva=10, **parametros)
+    esperado, _ = executar_pipeline_completo(df, **parametros)
+
+    assert artefatos["incremental"]["modo"] == "incremental"
+    assert resultado["rsolartot"].notna().all()
+    _comparar(resultado, esperado)
+
+
+@pytest.mark.parametrize("esparso", [False, True])
+def test_onehot_usa_categorias_do_ajuste(df_bruto, tmp_path, esparso):
+    """One-hot incremental gera as mesmas colunas do completo e recalcula com categoria nova."""
+    parametros = dict(PARAMETROS, metodo_codificacao="onehot", onehot_esparso=esparso)
+    executar_pipeline_incremental(df_bruto.iloc[:40], tmp_path, limite_deriva=10, **parametros)
+    resultado, artefatos = executar_pipeline_incremental(df_bruto, tmp_path, limite_deriva=10, **parametros)
+    esperado, _ = executar_pipeline_completo(df_bruto, **parametros)
+
+    assert artefatos["incremental"]["modo"] == "incremental"
+    _comparar(resultado, esperado)
+    assert isinstance(resultado["sexo_m"].dtype, pd.SparseDtype) == esparso
+
+    novo = df_bruto.copy()
+    novo.loc[55, "VESTIMENTA"] = "pesada"
+    executar_pipeline_incremental(novo.iloc[:40], tmp_path / "novo", limite_deriva=10, **parametros)
+    _, artefatos = executar_pipeline_incremental(novo, tmp_path / "novo", limite_deriva=10, **parametros)
+    assert artefatos["incremental"]["motivo"] == "categorias novas na codificação one-hot"
+
+
+def test_valida_esquema_como_o_completo(df_bruto, tmp_path):
+    """Lote que o pipeline completo rejeita também é rejeitado no incremental."""
+    invalido = df_bruto.copy()
+    invalido.loc[50, "IDADE"] = "500"
+    with pytest.raises(ErroValidacaoEsquema, match="idade"):
+        executar_pipeline_completo(invalido, **PARAMETROS)
+
+    # Recálculo completo (sem checkpoint)
+    with pytest.raises(ErroValidacaoEsquema, match="idade"):
+        executar_pipeline_incremental(invalido, tmp_path / "vazio", **PARAMETROS)
+
+    # Linhas novas sobre um checkpoint válido
+    executar_pipeline_incremental(df_bruto.iloc[:40], tmp_path / "delta", limite_deriva=10, **PARAMETROS)
+    with pytest.raises(ErroValidacaoEsquema, match="idade"):
+        executar_pipeline_incremental(invalido, tmp_path / "delta", limite_deriva=10, **PARAMETROS)
@@ -7,6 +7,8 @@ import pytest
 from datetime import datetime
 
 from src.pipelines.pipeline_processamento import executar_pipeline_processamento
+from src.features.criacao_features import calcular_tu_stull
+from src.processamento.validacao import ErroValidacaoEsquema
 
 
 @pytest.fixture
@@ -231,3 +233,66 @@ def test_pipeline_parametros_defaults():
     
     assert isinstance(resultado, pd.DataFrame)
     assert len(resultado) == len(df)
+
+
+def test_media_movel_interpola_antes_do_metodo_padrao():
+    """Colunas rolling_mean_48 são interpoladas no tempo, não preenchidas pela mediana."""
+    df = pd.DataFrame({
+        "data": ["01/01/2020"] * 6,
+        "hora": ["09:00", "09:00", "10:00", "10:00", "13:00", "13:00"],
+        "rsolartot": ["100", "100", "NAN", "NAN", "400", "400"],
+        "idade": ["20", "-", "30", "40", "50", "60"],
+    })
+    resultado = executar_pipeline_processamento(
+        df,
+        colunas_float=["rsolartot"],
+        colunas_int=["idade"],
+        config_imputacao_customizada={"rsolartot": "rolling_mean_48", "idade": "median"},
+        criar_agrupamento_temporal=False,
+    )
+    assert resultado["rsolartot"].tolist() == [100.0, 100.0, 175.0, 175.0, 400.0, 400.0]
+    assert resultado["idade"].notna().all()
+
+
+def test_backend_arrow_igual_ao_pandas(df_com_substituicoes):
+    """O backend Arrow produz exatamente o mesmo resultado do pandas."""
+    esperado = executar_pipeline_processamento(df_com_substituicoes, backend="pandas")
+    resultado = executar_pipeline_processamento(df_com_substituicoes, backend="arrow")
+
+    pd.testing.assert_frame_equal(resultado, esperado, check_exact=True)
+
+
+def test_backend_invalido(df_basico):
+    with pytest.raises(ValueError):
+        executar_pipeline_processamento(df_basico, backend="polars")
+
+
+def test_validacao_esquema_falha_antes_da_imputacao(df_basico):
+    """Lote fora das faixas declaradas é barrado com o relatório por coluna."""
+    df = df_basico.assign(idade=[25, -4, 35])
+
+    with pytest.raises(ErroValidacaoEsquema, match="idade: 1 abaixo do mínimo"):
+        executar_pipeline_processamento(df)
+
+    resultado = executar_pipeline_processamento(df, validar_esquema=False)
+    assert resultado["idade"].tolist() == [25, -4, 35]
+
+
+def test_imputacao_stull(df_basico):
+    """Método 'stull' preenche tu a partir de tmedia e ur; o restante usa o padrão."""
+    df = df_basico.assign(
+        tmedia=["25,0", "30,0", "20,0"],
+        ur=["60", "70", "2"],
+        tu=["19,5", "", ""],
+    )
+    
+    resultado = executar_pipeline_processamento(
+        df,
+        colunas_float=["tmedia", "ur", "tu"],
+        config_imputacao_customizada={"tu": "stull", "idade": "median"},
+        validar_esquema=False,
+    )
+    
+    assert resultado["tu"].iloc[1] == calcular_tu_stull(30.0, 70.0)
+    # UR fora do domínio de Stull: mediana de tu após o preenchimento
+    assert resultado["tu"].iloc[2] == np.median([19.5, calcular_tu_stull(30.0, 70.0)])
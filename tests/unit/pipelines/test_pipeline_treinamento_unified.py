@@ -135,3 +135,31 @@ def test_treinar_rapido(mock_treinar, mock_criar_exp):
     # Verifica que não otimizou nem salvou
     assert resultado['modelo_otimizado'] is None
     assert resultado['caminho_modelo'] is None
+
+
+@patch('src.pipelines.pipeline_treinamento_unified.criar_experimento')
+@patch('src.pipelines.pipeline_treinamento_unified.treinar_modelo_base')
+@patch('src.pipelines.pipeline_treinamento_unified.finalizar_modelo')
+@patch('src.pipelines.pipeline_treinamento_unified.salvar_modelo')
+def test_registra_features_do_modelo_final(
+    mock_salvar, mock_finalizar, mock_treinar, mock_criar_exp, df_treino, tmp_path
+):
+    """Features usadas pelo modelo final vão para o resultado e para o JSON."""
+    from sklearn.tree import DecisionTreeClassifier
+    from src.pipelines.pipeline_treinamento_unified import treinar_pipeline_completo
+    from src.treinamento.persistencia import carregar_features_modelo
+
+    modelo_final = DecisionTreeClassifier().fit(df_treino[['feature1']], df_treino['target'])
+    mock_treinar.return_value = ([MagicMock()], pd.DataFrame({'Accuracy': [0.9]}, index=['dt']))
+    mock_finalizar.return_value = modelo_final
+    mock_salvar.return_value = str(tmp_path / 'modelo_final.pkl')
+
+    resultado = treinar_pipeline_completo(
+        dados=df_treino,
+        coluna_alvo='target',
+        tipo_problema='classificacao',
+        otimizar_hiperparametros=False,
+    )
+
+    assert resultado['features_modelo']['features_modelo'] == ['feature1']
+    assert carregar_features_modelo(resultado['caminho_modelo']) == resultado['features_modelo']
@@ -0,0 +1,148 @@
+"""
+Testes unitários para plano_pipeline.py
+"""
+import contextlib
+import io
+
+import pandas as pd
+import pytest
+
+from config import config_custom as config
+from src.pipelines.pipeline_completo import executar_pipeline_completo
+from src.pipelines.plano_pipeline import (
+    carregar_especificacao,
+    compilar_plano,
+    executar_especificacao,
+    executar_plano,
+)
+from src.utils.benchmark import DadosBenchmark
+
+
+@pytest.fixture(scope="module")
+def bruto():
+    dados = DadosBenchmark()
+    try:
+        yield dados.bruto(1000)
+    finally:
+        dados.fechar()
+
+
+@pytest.fixture(scope="module")
+def esperado(bruto):
+    with contextlib.redirect_stdout(io.StringIO()):
+        df, _ = executar_pipeline_completo(
+            bruto,
+            config_imputacao_customizada=config.CONFIG_IMPUTACAO_CUSTOMIZADA,
+            criar_features_derivadas=True,
+            usar_cache_etapas=False,
+        )
+    return df
+
+
+def test_especificacao_padrao_igual_ao_pipeline_completo(bruto, esperado):
+    plano = compilar_plano(config.ESPECIFICACAO_PIPELINE, bruto)
+
+    resultado, artefatos = executar_plano(bruto, plano)
+
+    pd.testing.assert_frame_equal(resultado, esperado)
+    assert set(artefatos["mapeamentos_codificacao"]) == {"sexo", "vestimenta"}
+    assert [p.nome for p in plano.passos][0] == "limpeza_conversao"
+
+
+def test_poda_mantem_colunas_do_modelo(bruto, esperado):
+    features = ["idade", "sexo_cod", "tmedia_norm", "imc", "t*u"]
+
+    plano = compilar_plano(config.ESPECIFICACAO_PIPELINE, bruto, features_modelo=features)
+    resultado, _ = executar_plano(bruto, plano)
+
+    assert plano.passos[0].nome == "projecao"
+    assert "rsolartot" in plano.colunas_podadas and "tmedia" not in plano.colunas_podadas
+    assert "heat_index" not in resultado.columns
+    for coluna in features + ["p1"]:
+        pd.testing.assert_series_equal(resultado[coluna], esperado[coluna])
+
+
+def test_poda_mantem_dependencias_dentro_da_etapa(bruto):
+    plano = compilar_plano(config.ESPECIFICACAO_PIPELINE, bruto, features_modelo=["imc_classe"])
+
+    assert plano.passos[-1].parametros["tipos"] == ["imc", "imc_classe"]
+    assert set(plano.passos[0].colunas) == {"peso", "altura", "p1"}
+
+
+def test_remove_sem_efeito_e_une_consecutivas():
+    especificacao = {
+        "etapas": [
+            {"etapa": "conversao", "float": ["x", "y"]},
+            {"etapa": "conversao", "int": ["y"], "categoricas": ["c"]},
+            {"etapa": "features_derivadas", "tipos": ["imc"]},
+            {"etapa": "features_derivadas", "tipos": ["imc_classe"]},
+            {"etapa": "codificacao", "colunas": ["ausente"]},
+            {"etapa": "compactacao", "ativo": False},
+        ]
+    }
+    df = pd.DataFrame({"x": ["1,5", "2"], "y": ["3", "4"], "c": ["a", "b"], "peso": [70, 80], "altura": [1.7, 1.8]})
+
+    plano = compilar_plano(especificacao, df)
+    resultado, _ = executar_plano(df, plano)
+
+    assert [p.nome for p in plano.passos] == ["limpeza_conversao", "features_derivadas"]
+    assert plano.passos[0].parametros["float"] == ["x"]
+    assert plano.passos[0].parametros["int"] == ["y"]
+    assert plano.passos[1].parametros["tipos"] == ["imc", "imc_classe"]
+    assert str(resultado["y"].dtype) == "Int64"
+    assert {"imc", "imc_classe"} <= set(resultado.columns)
+    texto = "\n".join(plano.otimizacoes)
+    assert "conversão repetida de 'y'" in texto
+    assert "5:codificacao sem efeito" in texto and "6:compactacao sem efeito" in texto
+
+
+def test_plano_imprimivel_com_custos(bruto):
+    plano = compilar_plano(config.ESPECIFICACAO_PIPELINE, bruto.columns, n_linhas=100_000)
+
+    texto = str(plano)
+
+    assert "Custo estimado total" in texto and "100000 linhas" in texto
+    assert plano.custo_total_ms == pytest.approx(plano.tabela()["custo_estimado_ms"].sum(), rel=1e-3)
+    assert (plano.tabela()["custo_estimado_ms"] > 0).all()
+
+
+def test_executar_especificacao_yaml_em_texto():
+    yaml = """
+    etapas:
+      - etapa: limpeza
+        substituicoes: {"-": null}
+      - etapa: conversao
+        float: [x]
+      - etapa: normalizacao
+        metodo: minmax
+        colunas: [x]
+        agrupamento: null
+    """
+    df = pd.DataFrame({"X": ["1", "-", "3"]})
+
+    with contextlib.redirect_stdout(io.StringIO()) as saida:
+        resultado, artefatos = executar_especificacao(df, yaml)
+
+    assert "limpeza_conversao" in saida.getvalue()
+    assert resultado["x_norm"].tolist()[::2] == [0.0, 1.0]
+    assert artefatos["plano"].passos[0].origem == ("1:limpeza", "2:conversao")
+
+
+def test_especificacao_invalida(bruto):
+    with pytest.raises(ValueError, match="desconhecida"):
+        carregar_especificacao({"etapas": [{"etapa": "inexistente"}]})
+    with pytest.raises(ValueError, match="config"):
+        carregar_especificacao({"etapas": [{"etapa": "limpeza", "substituicoes": "config:NAO_EXISTE"}]})
+    with pytest.raises(ValueError, match="não produz"):
+        compilar_plano(config.ESPECIFICACAO_PIPELINE, bruto, features_modelo=["inexistente"])
+
+
+def test_especificacao_padrao_fora_da_raiz(bruto, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    plano = compilar_plano(None, bruto)
+
+    assert plano.passos[0].nome == "limpeza_conversao"
+    assert len(compilar_plano("config/pipeline.yaml", bruto).passos) == len(plano.passos)
+    with pytest.raises(FileNotFoundError, match="nao_existe.yaml"):
+        carregar_especificacao("config/nao_existe.yaml")
@@ -0,0 +1,170 @@
+"""
+Testes unitários para transformador_linha.py
+"""
+import contextlib
+import io
+import pickle
+
+import numpy as np
+import pytest
+
+from config import config_custom as config
+from src.pipelines.pipeline_completo import executar_pipeline_completo
+from src.pipelines.plano_pipeline import especificacao_de_parametros
+from src.pipelines.transformador_linha import compilar_transformador_linha
+from src.utils.benchmark import DadosBenchmark
+
+FEATURES = [
+    "idade", "sexo_cod", "imc", "heat_index", "dew_point", "t*u", "t/u", "tu",
+    "tmedia_norm", "ur_norm", "peso_norm", "imc_norm",
+]
+
+
+@pytest.fixture(scope="module")
+def bruto():
+    dados = DadosBenchmark()
+    try:
+        yield dados.bruto(1000)
+    finally:
+        dados.fechar()
+
+
+@pytest.fixture(scope="module")
+def esperado(bruto):
+    with contextlib.redirect_stdout(io.StringIO()):
+        df, _ = executar_pipeline_completo(
+            bruto,
+            config_imputacao_customizada=config.CONFIG_IMPUTACAO_CUSTOMIZADA,
+            criar_features_derivadas=True,
+            usar_cache_etapas=False,
+        )
+    return df
+
+
+@pytest.fixture(scope="module")
+def transformador(bruto):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return compilar_transformador_linha(bruto, FEATURES)
+
+
+def _iguais(a, b):
+    return np.array_equal(a, b, equal_nan=True)
+
+
+def test_vetor_igual_ao_pipeline_em_lote(bruto, esperado, transformador):
+    linhas = bruto.to_dict("records")
+
+    vetores = np.vstack([
+        transformador({**linha, "mes-ano": mes}) for linha, mes in zip(linhas, esperado["mes-ano"])
+    ])
+
+    referencia = esperado[FEATURES].to_numpy(dtype="float64", na_value=np.nan)
+    assert vetores.shape == (len(bruto), len(FEATURES))
+    assert _iguais(vetores, referencia)
+    # Grupo derivado da data bruta (sem mes-ano no registro)
+    assert _iguais(transformador(linhas[0]), referencia[0])
+
+
+def test_nomes_da_api_e_linha_numpy(bruto, esperado, transformador):
+    ultimo = esperado["mes-ano"].max()
+    i = int(np.flatnonzero((esperado["mes-ano"] == ultimo).to_numpy())[0])
+    linha = {k.lower(): v for k, v in bruto.iloc[i].items()}
+    api = {
+        config.NOVOS_CABECALHOS.get(c, c): float(str(linha[c]).replace(",", ".")) if c != "sexo" else linha[c]
+        for c in transformador.colunas_brutas if c not in ("data", "hora")
+    }
+
+    vetor = transformador(api)
+
+    # Sem data: normaliza pelo mês mais recente do ajuste
+    assert transformador.grupo_padrao == ultimo
+    assert _iguais(vetor, esperado[FEATURES].to_numpy(dtype="float64", na_value=np.nan)[i])
+    valores = np.array([linha.get(c) for c in transformador.colunas_brutas], dtype=object)
+    assert _iguais(transformador.transformar_array(valores), transformador({**linha, "mes-ano": ultimo}))
+
+
+def test_serializavel(bruto, transformador):
+    linha = bruto.iloc[3].to_dict()
+
+    copia = pickle.loads(pickle.dumps(transformador))
+
+    assert copia.codigo == transformador.codigo
+    assert _iguais(copia(linha), transformador(linha))
+
+
+def test_outros_metodos_de_normalizacao_e_onehot(bruto):
+    especificacao = especificacao_de_parametros(
+        metodo_normalizacao="minmax", agrupamento_normalizacao=None, metodo_codificacao="onehot",
+        criar_features_derivadas=True, tipos_features_derivadas=["imc"],
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        esperado, _ = executar_pipeline_completo(
+            bruto, metodo_normalizacao="minmax", agrupamento_normalizacao=None, metodo_codificacao="onehot",
+            criar_features_derivadas=True, tipos_features_derivadas=["imc"], usar_cache_etapas=False,
+        )
+        features = ["sexo_f", "sexo_m", "idade_norm", "imc_norm", "altura_norm"]
+        transformador = compilar_transformador_linha(bruto, features, especificacao=especificacao)
+
+    vetores = transformador.transformar_lote(bruto.to_dict("records"))
+
+    assert _iguais(vetores, esperado[features].to_numpy(dtype="float64", na_value=np.nan))
+
+
+def test_features_sem_calculo_por_linha(bruto):
+    with contextlib.redirect_stdout(io.StringIO()):
+        with pytest.raises(ValueError, match="não numérica"):
+            compilar_transformador_linha(bruto, ["imc_classe"])
+        with pytest.raises(ValueError, match="não produz"):
+            compilar_transformador_linha(bruto, ["inexistente"])
+
+
+def test_tu_imputado_por_stull_igual_ao_lote(bruto):
+    bruto = bruto.copy()
+    bruto.loc[::10, "Tu"] = np.nan
+    with contextlib.redirect_stdout(io.StringIO()):
+        esperado, _ = executar_pipeline_completo(
+            bruto,
+            config_imputacao_customizada=config.CONFIG_IMPUTACAO_CUSTOMIZADA,
+            usar_cache_etapas=False,
+        )
+        transformador = compilar_transformador_linha(bruto, ["tu", "tu_norm"])
+
+    vetores = np.vstack([
+        transformador({**linha, "mes-ano": mes})
+        for linha, mes in zip(bruto.to_dict("records"), esperado["mes-ano"])
+    ])
+
+    assert _iguais(vetores, esperado[["tu", "tu_norm"]].to_numpy(dtype="float64", na_value=np.nan))
+
+
+@pytest.mark.parametrize("tipo", list(dict.fromkeys([*config.TIPOS_FEATURES_DERIVADAS, "tu_stull"])))
+def test_cada_feature_derivada_igual_ao_lote(bruto, tipo):
+    bruto = bruto.copy()
+    # Bordas: divisor zero (t/u), altura zero (imc) e tu faltante (Stull)
+    bruto.loc[::7, "UR"] = "0"
+    bruto.loc[::11, "ALTURA"] = "0"
+    bruto.loc[::5, "Tu"] = np.nan
+    tipos = ["imc", "imc_classe"] if tipo == "imc_classe" else [tipo]
+    # imc_classe é texto: entra no vetor pelo código
+    categoricas = [*config.COLUNAS_CATEGORICAS, "imc_classe"] if tipo == "imc_classe" else None
+    parametros = dict(
+        criar_features_derivadas=True, tipos_features_derivadas=tipos, colunas_categoricas=categoricas,
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        esperado, _ = executar_pipeline_completo(bruto, usar_cache_etapas=False, **parametros)
+        saidas = {"tu_stull": ("tu",), "imc_classe": ("imc_classe_cod",), "t*u": ("t*u", "t_u")}.get(tipo, (tipo,))
+        features = [
+            c for c in esperado.columns
+            if any(c == s or c.startswith(f"{s}_") for s in saidas) and np.issubdtype(esperado[c].dtype, np.number)
+        ]
+        transformador = compilar_transformador_linha(
+            bruto, features, especificacao=especificacao_de_parametros(**parametros)
+        )
+
+    vetores = np.vstack([
+        transformador({**linha, "mes-ano": mes})
+        for linha, mes in zip(bruto.to_dict("records"), esperado["mes-ano"])
+    ])
+
+    assert features
+    assert _iguais(vetores, esperado[features].to_numpy(dtype="float64", na_value=np.nan))
@@ -0,0 +1,76 @@
+"""
+Testes unitários para imputar_interpolacao_temporal.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.processamento.imputacao import imputar_interpolacao_temporal
+
+
+@pytest.fixture
+def df_sessoes():
+    """Três respondentes por sessão; sessões com intervalos de tempo desiguais."""
+    sessoes = pd.to_datetime(["2020-01-01 09:00", "2020-01-01 10:00", "2020-01-01 13:00"])
+    df = pd.DataFrame({
+        "data": np.repeat(sessoes.normalize(), 3),
+        "hora": np.repeat(pd.to_datetime(["1900-01-01 09:00", "1900-01-01 10:00", "1900-01-01 13:00"]), 3),
+        "rsolartot": np.repeat([100.0, np.nan, 400.0], 3),
+        "rsolarmed": np.repeat([10.0, 20.0, np.nan], 3),
+        "idade": [20, 30, 40] * 3,
+    })
+    return df
+
+
+def test_interpola_no_tempo_e_nao_pela_posicao(df_sessoes):
+    resultado = imputar_interpolacao_temporal(df_sessoes, ["rsolartot", "rsolarmed"])
+    # 10h fica a 1/4 do caminho entre 9h e 13h (por posição seria a metade)
+    assert resultado["rsolartot"].iloc[3:6].tolist() == [175.0] * 3
+    # Extremo recebe o valor válido mais próximo
+    assert resultado["rsolarmed"].iloc[6:].tolist() == [20.0] * 3
+    assert df_sessoes["rsolartot"].isna().sum() == 3
+
+
+def test_faltante_dentro_da_sessao_recebe_valor_da_sessao(df_sessoes):
+    df = df_sessoes.copy()
+    df.loc[1, "rsolarmed"] = np.nan
+    resultado = imputar_interpolacao_temporal(df, ["rsolarmed"])
+    assert resultado.loc[1, "rsolarmed"] == 10.0
+    pd.testing.assert_series_equal(resultado["idade"], df["idade"])
+
+
+def test_data_desconhecida_fica_como_esta(df_sessoes):
+    df = df_sessoes.copy()
+    df.loc[4, "data"] = pd.NaT
+    resultado = imputar_interpolacao_temporal(df, ["rsolartot"])
+    assert np.isnan(resultado.loc[4, "rsolartot"])
+    assert resultado.loc[3, "rsolartot"] == 175.0
+
+
+def test_coluna_de_tempo_tem_prioridade(df_sessoes):
+    df = df_sessoes.assign(momento=np.repeat(pd.to_datetime(["2020-01-01", "2020-01-03", "2020-01-04"]), 3))
+    resultado = imputar_interpolacao_temporal(df, ["rsolartot"], coluna_tempo="momento")
+    assert resultado.loc[3, "rsolartot"] == pytest.approx(100 + 300 * 2 / 3)
+
+
+def test_sem_coluna_de_tempo_interpola_por_posicao():
+    df = pd.DataFrame({"rsolartot": [100.0, np.nan, np.nan, 160.0]})
+    resultado = imputar_interpolacao_temporal(df, ["rsolartot"])
+    assert resultado["rsolartot"].tolist() == [100.0, 120.0, 140.0, 160.0]
+
+
+def test_limite_com_fallback_de_media_movel():
+    horas = pd.date_range("2020-01-01", periods=6, freq="h")
+    df = pd.DataFrame({"data_cplt": horas, "v": [1.0, np.nan, np.nan, np.nan, np.nan, 11.0]})
+    sem_fallback = imputar_interpolacao_temporal(df, ["v"], coluna_tempo="data_cplt", limite=1, janela_fallback=None)
+    assert sem_fallback["v"].isna().tolist() == [False, False, True, True, False, False]
+    com_fallback = imputar_interpolacao_temporal(df, ["v"], coluna_tempo="data_cplt", limite=1, janela_fallback="3h")
+    # Lacuna central: média dos vizinhos na janela centrada de 3h
+    assert com_fallback["v"].tolist() == [1.0, 3.0, 3.0, 9.0, 9.0, 11.0]
+
+
+def test_colunas_ausentes_ou_sem_faltantes():
+    df = pd.DataFrame({"a": [1.0, 2.0], "texto": ["x", None]})
+    resultado = imputar_interpolacao_temporal(df, ["a", "texto", "inexistente"])
+    pd.testing.assert_frame_equal(resultado, df)
+    assert resultado is not df
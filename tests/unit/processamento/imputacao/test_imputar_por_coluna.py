@@ -197,3 +197,30 @@ class TestImputarPorColuna:
         # Deve usar método padrão
         assert not df_result['idade'].isna().any()
         assert df_result['idade'].iloc[1] == 30.0
+
+    @pytest.mark.parametrize('metodo_padrao', [None, 'median', 'mean', 'mode', 'forward', 'zero'])
+    def test_uma_passada_igual_ao_laco(self, metodo_padrao):
+        """Testa que o caminho vetorizado dá o mesmo resultado do laço por coluna"""
+        df = pd.DataFrame({
+            'inteiro': pd.array([1, None, 4, None, 2], dtype='Int64'),
+            'real': [1.5, np.nan, np.nan, 3.0, 2.0],
+            'vazio': [np.nan] * 5,
+            'texto': ['a', None, 'b', 'b', None],
+            'string': pd.array(['x', None, 'x', 'y', None], dtype='string'),
+            'categoria': pd.Categorical(['p', None, 'q', 'q', None]),
+            'objeto_num': pd.Series([1, None, 3, 3, None], dtype=object),
+            'posterior': [np.nan, 2.0, np.nan, 4.0, np.nan],
+        })
+        config = {
+            'inteiro': 'median',
+            'real': 'mean',
+            'texto': 'desconhecido',
+            'string': 'mode',
+            'objeto_num': 0,
+            'posterior': 'backward',
+        }
+
+        esperado = imputar_por_coluna(df, config, metodo_padrao=metodo_padrao, vetorizado=False)
+        resultado = imputar_por_coluna(df, config, metodo_padrao=metodo_padrao, vetorizado=True)
+
+        pd.testing.assert_frame_equal(resultado, esperado)
@@ -0,0 +1,70 @@
+"""
+Testes unitários para o backend Arrow de limpeza e conversão.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.processamento.limpeza import (
+    aplicar_substituicoes,
+    converter_colunas_categoricas,
+    converter_colunas_float,
+    converter_colunas_int,
+    limpar_e_converter_arrow,
+)
+
+SUBSTITUICOES = {"NAN": np.nan, "": np.nan, "-": np.nan, "99": np.nan, "F": "f"}
+
+
+def _caminho_pandas(df, substituicoes, colunas_float, colunas_int, colunas_categoricas):
+    df = aplicar_substituicoes(df, substituicoes)
+    df = converter_colunas_float(df, colunas_float)
+    df = converter_colunas_int(df, colunas_int)
+    return converter_colunas_categoricas(df, colunas_categoricas)
+
+
+@pytest.mark.unit
+class TestLimparConverterArrow:
+    """Testes para limpar_e_converter_arrow"""
+
+    @pytest.mark.parametrize("substituicoes", [SUBSTITUICOES, {}, {"x": 0}])
+    def test_igual_ao_caminho_pandas(self, substituicoes):
+        """Testa que o resultado é idêntico ao das funções pandas"""
+        df = pd.DataFrame({
+            "tmedia": ["22,5", "NAN", "18", "-"],
+            "inteiro": ["1", "2", "99", "3"],
+            "sem_faltante": ["1", "2", "3", "4"],
+            "sexo": ["m", "F", "f", ""],
+            "texto": ["a", "-", "NAN", "b"],
+            "vazia": ["-", "", "NAN", "99"],
+            "numerica": [1, 2, 3, 4],
+            "mista": [1, "a", 2.5, np.nan],
+            "estranho": ["1e3", " 5", "+5", "1.5"],
+        }, index=[10, 11, 12, 13])
+        listas = (["tmedia", "sem_faltante", "estranho"], ["inteiro", "numerica"], ["sexo"])
+
+        esperado = _caminho_pandas(df, substituicoes, *listas)
+        resultado = limpar_e_converter_arrow(df, substituicoes, *listas)
+
+        pd.testing.assert_frame_equal(resultado, esperado, check_exact=True)
+
+    def test_inteiro_com_fracao_levanta_como_pandas(self):
+        """Testa que valores fracionários em coluna int dão o mesmo erro do pandas"""
+        df = pd.DataFrame({"idade": ["30", "30,5", "1.5"]})
+
+        with pytest.raises(TypeError):
+            converter_colunas_int(df, ["idade"])
+        with pytest.raises(TypeError):
+            limpar_e_converter_arrow(df, SUBSTITUICOES, [], ["idade"], [])
+
+    def test_colunas_temporais_so_recebem_substituicoes(self):
+        """Testa que data/hora ficam como texto para a conversão temporal"""
+        df = pd.DataFrame({"data": ["5/8/2015", "-"], "hora": ["09:10", "NAN"]})
+
+        resultado = limpar_e_converter_arrow(
+            df, SUBSTITUICOES, ["hora"], [], ["data"], colunas_temporais=["data", "hora"]
+        )
+
+        assert resultado["data"].tolist()[0] == "5/8/2015"
+        assert resultado["data"].dtype == object
+        assert np.isnan(resultado["hora"].iloc[1])
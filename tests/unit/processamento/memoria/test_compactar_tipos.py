@@ -0,0 +1,81 @@
+"""
+Testes unitários para compactar_tipos.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.processamento.memoria import compactar_tipos
+
+
+@pytest.fixture
+def df_processado():
+    """Frame com os dtypes típicos da saída do processamento."""
+    n = 200
+    return pd.DataFrame({
+        "p1": pd.array(np.tile([-3, -2, -1, 0, 1, 2, 3, None], n // 8), dtype="Int64"),
+        "idade": np.arange(n, dtype="int64") + 18,
+        "populacao": np.full(n, 3_000_000_000, dtype="int64"),
+        "tmedia": np.round(np.linspace(10, 35, n), 2),
+        "preciso": np.linspace(0, 1, n) + 1e-12,
+        "sexo": pd.array(np.tile(["m", "f"], n // 2), dtype="string"),
+        "id_texto": pd.array([f"r{i}" for i in range(n)], dtype="string"),
+        "data": pd.date_range("2015-08-05", periods=n, freq="h"),
+    })
+
+
+class TestCompactarTipos:
+    """Testes para compactação de dtypes"""
+
+    def test_inteiros_menor_tipo(self, df_processado):
+        """Inteiros vão para o menor tipo que cabe; nullable continua nullable"""
+        df, _ = compactar_tipos(df_processado)
+
+        assert df["p1"].dtype == "Int8"
+        assert df["p1"].isna().sum() == df_processado["p1"].isna().sum()
+        assert df["idade"].dtype == "int16"
+        assert df["populacao"].dtype == "int64"
+
+    def test_float_dentro_da_tolerancia(self, df_processado):
+        """Floats vão para float32 somente dentro da tolerância"""
+        df, _ = compactar_tipos(df_processado, tolerancia=1e-6)
+
+        assert df["tmedia"].dtype == "float32"
+        np.testing.assert_allclose(df["tmedia"], df_processado["tmedia"], rtol=1e-6)
+
+    def test_float_fora_da_tolerancia_preservado(self, df_processado):
+        """Tolerância apertada mantém float64"""
+        df, _ = compactar_tipos(df_processado, tolerancia=1e-12)
+
+        assert df["preciso"].dtype == "float64"
+        pd.testing.assert_series_equal(df["preciso"], df_processado["preciso"])
+
+    def test_texto_baixa_cardinalidade_vira_category(self, df_processado):
+        """Apenas texto repetitivo vira category"""
+        df, _ = compactar_tipos(df_processado)
+
+        assert isinstance(df["sexo"].dtype, pd.CategoricalDtype)
+        assert df["id_texto"].dtype == "string"
+        assert df["sexo"].astype(str).tolist() == df_processado["sexo"].tolist()
+
+    def test_datas_inalteradas(self, df_processado):
+        df, _ = compactar_tipos(df_processado)
+
+        assert df["data"].dtype == df_processado["data"].dtype
+
+    def test_relatorio_bytes_por_coluna(self, df_processado):
+        """Relatório traz bytes antes/depois e economia por coluna"""
+        df, relatorio = compactar_tipos(df_processado)
+
+        assert list(relatorio["coluna"]) == list(df_processado.columns)
+        linha = relatorio.set_index("coluna").loc["idade"]
+        assert linha["bytes_antes"] == 200 * 8
+        assert linha["bytes_depois"] == 200 * 2
+        assert (relatorio["economia_bytes"] >= 0).all()
+        assert relatorio["bytes_depois"].sum() < relatorio["bytes_antes"].sum()
+
+    def test_nao_modifica_original(self, df_processado):
+        original = df_processado.copy()
+        compactar_tipos(df_processado)
+
+        pd.testing.assert_frame_equal(df_processado, original)
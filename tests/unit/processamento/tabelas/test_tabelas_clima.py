@@ -0,0 +1,67 @@
+"""
+Testes unitários para a separação das tabelas de clima e respondentes.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.processamento.tabelas import juntar_tabelas_clima, separar_tabelas_clima
+
+
+@pytest.fixture
+def df_respondentes():
+    """Três instantes, com 3, 2 e 1 respondentes; clima repetido por instante."""
+    return pd.DataFrame({
+        "data": ["5/8/2015"] * 5 + ["6/8/2015"],
+        "hora": ["09:10", "09:10", "09:10", "09:20", "09:20", "09:10"],
+        "idade": [20, 30, 40, 50, 60, 70],
+        "tmedia": ["19,5"] * 3 + ["20,1"] * 2 + ["18,0"],
+        "ur": ["80"] * 3 + [np.nan] * 2 + ["75"],
+        "sexo": ["m", "f", "m", "f", "m", "f"],
+    }, index=[10, 11, 12, 13, 14, 15])
+
+
+class TestTabelasClima:
+    """Testes para separar_tabelas_clima e juntar_tabelas_clima"""
+
+    def test_uma_linha_de_clima_por_instante(self, df_respondentes):
+        tabelas = separar_tabelas_clima(df_respondentes, ["tmedia", "ur", "vel_vento"])
+
+        assert list(tabelas.clima.columns) == ["data", "hora", "tmedia", "ur"]
+        assert len(tabelas.clima) == 3
+        assert list(tabelas.respondentes.columns) == ["data", "hora", "idade", "sexo"]
+        assert tabelas.posicao_clima.tolist() == [0, 0, 0, 1, 1, 2]
+        assert tabelas.fator_repeticao == 2.0
+
+    def test_juntar_reconstroi_original(self, df_respondentes):
+        tabelas = separar_tabelas_clima(df_respondentes, ["tmedia", "ur"])
+
+        pd.testing.assert_frame_equal(juntar_tabelas_clima(tabelas), df_respondentes)
+
+    def test_clima_divergente_no_mesmo_instante(self, df_respondentes):
+        """Valores diferentes no mesmo instante viram linhas de clima distintas"""
+        df = df_respondentes.copy()
+        df.loc[12, "tmedia"] = "30,0"
+
+        tabelas = separar_tabelas_clima(df, ["tmedia", "ur"])
+
+        assert len(tabelas.clima) == 4
+        pd.testing.assert_frame_equal(juntar_tabelas_clima(tabelas), df)
+
+    def test_colunas_novas_ao_final(self, df_respondentes):
+        tabelas = separar_tabelas_clima(df_respondentes, ["tmedia", "ur"])
+        tabelas = tabelas.substituir(
+            clima=tabelas.clima.assign(indice=np.arange(len(tabelas.clima))),
+            respondentes=tabelas.respondentes.assign(imc=1.0),
+        )
+
+        df = juntar_tabelas_clima(tabelas)
+
+        assert list(df.columns) == list(df_respondentes.columns) + ["imc", "indice"]
+        assert df["indice"].tolist() == [0, 0, 0, 1, 1, 2]
+
+    def test_substituir_exige_mesmas_linhas(self, df_respondentes):
+        tabelas = separar_tabelas_clima(df_respondentes, ["tmedia", "ur"])
+
+        with pytest.raises(ValueError):
+            tabelas.substituir(clima=tabelas.clima.iloc[:2])
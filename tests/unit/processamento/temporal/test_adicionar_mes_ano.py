@@ -14,3 +14,12 @@ def test_adicionar_mes_ano():
     
     assert 'mes-ano' in result.columns
     assert result['mes-ano'].tolist() == ['2023-01', '2023-02', '2023-01']
+
+
+def test_adicionar_mes_ano_data_invalida():
+    """Datas nulas/invalidas recebem rotulo 'desconhecido'."""
+    df = pd.DataFrame({'data': ['2023-01-15', None, 'nao-e-data']})
+
+    result = adicionar_mes_ano(df, 'data', 'mes-ano')
+
+    assert result['mes-ano'].tolist() == ['2023-01', 'desconhecido', 'desconhecido']
@@ -45,3 +45,49 @@ class TestConverterColunasTemporais:
         
         # Deve retornar DataFrame sem erro
         assert isinstance(df_resultado, pd.DataFrame)
+
+    def test_hora_com_e_sem_segundos(self):
+        """Testa cadeia de formatos da hora (%H:%M:%S e depois %H:%M)"""
+        from src.processamento.temporal.converter_colunas_temporais import converter_colunas_temporais
+
+        df = pd.DataFrame({"hora": ["09:10:30", "14:00", None, "invalida"]})
+
+        df_resultado = converter_colunas_temporais(df, "data", "hora")
+
+        assert df_resultado["hora"].dt.strftime("%H:%M:%S").tolist()[:2] == ["09:10:30", "14:00:00"]
+        assert df_resultado["hora"].iloc[2:].isna().all()
+
+    def test_coluna_data_hora_combinada(self):
+        """Testa criação opcional da coluna datetime combinada"""
+        from src.processamento.temporal.converter_colunas_temporais import converter_colunas_temporais
+
+        df = pd.DataFrame({
+            "data": ["5/8/2015", "6/8/2015"],
+            "hora": ["09:10", "14:30"],
+        })
+
+        df_resultado = converter_colunas_temporais(df, "data", "hora", coluna_data_hora="data_cplt")
+
+        assert df_resultado["data_cplt"].tolist() == [
+            pd.Timestamp("2015-08-05 09:10"),
+            pd.Timestamp("2015-08-06 14:30"),
+        ]
+
+    def test_valores_repetidos_convertidos_uma_vez(self, monkeypatch):
+        """Testa que apenas valores únicos são enviados ao parser"""
+        from src.processamento.temporal import converter_valores_unicos as modulo
+
+        chamadas = []
+        original = pd.to_datetime
+
+        def _espiao(valores, *args, **kwargs):
+            chamadas.append(len(valores))
+            return original(valores, *args, **kwargs)
+
+        monkeypatch.setattr(modulo.pd, "to_datetime", _espiao)
+        serie = pd.Series(["5/8/2015", "6/8/2015"] * 500)
+
+        resultado = modulo.converter_por_valores_unicos(serie)
+
+        assert max(chamadas) == 2
+        assert resultado.iloc[-1] == pd.Timestamp("2015-08-06")
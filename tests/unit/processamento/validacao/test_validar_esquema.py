@@ -0,0 +1,105 @@
+"""
+Testes unitários para a validação de esquema.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.processamento.validacao import (
+    ErroValidacaoEsquema,
+    compilar_esquema,
+    validar_esquema,
+)
+
+TIPOS = {
+    "data": "datetime64[ns]",
+    "idade": "Int64",
+    "peso": "Int64",
+    "ur": "float64",
+    "sexo": "string",
+}
+LIMITES = {"idade": (0, 120), "ur": (0, 100), "peso": (0, None)}
+
+
+@pytest.fixture
+def df_valido():
+    return pd.DataFrame({
+        "data": pd.date_range("2015-08-05", periods=4, freq="D"),
+        "idade": pd.array([18, 30, None, 65], dtype="Int64"),
+        "peso": [70.5, 80.0, 62.3, 90.1],
+        "ur": [14.4, 55.0, 88.3, np.nan],
+        "sexo": pd.array(["m", "f", "f", None], dtype="string"),
+        "extra": ["a", "b", "c", "d"],
+    })
+
+
+@pytest.fixture
+def esquema():
+    return compilar_esquema(TIPOS, LIMITES, taxa_maxima_faltantes=0.5)
+
+
+class TestValidarEsquema:
+    """Testes para compilar_esquema e validar_esquema"""
+
+    def test_lote_valido(self, df_valido, esquema):
+        """Float em coluna Int64 é aceito; colunas fora do esquema são ignoradas"""
+        relatorio = validar_esquema(df_valido, esquema)
+
+        assert relatorio["ok"].all()
+        assert list(relatorio.index) == list(TIPOS)
+        assert relatorio.loc["ur", "taxa_faltantes"] == 0.25
+
+    def test_relatorio_por_coluna(self, df_valido, esquema):
+        """Tipo, faixa e faltantes são conferidos numa chamada, coluna a coluna"""
+        df = df_valido.assign(
+            ur=[-1.0, 101.0, 150.0, np.nan],
+            idade=pd.array([None, None, None, 20], dtype="Int64"),
+            sexo=[1, 2, 1, 2],
+        )
+
+        relatorio = validar_esquema(df, esquema, falhar=False)
+
+        assert (relatorio.loc["ur", ["abaixo", "acima"]] == [1, 2]).all()
+        assert relatorio.loc["idade", "taxa_faltantes"] == 0.75
+        assert not relatorio.loc["sexo", "tipo_ok"]
+        assert relatorio.loc[~relatorio["ok"]].index.tolist() == ["idade", "ur", "sexo"]
+
+    def test_falha_com_relatorio(self, df_valido, esquema):
+        """Falha rápida: a mensagem lista só as colunas reprovadas"""
+        df = df_valido.assign(ur=["10", "20", "30", "40"])
+
+        with pytest.raises(ErroValidacaoEsquema, match="ur: tipo object") as erro:
+            validar_esquema(df, esquema)
+
+        assert "idade" not in str(erro.value)
+        assert not erro.value.relatorio.loc["ur", "ok"]
+
+    def test_colunas_restringem_esquema(self, df_valido):
+        """Com colunas, só elas entram no esquema (e nos limites)"""
+        esquema = compilar_esquema(TIPOS, LIMITES, colunas=["idade", "sexo"])
+
+        assert esquema.colunas == ("idade", "sexo")
+        assert validar_esquema(df_valido.drop(columns="sexo"), esquema).index.tolist() == ["idade"]
+
+    def test_isentas_faltantes(self, df_valido):
+        """Colunas isentas (imputadas adiante) não têm taxa máxima de faltantes"""
+        df = df_valido.assign(idade=[None, None, None, 300.0])
+        esquema = compilar_esquema(TIPOS, LIMITES, taxa_maxima_faltantes=0.5, isentas_faltantes=["idade"])
+
+        relatorio = validar_esquema(df.assign(idade=[None, None, None, 30.0]), esquema)
+        assert relatorio.loc["idade", "taxa_faltantes"] == 0.75
+        with pytest.raises(ErroValidacaoEsquema, match="idade: 1 acima do máximo$"):
+            validar_esquema(df, esquema)
+
+    @pytest.mark.parametrize(
+        "limites, taxa",
+        [
+            ({"altura": (0, None)}, 1.0),
+            ({"sexo": (0, 1)}, 1.0),
+            ({"ur": (100, 0)}, 1.0),
+            ({}, 1.5),
+        ],
+    )
+    def test_esquema_invalido(self, limites, taxa):
+        with pytest.raises(ValueError):
+            compilar_esquema(TIPOS, limites, taxa_maxima_faltantes=taxa)
@@ -0,0 +1,17 @@
+"""
+Testes unitários para salvar_features_modelo.py
+"""
+import os
+
+from src.treinamento.persistencia import carregar_features_modelo, salvar_features_modelo
+
+
+def test_salvar_e_carregar_ao_lado_do_modelo(tmp_path):
+    features = {"colunas_entrada": ["a", "t*u"], "features_modelo": ["t*u"], "alvo": "p1"}
+    caminho_modelo = os.path.join(tmp_path, "modelos", "modelo_final.pkl")
+
+    caminho = salvar_features_modelo(features, caminho_modelo)
+
+    assert caminho == os.path.join(tmp_path, "modelos", "modelo_final_features.json")
+    assert carregar_features_modelo(caminho_modelo) == features
+    assert carregar_features_modelo(caminho_modelo[:-4]) == features
@@ -0,0 +1,62 @@
+"""
+Testes unitários para extrair_features_modelo.py
+"""
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from sklearn.decomposition import PCA
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import FunctionTransformer
+from sklearn.tree import DecisionTreeClassifier
+
+from src.treinamento.utils import alinhar_entrada_modelo, extrair_features_modelo
+
+
+@pytest.fixture
+def dados():
+    return pd.DataFrame({
+        "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        "b": [6.0, 5.0, 4.0, 3.0, 2.0, 1.0],
+        "sexo": ["m", "f", "m", "f", "m", "f"],
+        "alvo": [0, 1, 0, 1, 1, 0],
+    })
+
+
+def _ajustar(dados, passo):
+    modelo = Pipeline([("preparo", FunctionTransformer(passo)), ("modelo", DecisionTreeClassifier())])
+    return modelo.fit(dados, dados["alvo"])
+
+
+def test_liga_one_hot_a_coluna_de_entrada(dados):
+    modelo = _ajustar(dados, lambda X: pd.get_dummies(X[["a", "sexo"]]))
+
+    features = extrair_features_modelo(modelo, "alvo")
+
+    assert features["colunas_entrada"] == ["a", "b", "sexo"]
+    assert features["features_modelo"] == ["a", "sexo"]
+    assert features["alvo"] == "alvo"
+
+
+def test_transformacao_sem_nomes_usa_todas_as_entradas(dados):
+    modelo = _ajustar(
+        dados,
+        lambda X: pd.DataFrame(PCA(1).fit_transform(X[["a", "b"]]), columns=["componente_0"]),
+    )
+
+    assert extrair_features_modelo(modelo, "alvo")["features_modelo"] == ["a", "b", "sexo"]
+
+
+def test_modelo_sem_nomes_retorna_none():
+    assert extrair_features_modelo(MagicMock()) is None
+
+
+def test_alinhar_entrada_preenche_colunas_nao_usadas():
+    features = {"colunas_entrada": ["a", "b", "sexo"], "features_modelo": ["a", "sexo"]}
+
+    alinhado = alinhar_entrada_modelo(pd.DataFrame({"sexo": ["m"], "a": [1.0]}), features)
+
+    assert alinhado.columns.tolist() == ["a", "b", "sexo"]
+    assert alinhado["b"].isna().all()
+    with pytest.raises(ValueError, match="ausentes"):
+        alinhar_entrada_modelo(pd.DataFrame({"a": [1.0]}), features)
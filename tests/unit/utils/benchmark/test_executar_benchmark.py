@@ -0,0 +1,125 @@
+"""
+Testes unitários para executar_benchmark.py e comparar_benchmark.py
+"""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config import config_custom as config
+from src.utils.benchmark import DadosBenchmark, comparar_benchmark, executar_benchmark
+from src.utils.benchmark.__main__ import principal
+
+
+@pytest.fixture(scope="module")
+def dados(tmp_path_factory):
+    rng = np.random.default_rng(1)
+    linhas = []
+    for dia in range(1, 9):
+        mes = 1 if dia <= 4 else 7
+        for hora in ("09:10", "14:30"):
+            tmedia, ur, rsolar = rng.normal(25, 4), rng.uniform(50, 90), rng.uniform(100, 800)
+            for _ in range(4):
+                linhas.append({
+                    "DATA": f"{dia}/{mes}/2015",
+                    "HORA": hora,
+                    "Tmedia": f"{tmedia:.2f}".replace(".", ","),
+                    "UR": f"{ur:.1f}".replace(".", ","),
+                    "RSolarMed": f"{rsolar:.1f}".replace(".", ","),
+                    "SEXO": rng.choice(["1", "2"]),
+                    "IDADE": str(rng.integers(18, 60)),
+                    "PESO": str(rng.integers(50, 100)),
+                    "ALTURA": str(rng.integers(150, 195)),
+                    "P1": rng.choice(["-1", "0", "1"]),
+                })
+    dados = DadosBenchmark(pd.DataFrame(linhas), diretorio=tmp_path_factory.mktemp("benchmark"))
+    yield dados
+    dados.fechar()
+
+
+def _resultado(tempo, memoria=10_000_000, calibracao=0.1, caso="features"):
+    return {
+        "calibracao_s": calibracao,
+        "resultados": [
+            {"caso": caso, "tamanho": 1000, "tempo_mediano_s": tempo, "pico_memoria_bytes": memoria}
+        ],
+    }
+
+
+def test_executa_casos_e_registra_metricas(dados):
+    resultado = executar_benchmark(
+        casos=["normalizar", "load_dataframe_parquet", "api_predict"],
+        tamanhos=[200, 100],
+        repeticoes=1,
+        aquecimento=0,
+        dados=dados,
+    )
+    tabela = pd.DataFrame(resultado["resultados"])
+    assert tabela[["caso", "tamanho"]].values.tolist()[:2] == [["normalizar", 100], ["normalizar", 200]]
+    assert (tabela["tempo_mediano_s"] > 0).all() and (tabela["pico_memoria_bytes"] > 0).all()
+    api = tabela[tabela["caso"] == "api_predict"]
+    assert api["unidade"].eq("requisicoes").all() and api["quantidade"].tolist() == [1, 2]
+    assert resultado["calibracao_s"] > 0
+    json.dumps(resultado)
+
+
+def test_api_predict_nos_tamanhos_padrao():
+    """Lotes sintéticos pequenos (clima vazio) passam pela validação do esquema"""
+    dados = DadosBenchmark()
+    try:
+        resultado = executar_benchmark(
+            casos=["api_predict"], repeticoes=1, aquecimento=0, medir_memoria=None, dados=dados
+        )
+    finally:
+        dados.fechar()
+
+    tabela = pd.DataFrame(resultado["resultados"])
+    assert tabela["tamanho"].tolist() == sorted(config.BENCHMARK_TAMANHOS)
+    assert (tabela["tempo_mediano_s"] > 0).all()
+
+
+def test_caso_desconhecido(dados):
+    with pytest.raises(ValueError):
+        executar_benchmark(casos=["treino"], dados=dados)
+
+
+def test_comparacao_marca_regressao_melhora_e_ruido():
+    base = {"calibracao_s": 0.1, "resultados": [
+        {"caso": "a", "tamanho": 1000, "tempo_mediano_s": 1.0, "pico_memoria_bytes": 10_000_000},
+        {"caso": "b", "tamanho": 1000, "tempo_mediano_s": 1.0, "pico_memoria_bytes": 10_000_000},
+        {"caso": "c", "tamanho": 1000, "tempo_mediano_s": 0.001, "pico_memoria_bytes": 1000},
+        {"caso": "d", "tamanho": 1000, "tempo_mediano_s": 1.0, "pico_memoria_bytes": None},
+    ]}
+    atual = {"calibracao_s": 0.1, "resultados": [
+        {"caso": "a", "tamanho": 1000, "tempo_mediano_s": 1.5, "pico_memoria_bytes": 10_100_000},
+        {"caso": "b", "tamanho": 1000, "tempo_mediano_s": 0.5, "pico_memoria_bytes": 30_000_000},
+        {"caso": "c", "tamanho": 1000, "tempo_mediano_s": 0.003, "pico_memoria_bytes": 5000},
+        {"caso": "e", "tamanho": 1000, "tempo_mediano_s": 1.0, "pico_memoria_bytes": 1},
+    ]}
+    tabela = comparar_benchmark(atual, base, limiar=0.25)
+    situacao = tabela.set_index(["caso", "metrica"])["situacao"]
+    assert situacao[("a", "tempo_mediano_s")] == "regressao"
+    assert situacao[("a", "pico_memoria_bytes")] == "estavel"
+    assert situacao[("b", "tempo_mediano_s")] == "melhora"
+    assert situacao[("b", "pico_memoria_bytes")] == "regressao"
+    # Variação relativa grande, mas abaixo do mínimo absoluto
+    assert situacao[("c", "tempo_mediano_s")] == "estavel"
+    assert situacao[("d", "tempo_mediano_s")] == "ausente"
+    assert situacao[("e", "tempo_mediano_s")] == "novo"
+
+
+def test_normalizacao_pela_calibracao():
+    # Máquina atual duas vezes mais lenta: 2x o tempo não é regressão
+    atual, base = _resultado(2.0, calibracao=0.2), _resultado(1.0, calibracao=0.1)
+    assert comparar_benchmark(atual, base)["situacao"].iloc[0] == "regressao"
+    assert comparar_benchmark(atual, base, normalizar_maquina=True)["situacao"].iloc[0] == "estavel"
+
+
+def test_comando_comparar_sai_com_erro_na_regressao(tmp_path):
+    caminhos = {}
+    for nome, tempo in {"base": 1.0, "ok": 1.1, "lento": 2.0}.items():
+        caminhos[nome] = tmp_path / f"{nome}.json"
+        caminhos[nome].write_text(json.dumps(_resultado(tempo)), encoding="utf-8")
+    assert principal(["comparar", str(caminhos["ok"]), "--baseline", str(caminhos["base"])]) == 0
+    assert principal(["comparar", str(caminhos["lento"]), "--baseline", str(caminhos["base"])]) == 1
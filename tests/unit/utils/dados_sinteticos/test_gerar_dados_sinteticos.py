@@ -0,0 +1,73 @@
+"""
+Testes unitários para ajustar_modelo_sintetico.py e gerar_dados_sinteticos.py
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipelines.pipeline_processamento import executar_pipeline_processamento
+from src.utils.dados_sinteticos.ajustar_modelo_sintetico import ajustar_modelo_sintetico
+from src.utils.dados_sinteticos.gerar_dados_sinteticos import gerar_dados_sinteticos
+from src.utils.io.io_local import load_dataframe
+
+
+@pytest.fixture
+def df_real():
+    """Base bruta no formato do CSV original: clima por sessão, respondentes por linha."""
+    rng = np.random.default_rng(0)
+    linhas = []
+    for dia in range(1, 7):
+        mes = 1 if dia <= 3 else 7
+        for hora in ("09:10", "14:30", "16:40"):
+            tmedia = rng.normal(30 if mes == 1 else 16, 2)
+            ur = rng.uniform(50, 90)
+            for _ in range(rng.integers(3, 6)):
+                linhas.append({
+                    "DATA": f"{dia}/{mes}/2015",
+                    "HORA": hora,
+                    "Tmedia": f"{tmedia:.2f}".replace(".", ","),
+                    "UR": f"{ur:.1f}".replace(".", ","),
+                    "Tu": "" if dia == 2 else f"{tmedia - 3:.1f}".replace(".", ","),
+                    "SEXO": rng.choice(["1", "2"]),
+                    "IDADE": str(rng.integers(18, 60)),
+                    "P1": rng.choice(["-2", "-1", "0", "1", "2", "99"], p=[.1, .2, .3, .2, .1, .1]),
+                    "PESO": rng.choice(["60", "72", "85", "x"], p=[.3, .3, .3, .1]),
+                })
+    return pd.DataFrame(linhas)
+
+
+def test_modelo_separa_clima_e_respondente(df_real):
+    modelo = ajustar_modelo_sintetico(df_real)
+    assert modelo["clima"] == ["Tmedia", "UR", "Tu"]
+    assert modelo["respondente"] == ["SEXO", "IDADE", "P1", "PESO"]
+    assert modelo["meses"] == [1, 7]
+    assert modelo["faltantes_clima"]["Tu"]["p_dia"] == pytest.approx(1 / 6)
+
+
+def test_reprodutivel_e_no_formato_bruto(df_real):
+    modelo = ajustar_modelo_sintetico(df_real)
+    a = gerar_dados_sinteticos(modelo, 2500, semente=5, linhas_por_lote=700, taxa_ruido=0.01)
+    b = gerar_dados_sinteticos(modelo, 2500, semente=5, linhas_por_lote=700, taxa_ruido=0.01)
+    c = gerar_dados_sinteticos(modelo, 2500, semente=6, linhas_por_lote=700, taxa_ruido=0.01)
+
+    pd.testing.assert_frame_equal(a, b)
+    assert not a.equals(c)
+    assert len(a) == 2500 and list(a.columns) == list(df_real.columns)
+    assert set(a["P1"].dropna()) <= set(df_real["P1"]) | {"x", "-"}
+    assert a["Tmedia"].str.contains(",").any()
+    assert set(pd.to_datetime(a["DATA"], format="%d/%m/%Y").dt.month) <= {1, 7}
+    assert "x" in set(a["PESO"]) and "99" in set(a["P1"])
+    assert a["Tu"].isna().any()
+
+
+def test_parquet_por_lotes_segue_no_pipeline(df_real, tmp_path):
+    caminho = gerar_dados_sinteticos(df_real, 1200, tmp_path / "sint.parquet", linhas_por_lote=500)
+    df = load_dataframe(str(caminho))
+    assert len(df) == 1200
+
+    processado = executar_pipeline_processamento(
+        df, colunas_float=["tmedia", "ur", "tu"], colunas_int=["idade", "peso"]
+    )
+    assert len(processado) == 1200
+    assert processado["tmedia"].between(0, 45).all()
+    assert processado["peso"].isna().sum() < 1200 * 0.3
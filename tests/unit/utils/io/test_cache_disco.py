@@ -0,0 +1,46 @@
+"""
+Testes unitários para cache_disco.py (gravação atômica e descarte LRU)
+"""
+import os
+
+import pytest
+
+from src.utils.io.cache_disco import aplicar_limite_lru, gravar_atomico
+
+
+class TestGravarAtomico:
+    def test_grava_e_nao_deixa_temporario(self, tmp_path):
+        destino = tmp_path / "saida.bin"
+        gravar_atomico(destino, lambda caminho: open(caminho, "wb").write(b"novo"))
+        assert destino.read_bytes() == b"novo"
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_falha_preserva_arquivo_anterior(self, tmp_path):
+        destino = tmp_path / "saida.bin"
+        destino.write_bytes(b"antigo")
+
+        def gravar_com_erro(caminho):
+            open(caminho, "wb").write(b"parcial")
+            raise OSError("disco cheio")
+
+        with pytest.raises(OSError):
+            gravar_atomico(destino, gravar_com_erro)
+        assert destino.read_bytes() == b"antigo"
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
+class TestAplicarLimiteLru:
+    def test_remove_mais_antigos_apenas_do_padrao(self, tmp_path):
+        for i, nome in enumerate(["a.feather", "b.feather", "c.feather"]):
+            caminho = tmp_path / nome
+            caminho.write_bytes(b"x" * 100)
+            os.utime(caminho, (1000 + i, 1000 + i))
+        (tmp_path / "outro.joblib").write_bytes(b"x" * 1000)
+
+        removidas = aplicar_limite_lru(tmp_path, "*.feather", 150)
+
+        assert removidas == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["c.feather", "outro.joblib"]
+
+    def test_pasta_inexistente(self, tmp_path):
+        assert aplicar_limite_lru(tmp_path / "nao_existe", "*.joblib", 0) == 0
@@ -0,0 +1,146 @@
+"""
+Testes unitários para cache_leitura.py (cache colunar do load_dataframe)
+"""
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.io import cache_leitura
+from src.utils.io.io_local import load_dataframe
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Isola o diretório de cache em pasta temporária."""
+    pasta = tmp_path / "cache"
+    monkeypatch.setenv("CACHE_DADOS_DIR", str(pasta))
+    monkeypatch.delenv("CACHE_DADOS_ATIVO", raising=False)
+    monkeypatch.delenv("CACHE_DADOS_LIMITE_MB", raising=False)
+    return pasta
+
+
+@pytest.fixture
+def csv_semicolon(tmp_path):
+    caminho = tmp_path / "dados.csv"
+    caminho.write_text("DATA;IDADE;SEXO;TMEDIA\n5/8/2015;51;f;18,27\n5/8/2015;;m;\n")
+    return caminho
+
+
+def test_primeira_leitura_grava_cache(cache_dir, csv_semicolon):
+    """A primeira leitura grava um arquivo Feather no cache."""
+    load_dataframe(str(csv_semicolon))
+
+    assert len(list(cache_dir.glob("*.feather"))) == 1
+
+
+def test_leitura_do_cache_igual_ao_parse(cache_dir, csv_semicolon):
+    """Leitura via cache é idêntica à leitura direta, inclusive nulos como NaN."""
+    original = load_dataframe(str(csv_semicolon), usar_cache=False)
+    load_dataframe(str(csv_semicolon))
+    do_cache = load_dataframe(str(csv_semicolon))
+
+    pd.testing.assert_frame_equal(do_cache, original)
+    assert isinstance(do_cache["TMEDIA"].iloc[1], float)
+
+
+def test_cache_usado_na_segunda_leitura(cache_dir, csv_semicolon, monkeypatch):
+    """Com entrada em cache, o parser não é chamado novamente."""
+    load_dataframe(str(csv_semicolon))
+
+    def _falhar(*args, **kwargs):
+        raise AssertionError("parser não deveria ser chamado")
+
+    monkeypatch.setattr("src.utils.io.io_local._read_csv_robust", _falhar)
+    df = load_dataframe(str(csv_semicolon))
+    assert len(df) == 2
+
+
+def test_conteudo_alterado_invalida_chave(cache_dir, csv_semicolon):
+    """Alterar o conteúdo do arquivo gera nova chave."""
+    load_dataframe(str(csv_semicolon))
+    csv_semicolon.write_text("DATA;IDADE\n1/1/2020;30\n")
+
+    df = load_dataframe(str(csv_semicolon))
+
+    assert list(df.columns) == ["DATA", "IDADE"]
+    assert len(list(cache_dir.glob("*.feather"))) == 2
+
+
+def test_opcoes_parser_fazem_parte_da_chave(csv_semicolon):
+    """Opções diferentes do parser geram chaves diferentes."""
+    chave_a = cache_leitura.chave_cache(str(csv_semicolon), "xlsx", {})
+    chave_b = cache_leitura.chave_cache(str(csv_semicolon), "xlsx", {"sheet_name": 1})
+
+    assert chave_a != chave_b
+
+
+def test_desativar_cache_por_argumento(cache_dir, csv_semicolon):
+    """usar_cache=False não grava nada."""
+    load_dataframe(str(csv_semicolon), usar_cache=False)
+
+    assert not cache_dir.exists()
+
+
+def test_desativar_cache_por_ambiente(cache_dir, csv_semicolon, monkeypatch):
+    """CACHE_DADOS_ATIVO=0 desativa o cache."""
+    monkeypatch.setenv("CACHE_DADOS_ATIVO", "0")
+    load_dataframe(str(csv_semicolon))
+
+    assert not cache_dir.exists()
+
+
+def test_limite_lru_remove_menos_usados(tmp_path):
+    """Acima do limite, as entradas com uso mais antigo são removidas."""
+    pasta = tmp_path / "cache"
+    df = pd.DataFrame({"x": np.arange(20_000, dtype="float64")})
+    for indice, chave in enumerate(["a", "b", "c"]):
+        caminho = cache_leitura.gravar_no_cache(df, chave, str(pasta), limite_mb=10)
+        os.utime(caminho, (time.time() - 100 + indice, time.time() - 100 + indice))
+
+    # Acesso recente em "a" o torna o mais novo
+    assert cache_leitura.ler_do_cache("a", str(pasta)) is not None
+    tamanho = (pasta / "a.feather").stat().st_size
+    removidas = cache_leitura.aplicar_limite_lru(str(pasta), limite_mb=2 * tamanho / 1024 / 1024)
+
+    assert removidas == 1
+    assert not (pasta / "b.feather").exists()
+    assert (pasta / "a.feather").exists()
+    assert (pasta / "c.feather").exists()
+
+
+def test_limpar_cache(tmp_path):
+    """limpar_cache_leitura remove todas as entradas."""
+    pasta = tmp_path / "cache"
+    cache_leitura.gravar_no_cache(pd.DataFrame({"x": [1]}), "a", str(pasta))
+
+    assert cache_leitura.limpar_cache_leitura(str(pasta)) == 1
+    assert list(pasta.glob("*.feather")) == []
+
+
+def test_falha_de_serializacao_nao_interrompe(tmp_path):
+    """Colunas não serializáveis apenas deixam de ser cacheadas."""
+    df = pd.DataFrame({"misto": [1, "a", 2.5]})
+
+    assert cache_leitura.gravar_no_cache(df, "x", str(tmp_path)) is None
+
+
+def test_filtro_de_data_usa_o_cache(cache_dir, tmp_path, monkeypatch):
+    """Datas em texto no cache: filtro temporal é acerto de cache, sem regravar a entrada."""
+    caminho = tmp_path / "datas.csv"
+    caminho.write_text("DATA;IDADE\n5/8/2015;51\n20/8/2016;30\n3/9/2016;22\n")
+    filtros = [("DATA", ">=", pd.Timestamp("2016-07-01"))]
+    esperado = load_dataframe(str(caminho), usar_cache=False, filters=filtros)
+    load_dataframe(str(caminho), filters=filtros)
+
+    def _falhar(*args, **kwargs):
+        raise AssertionError("cache deveria ser usado")
+
+    monkeypatch.setattr("src.utils.io.io_local._read_csv_robust", _falhar)
+    monkeypatch.setattr("src.utils.io.io_local.gravar_no_cache", _falhar)
+    df = load_dataframe(str(caminho), columns=["IDADE"], filters=filtros)
+
+    assert df["IDADE"].tolist() == esperado["IDADE"].tolist() == [30, 22]
+    pd.testing.assert_frame_equal(load_dataframe(str(caminho), filters=filtros), esperado)
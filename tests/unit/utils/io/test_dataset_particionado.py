@@ -0,0 +1,130 @@
+"""
+Testes unitários para dataset_particionado.py
+"""
+import pandas as pd
+import pyarrow.dataset as ds
+import pytest
+
+from src.utils.io.dataset_particionado import (
+    carregar_dados_etapa,
+    filtros_ultimos_meses,
+    ler_dataset_particionado,
+    salvar_dados_etapa,
+    salvar_dataset_particionado,
+    valores_particao,
+)
+from src.utils.io.leitura_colunar import filtros_para_expressao
+from src.utils.io.io_local import load_dataframe
+
+
+@pytest.fixture
+def df_meses():
+    return pd.DataFrame({
+        "data": pd.to_datetime(["2024-11-05", "2024-12-01", "2025-01-10", "2025-02-02", "2025-02-20", "2025-01-11"]),
+        "idade": pd.array([20, None, 35, 41, 28, 33], dtype="Int64"),
+        "sexo": pd.array(["m", "f", None, "f", "m", "f"], dtype="string"),
+        "tmedia": [18.5, 25.0, 30.1, 27.3, 22.0, 31.0],
+        "mes-ano": ["2024-11", "2024-12", "2025-01", "2025-02", "2025-02", "2025-01"],
+    })
+
+
+def _por_mes(df):
+    return df.sort_values("mes-ano", kind="stable").reset_index(drop=True)
+
+
+def test_grava_particoes_hive(df_meses, tmp_path):
+    diretorio = salvar_dataset_particionado(df_meses, str(tmp_path / "dados"))
+
+    arquivos = sorted(p.relative_to(diretorio).as_posix() for p in diretorio.rglob("*.parquet"))
+    assert arquivos == [
+        "ano=2024/mes-ano=2024-11/parte-0.parquet",
+        "ano=2024/mes-ano=2024-12/parte-0.parquet",
+        "ano=2025/mes-ano=2025-01/parte-0.parquet",
+        "ano=2025/mes-ano=2025-02/parte-0.parquet",
+    ]
+    estatisticas = ds.dataset(str(diretorio / arquivos[2]), format="parquet")
+    coluna = next(estatisticas.get_fragments()).metadata.row_group(0).column(3)
+    assert coluna.statistics.has_min_max
+    assert (coluna.statistics.min, coluna.statistics.max) == (30.1, 31.0)
+
+
+def test_leitura_preserva_colunas_e_tipos(df_meses, tmp_path):
+    salvar_dataset_particionado(df_meses, str(tmp_path / "dados"))
+
+    lido = load_dataframe(str(tmp_path / "dados"))
+
+    pd.testing.assert_frame_equal(_por_mes(lido), _por_mes(df_meses))
+
+
+def test_ultimos_meses_le_so_as_particoes(df_meses, tmp_path):
+    diretorio = str(tmp_path / "dados")
+    rotulos = df_meses["mes-ano"].replace("2024-11", "desconhecido")
+    salvar_dataset_particionado(df_meses.assign(**{"mes-ano": rotulos}), diretorio)
+
+    filtros = filtros_ultimos_meses(diretorio, 2)
+    lido = load_dataframe(diretorio, columns=["idade", "mes-ano"], filters=filtros)
+
+    assert filtros == [("mes-ano", "in", ["2025-01", "2025-02"])]
+    assert list(lido.columns) == ["idade", "mes-ano"]
+    assert sorted(lido["mes-ano"]) == ["2025-01", "2025-01", "2025-02", "2025-02"]
+    fragmentos = list(
+        ds.dataset(diretorio, format="parquet", partitioning="hive").get_fragments(
+            filter=filtros_para_expressao(filtros)
+        )
+    )
+    assert len(fragmentos) == 2
+
+
+def test_filtro_por_ano_derivado(df_meses, tmp_path):
+    diretorio = str(tmp_path / "dados")
+    salvar_dataset_particionado(df_meses, diretorio)
+
+    lido = ler_dataset_particionado(diretorio, filters=[("ano", "==", 2024)])
+
+    assert "ano" not in lido.columns
+    assert sorted(lido["mes-ano"]) == ["2024-11", "2024-12"]
+    assert valores_particao(diretorio, "ano") == [2024, 2025]
+
+
+def test_atualizacao_substitui_so_meses_presentes(df_meses, tmp_path):
+    diretorio = str(tmp_path / "dados")
+    salvar_dataset_particionado(df_meses, diretorio)
+    novo = df_meses[df_meses["mes-ano"] == "2025-02"].assign(tmedia=0.0)
+
+    salvar_dataset_particionado(novo, diretorio, substituir=False)
+
+    lido = _por_mes(ler_dataset_particionado(diretorio))
+    assert len(lido) == len(df_meses)
+    assert (lido.loc[lido["mes-ano"] == "2025-02", "tmedia"] == 0.0).all()
+    assert (lido.loc[lido["mes-ano"] != "2025-02", "tmedia"] > 0).all()
+
+
+def test_exige_coluna_de_particao(df_meses, tmp_path):
+    with pytest.raises(ValueError, match="ausente"):
+        salvar_dataset_particionado(df_meses.drop(columns="mes-ano"), str(tmp_path / "dados"))
+
+
+def test_dados_etapa_particionados_voltam_em_ordem_de_data(df_meses, tmp_path):
+    ordenado = df_meses.sort_values("data", ignore_index=True)
+    diretorio = salvar_dados_etapa(ordenado, str(tmp_path / "dados_features"))
+
+    resultado = carregar_dados_etapa(str(diretorio), coluna_ordem="data")
+
+    assert any(diretorio.rglob("*.parquet"))
+    assert resultado["data"].tolist() == ordenado["data"].tolist()
+    assert resultado["tmedia"].tolist() == ordenado["tmedia"].tolist()
+
+
+@pytest.mark.parametrize("sem_particao", ["ausente", "nulos"])
+def test_dados_etapa_sem_particao_gravam_csv(df_meses, tmp_path, sem_particao):
+    if sem_particao == "ausente":
+        df = df_meses.drop(columns="mes-ano")
+    else:
+        df = df_meses.assign(**{"mes-ano": df_meses["mes-ano"].where(df_meses.index != 2)})
+
+    diretorio = salvar_dados_etapa(df, str(tmp_path / "dados_processados"))
+    resultado = carregar_dados_etapa(str(diretorio), coluna_ordem="data")
+
+    assert [p.name for p in diretorio.iterdir()] == ["dados_processados.csv"]
+    assert resultado["tmedia"].tolist() == df["tmedia"].tolist()
+    assert resultado.columns.tolist() == df.columns.tolist()
@@ -0,0 +1,143 @@
+"""
+Testes unitários para leitura_colunar.py (columns/filters do load_dataframe)
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.io.io_local import load_dataframe
+from src.utils.io.leitura_colunar import (
+    colunas_dos_filtros,
+    ler_csv_filtrado,
+    ler_feather,
+    mascara_filtros,
+    normalizar_filtros,
+)
+
+
+@pytest.fixture(autouse=True)
+def sem_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("CACHE_DADOS_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def df_exemplo():
+    return pd.DataFrame({
+        "data": pd.to_datetime(["2015-08-05", "2015-08-06", "2015-09-01", "2015-10-10"]),
+        "tmedia": [18.2, 20.5, 25.1, 30.0],
+        "ur": [85.0, 70.0, 60.0, 50.0],
+        "sexo": ["f", "m", "f", "m"],
+    })
+
+
+def test_normalizar_filtros_and_simples():
+    """Lista de tuplas vira um único grupo AND."""
+    assert normalizar_filtros([("a", ">", 1), ("b", "==", 2)]) == [[("a", ">", 1), ("b", "==", 2)]]
+
+
+def test_operador_invalido():
+    with pytest.raises(ValueError):
+        normalizar_filtros([("a", "~", 1)])
+
+
+def test_colunas_dos_filtros():
+    assert colunas_dos_filtros([[("a", ">", 1)], [("b", "<", 2), ("a", "<", 5)]]) == ["a", "b"]
+
+
+def test_mascara_filtros_or_de_ands(df_exemplo):
+    """Grupos externos são combinados com OR."""
+    filtros = [[("sexo", "==", "f"), ("tmedia", ">", 20)], [("ur", ">=", 85)]]
+    assert mascara_filtros(df_exemplo, filtros).tolist() == [True, False, True, False]
+
+
+@pytest.mark.parametrize("ext", ["parquet", "feather"])
+def test_pushdown_colunar(tmp_path, df_exemplo, ext):
+    """Projeção e filtros em Parquet/Feather retornam apenas o necessário."""
+    caminho = tmp_path / f"dados.{ext}"
+    getattr(df_exemplo, f"to_{ext}")(caminho)
+
+    df = load_dataframe(
+        str(caminho),
+        columns=["tmedia", "sexo"],
+        filters=[("data", ">=", pd.Timestamp("2015-08-06")), ("data", "<", pd.Timestamp("2015-10-01"))],
+    )
+
+    assert list(df.columns) == ["tmedia", "sexo"]
+    assert df["tmedia"].tolist() == [20.5, 25.1]
+
+
+def test_feather_sem_copia_somente_leitura(tmp_path, df_exemplo):
+    """Com sem_copia, colunas numéricas sem nulos apontam para o arquivo mapeado."""
+    caminho = tmp_path / "dados.feather"
+    df_exemplo.to_feather(caminho, compression="uncompressed")
+
+    df = ler_feather(str(caminho), columns=["tmedia"], sem_copia=True)
+
+    assert not df["tmedia"].to_numpy().flags.writeable
+    assert df["tmedia"].tolist() == df_exemplo["tmedia"].tolist()
+
+
+def test_csv_filtrado_em_blocos(tmp_path):
+    """CSV é lido em blocos, mantendo só as colunas e linhas pedidas."""
+    caminho = tmp_path / "dados.csv"
+    n = 1_000
+    pd.DataFrame({
+        "id": np.arange(n),
+        "grupo": np.where(np.arange(n) % 2 == 0, "par", "impar"),
+        "valor": np.arange(n) * 0.5,
+    }).to_csv(caminho, sep=";", index=False)
+
+    df = ler_csv_filtrado(
+        str(caminho), columns=["valor"], filters=[("grupo", "==", "par"), ("id", "<", 10)],
+        tamanho_bloco=64,
+    )
+
+    assert list(df.columns) == ["valor"]
+    assert df["valor"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_csv_filtro_por_data_em_texto(tmp_path):
+    """Datas brutas (dia/mes/ano) são comparadas como datas quando o filtro é temporal."""
+    caminho = tmp_path / "dados.csv"
+    caminho.write_text("DATA;IDADE\n5/8/2015;51\n20/8/2015;30\n3/9/2015;22\n")
+
+    df = load_dataframe(str(caminho), usar_cache=False, filters=[("DATA", ">=", date(2015, 8, 10))])
+
+    assert df["IDADE"].tolist() == [30, 22]
+
+
+def test_csv_com_cache_aplica_projecao(tmp_path):
+    """Com cache ativo, a projeção vale na primeira leitura e no acerto de cache."""
+    caminho = tmp_path / "dados.csv"
+    caminho.write_text("A;B;C\n1;2;3\n4;5;6\n")
+
+    primeira = load_dataframe(str(caminho), columns=["C", "A"], filters=[("B", ">", 2)])
+    segunda = load_dataframe(str(caminho), columns=["C", "A"], filters=[("B", ">", 2)])
+
+    pd.testing.assert_frame_equal(primeira, segunda)
+    assert primeira.to_dict("list") == {"C": [6], "A": [4]}
+
+
+def test_csv_filtrado_igual_a_leitura_completa(tmp_path):
+    """Filtrar na leitura dá o mesmo que ler tudo e filtrar (delimitador, codificação e dtypes)."""
+    caminho = tmp_path / "dados.csv"
+    n = 300
+    df = pd.DataFrame({
+        "id": np.arange(n),
+        "codigo": [str(i) for i in range(n - 1)] + ["x1"],
+        "idade": pd.array([20 + i % 50 if i < 250 else None for i in range(n)], dtype="Int64"),
+        "tmedia": np.linspace(10.0, 35.0, n) / 3,
+        "sexo": np.where(np.arange(n) % 3 == 0, "mulher não informada", "homem"),
+    })
+    df.to_csv(caminho, sep=";", index=False, encoding="latin-1")
+    filtros = [("id", "<", 100), ("sexo", "!=", "homem")]
+
+    completo = load_dataframe(str(caminho), usar_cache=False)
+    esperado = completo.loc[mascara_filtros(completo, filtros)].reset_index(drop=True)
+    resultado = ler_csv_filtrado(str(caminho), filters=filtros, tamanho_bloco=64)
+
+    pd.testing.assert_frame_equal(resultado, esperado)
+    assert resultado["codigo"].map(type).eq(str).all()
+    assert resultado["idade"].dtype == np.float64
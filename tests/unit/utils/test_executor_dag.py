@@ -0,0 +1,82 @@
+"""
+Testes unitários para executor_dag.py
+"""
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.criacao_features import adicionar_features_derivadas
+from src.features.normalizacao.normalizar import normalizar
+from src.processamento.imputacao import imputar_por_coluna
+from src.utils.executor_dag import NoColuna, executar_grafo, montar_niveis
+
+
+def _dobrar(df, origem, destino):
+    return {destino: df[origem] * 2}, origem
+
+
+def _no(origem, destino):
+    return NoColuna(destino, partial(_dobrar, origem=origem, destino=destino), (origem,), (destino,))
+
+
+@pytest.fixture
+def df_clima():
+    rng = np.random.default_rng(3)
+    n = 120
+    df = pd.DataFrame({
+        "tmedia": rng.normal(22, 5, n),
+        "ur": rng.uniform(40, 95, n),
+        "peso": pd.array(rng.integers(50, 100, n), dtype="Int64"),
+        "altura": rng.normal(170, 10, n),
+        "sexo": pd.array(rng.choice(["m", "f"], n), dtype="string"),
+        "mes-ano": np.repeat(["01-2020", "02-2020", "03-2020"], n // 3),
+    })
+    df.loc[[3, 40, 90], "tmedia"] = np.nan
+    df.loc[[5, 77], "peso"] = pd.NA
+    df.loc[[8], "sexo"] = pd.NA
+    return df
+
+
+def test_niveis_respeitam_dependencias():
+    nos = [_no("a", "b"), _no("x", "y"), _no("b", "c"), _no("c", "a")]
+    assert montar_niveis(nos) == [[0, 1], [2], [3]]
+
+
+def test_ordem_das_colunas_segue_a_declaracao():
+    df = pd.DataFrame({"a": [1.0, 2.0]})
+    nos = [_no("a", "b"), _no("b", "c"), _no("a", "d")]
+    resultado, artefatos = executar_grafo(df, nos, n_trabalhadores=3)
+    assert list(resultado.columns) == ["a", "b", "c", "d"]
+    assert resultado["c"].tolist() == [4.0, 8.0]
+    assert list(artefatos) == ["b", "c", "d"]
+
+
+def test_modo_invalido():
+    with pytest.raises(ValueError):
+        executar_grafo(pd.DataFrame({"a": [1]}), [_no("a", "b")], modo="gpu")
+
+
+@pytest.mark.parametrize("modo", ["thread", "processo"])
+def test_paralelo_igual_ao_sequencial(df_clima, modo):
+    tipos = ["imc", "imc_classe", "heat_index", "dew_point", "t*u", "t/u"]
+    sequencial = adicionar_features_derivadas(df_clima, tipos)
+    paralelo = adicionar_features_derivadas(df_clima, tipos, n_trabalhadores=3, modo_execucao=modo)
+    pd.testing.assert_frame_equal(paralelo, sequencial)
+
+    config = {"tmedia": "mean", "peso": "median", "sexo": "mode"}
+    pd.testing.assert_frame_equal(
+        imputar_por_coluna(df_clima, config, n_trabalhadores=3, modo_execucao=modo),
+        imputar_por_coluna(df_clima, config),
+    )
+
+
+def test_normalizacao_paralela_igual_a_sequencial(df_clima):
+    colunas = ["tmedia", "ur", "altura"]
+    esperado, scalers = normalizar(df_clima, colunas, agrupamento="mes-ano", sufixo="_norm")
+    resultado, scalers_paralelo = normalizar(
+        df_clima, colunas, agrupamento="mes-ano", sufixo="_norm", n_trabalhadores=3
+    )
+    pd.testing.assert_frame_equal(resultado, esperado)
+    assert scalers_paralelo == scalers
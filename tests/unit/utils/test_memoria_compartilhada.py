@@ -0,0 +1,51 @@
+"""
+Testes unitários para memoria_compartilhada.py
+"""
+import pickle
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.memoria_compartilhada import PublicacaoCompartilhada
+
+
+@pytest.fixture
+def df_tipos():
+    return pd.DataFrame(
+        {
+            "real": [1.5, np.nan, 3.0, 4.25],
+            "inteiro": np.arange(4, dtype="int64"),
+            "nullable": pd.array([1, None, 3, 4], dtype="Int64"),
+            "real_nullable": pd.array([0.5, 1.5, None, 2.0], dtype="Float64"),
+            "booleano": [True, False, True, False],
+            "data": pd.date_range("2025-01-01", periods=4),
+            "texto": ["a", None, "c", "d"],
+            "categoria": pd.Categorical(["x", "y", "x", "y"]),
+        }
+    )
+
+
+def test_ler_particao_igual_ao_iloc(df_tipos):
+    posicoes = np.array([3, 1])
+    with PublicacaoCompartilhada(df_tipos) as publicacao:
+        quadro = pickle.loads(pickle.dumps(publicacao.quadro))
+        lido = quadro.ler(posicoes, publicacao.restantes(posicoes))
+
+    esperado = df_tipos.iloc[posicoes].reset_index(drop=True)
+    pd.testing.assert_frame_equal(lido, esperado)
+
+
+def test_colunas_sem_buffer_vao_serializadas(df_tipos):
+    with PublicacaoCompartilhada(df_tipos) as publicacao:
+        assert publicacao.colunas_serializadas == ["texto", "categoria"]
+        nomes = [c.nome for c in publicacao.quadro.compartilhadas]
+    assert "nullable" in nomes and "data" in nomes
+
+
+def test_segmento_removido_ao_fechar(df_tipos):
+    with PublicacaoCompartilhada(df_tipos) as publicacao:
+        segmento = publicacao.quadro.segmento
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=segmento)